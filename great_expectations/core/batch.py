@@ -1,7 +1,8 @@
 import datetime
 import json
 import logging
-from typing import Any, Callable, Dict, Optional, Set, Union
+import weakref
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.id_dict import BatchKwargs, BatchSpec, IDDict
@@ -512,8 +513,19 @@ class Batch(SerializableDictDot):
         datasource_name=None,
         batch_parameters=None,
         batch_kwargs=None,
+        batch_data_loader: Optional[Callable[[], Tuple[Any, BatchMarkers]]] = None,
     ) -> None:
+        """A batch of data, along with the request, definition, spec and markers identifying it.
+
+        Args:
+            data: the batch data (None if it is loaded lazily)
+            batch_data_loader: a function returning the batch data and batch markers, called when the data of a batch
+                built without "data" is first accessed (the batch only keeps a weak reference to the data it loads, so
+                that the data can be released once it is no longer used, and is loaded again if it is accessed later)
+        """
         self._data = data
+        self._batch_data_loader = batch_data_loader
+        self._data_reference: Optional[weakref.ref] = None
         if batch_request is None:
             batch_request = {}
         self._batch_request = batch_request
@@ -524,7 +536,7 @@ class Batch(SerializableDictDot):
             batch_spec = BatchSpec()
         self._batch_spec = batch_spec
 
-        if batch_markers is None:
+        if batch_markers is None and (data is not None or batch_data_loader is None):
             batch_markers = BatchMarkers(
                 {
                     "ge_load_time": datetime.datetime.now(
@@ -542,7 +554,34 @@ class Batch(SerializableDictDot):
 
     @property
     def data(self):
-        return self._data
+        if self._data is not None or self._batch_data_loader is None:
+            return self._data
+
+        data: Any = None if self._data_reference is None else self._data_reference()
+        # Batch data still referenced elsewhere may have been released when it was unloaded (e.g., its temporary table
+        # may have been dropped), in which case it is loaded again.
+        if data is None or getattr(data, "is_released", False):
+            batch_markers: BatchMarkers
+            data, batch_markers = self._batch_data_loader()
+            if self._batch_markers is None:
+                self._batch_markers = batch_markers
+            try:
+                self._data_reference = weakref.ref(data)
+            except TypeError:
+                self._data = data
+
+        return data
+
+    @property
+    def batch_data_loader(
+        self,
+    ) -> Optional[Callable[[], Tuple[Any, BatchMarkers]]]:
+        return self._batch_data_loader
+
+    @property
+    def is_lazy(self) -> bool:
+        """Whether the data of the batch is loaded on demand (by its "batch_data_loader")."""
+        return self._data is None and self._batch_data_loader is not None
 
     @property
     def batch_request(self):
@@ -566,6 +605,9 @@ class Batch(SerializableDictDot):
 
     @property
     def batch_markers(self):
+        if self._batch_markers is None and self.is_lazy:
+            # Batch markers are produced when the data is loaded.
+            _ = self.data
         return self._batch_markers
 
     # The remaining properties are for backward compatibility.
@@ -625,7 +667,7 @@ class Batch(SerializableDictDot):
             {"batch_id": self.id},
             {"n_rows": n_rows, "fetch_all": fetch_all},
         )
-        return self._data.execution_engine.resolve_metrics((metric,))[metric.id]
+        return self.data.execution_engine.resolve_metrics((metric,))[metric.id]
 
 
 def materialize_batch_request(
@@ -1,11 +1,14 @@
 import copy
 import datetime
+import functools
 import logging
 import math
 import operator
+import threading
 import traceback
 from collections import namedtuple
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from pyparsing import (
     CaselessKeyword,
@@ -242,6 +245,117 @@ def build_evaluation_parameters(
 
 expr = EvaluationParameterParser()
 
+# The parse actions of the parser push onto its (shared) exprStack, so parsing is serialized; evaluation is done on a
+# copy of the compiled stack, and does not need the lock.
+_evaluation_parameter_parser_lock = threading.Lock()
+
+CompiledEvaluationParameterExpression = namedtuple(
+    "CompiledEvaluationParameterExpression",
+    ["parse_result", "expr_stack", "parse_error"],
+)
+
+
+def compile_evaluation_parameter_expression(
+    parameter_expression: str,
+) -> CompiledEvaluationParameterExpression:
+    """Parse a parameter expression into the stack of operands and operations evaluated by the parser.
+
+    Compiled expressions are cached by expression text and must not be modified.  If the expression cannot be parsed,
+    "parse_error" holds the (message, line, column) of the parse exception.
+    """
+    if isinstance(parameter_expression, str):
+        return _compile_evaluation_parameter_expression_cached(parameter_expression)
+
+    return _compile_evaluation_parameter_expression(parameter_expression)
+
+
+def _compile_evaluation_parameter_expression(
+    parameter_expression: str,
+) -> CompiledEvaluationParameterExpression:
+    with _evaluation_parameter_parser_lock:
+        # Calling get_parser clears the stack
+        parser = expr.get_parser()
+        try:
+            parse_result = parser.parseString(parameter_expression, parseAll=True)
+        except ParseException as err:
+            return CompiledEvaluationParameterExpression(
+                parse_result=(),
+                expr_stack=(),
+                parse_error=(str(err), err.line, err.column),
+            )
+
+        return CompiledEvaluationParameterExpression(
+            parse_result=tuple(parse_result),
+            expr_stack=tuple(expr.exprStack),
+            parse_error=None,
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_evaluation_parameter_expression_cached(
+    parameter_expression: str,
+) -> CompiledEvaluationParameterExpression:
+    return _compile_evaluation_parameter_expression(parameter_expression)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ge_urn(word: str) -> Optional[Mapping[str, Any]]:
+    """Return the named parts of the parsed GE URN (e.g. "urn_type"), or None if the word is not a valid URN.
+
+    Parsed URNs are shared by every caller, so they are returned as read-only mappings.
+    """
+    try:
+        return MappingProxyType(ge_urn.parseString(word).asDict())
+    except ParseException:
+        return None
+
+
+def _get_store_urn_value(res: Mapping[str, Any], data_context: Optional[Any]) -> Any:
+    """Query the metric referenced by a parsed "stores" URN; raises AttributeError if the store cannot be found."""
+    store = data_context.stores.get(res["store_name"])  # type: ignore[union-attr]
+    return store.get_query_result(res["metric_name"], res.get("metric_kwargs", {}))
+
+
+def resolve_evaluation_parameter_urns(
+    parameter_expressions: Iterable[str],
+    evaluation_parameters: Optional[Dict[str, Any]] = None,
+    data_context: Optional[Any] = None,  # Cannot type 'DataContext' due to import cycle
+) -> Dict[str, Any]:
+    """Resolve, in bulk, the store URNs referenced by several parameter expressions (e.g. those of a suite).
+
+    Every distinct URN that is not already among the evaluation_parameters is queried once; URNs that cannot be resolved
+    are left out (and are reported when the expressions referencing them are evaluated).
+
+    Returns:
+        A dictionary of the resolved URNs and their values, to be used as additional evaluation parameters.
+    """
+    if evaluation_parameters is None:
+        evaluation_parameters = {}
+
+    urns: Set[str] = set()
+    for parameter_expression in parameter_expressions:
+        try:
+            urns.update(
+                find_evaluation_parameter_dependencies(parameter_expression)["urns"]
+            )
+        except EvaluationParameterError:
+            continue
+
+    resolved_urns: Dict[str, Any] = {}
+    for urn in sorted(urns - set(evaluation_parameters.keys())):
+        res = _parse_ge_urn(urn)
+        if res is None or res["urn_type"] != "stores" or data_context is None:
+            continue
+
+        try:
+            resolved_urns[urn] = _get_store_urn_value(
+                res=res, data_context=data_context
+            )
+        except Exception as e:
+            logger.debug(f"Unable to resolve evaluation parameter URN {urn}: {e}")
+
+    return resolved_urns
+
 
 def find_evaluation_parameter_dependencies(parameter_expression):
     """Parse a parameter expression to identify dependencies including GE URNs.
@@ -255,23 +369,23 @@ def find_evaluation_parameter_dependencies(parameter_expression):
           - "other": set of non-GE URN strings that are required to evaluate the parameter expression
 
     """
-    expr = EvaluationParameterParser()
-
     dependencies = {"urns": set(), "other": set()}
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
     try:
-        _ = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        raise EvaluationParameterError(
-            f"Unable to parse evaluation parameter: {str(err)} at line {err.line}, column {err.column}"
+        compiled_expression = compile_evaluation_parameter_expression(
+            parameter_expression
         )
     except AttributeError as err:
         raise EvaluationParameterError(
             f"Unable to parse evaluation parameter: {str(err)}"
         )
 
-    for word in expr.exprStack:
+    if compiled_expression.parse_error is not None:
+        err_str, err_line, err_col = compiled_expression.parse_error
+        raise EvaluationParameterError(
+            f"Unable to parse evaluation parameter: {err_str} at line {err_line}, column {err_col}"
+        )
+
+    for word in compiled_expression.expr_stack:
         if isinstance(word, (int, float)):
             continue
 
@@ -290,13 +404,9 @@ def find_evaluation_parameter_dependencies(parameter_expression):
         except ValueError:
             pass
 
-        try:
-            _ = ge_urn.parseString(word)
+        if _parse_ge_urn(word) is not None:
             dependencies["urns"].add(word)
             continue
-        except ParseException:
-            # This particular evaluation_parameter or operator is not a valid URN
-            pass
 
         # If we got this far, it's a legitimate "other" evaluation parameter
         dependencies["other"].add(word)
@@ -327,12 +437,15 @@ def parse_evaluation_parameter(  # noqa: C901 - complexity 21
     if evaluation_parameters is None:
         evaluation_parameters = {}
 
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
-    try:
-        L = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        L = ["Parse Failure", parameter_expression, (str(err), err.line, err.column)]
+    compiled_expression = compile_evaluation_parameter_expression(parameter_expression)
+    L: Tuple[Any, ...]
+    if compiled_expression.parse_error is None:
+        L = compiled_expression.parse_result
+    else:
+        L = ("Parse Failure", parameter_expression, compiled_expression.parse_error)
+
+    # Compiled expressions are shared, so substitutions are made on a copy of the stack.
+    expr_stack: List[Any] = list(compiled_expression.expr_stack)
 
     # Represents a valid parser result of a single function that has no arguments
     if len(L) == 1 and isinstance(L[0], tuple) and L[0][2] is False:
@@ -344,12 +457,16 @@ def parse_evaluation_parameter(  # noqa: C901 - complexity 21
         # In this special case there were no operations to find, so only one value, but we don't have something to
         # substitute for that value
         try:
-            res = ge_urn.parseString(L[0])
-            if res["urn_type"] == "stores":
-                store = data_context.stores.get(res["store_name"])  # type: ignore[union-attr]
-                return store.get_query_result(
-                    res["metric_name"], res.get("metric_kwargs", {})
+            res = _parse_ge_urn(L[0])
+            if res is None:
+                logger.debug(
+                    f"Parse exception while parsing evaluation parameter: {str(L[0])} is not a valid URN"
                 )
+                raise EvaluationParameterError(
+                    f"No value found for $PARAMETER {str(L[0])}"
+                )
+            elif res["urn_type"] == "stores":
+                return _get_store_urn_value(res=res, data_context=data_context)
             else:
                 logger.error(
                     "Unrecognized urn_type in ge_urn: must be 'stores' to use a metric store."
@@ -357,11 +474,6 @@ def parse_evaluation_parameter(  # noqa: C901 - complexity 21
                 raise EvaluationParameterError(
                     f"No value found for $PARAMETER {str(L[0])}"
                 )
-        except ParseException as e:
-            logger.debug(
-                f"Parse exception while parsing evaluation parameter: {str(e)}"
-            )
-            raise EvaluationParameterError(f"No value found for $PARAMETER {str(L[0])}")
         except AttributeError:
             logger.warning("Unable to get store for store-type valuation parameter.")
             raise EvaluationParameterError(f"No value found for $PARAMETER {str(L[0])}")
@@ -376,28 +488,22 @@ def parse_evaluation_parameter(  # noqa: C901 - complexity 21
     elif len(L) == 0 or L[0] != "Parse Failure":
         # we have a stack to evaluate and there was no parse failure.
         # iterate through values and look for URNs pointing to a store:
-        for i, ob in enumerate(expr.exprStack):
+        for i, ob in enumerate(expr_stack):
             if isinstance(ob, str) and ob in evaluation_parameters:
-                expr.exprStack[i] = str(evaluation_parameters[ob])
+                expr_stack[i] = str(evaluation_parameters[ob])
             elif isinstance(ob, str) and ob not in evaluation_parameters:
                 # try to retrieve this value from a store
-                try:
-                    res = ge_urn.parseString(ob)
-                    if res["urn_type"] == "stores":
-                        store = data_context.stores.get(res["store_name"])  # type: ignore[union-attr]
-                        expr.exprStack[i] = str(
-                            store.get_query_result(
-                                res["metric_name"], res.get("metric_kwargs", {})
-                            )
-                        )  # value placed back in stack must be a string
-                    else:
-                        # handle other urn_types here, but note that validations URNs are being resolved elsewhere.
-                        pass
+                res = _parse_ge_urn(ob)
                 # graceful error handling for cases where the value in the stack isn't a URN:
-                except ParseException:
-                    pass
-                except AttributeError:
-                    pass
+                if res is not None and res["urn_type"] == "stores":
+                    try:
+                        # value placed back in stack must be a string
+                        expr_stack[i] = str(
+                            _get_store_urn_value(res=res, data_context=data_context)
+                        )
+                    except AttributeError:
+                        pass
+                # handle other urn_types here, but note that validations URNs are being resolved elsewhere.
 
     else:
         err_str, err_line, err_col = L[-1]
@@ -406,7 +512,7 @@ def parse_evaluation_parameter(  # noqa: C901 - complexity 21
         )
 
     try:
-        result = expr.evaluate_stack(expr.exprStack)
+        result = expr.evaluate_stack(expr_stack)
         result = convert_to_json_serializable(result)
     except Exception as e:
         exception_traceback = traceback.format_exc()
@@ -427,16 +427,13 @@ class ExpectationSuiteValidationResult(SerializableDictDot):
         return json.dumps(self.to_json_dict(), indent=2)
 
     def to_json_dict(self):
-        myself = deepcopy(self)
-        # NOTE - JPC - 20191031: migrate to expectation-specific schemas that subclass result with properly-typed
-        # schemas to get serialization all-the-way down via dump
-        myself["evaluation_parameters"] = convert_to_json_serializable(
-            myself["evaluation_parameters"]
+        # Produces the same output as converting "evaluation_parameters", "statistics", and "meta" of a copy of this
+        # object, and dumping the copy with "expectationSuiteValidationResultSchema", without copying the results.
+        from great_expectations.core.json_serializer import (
+            expectationSuiteValidationResultJsonSerializer,
         )
-        myself["statistics"] = convert_to_json_serializable(myself["statistics"])
-        myself["meta"] = convert_to_json_serializable(myself["meta"])
-        myself = expectationSuiteValidationResultSchema.dump(myself)
-        return myself
+
+        return expectationSuiteValidationResultJsonSerializer.to_json_dict(value=self)
 
     def get_metric(self, metric_name, **kwargs):
         metric_name_parts = metric_name.split(".")
@@ -4,6 +4,7 @@ from requests.adapters import HTTPAdapter, Retry
 from great_expectations import __version__
 
 DEFAULT_TIMEOUT = 20
+DEFAULT_POOL_MAXSIZE = 10
 
 
 class _TimeoutHTTPAdapter(HTTPAdapter):
@@ -24,7 +25,13 @@ def create_session(
     retry_count: int = 5,
     backoff_factor: float = 1.0,
     timeout: int = DEFAULT_TIMEOUT,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
 ) -> requests.Session:
+    """Create a session authenticated with the given access token.
+
+    pool_maxsize is the number of connections kept open per host, which should be at least the number of threads
+    sharing the session.
+    """
     session = requests.Session()
     session = _update_headers(session=session, access_token=access_token)
     session = _mount_adapter(
@@ -32,6 +39,7 @@ def create_session(
         timeout=timeout,
         retry_count=retry_count,
         backoff_factor=backoff_factor,
+        pool_maxsize=pool_maxsize,
     )
     return session
 
@@ -47,10 +55,16 @@ def _update_headers(session: requests.Session, access_token: str) -> requests.Se
 
 
 def _mount_adapter(
-    session: requests.Session, timeout: int, retry_count: int, backoff_factor: float
+    session: requests.Session,
+    timeout: int,
+    retry_count: int,
+    backoff_factor: float,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
 ) -> requests.Session:
     retries = Retry(total=retry_count, backoff_factor=backoff_factor)
-    adapter = _TimeoutHTTPAdapter(timeout=timeout, max_retries=retries)
+    adapter = _TimeoutHTTPAdapter(
+        timeout=timeout, max_retries=retries, pool_maxsize=pool_maxsize
+    )
     for protocol in ("http://", "https://"):
         session.mount(protocol, adapter)
     return session
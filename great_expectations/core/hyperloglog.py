@@ -0,0 +1,126 @@
+"""
+HyperLogLog sketches, estimating the number of distinct values of (possibly very large, or chunked) data with a fixed
+amount of memory.
+
+WARNING: This module is experimental.
+"""
+
+import math
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PRECISION = 14
+
+# Number of values hashed at once, bounding the memory used to update a sketch with a large column.
+UPDATE_CHUNK_SIZE = 1_000_000
+
+
+class HyperLogLog:
+    """A HyperLogLog sketch (Flajolet et al., 2007) of 2 ** "precision" registers, using 64-bit hashes.
+
+    Sketches of the same precision can be merged, so that data read in chunks (or split into batches) can be sketched
+    piece by piece.  The relative standard error of the estimated number of distinct values is about
+    1.04 / sqrt(2 ** precision), i.e. 0.81% for the default precision of 14 (which uses 16 KiB of registers).
+
+    WARNING: This class is experimental.
+    """
+
+    def __init__(self, precision: int = DEFAULT_PRECISION) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError(f'"precision" must be between 4 and 18 (got {precision}).')
+
+        self._precision = precision
+        self._registers = np.zeros(2**precision, dtype=np.uint8)
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def relative_standard_error(self) -> float:
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def update(self, values: Union[pd.Series, Iterable]) -> None:
+        """Add values (nulls are ignored) to the sketch."""
+        if not isinstance(values, pd.Series):
+            values = pd.Series(list(values), dtype="object")
+
+        values = values.dropna()
+        if pd.api.types.is_float_dtype(values.dtype) and bool(
+            ((values == np.floor(values)) & (values.abs() < 2**63)).all()
+        ):
+            # Integers are hashed alike, whether or not nulls made pandas store them as floats.
+            values = values.astype(np.int64)
+
+        start: int
+        for start in range(0, len(values), UPDATE_CHUNK_SIZE):
+            self._update_with_hashes(
+                pd.util.hash_pandas_object(
+                    values.iloc[start : start + UPDATE_CHUNK_SIZE], index=False
+                ).to_numpy(dtype=np.uint64)
+            )
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Add the values of another sketch (of the same precision) to this sketch."""
+        if other.precision != self._precision:
+            raise ValueError(
+                f"Cannot merge a sketch of precision {other.precision} into a sketch of precision {self._precision}."
+            )
+
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def count(self) -> int:
+        """Estimate the number of distinct values added to the sketch."""
+        register_count: int = len(self._registers)
+        alpha: float = 0.7213 / (1 + 1.079 / register_count)
+        estimate: float = (
+            alpha
+            * register_count**2
+            / np.sum(np.power(2.0, -self._registers.astype(np.float64)))
+        )
+
+        # Small cardinalities are better estimated by linear counting of the empty registers.
+        empty_register_count: int = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * register_count and empty_register_count > 0:
+            estimate = register_count * math.log(register_count / empty_register_count)
+
+        return int(round(estimate))
+
+    def _update_with_hashes(self, hashes: np.ndarray) -> None:
+        if len(hashes) == 0:
+            return
+
+        # The first "precision" bits of a hash select a register, which keeps the largest position of the first 1 bit
+        # in the remaining bits of the hashes it was updated with.
+        indexes: np.ndarray = (hashes >> np.uint64(64 - self._precision)).astype(
+            np.int64
+        )
+        remaining_bits: np.ndarray = hashes << np.uint64(self._precision)
+        ranks: np.ndarray = np.minimum(
+            self._count_leading_zeros(remaining_bits) + 1, 64 - self._precision + 1
+        ).astype(np.uint8)
+        np.maximum.at(self._registers, indexes, ranks)
+
+    @staticmethod
+    def _count_leading_zeros(values: np.ndarray) -> np.ndarray:
+        # Frexp is exact for 32-bit integers, so the high and low halves of 64-bit integers are handled separately.
+        high: np.ndarray = (values >> np.uint64(32)).astype(np.float64)
+        low: np.ndarray = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        high_exponents: np.ndarray = np.frexp(high)[1]
+        low_exponents: np.ndarray = np.frexp(low)[1]
+        return np.where(
+            high > 0,
+            32 - high_exponents,
+            np.where(low > 0, 64 - low_exponents, 64),
+        )
+
+
+def estimate_distinct_count(
+    values: Union[pd.Series, Iterable], precision: Optional[int] = None
+) -> int:
+    """Estimate the number of distinct (non-null) values with a HyperLogLog sketch."""
+    sketch = HyperLogLog(precision=precision or DEFAULT_PRECISION)
+    sketch.update(values)
+    return sketch.count()
@@ -0,0 +1,501 @@
+"""Fast JSON serialization of Expectation Suites and Validation Results.
+
+The marshmallow schemas (ExpectationSuiteSchema, ExpectationSuiteValidationResultSchema, and the schemas nested in
+them) remain the source of truth for the serialized format.  Dumping and loading large Expectation Suites and
+Validation Results through them is slow, however: "pre_dump" hooks deep-copy every object (once per level of nesting),
+"convert_to_json_serializable" runs over the same data several times, and marshmallow's per-field machinery dominates
+both directions.
+
+The serializers in this module resolve the fields of these schemas once (in the same order as the schemas themselves)
+and reproduce the effects of their hooks with a single conversion pass, so that their output is identical to that of
+the schemas.  Whenever an input is not one these fast paths are known to reproduce exactly (e.g., plain dictionaries,
+or Expectation Configurations with rendered content), the work is delegated to the corresponding schema.
+
+Typical usage example:
+
+serializer = ExpectationSuiteValidationResultJsonSerializer()
+serialized_value = serializer.dumps(validation_result, indent=2, sort_keys=True)
+validation_result = serializer.loads(serialized_value)
+"""
+
+import copy
+import json
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from marshmallow import Schema, fields, missing
+
+from great_expectations.core.expectation_configuration import (
+    ExpectationConfiguration,
+    ExpectationConfigurationSchema,
+)
+from great_expectations.core.expectation_suite import (
+    ExpectationSuite,
+    ExpectationSuiteSchema,
+)
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+    ExpectationSuiteValidationResultSchema,
+    ExpectationValidationResult,
+    ExpectationValidationResultSchema,
+)
+from great_expectations.core.util import convert_to_json_serializable
+
+# Values of these types are immutable, and therefore never need to be copied.
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
+class _FastPathUnavailable(Exception):
+    """Raised when an input cannot be handled by the fast path (the schema is used instead)."""
+
+
+class _CompiledSchema:
+    """Fields of a marshmallow schema, resolved once for repeated dumping and loading."""
+
+    def __init__(self, schema: Schema) -> None:
+        self._schema = schema
+        self._dump_fields: List[Tuple[str, str, fields.Field]] = [
+            (
+                attr_name,
+                field_obj.data_key if field_obj.data_key is not None else attr_name,
+                field_obj,
+            )
+            for attr_name, field_obj in schema.dump_fields.items()
+        ]
+        self._load_fields: List[Tuple[str, str, fields.Field]] = [
+            (
+                attr_name,
+                field_obj.data_key if field_obj.data_key is not None else attr_name,
+                field_obj,
+            )
+            for attr_name, field_obj in schema.load_fields.items()
+        ]
+        self._load_keys = {data_key for _, data_key, _ in self._load_fields}
+
+    @property
+    def schema(self) -> Schema:
+        return self._schema
+
+    def dump(
+        self,
+        obj: Any,
+        values: Optional[Dict[str, Any]] = None,
+        nested: Optional[Dict[str, Callable[[Any], Any]]] = None,
+        omit: Tuple[str, ...] = (),
+    ) -> dict:
+        """Serialize "obj" the way the schema does (without its hooks, which callers reproduce).
+
+        :param obj: object being serialized
+        :param values: already converted (and not shared with "obj") attribute values, used instead of those of "obj"
+        :param nested: serializers for (lists of) nested objects, keyed by attribute name
+        :param omit: attribute names to leave out of the result
+        :return: serialized object, which shares no mutable state with "obj"
+        """
+        values = values or {}
+        nested = nested or {}
+
+        data: dict = {}
+        for attr_name, data_key, field_obj in self._dump_fields:
+            if attr_name in omit:
+                continue
+
+            if attr_name in values:
+                value = values[attr_name]
+                is_converted = True
+            else:
+                value = self._schema.get_attribute(obj, attr_name, missing)
+                is_converted = False
+
+            if value is missing:
+                continue
+
+            if attr_name in nested:
+                data[data_key] = None if value is None else nested[attr_name](value)
+                continue
+
+            serialized_value = field_obj._serialize(value, attr_name, obj)
+            if not is_converted and not isinstance(serialized_value, _IMMUTABLE_TYPES):
+                serialized_value = copy.deepcopy(serialized_value)
+
+            data[data_key] = serialized_value
+
+        return data
+
+    def load(
+        self,
+        data: Any,
+        nested: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    ) -> dict:
+        """Deserialize "data" the way the schema does (without its "post_load" hook, which callers reproduce).
+
+        :param data: deserialized JSON document
+        :param nested: deserializers for (lists of) nested objects, keyed by attribute name
+        :return: dictionary of attribute values
+        :raises _FastPathUnavailable: if the document requires validation or coercion, which only the schema provides
+        """
+        nested = nested or {}
+
+        if not isinstance(data, dict) or not self._load_keys.issuperset(data.keys()):
+            raise _FastPathUnavailable
+
+        result: dict = {}
+        for attr_name, data_key, field_obj in self._load_fields:
+            if data_key not in data:
+                if field_obj.required or _get_load_default(field_obj) is not missing:
+                    raise _FastPathUnavailable
+
+                continue
+
+            value = data[data_key]
+            if value is None:
+                if not field_obj.allow_none:
+                    raise _FastPathUnavailable
+
+                result[attr_name] = None
+            elif attr_name in nested:
+                result[attr_name] = nested[attr_name](value)
+            else:
+                result[attr_name] = _load_scalar_field(field_obj=field_obj, value=value)
+
+        return result
+
+
+def _get_load_default(field_obj: fields.Field) -> Any:
+    # "Field.missing" was renamed to "Field.load_default" in marshmallow 3.13.
+    if hasattr(field_obj, "load_default"):
+        return field_obj.load_default
+
+    return field_obj.missing
+
+
+def _load_scalar_field(field_obj: fields.Field, value: Any) -> Any:
+    if field_obj.validators:
+        raise _FastPathUnavailable
+
+    # "fields.UUID" is a subclass of "fields.String", and must be handled first.
+    if isinstance(field_obj, fields.UUID):
+        if not isinstance(value, str):
+            raise _FastPathUnavailable
+
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            raise _FastPathUnavailable
+
+    if isinstance(field_obj, fields.String) and isinstance(value, str):
+        return value
+
+    if isinstance(field_obj, fields.Boolean) and isinstance(value, bool):
+        return value
+
+    if (
+        isinstance(field_obj, fields.Dict)
+        and field_obj.key_field is None
+        and field_obj.value_field is None
+        and isinstance(value, dict)
+    ):
+        return dict(value)
+
+    raise _FastPathUnavailable
+
+
+def _load_list(value: Any, load_item: Callable[[Any], Any]) -> list:
+    if not isinstance(value, list):
+        raise _FastPathUnavailable
+
+    return [load_item(item) for item in value]
+
+
+def _json_loads(value: Any) -> Any:
+    # Schema.loads() accepts the same inputs (and raises the same errors) as "json.loads()".
+    return json.loads(value)
+
+
+class ExpectationConfigurationJsonSerializer:
+    """Serializes ExpectationConfiguration objects exactly as ExpectationConfigurationSchema does."""
+
+    def __init__(self) -> None:
+        self._compiled_schema = _CompiledSchema(schema=ExpectationConfigurationSchema())
+
+    @property
+    def schema(self) -> Schema:
+        return self._compiled_schema.schema
+
+    def dump(self, value: Any) -> dict:
+        """Equivalent to "ExpectationConfigurationSchema().dump(value)"."""
+        if not isinstance(value, ExpectationConfiguration):
+            return self.schema.dump(value)
+
+        return self._dump(value=value, values=None)
+
+    def to_json_dict(self, value: ExpectationConfiguration) -> dict:
+        """Equivalent to "value.to_json_dict()"."""
+        if not self._is_plain(value=value):
+            return value.to_json_dict()
+
+        return self._dump(
+            value=value,
+            values={"kwargs": convert_to_json_serializable(data=value.kwargs)},
+        )
+
+    def dump_converted(self, value: Any) -> dict:
+        """Equivalent to "ExpectationConfigurationSchema().dump(convert_to_json_serializable(value))".
+
+        This is how each Expectation Configuration is serialized as part of an Expectation Suite.
+        """
+        if not self._is_plain(value=value):
+            return self.schema.dump(convert_to_json_serializable(data=value))
+
+        # Dumping the JSON dictionary of a plain Expectation Configuration once more reproduces it unchanged.
+        return self.to_json_dict(value=value)
+
+    def load(self, data: Any) -> ExpectationConfiguration:
+        """Equivalent to "ExpectationConfigurationSchema().load(data)" for well-formed documents.
+
+        :raises _FastPathUnavailable: if the document requires validation or coercion, which only the schema provides
+        """
+        return ExpectationConfiguration(**self._compiled_schema.load(data=data))
+
+    @staticmethod
+    def _is_plain(value: Any) -> bool:
+        # Expectation context and rendered content are serialized by schemas whose output is not idempotent.
+        return (
+            isinstance(value, ExpectationConfiguration)
+            and value.expectation_context is None
+            and value.rendered_content is None
+        )
+
+    def _dump(
+        self, value: ExpectationConfiguration, values: Optional[Dict[str, Any]]
+    ) -> dict:
+        data: dict = self._compiled_schema.dump(obj=value, values=values)
+        # Reproduces the "post_dump" hook of the schema.
+        for key in ExpectationConfigurationSchema.REMOVE_KEYS_IF_NONE:
+            if key in data and data[key] is None:
+                data.pop(key)
+
+        return data
+
+
+class ExpectationSuiteJsonSerializer:
+    """Serializes ExpectationSuite objects exactly as ExpectationSuiteSchema does."""
+
+    def __init__(self) -> None:
+        self._compiled_schema = _CompiledSchema(schema=ExpectationSuiteSchema())
+        self._expectation_configuration_serializer = (
+            ExpectationConfigurationJsonSerializer()
+        )
+
+    @property
+    def schema(self) -> Schema:
+        return self._compiled_schema.schema
+
+    def dump(self, value: Any) -> dict:
+        """Equivalent to "ExpectationSuiteSchema().dump(value)"."""
+        try:
+            return self._dump(value=value)
+        except _FastPathUnavailable:
+            pass
+
+        return self.schema.dump(value)
+
+    def dumps(self, value: Any, **kwargs) -> str:
+        """Equivalent to "ExpectationSuiteSchema().dumps(value, **kwargs)"."""
+        return json.dumps(self.dump(value=value), **kwargs)
+
+    def load(self, data: Any) -> dict:
+        """Equivalent to "ExpectationSuiteSchema().load(data)"."""
+        try:
+            return self._compiled_schema.load(
+                data=data,
+                nested={
+                    "expectations": lambda expectations: _load_list(
+                        value=expectations,
+                        load_item=self._expectation_configuration_serializer.load,
+                    )
+                },
+            )
+        except _FastPathUnavailable:
+            pass
+
+        return self.schema.load(data)
+
+    def loads(self, value: Any) -> dict:
+        """Equivalent to "ExpectationSuiteSchema().loads(value)"."""
+        return self.load(data=_json_loads(value))
+
+    def _dump(self, value: Any) -> dict:
+        if not isinstance(value, ExpectationSuite):
+            raise _FastPathUnavailable
+
+        # Reproduces the "pre_dump" hook of the schema, which converts every (copied) schema attribute.
+        values: Dict[str, Any] = {}
+        for attr_name in self.schema.fields.keys():
+            if not hasattr(value, attr_name):
+                raise _FastPathUnavailable
+
+            if attr_name == "expectations":
+                continue
+
+            values[attr_name] = convert_to_json_serializable(
+                data=getattr(value, attr_name)
+            )
+
+        if not isinstance(value.expectations, (list, tuple, set)):
+            raise _FastPathUnavailable
+
+        values["expectations"] = [
+            self._expectation_configuration_serializer.dump_converted(value=expectation)
+            for expectation in value.expectations
+        ]
+
+        # Reproduces "ExpectationSuiteSchema.clean_empty()".
+        omit: List[str] = []
+        if not isinstance(values["evaluation_parameters"], dict):
+            raise _FastPathUnavailable
+
+        if len(values["evaluation_parameters"]) == 0:
+            omit.append("evaluation_parameters")
+
+        meta: Any = values["meta"]
+        if meta is None or meta == []:
+            pass
+        elif not isinstance(meta, dict):
+            raise _FastPathUnavailable
+        elif len(meta) == 0:
+            omit.append("meta")
+
+        return self._compiled_schema.dump(obj=value, values=values, omit=tuple(omit))
+
+
+class ExpectationSuiteValidationResultJsonSerializer:
+    """Serializes ExpectationSuiteValidationResult objects exactly as ExpectationSuiteValidationResultSchema does."""
+
+    def __init__(self) -> None:
+        self._compiled_schema = _CompiledSchema(
+            schema=ExpectationSuiteValidationResultSchema()
+        )
+        self._compiled_result_schema = _CompiledSchema(
+            schema=ExpectationValidationResultSchema()
+        )
+        self._expectation_configuration_serializer = (
+            ExpectationConfigurationJsonSerializer()
+        )
+
+    @property
+    def schema(self) -> Schema:
+        return self._compiled_schema.schema
+
+    def dump(self, value: Any) -> dict:
+        """Equivalent to "ExpectationSuiteValidationResultSchema().dump(value)"."""
+        if not isinstance(value, ExpectationSuiteValidationResult):
+            return self.schema.dump(value)
+
+        return self._dump(
+            value=value,
+            values={
+                "meta": convert_to_json_serializable(data=value.meta),
+                "statistics": convert_to_json_serializable(data=value.statistics),
+            },
+        )
+
+    def dumps(self, value: Any, **kwargs) -> str:
+        """Equivalent to "ExpectationSuiteValidationResultSchema().dumps(value, **kwargs)"."""
+        return json.dumps(self.dump(value=value), **kwargs)
+
+    def to_json_dict(self, value: ExpectationSuiteValidationResult) -> dict:
+        """Equivalent to "value.to_json_dict()"."""
+        # "to_json_dict()" converts these attributes, and then dumps them through the schema (which converts again).
+        return self._dump(
+            value=value,
+            values={
+                "evaluation_parameters": convert_to_json_serializable(
+                    data=value.evaluation_parameters
+                ),
+                "meta": convert_to_json_serializable(
+                    data=convert_to_json_serializable(data=value.meta)
+                ),
+                "statistics": convert_to_json_serializable(
+                    data=convert_to_json_serializable(data=value.statistics)
+                ),
+            },
+        )
+
+    def load(self, data: Any) -> ExpectationSuiteValidationResult:
+        """Equivalent to "ExpectationSuiteValidationResultSchema().load(data)"."""
+        try:
+            return ExpectationSuiteValidationResult(
+                **self._compiled_schema.load(
+                    data=data,
+                    nested={
+                        "results": lambda results: _load_list(
+                            value=results, load_item=self._load_result
+                        )
+                    },
+                )
+            )
+        except _FastPathUnavailable:
+            pass
+
+        return self.schema.load(data)
+
+    def loads(self, value: Any) -> ExpectationSuiteValidationResult:
+        """Equivalent to "ExpectationSuiteValidationResultSchema().loads(value)"."""
+        return self.load(data=_json_loads(value))
+
+    def _dump(
+        self, value: ExpectationSuiteValidationResult, values: Dict[str, Any]
+    ) -> dict:
+        return self._compiled_schema.dump(
+            obj=value,
+            values=values,
+            nested={
+                "results": lambda results: self._dump_results(results=results),
+            },
+        )
+
+    def _dump_results(self, results: Any) -> list:
+        if not isinstance(results, list):
+            return self._compiled_schema.schema.fields["results"]._serialize(
+                results, "results", None
+            )
+
+        return [
+            None if result is None else self._dump_result(value=result)
+            for result in results
+        ]
+
+    def _dump_result(self, value: Any) -> dict:
+        if not isinstance(value, ExpectationValidationResult):
+            return self._compiled_result_schema.schema.dump(value)
+
+        # Reproduces the "pre_dump" hook of ExpectationValidationResultSchema.
+        data: dict = self._compiled_result_schema.dump(
+            obj=value,
+            values={"result": convert_to_json_serializable(data=value.result)},
+            nested={
+                "expectation_config": self._expectation_configuration_serializer.dump,
+            },
+        )
+        # Reproduces the "post_dump" hook of ExpectationValidationResultSchema.
+        for key in ExpectationConfigurationSchema.REMOVE_KEYS_IF_NONE:
+            if key in data and data[key] is None:
+                data.pop(key)
+
+        return data
+
+    def _load_result(self, data: Any) -> ExpectationValidationResult:
+        return ExpectationValidationResult(
+            **self._compiled_result_schema.load(
+                data=data,
+                nested={
+                    "expectation_config": self._expectation_configuration_serializer.load,
+                },
+            )
+        )
+
+
+expectationSuiteJsonSerializer = ExpectationSuiteJsonSerializer()
+expectationSuiteValidationResultJsonSerializer = (
+    ExpectationSuiteValidationResultJsonSerializer()
+)
@@ -294,3 +294,64 @@ class ValidationMetricIdentifier(MetricIdentifier):
             metric_name=metric_id.metric_name,
             metric_kwargs_id=metric_id.metric_kwargs_id,
         )
+
+
+class BatchMetricIdentifier(MetricIdentifier):
+    """A BatchMetricIdentifier serves as a key to store and retrieve the value of a metric computed for a particular
+    Batch of data (identified by its batch_id)."""
+
+    def __init__(
+        self, batch_id, metric_name, metric_domain_kwargs_id, metric_value_kwargs_id
+    ) -> None:
+        super().__init__(metric_name, metric_value_kwargs_id)
+        self._batch_id = batch_id
+        self._metric_domain_kwargs_id = metric_domain_kwargs_id
+
+    @property
+    def batch_id(self):
+        return self._batch_id
+
+    @property
+    def metric_domain_kwargs_id(self):
+        return self._metric_domain_kwargs_id
+
+    @property
+    def metric_value_kwargs_id(self):
+        return self._metric_kwargs_id
+
+    @classmethod
+    def from_metric_configuration(cls, metric_configuration):
+        return cls(
+            batch_id=metric_configuration.metric_domain_kwargs["batch_id"],
+            metric_name=metric_configuration.metric_name,
+            metric_domain_kwargs_id=metric_configuration.metric_domain_kwargs_id,
+            metric_value_kwargs_id=metric_configuration.metric_value_kwargs_id,
+        )
+
+    def to_tuple(self):
+        return (
+            self.batch_id,
+            self.metric_name,
+            self.metric_domain_kwargs_id or "__",
+            self.metric_value_kwargs_id or "__",
+        )
+
+    def to_fixed_length_tuple(self):
+        return self.to_tuple()
+
+    @classmethod
+    def from_tuple(cls, tuple_):
+        if len(tuple_) != 4:
+            raise GreatExpectationsError(
+                "BatchMetricIdentifier tuple must have exactly four components."
+            )
+        return cls(
+            batch_id=tuple_[0],
+            metric_name=tuple_[1],
+            metric_domain_kwargs_id=None if tuple_[2] == "__" else tuple_[2],
+            metric_value_kwargs_id=None if tuple_[3] == "__" else tuple_[3],
+        )
+
+    @classmethod
+    def from_fixed_length_tuple(cls, tuple_):
+        return cls.from_tuple(tuple_)
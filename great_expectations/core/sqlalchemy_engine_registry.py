@@ -0,0 +1,227 @@
+"""
+Process-wide registry of SqlAlchemy engines, so that execution engines, datasources and stores connecting to the same
+database with the same options share one engine (and therefore one connection pool).
+
+WARNING: This module is experimental.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy.engine.url import make_url
+except ImportError:
+    sa = None
+    make_url = None
+
+
+class PoolStatistics:
+    """Connection checkout statistics of a SqlAlchemy engine's connection pool.
+
+    The wait time of a checkout is the time spent obtaining a connection from the pool, which includes waiting for a
+    connection to be returned to an exhausted pool as well as opening (and authenticating) new connections.
+
+    WARNING: This class is experimental.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self._checkouts += 1
+            self._total_wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+
+    @property
+    def checkouts(self) -> int:
+        return self._checkouts
+
+    @property
+    def total_wait_seconds(self) -> float:
+        return self._total_wait_seconds
+
+    @property
+    def max_wait_seconds(self) -> float:
+        return self._max_wait_seconds
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        if self._checkouts == 0:
+            return 0.0
+        return self._total_wait_seconds / self._checkouts
+
+    def to_json_dict(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "total_wait_seconds": self.total_wait_seconds,
+            "mean_wait_seconds": self.mean_wait_seconds,
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+
+class _RegisteredEngine:
+    def __init__(self, engine: "sa.engine.Engine", key: Optional[Tuple]) -> None:
+        self.engine = engine
+        self.key = key
+        self.references = 1
+        self.pool_statistics = PoolStatistics()
+
+
+class SqlAlchemyEngineRegistry:
+    """Creates SqlAlchemy engines, reusing the engine already created for the same URL (including its credentials)
+    and create_engine() options, such as "pool_size", "max_overflow", "pool_pre_ping" or "pool_recycle".
+
+    Engines are reference counted: every get_engine() call must be matched by a release_engine() call, and an engine
+    is only disposed of once it is no longer referenced.  Engines for in-memory sqlite databases (each of which is a
+    distinct database) and engines built with options that cannot be compared (e.g. a "creator" function) are never
+    shared.
+
+    WARNING: This class is experimental.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._engines_by_key: Dict[Tuple, _RegisteredEngine] = {}
+        self._engines_by_id: Dict[int, _RegisteredEngine] = {}
+
+    def get_engine(
+        self, url: Union[str, "sa.engine.url.URL"], **kwargs
+    ) -> "sa.engine.Engine":
+        """Return an engine for the given URL and create_engine() options, creating it if necessary."""
+        key: Optional[Tuple] = self._get_engine_key(url=url, kwargs=kwargs)
+        with self._lock:
+            registered_engine: Optional[_RegisteredEngine] = (
+                None if key is None else self._engines_by_key.get(key)
+            )
+            if registered_engine is not None:
+                registered_engine.references += 1
+                return registered_engine.engine
+
+            engine = sa.create_engine(url, **kwargs)
+            registered_engine = _RegisteredEngine(engine=engine, key=key)
+            self._instrument_engine(registered_engine)
+            if key is not None:
+                self._engines_by_key[key] = registered_engine
+            self._engines_by_id[id(engine)] = registered_engine
+            return engine
+
+    def release_engine(self, engine: "sa.engine.Engine") -> None:
+        """Release a reference to an engine obtained from get_engine(), disposing of it if it is no longer used.
+
+        Engines that were not created by this registry are disposed of immediately.
+        """
+        with self._lock:
+            registered_engine: Optional[_RegisteredEngine] = self._engines_by_id.get(
+                id(engine)
+            )
+            if registered_engine is None or registered_engine.engine is not engine:
+                engine.dispose()
+                return
+
+            registered_engine.references -= 1
+            if registered_engine.references > 0:
+                return
+
+            del self._engines_by_id[id(engine)]
+            if registered_engine.key is not None:
+                del self._engines_by_key[registered_engine.key]
+
+        logger.debug(
+            f"Disposing of SqlAlchemy engine {engine.url!r}; connection pool statistics: "
+            f"{registered_engine.pool_statistics.to_json_dict()}"
+        )
+        engine.dispose()
+
+    def get_pool_statistics(
+        self, engine: "sa.engine.Engine"
+    ) -> Optional[PoolStatistics]:
+        """Return the connection pool statistics of an engine obtained from get_engine() (None for other engines)."""
+        registered_engine: Optional[_RegisteredEngine] = self._engines_by_id.get(
+            id(engine)
+        )
+        if registered_engine is None or registered_engine.engine is not engine:
+            return None
+        return registered_engine.pool_statistics
+
+    def clear(self) -> None:
+        """Dispose of all the engines of the registry, whether or not they are still referenced."""
+        with self._lock:
+            registered_engines = list(self._engines_by_id.values())
+            self._engines_by_key = {}
+            self._engines_by_id = {}
+        for registered_engine in registered_engines:
+            registered_engine.engine.dispose()
+
+    @staticmethod
+    def _get_engine_key(
+        url: Union[str, "sa.engine.url.URL"], kwargs: Dict[str, Any]
+    ) -> Optional[Tuple]:
+        try:
+            parsed_url = make_url(url)
+        except Exception:
+            return None
+
+        if parsed_url.get_backend_name() == "sqlite" and (
+            parsed_url.database in (None, "", ":memory:")
+            or parsed_url.query.get("mode") == "memory"
+        ):
+            return None
+
+        if not SqlAlchemyEngineRegistry._is_comparable(kwargs):
+            return None
+
+        if hasattr(parsed_url, "render_as_string"):
+            rendered_url = parsed_url.render_as_string(hide_password=False)
+        else:
+            rendered_url = parsed_url.__to_string__(hide_password=False)
+
+        return rendered_url, repr(sorted(kwargs.items()))
+
+    @staticmethod
+    def _is_comparable(value: Any) -> bool:
+        if value is None or isinstance(value, (bool, int, float, str, bytes)):
+            return True
+        if isinstance(value, (list, tuple)):
+            return all(SqlAlchemyEngineRegistry._is_comparable(item) for item in value)
+        if isinstance(value, dict):
+            return all(
+                isinstance(key, str) and SqlAlchemyEngineRegistry._is_comparable(item)
+                for key, item in value.items()
+            )
+        return False
+
+    @staticmethod
+    def _instrument_engine(registered_engine: _RegisteredEngine) -> None:
+        pool_statistics: PoolStatistics = registered_engine.pool_statistics
+
+        def instrument_pool(pool: "sa.pool.Pool") -> None:
+            connect = pool.connect
+
+            def timed_connect(*args, **kwargs):
+                start: float = time.perf_counter()
+                try:
+                    return connect(*args, **kwargs)
+                finally:
+                    pool_statistics.record_checkout(time.perf_counter() - start)
+
+            pool.connect = timed_connect
+
+        instrument_pool(registered_engine.engine.pool)
+        # Engine.dispose() replaces the pool of the engine with a new one.
+        sa.event.listen(
+            registered_engine.engine,
+            "engine_disposed",
+            lambda engine: instrument_pool(engine.pool),
+        )
+
+
+sqlalchemy_engine_registry = SqlAlchemyEngineRegistry()
@@ -0,0 +1,428 @@
+"""
+Process-wide cache of database catalog metadata (schema, table, view and column names and types), so that metrics,
+data connectors and column reflection do not repeat slow catalog queries for every batch and every validator.
+
+WARNING: This module is experimental.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy.engine.url import make_url
+except ImportError:
+    sa = None
+    make_url = None
+
+# Metadata is only cached for databases (or caches) configured with a positive TTL.
+DEFAULT_TTL_SECONDS = 0.0
+
+# Maximum number of cached entries (expired entries, then the oldest ones, are discarded beyond it).
+DEFAULT_MAX_ENTRIES = 10000
+
+# Temporary tables created for batches are only used once, so their columns are not cached.
+TEMPORARY_TABLE_NAME_PREFIX = "ge_temp_"
+
+# Dialects whose catalog can be read from the ANSI "information_schema.columns" view.
+INFORMATION_SCHEMA_DIALECT_NAMES = (
+    "mssql",
+    "mysql",
+    "postgresql",
+    "redshift",
+    "snowflake",
+    "trino",
+)
+
+
+class SqlAlchemyMetadataCache:
+    """Caches the results of catalog queries (SqlAlchemy Inspector calls and column reflection) by database URL, kind
+    of metadata, schema and table, for at most "ttl_seconds" seconds.
+
+    Caching is disabled unless enabled for a database with set_database_ttl_seconds() (as SqlAlchemyExecutionEngine
+    does when configured with "metadata_cache_ttl_seconds"), or for all databases with a positive "ttl_seconds".
+
+    Engines (or connections) to the same database URL share cached metadata; metadata of in-memory sqlite databases
+    (each of which is a distinct database) is never cached.  Metadata is not refreshed when tables are altered: call
+    invalidate() after changing the structure of a table.  At most "max_entries" entries are kept.
+
+    WARNING: This class is experimental.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._ttl_seconds_by_database: Dict[Hashable, float] = {}
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds
+
+    @ttl_seconds.setter
+    def ttl_seconds(self, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+
+    def set_database_ttl_seconds(
+        self, engine: "sa.engine.Engine", ttl_seconds: float
+    ) -> None:
+        """Cache the metadata of the engine's database for "ttl_seconds" seconds (0 disables caching for it)."""
+        engine_key: Optional[Hashable] = self._get_engine_key(engine=engine)
+        if engine_key is None:
+            return
+
+        with self._lock:
+            self._ttl_seconds_by_database[engine_key] = ttl_seconds
+
+    def _get_ttl_seconds(self, key: Tuple) -> float:
+        return self._ttl_seconds_by_database.get(key[0], self._ttl_seconds)
+
+    def get(
+        self,
+        engine: "sa.engine.Engine",
+        metadata_type: str,
+        loader: Callable[[], Any],
+        schema_name: Optional[str] = None,
+        table_name: Optional[str] = None,
+    ) -> Any:
+        """Return the cached metadata of the given type for a schema and/or table, calling "loader" to obtain it (and
+        caching its result) if it is not cached or has expired.  Exceptions raised by "loader" are not cached."""
+        key: Optional[Tuple] = self._get_key(
+            engine=engine,
+            metadata_type=metadata_type,
+            schema_name=schema_name,
+            table_name=table_name,
+        )
+        if key is None:
+            return loader()
+
+        ttl_seconds: float = self._get_ttl_seconds(key=key)
+        if ttl_seconds <= 0:
+            return loader()
+
+        with self._lock:
+            entry: Optional[Tuple[float, Any]] = self._entries.get(key)
+            if entry is not None:
+                if time.monotonic() < entry[0]:
+                    return self._copy(entry[1])
+
+                del self._entries[key]
+
+        value: Any = loader()
+        self._set(key=key, value=value, ttl_seconds=ttl_seconds)
+        return self._copy(value)
+
+    def get_schema_names(self, engine: "sa.engine.Engine") -> List[str]:
+        return self.get(
+            engine=engine,
+            metadata_type="schema_names",
+            loader=lambda: sa.inspect(engine).get_schema_names(),
+        )
+
+    def get_table_names(
+        self, engine: "sa.engine.Engine", schema_name: Optional[str] = None
+    ) -> List[str]:
+        return self.get(
+            engine=engine,
+            metadata_type="table_names",
+            loader=lambda: sa.inspect(engine).get_table_names(schema=schema_name),
+            schema_name=schema_name,
+        )
+
+    def get_view_names(
+        self, engine: "sa.engine.Engine", schema_name: Optional[str] = None
+    ) -> List[str]:
+        return self.get(
+            engine=engine,
+            metadata_type="view_names",
+            loader=lambda: sa.inspect(engine).get_view_names(schema=schema_name),
+            schema_name=schema_name,
+        )
+
+    def get_columns(
+        self,
+        engine: "sa.engine.Engine",
+        table_name: str,
+        schema_name: Optional[str] = None,
+        loader: Optional[Callable[[], List[Dict[str, Any]]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the columns of a table, in the format of SqlAlchemy's Inspector.get_columns() (which is used to
+        reflect them unless another "loader" is provided)."""
+        if loader is None:
+            loader = lambda: sa.inspect(engine).get_columns(  # noqa: E731
+                table_name, schema=schema_name
+            )
+
+        if table_name.lstrip("#").startswith(TEMPORARY_TABLE_NAME_PREFIX):
+            return loader()
+
+        return self.get(
+            engine=engine,
+            metadata_type="columns",
+            loader=loader,
+            schema_name=schema_name,
+            table_name=table_name,
+        )
+
+    def prefetch_columns(
+        self, engine: "sa.engine.Engine", schema_name: Optional[str] = None
+    ) -> int:
+        """Cache the columns of all the tables and views of a schema at once, so that subsequent calls to
+        get_columns() for these tables (with the same "schema_name") do not query the database.
+
+        For databases providing "information_schema.columns", a single query is issued for the whole schema (tables
+        with types that the SqlAlchemy dialect cannot map are left to be reflected individually); other databases are
+        reflected one table at a time.
+
+        Returns:
+            The number of tables and views whose columns were cached.
+        """
+        key: Optional[Tuple] = self._get_key(
+            engine=engine, metadata_type="columns", schema_name=schema_name
+        )
+        if key is None:
+            return 0
+
+        ttl_seconds: float = self._get_ttl_seconds(key=key)
+        if ttl_seconds <= 0:
+            return 0
+
+        columns_by_table_name: Dict[str, List[Dict[str, Any]]]
+        dialect_name: str = engine.dialect.name.lower()
+        if schema_name is not None and dialect_name in INFORMATION_SCHEMA_DIALECT_NAMES:
+            columns_by_table_name = self._get_columns_from_information_schema(
+                engine=engine, schema_name=schema_name
+            )
+        else:
+            inspector = sa.inspect(engine)
+            columns_by_table_name = {
+                table_name: inspector.get_columns(table_name, schema=schema_name)
+                for table_name in inspector.get_table_names(schema=schema_name)
+                + inspector.get_view_names(schema=schema_name)
+            }
+
+        table_name: str
+        columns: List[Dict[str, Any]]
+        for table_name, columns in columns_by_table_name.items():
+            self._set(
+                key=(*key[:-1], table_name), value=columns, ttl_seconds=ttl_seconds
+            )
+
+        logger.debug(
+            f"Cached the columns of {len(columns_by_table_name)} tables of schema {schema_name}"
+        )
+        return len(columns_by_table_name)
+
+    def invalidate(
+        self,
+        engine: Optional["sa.engine.Engine"] = None,
+        schema_name: Optional[str] = None,
+        table_name: Optional[str] = None,
+    ) -> None:
+        """Discard cached metadata: all of it if no engine is given, otherwise that of the engine's database, optionally
+        restricted to a schema and/or table (the lists of schema, table and view names are always discarded)."""
+        if engine is None:
+            self.clear()
+            return
+
+        engine_key: Optional[Hashable] = self._get_engine_key(engine=engine)
+        if engine_key is None:
+            return
+
+        with self._lock:
+            key: Tuple
+            for key in list(self._entries):
+                if key[0] != engine_key:
+                    continue
+
+                _, metadata_type, key_schema_name, key_table_name = key
+                if metadata_type == "columns" and (
+                    (schema_name is not None and key_schema_name != schema_name)
+                    or (table_name is not None and key_table_name != table_name)
+                ):
+                    continue
+
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+
+    def _set(self, key: Tuple, value: Any, ttl_seconds: float) -> None:
+        now: float = time.monotonic()
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self._max_entries:
+                self._evict_entries(now=now)
+
+            self._entries[key] = (now + ttl_seconds, self._copy(value))
+
+    def _evict_entries(self, now: float) -> None:
+        # Discard expired entries, and then the oldest entries, down to 90% of the maximum number of entries (so that
+        # entries are not evicted one by one on every write).
+        self._entries = {
+            key: entry for key, entry in self._entries.items() if now < entry[0]
+        }
+        num_entries_to_evict: int = len(self._entries) - int(self._max_entries * 0.9)
+        key: Tuple
+        for key in list(self._entries)[: max(num_entries_to_evict, 0)]:
+            del self._entries[key]
+
+    @staticmethod
+    def _get_columns_from_information_schema(
+        engine: "sa.engine.Engine", schema_name: str
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        dialect = engine.dialect
+        requires_name_normalize: bool = getattr(
+            dialect, "requires_name_normalize", False
+        )
+
+        columns_table = sa.table(
+            "columns",
+            sa.column("table_schema"),
+            sa.column("table_name"),
+            sa.column("column_name"),
+            sa.column("data_type"),
+            sa.column("is_nullable"),
+            sa.column("column_default"),
+            sa.column("ordinal_position"),
+            schema="information_schema",
+        )
+        query = (
+            sa.select(
+                [
+                    columns_table.c.table_name,
+                    columns_table.c.column_name,
+                    columns_table.c.data_type,
+                    columns_table.c.is_nullable,
+                    columns_table.c.column_default,
+                ]
+            )
+            .where(
+                columns_table.c.table_schema
+                == (
+                    dialect.denormalize_name(schema_name)
+                    if requires_name_normalize
+                    else schema_name
+                )
+            )
+            .order_by(columns_table.c.table_name, columns_table.c.ordinal_position)
+        )
+        rows: List[Tuple] = [tuple(row) for row in engine.execute(query).fetchall()]
+
+        if requires_name_normalize:
+            rows = [
+                (dialect.normalize_name(row[0]), dialect.normalize_name(row[1]))
+                + row[2:]
+                for row in rows
+            ]
+
+        return SqlAlchemyMetadataCache._build_columns_from_information_schema_rows(
+            dialect=dialect, rows=rows
+        )
+
+    @staticmethod
+    def _build_columns_from_information_schema_rows(
+        dialect: "sa.engine.Dialect", rows: List[Tuple]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Build Inspector.get_columns()-like column dictionaries from (table_name, column_name, data_type,
+        is_nullable, column_default) rows, skipping the tables of columns whose type the dialect cannot map."""
+        ischema_names: Dict[str, Any] = getattr(dialect, "ischema_names", {})
+
+        columns_by_table_name: Dict[str, List[Dict[str, Any]]] = {}
+        unmapped_table_names: set = set()
+
+        table_name: str
+        column_name: str
+        data_type: str
+        is_nullable: str
+        column_default: Optional[str]
+        for table_name, column_name, data_type, is_nullable, column_default in rows:
+            type_class: Optional[Any] = None
+            if data_type is not None:
+                type_class = (
+                    ischema_names.get(data_type)
+                    or ischema_names.get(data_type.lower())
+                    or ischema_names.get(data_type.upper())
+                )
+
+            if type_class is None:
+                unmapped_table_names.add(table_name)
+                continue
+
+            columns_by_table_name.setdefault(table_name, []).append(
+                {
+                    "name": column_name,
+                    "type": type_class()
+                    if isinstance(type_class, type)
+                    else type_class,
+                    "nullable": str(is_nullable).upper() == "YES",
+                    "default": column_default,
+                }
+            )
+
+        for table_name in unmapped_table_names:
+            logger.debug(
+                f'Columns of table "{table_name}" have types that could not be mapped, and will be reflected individually'
+            )
+            columns_by_table_name.pop(table_name, None)
+
+        return columns_by_table_name
+
+    @staticmethod
+    def _get_key(
+        engine: "sa.engine.Engine",
+        metadata_type: str,
+        schema_name: Optional[str] = None,
+        table_name: Optional[str] = None,
+    ) -> Optional[Tuple]:
+        engine_key: Optional[Hashable] = SqlAlchemyMetadataCache._get_engine_key(
+            engine=engine
+        )
+        if engine_key is None:
+            return None
+
+        return engine_key, metadata_type, schema_name, table_name
+
+    @staticmethod
+    def _get_engine_key(engine: "sa.engine.Engine") -> Optional[Hashable]:
+        # Execution engines sometimes hold a connection rather than an engine.
+        url = getattr(getattr(engine, "engine", engine), "url", None)
+        if url is None:
+            return None
+
+        try:
+            parsed_url = make_url(url)
+        except Exception:
+            return None
+
+        if parsed_url.get_backend_name() == "sqlite" and (
+            parsed_url.database in (None, "", ":memory:")
+            or parsed_url.query.get("mode") == "memory"
+        ):
+            return None
+
+        if hasattr(parsed_url, "render_as_string"):
+            return parsed_url.render_as_string(hide_password=False)
+
+        return parsed_url.__to_string__(hide_password=False)
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        # Callers may modify the lists (and column dictionaries) they are given.
+        if isinstance(value, list):
+            return [dict(item) if isinstance(item, dict) else item for item in value]
+
+        return value
+
+
+sqlalchemy_metadata_cache = SqlAlchemyMetadataCache()
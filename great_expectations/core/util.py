@@ -161,6 +161,10 @@ def determine_progress_bar_method_by_environment() -> Callable:
     return tqdm
 
 
+# Values of these (exact) types are returned by "convert_to_json_serializable()" unchanged.
+_JSON_NATIVE_SCALAR_TYPES = frozenset({str, int, bool, type(None)})
+
+
 def convert_to_json_serializable(data):  # noqa: C901 - complexity 28
     """
     Helper function to convert an object to one that is json serializable
@@ -172,6 +176,14 @@ def convert_to_json_serializable(data):  # noqa: C901 - complexity 28
         test_obj may also be converted in place.
     """
 
+    # Fast path for the (by far) most common values; exact type checks leave subclasses to the general handling below.
+    data_type: type = type(data)
+    if data_type in _JSON_NATIVE_SCALAR_TYPES:
+        return data
+
+    if data_type is float:
+        return None if data != data else data
+
     # If it's one of our types, we use our own conversion; this can move to full schema
     # once nesting goes all the way down
     if isinstance(data, (SerializableDictDot, SerializableDotDict)):
@@ -194,11 +206,7 @@ def convert_to_json_serializable(data):  # noqa: C901 - complexity 28
         return new_dict
 
     if isinstance(data, (list, tuple, set)):
-        new_list = []
-        for val in data:
-            new_list.append(convert_to_json_serializable(val))
-
-        return new_list
+        return [convert_to_json_serializable(val) for val in data]
 
     if isinstance(data, (np.ndarray, pd.Index)):
         # test_obj[key] = test_obj[key].tolist()
@@ -174,6 +174,10 @@ class AbstractDataContext(ABC):
         self._variables: Optional[DataContextVariables] = None
         self._config_variables: Optional[dict] = None
 
+        # Memoized results of config variable substitution (see "_invalidate_config_substitution_cache()").
+        self._substitutions_cache: Dict[str, Any] = {}
+        self._config_substitution_cache: Dict[Optional[str], Tuple[Any, dict, Any]] = {}
+
         # Init plugin support
         if self.plugins_directory is not None and os.path.exists(
             self.plugins_directory
@@ -187,6 +191,7 @@ class AbstractDataContext(ABC):
         )
         # Init stores
         self._stores: dict = {}
+        # Substituting the whole config (rather than only its "stores" section) surfaces missing variables early.
         self._init_stores(self.project_config_with_variables_substituted.stores)  # type: ignore[arg-type]
 
         # Init data_context_id
@@ -255,6 +260,7 @@ class AbstractDataContext(ABC):
         """
         if not self._config_variables:
             self._config_variables = self._load_config_variables()
+            self._invalidate_config_substitution_cache()
         return self._config_variables
 
     @property
@@ -460,6 +466,7 @@ class AbstractDataContext(ABC):
     def set_config(self, project_config: DataContextConfig) -> None:
         self._project_config = project_config
         self.variables.config = project_config
+        self._invalidate_config_substitution_cache()
 
     def save_datasource(
         self, datasource: Union[LegacyDatasource, BaseDatasource]
@@ -491,6 +498,7 @@ class AbstractDataContext(ABC):
         )
         # Use the updated datasource config, since the store may populate additional info on update.
         self.config.datasources[datasource_name] = updated_datasource_config_from_store  # type: ignore[index,assignment]
+        self._invalidate_config_substitution_cache()
 
         # Also use the updated config to initialize a datasource for the cache and overwrite the existing datasource.
         substituted_config = self._perform_substitutions_on_datasource_config(
@@ -561,14 +569,101 @@ class AbstractDataContext(ABC):
         if not config:
             config = self._project_config
 
-        substitutions: dict = self._determine_substitutions()
+        substitutions: dict = self._determine_config_substitutions()
 
-        return DataContextConfig(
-            **substitute_all_config_variables(
-                config, substitutions, self.DOLLAR_SIGN_ESCAPE_STRING
-            )
+        return self._substitute_config_variables_with_cache(
+            config=config, substitutions=substitutions
+        )
+
+    def get_config_section_with_variables_substituted(
+        self, section: str, config: Optional[DataContextConfig] = None
+    ) -> Any:
+        """
+        Substitute vars in a single top-level section of config (e.g., "stores" or "datasources"), leaving the rest of
+        the config untouched.  The same substitutions as in "get_config_with_variables_substituted()" are applied.
+
+        Args:
+            section: name of the top-level DataContextConfig key to substitute
+            config: config to use instead of the project config
+
+        Returns:
+            The serialized section of config with all variables substituted (None if the section is not set).
+        """
+        if not config:
+            config = self._project_config
+
+        substitutions: dict = self._determine_config_substitutions()
+
+        return self._substitute_config_variables_with_cache(
+            config=config, substitutions=substitutions, section=section
+        )
+
+    def _substitute_config_variables_with_cache(
+        self,
+        config: DataContextConfig,
+        substitutions: dict,
+        section: Optional[str] = None,
+    ) -> Any:
+        """Memoized "substitute_all_config_variables()" over config (or one of its top-level sections).
+
+        The cached result is reused for as long as the same config (with the same top-level values) is substituted with
+        the same substitutions.  Changes made in place to the values of config are not detected; the methods of this
+        DataContext that make them invalidate the cache (see "_invalidate_config_substitution_cache()").
+
+        Args:
+            config: config to substitute
+            substitutions: variables available for substitution (see "_determine_substitutions()")
+            section: name of the top-level key of config to substitute; if None, the whole config is substituted
+
+        Returns:
+            A DataContextConfig (if section is None); otherwise the serialized section with variables substituted.  The
+            result is a copy, which callers are free to modify.
+        """
+        # Top-level values of config, which are replaced (rather than changed in place) by "DataContextVariables" setters.
+        config_values: Any = (
+            tuple(vars(config).values())
+            if section is None
+            else getattr(config, section, None)
         )
 
+        cached: Optional[Tuple[Any, dict, Any]] = self._config_substitution_cache.get(
+            section
+        )
+        if not (
+            cached is not None
+            and (cached[0] is config_values or cached[0] == config_values)
+            and cached[1] == substitutions
+        ):
+            substituted_config: Any
+            if section is None:
+                substituted_config = DataContextConfig(
+                    **substitute_all_config_variables(
+                        config, substitutions, self.DOLLAR_SIGN_ESCAPE_STRING
+                    )
+                )
+            else:
+                schema = config.get_schema_class()(only=(section,))
+                substituted_config = substitute_all_config_variables(
+                    schema.dump(config).get(section),
+                    substitutions,
+                    self.DOLLAR_SIGN_ESCAPE_STRING,
+                )
+
+            cached = (config_values, dict(substitutions), substituted_config)
+            self._config_substitution_cache[section] = cached
+
+        # Results are handed out as copies, since consumers (e.g., store initialization) amend them in place.
+        return copy.deepcopy(cached[2])
+
+    def _invalidate_config_substitution_cache(self) -> None:
+        """Discards the memoized results of config variable substitution.
+
+        Must be called whenever the project config or the config variables are changed in place, e.g., when adding a
+        Datasource or a Store to the project config.
+        """
+        self._substitutions_cache.clear()
+        self._config_substitution_cache.clear()
+
     def list_stores(self) -> List[Store]:
         """List currently-configured Stores on this context"""
         stores = []
@@ -725,6 +820,7 @@ class AbstractDataContext(ABC):
             self._datasource_store.delete_by_name(datasource_name)  # type: ignore[attr-defined]
         self._cached_datasources.pop(datasource_name, None)
         self.config.datasources.pop(datasource_name, None)  # type: ignore[union-attr]
+        self._invalidate_config_substitution_cache()
 
     def add_checkpoint(
         self,
@@ -1613,6 +1709,7 @@ class AbstractDataContext(ABC):
         (example is add_datasource())
         """
         self._config_variables = self._load_config_variables()
+        self._invalidate_config_substitution_cache()
 
     def _determine_substitutions(self) -> Dict:
         """Aggregates substitutions from the project's config variables file, any environment variables, and
@@ -1621,19 +1718,40 @@ class AbstractDataContext(ABC):
         Returns: A dictionary containing all possible substitutions that can be applied to a given object
                  using `substitute_all_config_variables`.
         """
+        environment: dict = dict(os.environ)
+        if (
+            self._substitutions_cache
+            and self._substitutions_cache["environment"] == environment
+            and self._substitutions_cache["runtime_environment"]
+            == self.runtime_environment
+        ):
+            # Callers are free to modify the returned dictionary (e.g., to add defaults), hence the copy.
+            return dict(self._substitutions_cache["substitutions"])
+
         substituted_config_variables: dict = substitute_all_config_variables(
             self.config_variables,
-            dict(os.environ),
+            environment,
             self.DOLLAR_SIGN_ESCAPE_STRING,
         )
 
         substitutions: dict = {
             **substituted_config_variables,
-            **dict(os.environ),
+            **environment,
             **self.runtime_environment,
         }
 
-        return substitutions
+        self._substitutions_cache.update(
+            environment=environment,
+            runtime_environment=dict(self.runtime_environment),
+            substitutions=substitutions,
+        )
+        return dict(substitutions)
+
+    def _determine_config_substitutions(self) -> Dict:
+        """Determines the substitutions applied to the project config itself; by default, these are the same as those
+        returned by `_determine_substitutions` (child classes may supply defaults for optional variables).
+        """
+        return self._determine_substitutions()
 
     def _initialize_usage_statistics(
         self, usage_statistics_config: AnonymizedUsageStatisticsConfig
@@ -1652,11 +1770,11 @@ class AbstractDataContext(ABC):
 
     def _init_datasources(self) -> None:
         """Initialize the datasources in store"""
-        config: DataContextConfig = self.get_config_with_variables_substituted(
-            self.config
-        )
         datasources: Dict[str, DatasourceConfig] = cast(
-            Dict[str, DatasourceConfig], config.datasources
+            Dict[str, DatasourceConfig],
+            self.get_config_section_with_variables_substituted(
+                section="datasources", config=self.config
+            ),
         )
 
         for datasource_name, datasource_config in datasources.items():
@@ -1784,6 +1902,7 @@ class AbstractDataContext(ABC):
             config = self._datasource_store.set(key=None, value=config)  # type: ignore[attr-defined]
 
         self.config.datasources[config.name] = config  # type: ignore[index,assignment]
+        self._invalidate_config_substitution_cache()
 
         substituted_config = self._perform_substitutions_on_datasource_config(config)
 
@@ -1800,6 +1919,7 @@ class AbstractDataContext(ABC):
                     self._datasource_store.delete(config)  # type: ignore[attr-defined]
                 # If the DatasourceStore uses an InlineStoreBackend, the config may already be updated
                 self.config.datasources.pop(config.name, None)  # type: ignore[union-attr,arg-type]
+                self._invalidate_config_substitution_cache()
                 raise e
 
         return datasource
@@ -1859,6 +1979,8 @@ class AbstractDataContext(ABC):
             "data_asset_name"
         )
 
+        # The metrics of the validation are written at once, letting the store write them in a single transaction.
+        metrics_to_store: List[Tuple[ValidationMetricIdentifier, Any]] = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (
                 expectation_suite_dependency != expectation_suite_name
@@ -1882,19 +2004,21 @@ class AbstractDataContext(ABC):
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
-                            ValidationMetricIdentifier(
-                                run_id=run_id,
-                                data_asset_name=data_asset_name,
-                                expectation_suite_identifier=ExpectationSuiteIdentifier(
-                                    expectation_suite_name
-                                ),
-                                metric_name=metric_name,
-                                metric_kwargs_id=get_metric_kwargs_id(
-                                    metric_name, metric_kwargs
+                        metrics_to_store.append(
+                            (
+                                ValidationMetricIdentifier(
+                                    run_id=run_id,
+                                    data_asset_name=data_asset_name,
+                                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                                        expectation_suite_name
+                                    ),
+                                    metric_name=metric_name,
+                                    metric_kwargs_id=get_metric_kwargs_id(
+                                        metric_name, metric_kwargs
+                                    ),
                                 ),
-                            ),
-                            metric_value,
+                                metric_value,
+                            )
                         )
                     except ge_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
@@ -1903,6 +2027,9 @@ class AbstractDataContext(ABC):
                             "this validation result.".format(metric_name)
                         )
 
+        if metrics_to_store:
+            self.stores[target_store_name].set_many(metrics_to_store)
+
     def send_usage_message(
         self, event: str, event_payload: Optional[dict], success: Optional[bool] = None
     ) -> None:
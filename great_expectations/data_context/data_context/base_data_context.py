@@ -374,6 +374,9 @@ class BaseDataContext(EphemeralDataContext, ConfigPeer):
         self._project_config = self._data_context._project_config  # type: ignore[union-attr]
         self.runtime_environment = self._data_context.runtime_environment or {}  # type: ignore[union-attr]
         self._config_variables = self._data_context.config_variables  # type: ignore[union-attr]
+        # Caches are shared (and invalidated in place), so that changes made through either context invalidate both.
+        self._substitutions_cache = self._data_context._substitutions_cache  # type: ignore[union-attr]
+        self._config_substitution_cache = self._data_context._config_substitution_cache  # type: ignore[union-attr]
         self._in_memory_instance_id = self._data_context._in_memory_instance_id  # type: ignore[union-attr]
         self._stores = self._data_context._stores  # type: ignore[union-attr]
         self._datasource_store = self._data_context._datasource_store  # type: ignore[union-attr]
@@ -412,6 +415,7 @@ class BaseDataContext(EphemeralDataContext, ConfigPeer):
         """
 
         self.config.stores[store_name] = store_config  # type: ignore[index]
+        self._invalidate_config_substitution_cache()
         return self._build_store_from_config(store_name, store_config)
 
     def add_validation_operator(
@@ -430,6 +434,7 @@ class BaseDataContext(EphemeralDataContext, ConfigPeer):
         self.config.validation_operators[
             validation_operator_name
         ] = validation_operator_config
+        self._invalidate_config_substitution_cache()
         config = self.variables.validation_operators[validation_operator_name]  # type: ignore[index]
         module_name = "great_expectations.validation_operators"
         new_validation_operator = instantiate_class_from_config(
@@ -645,6 +650,7 @@ class BaseDataContext(EphemeralDataContext, ConfigPeer):
             skip_if_substitution_variable=skip_if_substitution_variable,
         )
         config_variables[config_variable_name] = value
+        self._invalidate_config_substitution_cache()
         # Required to call _variables instead of variables property because we don't want to trigger substitutions
         config = self._variables.config
         config_variables_filepath = config.config_variables_file_path
@@ -1310,6 +1316,7 @@ class BaseDataContext(EphemeralDataContext, ConfigPeer):
                 datasource_name=datasource_name, datasource_config=datasource_config
             )
         self.config.datasources[datasource_name] = datasource_config  # type: ignore[assignment,index]
+        self._invalidate_config_substitution_cache()
         self._cached_datasources[datasource_name] = datasource_config
 
     def add_batch_kwargs_generator(
@@ -2653,6 +2660,7 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
         )
         store_name = instantiated_class.store_name or store_name
         self.config.stores[store_name] = config  # type: ignore[index]
+        self._invalidate_config_substitution_cache()
 
         anonymizer = Anonymizer(self.data_context_id)
         usage_stats_event_payload = anonymizer.anonymize(
@@ -27,7 +27,6 @@ from great_expectations.data_context.types.base import (
 )
 from great_expectations.data_context.types.refs import GeCloudResourceRef
 from great_expectations.data_context.types.resource_identifiers import GeCloudIdentifier
-from great_expectations.data_context.util import substitute_all_config_variables
 from great_expectations.exceptions.exceptions import DataContextError
 
 if TYPE_CHECKING:
@@ -330,18 +329,13 @@ class CloudDataContext(AbstractDataContext):
         # if in ge_cloud_mode, use ge_cloud_organization_id
         return self.ge_cloud_config.organization_id  # type: ignore[return-value,union-attr]
 
-    def get_config_with_variables_substituted(
-        self, config: Optional[DataContextConfig] = None
-    ) -> DataContextConfig:
+    def _determine_config_substitutions(self) -> Dict:
         """
-        Substitute vars in config of form ${var} or $(var) with values found in the following places,
+        Determine values for vars in config of form ${var} or $(var) from the following places,
         in order of precedence: ge_cloud_config (for Data Contexts in GE Cloud mode), runtime_environment,
         environment variables, config_variables, or ge_cloud_config_variable_defaults (allows certain variables to
         be optional in GE Cloud mode).
         """
-        if not config:
-            config = self.config
-
         substitutions: dict = self._determine_substitutions()
 
         ge_cloud_config_variable_defaults = {
@@ -362,11 +356,7 @@ class CloudDataContext(AbstractDataContext):
                 )
                 substitutions[config_variable] = value
 
-        return DataContextConfig(
-            **substitute_all_config_variables(
-                config, substitutions, self.DOLLAR_SIGN_ESCAPE_STRING
-            )
-        )
+        return substitutions
 
     def create_expectation_suite(
         self,
@@ -13,11 +13,13 @@ from .tuple_store_backend import (  # isort:skip
     TupleAzureBlobStoreBackend,
 )
 from .database_store_backend import DatabaseStoreBackend  # isort:skip
+from .columnar_metric_store_backend import ColumnarMetricStoreBackend  # isort:skip
 from .inline_store_backend import InlineStoreBackend  # isort:skip
 from .in_memory_store_backend import InMemoryStoreBackend  # isort:skip
 from .configuration_store import ConfigurationStore  # isort:skip
 from .checkpoint_store import CheckpointStore  # isort:skip
 from .metric_store import (  # isort:skip
+    BatchMetricStore,
     EvaluationParameterStore,
     MetricStore,
 )
@@ -1,7 +1,7 @@
 import logging
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Optional, Union
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pyparsing as pp
 
@@ -120,6 +120,17 @@ class StoreBackend(metaclass=ABCMeta):
         value = self._get(key, **kwargs)
         return value
 
+    def get_many(self, keys: Iterable[tuple], **kwargs) -> List[Any]:
+        """Retrieve the values of several keys at once.
+
+        Values are returned in the order of the requested keys; keys that do not exist in the store yield None.
+        Backends talking to a remote service may override "_get_many()" to fetch the values concurrently.
+        """
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._get_many(keys, **kwargs)
+
     def set(self, key, value, **kwargs):
         self._validate_key(key)
         self._validate_value(value)
@@ -130,6 +141,14 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def set_many(self, items: Iterable[Tuple[tuple, Any]], **kwargs) -> None:
+        """Store the values of several keys at once.
+
+        Backends writing to a database may override this method to write all the values in a single transaction.
+        """
+        for key, value in items:
+            self.set(key, value, **kwargs)
+
     def move(self, source_key, dest_key, **kwargs):
         self._validate_key(source_key)
         self._validate_key(dest_key)
@@ -192,6 +211,23 @@ class StoreBackend(metaclass=ABCMeta):
     def _has_key(self, key) -> bool:
         raise NotImplementedError
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        return [self._get_or_none(key, **kwargs) for key in keys]
+
+    def _get_or_none(self, key, **kwargs) -> Any:
+        try:
+            return self._get(key, **kwargs)
+        except InvalidKeyError:
+            return None
+
+    def iter_keys(self, prefix=()) -> Iterator:
+        """Iterate over the keys of the store, for backends that can produce them lazily (see "list_keys()")."""
+        return iter(self.list_keys(prefix))
+
+    def close(self) -> None:
+        """Release the resources (e.g., database engines and their connection pools) held by the store backend."""
+        pass
+
     def is_ignored_key(self, key):
         for ignored in self.IGNORED_FILES:
             if ignored in key:
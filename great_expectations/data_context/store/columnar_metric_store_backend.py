@@ -0,0 +1,353 @@
+import datetime
+import logging
+import os
+import uuid
+from typing import Any, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.sqlalchemy_engine_registry import (
+    sqlalchemy_engine_registry,
+)
+from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.util import filter_properties_dict
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy import Column, Index, MetaData, String, Table, Text, and_, select
+    from sqlalchemy.exc import SQLAlchemyError
+except ImportError:
+    sa = None
+
+logger = logging.getLogger(__name__)
+
+# Columns of the components of (fixed length) ValidationMetricIdentifier keys, in the order of the key tuples.
+METRIC_KEY_COLUMNS = (
+    "run_name",
+    "run_time",
+    "data_asset_name",
+    "expectation_suite_name",
+    "metric_name",
+    "metric_kwargs_id",
+)
+
+# Format of run times in ValidationMetricIdentifier keys, whose lexicographic order is their chronological order.
+RUN_TIME_FORMAT = "%Y%m%dT%H%M%S.%fZ"
+
+# Maximum number of keys looked up by a single query.
+GET_MANY_CHUNK_SIZE = 500
+
+
+class ColumnarMetricStoreBackend(StoreBackend):
+    """Stores the values of validation metrics in a database table (by default, a sqlite file) with a column per
+    component of their ValidationMetricIdentifier keys, indexed for looking up the history of a metric.
+
+    Unlike the generic DatabaseStoreBackend and tuple store backends, which store a value per key and can only list and
+    fetch keys one by one, this backend writes the metrics of a validation in a single transaction (see set_many()),
+    and returns the values of a metric over a range of run times with a single indexed query (see
+    get_metric_history()).
+
+    The database is given by "connection_string", "url" or "engine"; otherwise, "filepath" is the path of a sqlite
+    database file (relative to the root directory of the DataContext, unless it is absolute).
+
+    WARNING: This class is experimental.
+    """
+
+    def __init__(
+        self,
+        table_name: str = "ge_metrics",
+        filepath: Optional[str] = None,
+        connection_string: Optional[str] = None,
+        url: Optional[str] = None,
+        engine: Optional["sa.engine.Engine"] = None,
+        root_directory: Optional[str] = None,
+        store_name: Optional[str] = None,
+        suppress_store_backend_id: bool = False,
+        manually_initialize_store_backend_id: str = "",
+        **kwargs,
+    ) -> None:
+        super().__init__(
+            fixed_length_key=True,
+            suppress_store_backend_id=suppress_store_backend_id,
+            manually_initialize_store_backend_id=manually_initialize_store_backend_id,
+            store_name=store_name,
+        )
+        if not sa:
+            raise ge_exceptions.DataContextError(
+                "ModuleNotFoundError: No module named 'sqlalchemy'"
+            )
+
+        # The engine obtained from the engine registry (if any), to be released by close().
+        self._registered_engine = None
+
+        if engine is not None:
+            self.engine = engine
+        elif connection_string is not None or url is not None:
+            self.engine = sqlalchemy_engine_registry.get_engine(
+                connection_string or url, **kwargs
+            )
+        elif filepath is not None:
+            if not os.path.isabs(filepath):
+                if root_directory is None:
+                    raise ge_exceptions.InvalidConfigError(
+                        "filepath must be an absolute path if root_directory is not provided"
+                    )
+                filepath = os.path.join(root_directory, filepath)
+            os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+            self.engine = sqlalchemy_engine_registry.get_engine(
+                f"sqlite:///{filepath}", **kwargs
+            )
+        else:
+            raise ge_exceptions.InvalidConfigError(
+                "A filepath, url, connection_string, or an engine is required for a ColumnarMetricStoreBackend."
+            )
+
+        if engine is None:
+            self._registered_engine = self.engine
+
+        meta = MetaData()
+        self._table = Table(
+            table_name,
+            meta,
+            *(
+                Column(name, String(255), primary_key=True)
+                for name in METRIC_KEY_COLUMNS
+            ),
+            Column("value", Text),
+            # Look-ups of the history of a metric, optionally restricted to a data asset.
+            Index(
+                f"ix_{table_name}_metric_history",
+                "expectation_suite_name",
+                "metric_name",
+                "metric_kwargs_id",
+                "run_time",
+            ),
+            Index(f"ix_{table_name}_run_time", "run_time"),
+        )
+        try:
+            meta.create_all(self.engine, checkfirst=True)
+        except SQLAlchemyError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Unable to create table {table_name} because of an error. SqlAlchemyError: {str(e)}"
+            )
+
+        self._store_backend_id = None
+        self._store_backend_id = self.store_backend_id
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "table_name": table_name,
+            "filepath": filepath,
+            "connection_string": connection_string,
+            "url": url,
+            "engine": engine,
+            "store_name": store_name,
+            "suppress_store_backend_id": suppress_store_backend_id,
+            "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        self._config.update(kwargs)
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+
+    @property
+    def store_backend_id(self) -> str:
+        """
+        Create a store_backend_id if one does not exist, and return it if it exists
+        Ephemeral store_backend_id for columnar_metric_store_backend until there is a place to store metadata
+        Returns:
+            store_backend_id which is a UUID(version=4)
+        """
+        if not self._store_backend_id:
+            store_id = (
+                self._manually_initialize_store_backend_id
+                if self._manually_initialize_store_backend_id
+                else str(uuid.uuid4())
+            )
+            self._store_backend_id = f"{self.STORE_BACKEND_ID_PREFIX}{store_id}"
+        return self._store_backend_id.replace(self.STORE_BACKEND_ID_PREFIX, "")
+
+    @property
+    def store_backend_id_warnings_suppressed(self) -> str:
+        return self.store_backend_id
+
+    def close(self) -> None:
+        """Release the engine obtained from the engine registry (engines provided to the store backend are left open)."""
+        if self._registered_engine is not None:
+            engine = self._registered_engine
+            self._registered_engine = None
+            sqlalchemy_engine_registry.release_engine(engine)
+
+    def _validate_key(self, key) -> None:
+        super()._validate_key(key)
+        if len(key) != len(METRIC_KEY_COLUMNS):
+            raise TypeError(
+                f"Keys in {self.__class__.__name__} must have {len(METRIC_KEY_COLUMNS)} elements, not {len(key)}"
+            )
+
+    def _get(self, key):
+        sel = select([self._table.c.value]).where(self._key_condition(key))
+        row = self.engine.execute(sel).fetchone()
+        if row is None:
+            raise ge_exceptions.InvalidKeyError(f"Unable to fetch value for key: {key}")
+
+        return row[0]
+
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        values_by_key: dict = {}
+        start: int
+        for start in range(0, len(keys), GET_MANY_CHUNK_SIZE):
+            chunk: List[tuple] = keys[start : start + GET_MANY_CHUNK_SIZE]
+            # Rows are narrowed down with indexed columns, and matched with the keys in memory.
+            sel = select(
+                [
+                    *(self._table.c[name] for name in METRIC_KEY_COLUMNS),
+                    self._table.c.value,
+                ]
+            ).where(
+                and_(
+                    self._table.c.run_time.in_({key[1] for key in chunk}),
+                    self._table.c.metric_name.in_({key[4] for key in chunk}),
+                )
+            )
+            for row in self.engine.execute(sel).fetchall():
+                values_by_key[tuple(row[:-1])] = row[-1]
+
+        return [values_by_key.get(key) for key in keys]
+
+    def _set(self, key, value, **kwargs) -> None:
+        self.set_many([(key, value)])
+
+    def set_many(self, items: Iterable[Tuple[tuple, Any]], **kwargs) -> None:
+        """Store the values of several keys in a single transaction (replacing the values of existing keys)."""
+        rows: dict = {}
+        key: tuple
+        for key, value in items:
+            self._validate_key(key)
+            self._validate_value(value)
+            rows[key] = {**dict(zip(METRIC_KEY_COLUMNS, key)), "value": value}
+
+        if not rows:
+            return
+
+        try:
+            with self.engine.begin() as connection:
+                for key in rows:
+                    connection.execute(
+                        self._table.delete().where(self._key_condition(key))
+                    )
+                connection.execute(self._table.insert(), list(rows.values()))
+        except SQLAlchemyError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Unable to store {len(rows)} metrics: got sqlalchemy error {str(e)}"
+            )
+
+    def _move(self, source_key, dest_key, **kwargs) -> None:
+        raise NotImplementedError
+
+    def _has_key(self, key) -> bool:
+        sel = (
+            select([sa.func.count()])
+            .select_from(self._table)
+            .where(self._key_condition(key))
+        )
+        return self.engine.execute(sel).scalar() > 0
+
+    def list_keys(self, prefix=()) -> List[tuple]:
+        sel = (
+            select([self._table.c[name] for name in METRIC_KEY_COLUMNS])
+            .where(
+                and_(
+                    True,
+                    *(
+                        self._table.c[name] == value
+                        for name, value in zip(METRIC_KEY_COLUMNS, prefix)
+                    ),
+                )
+            )
+            .order_by(self._table.c.run_time, self._table.c.run_name)
+        )
+        return [tuple(row) for row in self.engine.execute(sel).fetchall()]
+
+    def remove_key(self, key):
+        try:
+            return self.engine.execute(
+                self._table.delete().where(self._key_condition(key))
+            )
+        except SQLAlchemyError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Unable to delete key: got sqlalchemy error {str(e)}"
+            )
+
+    def get_metric_history(
+        self,
+        expectation_suite_name: str,
+        metric_name: str,
+        metric_kwargs_id: Optional[str] = "__",
+        data_asset_name: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Return the (serialized) values of a metric, with the run names, run times, data asset names and metric
+        kwargs ids of the runs computing them, in chronological order.
+
+        Args:
+            expectation_suite_name: the name of the expectation suite of the validations computing the metric
+            metric_name: the name of the metric
+            metric_kwargs_id: the id of the metric's kwargs ("__" for metrics without kwargs), or None for all kwargs
+            data_asset_name: optional name of the data asset the metric was computed for
+            start_time: optional earliest (inclusive) run time
+            end_time: optional latest (exclusive) run time
+            limit: optional maximum number of values, which are the latest ones
+
+        Returns:
+            A DataFrame with a row per value, and the columns of the key components and "value"
+        """
+        conditions: list = [
+            self._table.c.expectation_suite_name == expectation_suite_name,
+            self._table.c.metric_name == metric_name,
+        ]
+        if metric_kwargs_id is not None:
+            conditions.append(self._table.c.metric_kwargs_id == metric_kwargs_id)
+        if data_asset_name is not None:
+            conditions.append(self._table.c.data_asset_name == data_asset_name)
+        if start_time is not None:
+            conditions.append(
+                self._table.c.run_time >= start_time.strftime(RUN_TIME_FORMAT)
+            )
+        if end_time is not None:
+            conditions.append(
+                self._table.c.run_time < end_time.strftime(RUN_TIME_FORMAT)
+            )
+
+        sel = (
+            select(
+                [
+                    *(self._table.c[name] for name in METRIC_KEY_COLUMNS),
+                    self._table.c.value,
+                ]
+            )
+            .where(and_(*conditions))
+            .order_by(self._table.c.run_time.desc(), self._table.c.run_name.desc())
+        )
+        if limit is not None:
+            sel = sel.limit(limit)
+
+        rows: List[tuple] = [tuple(row) for row in self.engine.execute(sel).fetchall()]
+        rows.reverse()
+        return pd.DataFrame(rows, columns=[*METRIC_KEY_COLUMNS, "value"])
+
+    def _key_condition(self, key: tuple):
+        return and_(
+            *(
+                self._table.c[name] == value
+                for name, value in zip(METRIC_KEY_COLUMNS, key)
+            )
+        )
+
+    @property
+    def config(self) -> dict:
+        return self._config
@@ -4,6 +4,9 @@ from pathlib import Path
 from typing import Dict, Tuple
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.sqlalchemy_engine_registry import (
+    sqlalchemy_engine_registry,
+)
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.util import (
     filter_properties_dict,
@@ -61,6 +64,8 @@ class DatabaseStoreBackend(StoreBackend):
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
+        # The engine obtained from the engine registry (if any), to be released by close().
+        self._registered_engine = None
 
         if engine is not None:
             if credentials is not None:
@@ -72,16 +77,21 @@ class DatabaseStoreBackend(StoreBackend):
         elif credentials is not None:
             self.engine = self._build_engine(credentials=credentials, **kwargs)
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = sqlalchemy_engine_registry.get_engine(
+                connection_string, **kwargs
+            )
         elif url is not None:
             parsed_url = make_url(url)
             self.drivername = parsed_url.drivername
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = sqlalchemy_engine_registry.get_engine(url, **kwargs)
         else:
             raise ge_exceptions.InvalidConfigError(
                 "Credentials, url, connection_string, or an engine are required for a DatabaseStoreBackend."
             )
 
+        if engine is None:
+            self._registered_engine = self.engine
+
         meta = MetaData(schema=self._schema_name)
         self.key_columns = key_columns
         # Dynamically construct a SQLAlchemy table with the name and column names we'll use
@@ -178,9 +188,16 @@ class DatabaseStoreBackend(StoreBackend):
 
         self.drivername = drivername
 
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = sqlalchemy_engine_registry.get_engine(options, **create_engine_kwargs)
         return engine
 
+    def close(self) -> None:
+        """Release the engine obtained from the engine registry (engines provided to the store backend are left open)."""
+        if self._registered_engine is not None:
+            engine = self._registered_engine
+            self._registered_engine = None
+            sqlalchemy_engine_registry.release_engine(engine)
+
     def _get_sqlalchemy_key_pair_auth_url(
         self, drivername: str, credentials: dict
     ) -> Tuple["URL", Dict]:
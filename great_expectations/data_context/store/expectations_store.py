@@ -3,7 +3,7 @@ import uuid
 from typing import Dict
 
 from great_expectations.core import ExpectationSuite
-from great_expectations.core.expectation_suite import ExpectationSuiteSchema
+from great_expectations.core.json_serializer import ExpectationSuiteJsonSerializer
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
@@ -116,7 +116,7 @@ class ExpectationsStore(Store):
         store_name=None,
         data_context=None,
     ) -> None:
-        self._expectationSuiteSchema = ExpectationSuiteSchema()
+        self._expectationSuiteSerializer = ExpectationSuiteJsonSerializer()
         # TODO: refactor so ExpectationStore can have access to DataContext. Currently used by usage_stats messages.
         self._data_context = data_context
         if store_backend is not None:
@@ -183,14 +183,14 @@ class ExpectationsStore(Store):
     def serialize(self, value):
         if self.ge_cloud_mode:
             # GeCloudStoreBackend expects a json str
-            return self._expectationSuiteSchema.dump(value)
-        return self._expectationSuiteSchema.dumps(value, indent=2, sort_keys=True)
+            return self._expectationSuiteSerializer.dump(value)
+        return self._expectationSuiteSerializer.dumps(value, indent=2, sort_keys=True)
 
     def deserialize(self, value):
         if isinstance(value, dict):
-            return self._expectationSuiteSchema.load(value)
+            return self._expectationSuiteSerializer.load(value)
         else:
-            return self._expectationSuiteSchema.loads(value)
+            return self._expectationSuiteSerializer.loads(value)
 
     def self_check(self, pretty_print):
         return_obj = {}
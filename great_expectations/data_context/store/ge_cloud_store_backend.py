@@ -1,5 +1,8 @@
+import copy
 import json
 import logging
+import threading
+import time
 from abc import ABCMeta
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
@@ -7,8 +10,10 @@ from urllib.parse import urljoin
 
 import requests
 
-from great_expectations.core.http import create_session
+from great_expectations.core.async_executor import AsyncExecutor
+from great_expectations.core.http import DEFAULT_POOL_MAXSIZE, create_session
 from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.types.refs import GeCloudResourceRef
 from great_expectations.data_context.types.resource_identifiers import GeCloudIdentifier
 from great_expectations.exceptions import StoreBackendError
@@ -23,6 +28,20 @@ logger = logging.getLogger(__name__)
 
 SUPPORT_EMAIL = "support@greatexpectations.io"
 
+_sessions: Dict[Tuple[str, int], requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_shared_session(access_token: str, pool_maxsize: int) -> requests.Session:
+    """Return the session (and therefore the connection pool) shared by the GE Cloud clients of an access token."""
+    with _sessions_lock:
+        key = (access_token, pool_maxsize)
+        if key not in _sessions:
+            _sessions[key] = create_session(
+                access_token=access_token, pool_maxsize=pool_maxsize
+            )
+        return _sessions[key]
+
 
 class ErrorDetail(TypedDict):
     code: Optional[str]
@@ -176,6 +195,21 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
         }
     )
 
+    # Resources whose collection endpoint returns complete objects, so that "get_many()" can read several of them at once.
+    BULK_READ_RESOURCE_TYPES: Set[GeCloudRESTResource] = {
+        GeCloudRESTResource.CHECKPOINT,
+        GeCloudRESTResource.DATASOURCE,
+        GeCloudRESTResource.EXPECTATION_SUITE,
+        GeCloudRESTResource.PROFILER,
+    }
+
+    # Minimal fraction of the resources of a collection that "get_many()" reads by reading the whole collection (in one
+    # request) rather than each resource (concurrently).
+    BULK_READ_MIN_FRACTION = 0.5
+
+    # Number of seconds during which a response is kept, and revalidated with its ETag rather than downloaded again.
+    READ_CACHE_TTL_SECONDS = 60
+
     DEFAULT_BASE_URL = "https://app.greatexpectations.io/"
 
     def __init__(
@@ -187,7 +221,13 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
         suppress_store_backend_id: bool = True,
         manually_initialize_store_backend_id: str = "",
         store_name: Optional[str] = None,
+        max_concurrent_requests: Optional[int] = None,
     ) -> None:
+        """
+        Args:
+            max_concurrent_requests: maximum number of requests "get_many()" sends concurrently (and size of the
+                connection pool shared by the GE Cloud store backends using the same credentials); defaults to 10.
+        """
         super().__init__(
             fixed_length_key=True,
             suppress_store_backend_id=suppress_store_backend_id,
@@ -222,10 +262,18 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
 
-        self._session = create_session(
-            access_token=self._ge_cloud_credentials["access_token"]
+        self._max_concurrent_requests = max_concurrent_requests or DEFAULT_POOL_MAXSIZE
+        self._session = get_shared_session(
+            access_token=self._ge_cloud_credentials["access_token"],
+            pool_maxsize=self._max_concurrent_requests,
         )
 
+        # ETag-validated responses of GET requests, by URL and parameters (see "_get_json()").
+        self._read_cache: Dict[Tuple[str, Optional[tuple]], Tuple[float, str, Any]] = {}
+        self._read_cache_lock = threading.Lock()
+        # The number of resources of the collection when it was last read (None if it has not been read).
+        self._collection_size: Optional[int] = None
+
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
         self._config = {
@@ -236,6 +284,7 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
             "suppress_store_backend_id": suppress_store_backend_id,
             "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
             "store_name": store_name,
+            "max_concurrent_requests": max_concurrent_requests,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -250,16 +299,11 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
                 params = {"name": key[2]}
                 ge_cloud_url = ge_cloud_url.rstrip("/")
 
-            response = self._session.get(
-                ge_cloud_url,
-                params=params,
-            )
-            response.raise_for_status()
-            return cast(ResponsePayload, response.json())
+            return cast(ResponsePayload, self._get_json(ge_cloud_url, params=params))
         except json.JSONDecodeError as jsonError:
             logger.debug(
                 "Failed to parse GE Cloud Response into JSON",
-                str(response.text),
+                str(jsonError.doc),
                 str(jsonError),
             )
             raise StoreBackendError(
@@ -268,13 +312,132 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
         except requests.HTTPError as http_err:
             raise StoreBackendError(
                 f"Unable to get object in GE Cloud Store Backend: {get_user_friendly_error_message(http_err)}"
-            )
+            ) from http_err
         except requests.Timeout as timeout_exc:
             logger.exception(timeout_exc)
             raise StoreBackendError(
                 "Unable to get object in GE Cloud Store Backend: This is likely a transient error. Please try again."
             )
 
+    def _get_json(self, url: str, **kwargs) -> Any:
+        """GET the JSON document at the given URL, revalidating a recent response with its ETag if there is one.
+
+        Raises:
+            requests.HTTPError, requests.Timeout or json.JSONDecodeError
+        """
+        params: Optional[dict] = kwargs.get("params")
+        cache_key = (url, tuple(sorted(params.items())) if params else None)
+        now: float = time.monotonic()
+        with self._read_cache_lock:
+            cached_response = self._read_cache.get(cache_key)
+        if cached_response is not None and (
+            now - cached_response[0] > self.READ_CACHE_TTL_SECONDS
+        ):
+            cached_response = None
+
+        if cached_response is None:
+            response = self._session.get(url, **kwargs)
+        else:
+            response = self._session.get(
+                url, headers={"If-None-Match": cached_response[1]}, **kwargs
+            )
+            if response.status_code == 304:
+                with self._read_cache_lock:
+                    self._read_cache[cache_key] = (now,) + cached_response[1:]
+                return copy.deepcopy(cached_response[2])
+
+        response.raise_for_status()
+        response_json = response.json()
+
+        etag = response.headers.get("ETag")
+        if isinstance(etag, str):
+            with self._read_cache_lock:
+                self._read_cache[cache_key] = (
+                    now,
+                    etag,
+                    copy.deepcopy(response_json),
+                )
+        return response_json
+
+    def _invalidate_read_cache(self) -> None:
+        with self._read_cache_lock:
+            self._read_cache.clear()
+
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        values: Dict[int, Any] = {}
+        if self.ge_cloud_resource_type in self.BULK_READ_RESOURCE_TYPES:
+            indices_by_id: Dict[str, List[int]] = {}
+            for idx, key in enumerate(keys):
+                if len(key) > 1 and key[1]:
+                    indices_by_id.setdefault(key[1], []).append(idx)
+            if len(indices_by_id) > 1 and self._prefers_bulk_read(
+                id_count=len(indices_by_id)
+            ):
+                # Resources read are not shared with other callers, so only those requested more than once are copied.
+                for id, resource in self._get_resources_by_id().items():
+                    for copy_idx, idx in enumerate(indices_by_id.get(id, [])):
+                        values[idx] = {
+                            "data": copy.deepcopy(resource) if copy_idx else resource
+                        }
+
+        # Fetch the rest (e.g. keys identifying a resource by name) individually, concurrently.
+        remaining_indices: List[int] = [
+            idx for idx in range(len(keys)) if idx not in values
+        ]
+        if remaining_indices:
+            max_workers: int = min(
+                self._max_concurrent_requests, len(remaining_indices)
+            )
+            with AsyncExecutor(
+                concurrency_config=ConcurrencyConfig(enabled=True),
+                max_workers=max_workers,
+            ) as async_executor:
+                async_results = {
+                    idx: async_executor.submit(self._get_or_none, keys[idx], **kwargs)
+                    for idx in remaining_indices
+                }
+                for idx, async_result in async_results.items():
+                    values[idx] = async_result.result()
+
+        return [values[idx] for idx in range(len(keys))]
+
+    def _get_or_none(self, key, **kwargs) -> Any:
+        try:
+            return self._get(key, **kwargs)
+        except StoreBackendError as e:
+            # Resources that do not exist are None (as keys that do not exist are for other store backends).
+            if (
+                isinstance(e.__cause__, requests.HTTPError)
+                and e.__cause__.response is not None
+                and e.__cause__.response.status_code == 404
+            ):
+                return None
+            raise
+
+    def _prefers_bulk_read(self, id_count: int) -> bool:
+        """Whether to read "id_count" resources by reading the whole collection: if they are a large enough fraction of
+        the collection (as of when it was last read), or, if its size is unknown, cannot all be read concurrently."""
+        if self._collection_size is None:
+            return id_count > self._max_concurrent_requests
+
+        return id_count >= self.BULK_READ_MIN_FRACTION * self._collection_size
+
+    def _get_resources_by_id(self) -> Dict[str, dict]:
+        url = construct_url(
+            base_url=self.ge_cloud_base_url,
+            organization_id=self.ge_cloud_credentials["organization_id"],
+            resource_name=self.ge_cloud_resource_name,
+        )
+        try:
+            response_json = self._get_json(url)
+            self._collection_size = len(response_json["data"])
+            return {resource["id"]: resource for resource in response_json["data"]}
+        except Exception as e:
+            logger.debug(
+                f"Unable to read {self.ge_cloud_resource_name} in bulk from GE Cloud: {e}"
+            )
+            return {}
+
     def _move(self) -> None:  # type: ignore[override]
         pass
 
@@ -301,6 +464,7 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
             data["data"]["id"] = ge_cloud_id
             url = urljoin(f"{url}/", ge_cloud_id)
 
+        self._invalidate_read_cache()
         try:
             response = self._session.put(url, json=data)
             response_status_code = response.status_code
@@ -390,6 +554,7 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
             resource_name=resource_name,
         )
 
+        self._invalidate_read_cache()
         try:
             response = self._session.post(url, json=data)
             response.raise_for_status()
@@ -444,9 +609,8 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
         attributes_key = self.PAYLOAD_ATTRIBUTES_KEYS[resource_type]
 
         try:
-            response = self._session.get(url)
-            response.raise_for_status()
-            response_json = response.json()
+            response_json = self._get_json(url)
+            self._collection_size = len(response_json["data"])
 
             # Chetan - 20220824 - Explicit fork due to ExpectationSuite using a different name field.
             # Once 'expectation_suite_name' is renamed, this can be removed.
@@ -510,6 +674,7 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
             id=ge_cloud_id,
         )
 
+        self._invalidate_read_cache()
         try:
             response = self._session.delete(url, json=data)
             response.raise_for_status()
@@ -100,6 +100,8 @@ class HtmlSiteStore:
 
     _key_class = SiteSectionIdentifier
 
+    RENDER_MANIFEST_KEY = ("render_manifest.json",)
+
     def __init__(self, store_backend=None, runtime_environment=None) -> None:
         store_backend_module_name = store_backend.get(
             "module_name", "great_expectations.data_context.store"
@@ -366,6 +368,23 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def get_render_manifest(self):
+        """Return the serialized render manifest of the site (used for incremental builds), or None if there is none."""
+        static_assets_backend = self.store_backends["static_assets"]
+        if not static_assets_backend.has_key(self.RENDER_MANIFEST_KEY):  # noqa: W601
+            return None
+
+        return static_assets_backend.get(self.RENDER_MANIFEST_KEY)
+
+    def set_render_manifest(self, serialized_manifest):
+        """The render manifest lives next to the index page, in the "static_assets" backend (variable-length keys)."""
+        return self.store_backends["static_assets"].set(
+            self.RENDER_MANIFEST_KEY,
+            serialized_manifest,
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
@@ -188,6 +188,7 @@ class InlineStoreBackend(StoreBackend):
 
     def _save_changes(self) -> None:
         context = self._data_context
+        context._invalidate_config_substitution_cache()
         config_filepath = pathlib.Path(context.root_directory) / context.GE_YML  # type: ignore[arg-type]
 
         try:
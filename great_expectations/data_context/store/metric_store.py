@@ -1,7 +1,22 @@
+import datetime
 import json
+import numbers
+from typing import Any, Dict, List, Optional, Tuple
 
-from great_expectations.core.metric import ValidationMetricIdentifier
+import numpy as np
+import pandas as pd
+
+from great_expectations.core.metric import (
+    BatchMetricIdentifier,
+    ValidationMetricIdentifier,
+)
 from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.data_context.store.columnar_metric_store_backend import (
+    METRIC_KEY_COLUMNS,
+    RUN_TIME_FORMAT,
+    ColumnarMetricStoreBackend,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
@@ -20,7 +35,9 @@ class MetricStore(Store):
 
     _key_class = ValidationMetricIdentifier  # type: ignore[assignment]
 
-    def __init__(self, store_backend=None, store_name=None) -> None:
+    def __init__(
+        self, store_backend=None, runtime_environment=None, store_name=None
+    ) -> None:
         if store_backend is not None:
             store_backend_module_name = store_backend.get(
                 "module_name", "great_expectations.data_context.store"
@@ -52,7 +69,11 @@ class MetricStore(Store):
                         ],
                     )
 
-        super().__init__(store_backend=store_backend, store_name=store_name)
+        super().__init__(
+            store_backend=store_backend,
+            runtime_environment=runtime_environment,
+            store_name=store_name,
+        )
 
     def serialize(self, value):
         return json.dumps({"value": value})
@@ -61,6 +82,86 @@ class MetricStore(Store):
         if value:
             return json.loads(value)["value"]
 
+    def get_metric_history(
+        self,
+        expectation_suite_name: str,
+        metric_name: str,
+        metric_kwargs_id: Optional[str] = None,
+        data_asset_name: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Return the values of a metric computed by the validations of an expectation suite, in chronological order.
+
+        With a ColumnarMetricStoreBackend, the values are looked up with a single (indexed) query; other store
+        backends list all their keys, and fetch the values of the matching ones.
+
+        Args:
+            expectation_suite_name: the name of the expectation suite of the validations computing the metric
+            metric_name: the name of the metric
+            metric_kwargs_id: optional id of the metric's kwargs (by default, the values of the metric without kwargs)
+            data_asset_name: optional name of the data asset the metric was computed for
+            start_time: optional earliest (inclusive) run time
+            end_time: optional latest (exclusive) run time
+            limit: optional maximum number of values, which are the latest ones
+
+        Returns:
+            A DataFrame with a row per value, and the columns "run_name", "run_time" (as datetimes), "data_asset_name",
+            "expectation_suite_name", "metric_name", "metric_kwargs_id" and "value"
+        """
+        metric_kwargs_id = metric_kwargs_id or "__"
+        history: pd.DataFrame
+        if isinstance(self._store_backend, ColumnarMetricStoreBackend):
+            history = self._store_backend.get_metric_history(
+                expectation_suite_name=expectation_suite_name,
+                metric_name=metric_name,
+                metric_kwargs_id=metric_kwargs_id,
+                data_asset_name=data_asset_name,
+                start_time=start_time,
+                end_time=end_time,
+                limit=limit,
+            )
+            history["value"] = [self.deserialize(value) for value in history["value"]]
+        else:
+            start: Optional[str] = (
+                start_time.strftime(RUN_TIME_FORMAT) if start_time else None
+            )
+            end: Optional[str] = (
+                end_time.strftime(RUN_TIME_FORMAT) if end_time else None
+            )
+            keys: List[ValidationMetricIdentifier] = []
+            key_tuples: List[tuple] = []
+            key: ValidationMetricIdentifier
+            for key in self.list_keys():
+                key_tuple: tuple = key.to_fixed_length_tuple()
+                if (
+                    key_tuple[3:]
+                    == (expectation_suite_name, metric_name, metric_kwargs_id)
+                    and (data_asset_name is None or key_tuple[2] == data_asset_name)
+                    and (start is None or key_tuple[1] >= start)
+                    and (end is None or key_tuple[1] < end)
+                ):
+                    keys.append(key)
+                    key_tuples.append(key_tuple)
+
+            order: List[int] = sorted(
+                range(len(keys)),
+                key=lambda index: (key_tuples[index][1], key_tuples[index][0]),
+            )
+            if limit is not None:
+                order = order[len(order) - limit :] if limit > 0 else []
+            values: list = self.get_many([keys[index] for index in order])
+            history = pd.DataFrame(
+                [(*key_tuples[index], value) for index, value in zip(order, values)],
+                columns=[*METRIC_KEY_COLUMNS, "value"],
+            )
+
+        history["run_time"] = pd.to_datetime(
+            history["run_time"], format=RUN_TIME_FORMAT, utc=True
+        )
+        return history
+
 
 class EvaluationParameterStore(MetricStore):
     def __init__(self, store_backend=None, store_name=None) -> None:
@@ -95,12 +196,156 @@ class EvaluationParameterStore(MetricStore):
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
     def get_bind_params(self, run_id: RunIdentifier) -> dict:
-        params = {}
-        for k in self._store_backend.list_keys(run_id.to_tuple()):
-            key = self.tuple_to_key(k)
-            params[key.to_evaluation_parameter_urn()] = self.get(key)  # type: ignore[attr-defined]
-        return params
+        keys = [
+            self.tuple_to_key(k)
+            for k in self._store_backend.list_keys(run_id.to_tuple())
+        ]
+        values = self.get_many(keys)
+        return {
+            key.to_evaluation_parameter_urn(): value  # type: ignore[attr-defined]
+            for key, value in zip(keys, values)
+        }
 
     @property
     def config(self) -> dict:
         return self._config
+
+
+class BatchMetricStore(Store):
+    """
+    A BatchMetricStore stores the values of metrics computed for Batches of data (e.g., by the ParameterBuilders of
+    Rule-Based Profilers and DataAssistants), keyed by batch_id, so that they are looked up rather than computed again
+    for Batches whose data has not changed.  Values are stored along with a fingerprint of the data of their Batch
+    (e.g., its row count), and are only looked up for Batches with the same fingerprint.
+
+    Only numeric, string, and boolean values (and sequences of numbers) are stored; other metric values (e.g., pandas
+    Series or datetimes) would not be restored with their original type, and are computed every time.
+    """
+
+    _key_class = BatchMetricIdentifier  # type: ignore[assignment]
+
+    def __init__(
+        self, store_backend=None, runtime_environment=None, store_name=None
+    ) -> None:
+        if store_backend is not None:
+            store_backend_module_name = store_backend.get(
+                "module_name", "great_expectations.data_context.store"
+            )
+            store_backend_class_name = store_backend.get(
+                "class_name", "InMemoryStoreBackend"
+            )
+            verify_dynamic_loading_support(module_name=store_backend_module_name)
+            store_backend_class = load_class(
+                store_backend_class_name, store_backend_module_name
+            )
+
+            if issubclass(store_backend_class, DatabaseStoreBackend):
+                # Provide defaults for this common case
+                if "table_name" not in store_backend:
+                    store_backend["table_name"] = "ge_batch_metrics"
+                if "key_columns" not in store_backend:
+                    store_backend["key_columns"] = [
+                        "batch_id",
+                        "metric_name",
+                        "metric_domain_kwargs_id",
+                        "metric_value_kwargs_id",
+                    ]
+
+        super().__init__(
+            store_backend=store_backend,
+            runtime_environment=runtime_environment,
+            store_name=store_name,
+        )
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "store_backend": store_backend,
+            "runtime_environment": runtime_environment,
+            "store_name": store_name,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+
+    def serialize(self, value):
+        return json.dumps(convert_to_json_serializable(data=value))
+
+    def deserialize(self, value):
+        if value:
+            return json.loads(value)
+
+    def get_metric_values(
+        self,
+        metric_configurations: List["MetricConfiguration"],  # noqa: F821
+        batch_fingerprints: Dict[str, Any],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Look up the stored values of metrics (whose domain kwargs must include a "batch_id").
+
+        Args:
+            metric_configurations: the metrics to look up
+            batch_fingerprints: the fingerprints of the data of the Batches, by batch_id; the metrics of other Batches
+                (e.g., of Batches of runtime data) are not looked up
+
+        Returns:
+            A dictionary of the stored values, keyed by the ids of their metric configurations (metrics whose values
+            are not stored, or were stored for different data of their Batches, are absent)
+        """
+        metric_configurations = [
+            metric_configuration
+            for metric_configuration in metric_configurations
+            if metric_configuration.metric_domain_kwargs.get("batch_id")
+            in batch_fingerprints
+        ]
+        values: list = self.get_many(
+            [
+                BatchMetricIdentifier.from_metric_configuration(metric_configuration)
+                for metric_configuration in metric_configurations
+            ]
+        )
+        return {
+            metric_configuration.id: value["value"]
+            for metric_configuration, value in zip(metric_configurations, values)
+            if isinstance(value, dict)
+            and "batch_fingerprint" in value
+            and value["batch_fingerprint"]
+            == batch_fingerprints[metric_configuration.metric_domain_kwargs["batch_id"]]
+        }
+
+    def set_metric_values(
+        self,
+        metric_configurations: List["MetricConfiguration"],  # noqa: F821
+        resolved_metrics: Dict[Tuple[str, str, str], Any],
+        batch_fingerprints: Dict[str, Any],
+    ) -> None:
+        """Store the (resolved) values of metrics, whose domain kwargs include a "batch_id", along with the fingerprints
+        of the data of their Batches (the metrics of Batches without fingerprints are not stored)."""
+        self.set_many(
+            [
+                (
+                    BatchMetricIdentifier.from_metric_configuration(
+                        metric_configuration
+                    ),
+                    {
+                        "value": resolved_metrics[metric_configuration.id],
+                        "batch_fingerprint": batch_fingerprints[
+                            metric_configuration.metric_domain_kwargs["batch_id"]
+                        ],
+                    },
+                )
+                for metric_configuration in metric_configurations
+                if metric_configuration.metric_domain_kwargs.get("batch_id")
+                in batch_fingerprints
+                and metric_configuration.id in resolved_metrics
+                and self._is_storable_value(resolved_metrics[metric_configuration.id])
+            ]
+        )
+
+    @staticmethod
+    def _is_storable_value(value: Any) -> bool:
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return all(
+                isinstance(element, (numbers.Number, np.number)) for element in value
+            )
+
+        return isinstance(value, (numbers.Number, np.number, np.bool_, str))
@@ -3,16 +3,17 @@ from string import Template
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.data_context_key import StringKey
+from great_expectations.core.sqlalchemy_engine_registry import (
+    sqlalchemy_engine_registry,
+)
 from great_expectations.data_context.store.store import Store
 from great_expectations.util import filter_properties_dict
 
 try:
     import sqlalchemy
-    from sqlalchemy import create_engine
     from sqlalchemy.engine.url import URL
 except ImportError:
     sqlalchemy = None
-    create_engine = None
     URL = None
 
 
@@ -62,16 +63,24 @@ class SqlAlchemyQueryStore(Store):
             except (AssertionError, KeyError) as e:
                 raise ge_exceptions.InvalidConfigError(str(e))
 
+        # The engine obtained from the engine registry (if any), to be released by close().
+        self._registered_engine = None
+
         if "engine" in credentials:
             self.engine = credentials["engine"]
         elif "url" in credentials:
-            self.engine = create_engine(credentials["url"])
+            self.engine = sqlalchemy_engine_registry.get_engine(credentials["url"])
         elif "connection_string" in credentials:
-            self.engine = create_engine(credentials["connection_string"])
+            self.engine = sqlalchemy_engine_registry.get_engine(
+                credentials["connection_string"]
+            )
         else:
             drivername = credentials.pop("drivername")
             options = URL(drivername, **credentials)
-            self.engine = create_engine(options)
+            self.engine = sqlalchemy_engine_registry.get_engine(options)
+
+        if "engine" not in credentials:
+            self._registered_engine = self.engine
 
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
@@ -86,6 +95,15 @@ class SqlAlchemyQueryStore(Store):
         }
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+    def close(self) -> None:
+        """Release the engine obtained from the engine registry (engines provided in credentials are left open)."""
+        if self._registered_engine is not None:
+            engine = self._registered_engine
+            self._registered_engine = None
+            sqlalchemy_engine_registry.release_engine(engine)
+
+        super().close()
+
     def _convert_key(self, key):
         if isinstance(key, str):
             return StringKey(key)
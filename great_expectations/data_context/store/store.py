@@ -9,7 +9,11 @@ from great_expectations.data_context.store.ge_cloud_store_backend import (
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.data_context.types.resource_identifiers import GeCloudIdentifier
 from great_expectations.data_context.util import instantiate_class_from_config
-from great_expectations.exceptions import ClassInstantiationError, DataContextError
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    DataContextError,
+    InvalidKeyError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -160,6 +164,32 @@ class Store:
         else:
             return None
 
+    def get_many(self, keys: List[DataContextKey]) -> List[Optional[Any]]:
+        """Retrieve the values of several keys at once, in order; keys that do not exist in the store yield None.
+
+        This lets the store backend fetch the values in bulk (e.g. concurrently, for cloud object stores).
+        """
+        if type(self).get is not Store.get:
+            values: List[Optional[Any]] = []
+            for key in keys:
+                try:
+                    values.append(self.get(key))
+                except InvalidKeyError:
+                    values.append(None)
+            return values
+
+        for key in keys:
+            self._validate_key(key)
+        values = self._store_backend.get_many([self.key_to_tuple(key) for key in keys])
+        if self.ge_cloud_mode:
+            values = [
+                self.ge_cloud_response_json_to_object_dict(response_json=value)
+                if value
+                else value
+                for value in values
+            ]
+        return [self.deserialize(value) if value else None for value in values]
+
     def set(self, key: DataContextKey, value: Any, **kwargs) -> None:
         if key == StoreBackend.STORE_BACKEND_ID_KEY:
             return self._store_backend.set(key, value, **kwargs)
@@ -169,6 +199,21 @@ class Store:
             self.key_to_tuple(key), self.serialize(value), **kwargs
         )
 
+    def set_many(self, items: List[Tuple[DataContextKey, Any]], **kwargs) -> None:
+        """Store the values of several keys at once, letting the store backend write them in bulk (e.g. in a single
+        database transaction)."""
+        if type(self).set is not Store.set:
+            for key, value in items:
+                self.set(key, value, **kwargs)
+            return
+
+        for key, _ in items:
+            self._validate_key(key)
+        self._store_backend.set_many(
+            [(self.key_to_tuple(key), self.serialize(value)) for key, value in items],
+            **kwargs,
+        )
+
     def list_keys(self) -> List[DataContextKey]:
         keys_without_store_backend_id = [
             key
@@ -187,6 +232,10 @@ class Store:
                 )
             return self._store_backend.has_key(key.to_tuple())  # noqa: W601
 
+    def close(self) -> None:
+        """Release the resources (e.g., database engines and their connection pools) held by the store."""
+        self._store_backend.close()
+
     def self_check(self, pretty_print: bool) -> None:
         NotImplementedError(
             f"The test method is not implemented for Store class {self.__class__.__name__}."
@@ -5,10 +5,17 @@ import os
 import random
 import re
 import shutil
+import threading
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from typing import Any, Iterator, List, Optional, Tuple, Union
 
+from great_expectations.core.async_executor import AsyncExecutor
 from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.types.base import ConcurrencyConfig
+from great_expectations.data_context.util import (
+    COMPRESSION_MAGIC_BYTES,
+    get_compression_of_bytes,
+)
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
 from great_expectations.util import filter_properties_dict
 
@@ -22,6 +29,8 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
 
     For example, in the following template path: expectations/{0}/{1}/{2}/prefix-{2}.json, keys must have
     three components.
+
+    If max_concurrent_requests is greater than 1, "get_many()" retrieves values using up to that many threads.
     """
 
     def __init__(
@@ -36,6 +45,7 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        max_concurrent_requests: int = 1,
     ) -> None:
         super().__init__(
             fixed_length_key=fixed_length_key,
@@ -65,6 +75,7 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
         self.filepath_prefix = filepath_prefix
         self.filepath_suffix = filepath_suffix
         self.base_public_path = base_public_path
+        self.max_concurrent_requests = max_concurrent_requests
 
         if filepath_template is not None:
             # key length is the number of unique values to be substituted in the filepath_template
@@ -73,6 +84,28 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             self.verify_that_key_to_filepath_operation_is_reversible()
             self._fixed_length_key = True
 
+    @staticmethod
+    def _decode_stored_value(
+        value: bytes, content_encoding: Optional[str] = None
+    ) -> Union[str, bytes]:
+        """
+        Convert the raw bytes of a stored object into the value returned by "_get()".
+
+        Compressed objects (recognized by their leading bytes, or by a compression "content_encoding" recorded alongside
+        them) are returned as bytes, and it is up to the Store to decompress them; all other objects are decoded to str.
+        This keeps objects written before compression was enabled readable.
+        """
+        if (
+            get_compression_of_bytes(value=value) is not None
+            or content_encoding in COMPRESSION_MAGIC_BYTES
+        ):
+            return value
+
+        if not content_encoding:
+            content_encoding = "utf-8"
+
+        return value.decode(content_encoding)
+
     def _validate_key(self, key) -> None:
         super()._validate_key(key)
 
@@ -124,6 +157,56 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
 
         return converted_string
 
+    def _get_listing_prefix(self, prefix: Tuple = ()) -> str:
+        """Return the longest filepath prefix shared by all keys starting with the given key prefix.
+
+        Remote backends pass this to their listing calls, so that only the relevant objects are listed server-side.
+        """
+        if tuple(prefix) == self.STORE_BACKEND_ID_KEY:
+            return self._convert_key_to_filepath(self.STORE_BACKEND_ID_KEY)
+
+        if not prefix:
+            # The store_backend_id is stored outside of the filepath_template.
+            listing_prefix = ""
+        elif self.filepath_template:
+            listing_prefix = ""
+            for part in re.split(r"({\d+})", self.filepath_template):
+                match = re.fullmatch(r"{(\d+)}", part)
+                if match is None:
+                    if "{" in part or "}" in part:
+                        break
+                    listing_prefix += part
+                elif int(match.group(1)) < len(prefix):
+                    listing_prefix += prefix[int(match.group(1))]
+                else:
+                    break
+        else:
+            listing_prefix = "/".join(prefix)
+
+        if self.filepath_prefix:
+            listing_prefix = f"{self.filepath_prefix}/{listing_prefix}"
+        if listing_prefix and self.platform_specific_separator:
+            # normpath() drops trailing separators, which keeps the result a prefix of the normalized filepaths.
+            listing_prefix = os.path.normpath(listing_prefix)
+            if listing_prefix == os.curdir:
+                listing_prefix = ""
+
+        return listing_prefix
+
+    @staticmethod
+    def _key_has_prefix(key: Optional[Tuple], prefix: Tuple) -> bool:
+        return key is not None and key[: len(prefix)] == tuple(prefix)
+
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        max_workers: int = min(self.max_concurrent_requests, len(keys))
+        with AsyncExecutor(
+            concurrency_config=ConcurrencyConfig(enabled=True), max_workers=max_workers
+        ) as async_executor:
+            async_results = [
+                async_executor.submit(self._get_or_none, key, **kwargs) for key in keys
+            ]
+            return [async_result.result() for async_result in async_results]
+
     def _convert_filepath_to_key(self, filepath):
         if filepath == self.STORE_BACKEND_ID_KEY[0]:
             return self.STORE_BACKEND_ID_KEY
@@ -299,14 +382,18 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             self.full_base_directory, self._convert_key_to_filepath(key)
         )
         try:
-            with open(filepath) as infile:
-                contents: str = infile.read().rstrip("\n")
+            with open(filepath, "rb") as infile:
+                contents: bytes = infile.read()
         except FileNotFoundError:
             raise InvalidKeyError(
                 f"Unable to retrieve object from TupleFilesystemStoreBackend with the following Key: {str(filepath)}"
             )
 
-        return contents
+        value: Union[str, bytes] = self._decode_stored_value(value=contents)
+        if isinstance(value, str):
+            value = value.rstrip("\n")
+
+        return value
 
     def _set(self, key, value, **kwargs):
         if not isinstance(key, tuple):
@@ -456,6 +543,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        max_concurrent_requests: int = 16,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -468,6 +556,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            max_concurrent_requests=max_concurrent_requests,
         )
         self.bucket = bucket
         if prefix:
@@ -485,6 +574,11 @@ class TupleS3StoreBackend(TupleStoreBackend):
             s3_put_options = {}
         self.s3_put_options = s3_put_options
         self.endpoint_url = endpoint_url
+        # boto3 clients are thread-safe and keep a pool of connections, so a single client is shared; resources are not
+        # thread-safe, so one is created per thread.
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._thread_local = threading.local()
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -507,6 +601,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "max_concurrent_requests": max_concurrent_requests,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -541,10 +636,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 f"Unable to retrieve object from TupleS3StoreBackend with the following Key: {str(s3_object_key)}"
             )
 
-        return (
-            s3_response_object["Body"]
-            .read()
-            .decode(s3_response_object.get("ContentEncoding", "utf-8"))
+        return self._decode_stored_value(
+            value=s3_response_object["Body"].read(),
+            content_encoding=s3_response_object.get("ContentEncoding", "utf-8"),
         )
 
     def _set(
@@ -569,9 +663,18 @@ class TupleS3StoreBackend(TupleStoreBackend):
                     **self.s3_put_options,
                 )
             else:
-                result_s3.put(
-                    Body=value, ContentType=content_type, **self.s3_put_options
-                )
+                compression: Optional[str] = get_compression_of_bytes(value=value)
+                if compression:
+                    result_s3.put(
+                        Body=value,
+                        ContentEncoding=compression,
+                        ContentType=content_type,
+                        **self.s3_put_options,
+                    )
+                else:
+                    result_s3.put(
+                        Body=value, ContentType=content_type, **self.s3_put_options
+                    )
         except s3.meta.client.exceptions.ClientError as e:
             logger.debug(str(e))
             raise StoreBackendError("Unable to set object in s3.")
@@ -595,58 +698,60 @@ class TupleS3StoreBackend(TupleStoreBackend):
         s3.Object(self.bucket, source_filepath).delete()
 
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature
+        return list(self.iter_keys(prefix=prefix))
+
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
         s3 = self._create_client()
         paginator = s3.get_paginator("list_objects_v2")
 
-        if self.prefix:
-            page_iterator = paginator.paginate(Bucket=self.bucket, Prefix=self.prefix)
+        listing_prefix: str = self._get_listing_prefix(prefix=prefix)
+        if self.prefix and listing_prefix:
+            listing_prefix = "/".join((self.prefix, listing_prefix))
         else:
-            page_iterator = paginator.paginate(Bucket=self.bucket)
+            listing_prefix = listing_prefix or self.prefix
 
-        objects: list = []
+        if listing_prefix:
+            page_iterator = paginator.paginate(
+                Bucket=self.bucket, Prefix=listing_prefix
+            )
+        else:
+            page_iterator = paginator.paginate(Bucket=self.bucket)
 
+        is_first_page = True
         for page in page_iterator:
             current_page_contents = page.get("Contents")
             # On first iteration check for "CommonPrefixes"
             if (
                 current_page_contents is None
-                and objects == []
+                and is_first_page
                 and "CommonPrefixes" in page
             ):
                 logger.warning(
                     "TupleS3StoreBackend returned CommonPrefixes, but delimiter should not have been set."
                 )
-                objects = []
-                break
-            if current_page_contents is not None:
-                objects.extend(current_page_contents)
+                return
+            is_first_page = False
 
-        key_list = []
-        for s3_object_info in objects:
-            s3_object_key = s3_object_info["Key"]
-            if self.platform_specific_separator:
-                s3_object_key = os.path.relpath(s3_object_key, self.prefix)
-            else:
-                if self.prefix is None:
-                    if s3_object_key.startswith("/"):
-                        s3_object_key = s3_object_key[1:]
-                else:
-                    if s3_object_key.startswith(f"{self.prefix}/"):
-                        s3_object_key = s3_object_key[len(self.prefix) + 1 :]
-            if self.filepath_prefix and not s3_object_key.startswith(
-                self.filepath_prefix
-            ):
-                continue
-            elif self.filepath_suffix and not s3_object_key.endswith(
-                self.filepath_suffix
-            ):
-                continue
-            key = self._convert_filepath_to_key(s3_object_key)
-            if key:
-                key_list.append(key)
+            for s3_object_info in current_page_contents or []:
+                key = self._convert_s3_object_key_to_key(s3_object_info["Key"])
+                if self._key_has_prefix(key=key, prefix=prefix):
+                    yield key
 
-        return key_list
+    def _convert_s3_object_key_to_key(self, s3_object_key: str) -> Optional[Tuple]:
+        if self.platform_specific_separator:
+            s3_object_key = os.path.relpath(s3_object_key, self.prefix)
+        else:
+            if self.prefix is None:
+                if s3_object_key.startswith("/"):
+                    s3_object_key = s3_object_key[1:]
+            else:
+                if s3_object_key.startswith(f"{self.prefix}/"):
+                    s3_object_key = s3_object_key[len(self.prefix) + 1 :]
+        if self.filepath_prefix and not s3_object_key.startswith(self.filepath_prefix):
+            return None
+        elif self.filepath_suffix and not s3_object_key.endswith(self.filepath_suffix):
+            return None
+        return self._convert_filepath_to_key(s3_object_key)
 
     def get_url_for_key(self, key, protocol=None):
         location = None
@@ -702,30 +807,56 @@ class TupleS3StoreBackend(TupleStoreBackend):
             return False
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.iter_keys(prefix=key)
 
     @property
     def boto3_options(self):
         from botocore.client import Config
 
         result = {}
-        if self._boto3_options.get("signature_version"):
-            signature_version = self._boto3_options.pop("signature_version")
+        signature_version = self._boto3_options.get("signature_version")
+        if signature_version:
             result["config"] = Config(signature_version=signature_version)
-        result.update(self._boto3_options)
+        result.update(
+            {
+                option: value
+                for option, value in self._boto3_options.items()
+                if option != "signature_version"
+            }
+        )
 
         return result
 
     def _create_client(self):
-        import boto3
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import boto3
+                    from botocore.client import Config
+
+                    boto3_options: dict = self.boto3_options
+                    # Allow every thread used by "get_many()" to hold a connection of its own.
+                    pool_config = Config(
+                        max_pool_connections=max(self.max_concurrent_requests, 10)
+                    )
+                    boto3_options["config"] = (
+                        boto3_options["config"].merge(pool_config)
+                        if "config" in boto3_options
+                        else pool_config
+                    )
+                    self._client = boto3.client("s3", **boto3_options)
 
-        return boto3.client("s3", **self.boto3_options)
+        return self._client
 
     def _create_resource(self):
-        import boto3
+        resource = getattr(self._thread_local, "resource", None)
+        if resource is None:
+            import boto3
+
+            resource = boto3.resource("s3", **self.boto3_options)
+            self._thread_local.resource = resource
 
-        return boto3.resource("s3", **self.boto3_options)
+        return resource
 
     @property
     def config(self) -> dict:
@@ -758,6 +889,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        max_concurrent_requests: int = 16,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -770,11 +902,14 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            max_concurrent_requests=max_concurrent_requests,
         )
         self.bucket = bucket
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        # GCS clients are not guaranteed to be thread-safe, so one (reused) client is created per thread.
+        self._thread_local = threading.local()
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -796,6 +931,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             "public_urls": public_urls,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "max_concurrent_requests": max_concurrent_requests,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -821,9 +957,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     def _get(self, key):
         gcs_object_key = self._build_gcs_object_key(key)
 
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
+        gcs = self._create_client()
         bucket = gcs.bucket(self.bucket)
         gcs_response_object = bucket.get_blob(gcs_object_key)
         if not gcs_response_object:
@@ -831,7 +965,10 @@ class TupleGCSStoreBackend(TupleStoreBackend):
                 f"Unable to retrieve object from TupleGCSStoreBackend with the following Key: {str(key)}"
             )
         else:
-            return gcs_response_object.download_as_string().decode("utf-8")
+            return self._decode_stored_value(
+                value=gcs_response_object.download_as_string(),
+                content_encoding="utf-8",
+            )
 
     def _set(
         self,
@@ -843,9 +980,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     ):
         gcs_object_key = self._build_gcs_object_key(key)
 
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
+        gcs = self._create_client()
         bucket = gcs.bucket(self.bucket)
         blob = bucket.blob(gcs_object_key)
 
@@ -855,13 +990,14 @@ class TupleGCSStoreBackend(TupleStoreBackend):
                 value.encode(content_encoding), content_type=content_type
             )
         else:
+            compression: Optional[str] = get_compression_of_bytes(value=value)
+            if compression:
+                blob.content_encoding = compression
             blob.upload_from_string(value, content_type=content_type)
         return gcs_object_key
 
     def _move(self, source_key, dest_key, **kwargs) -> None:
-        from google.cloud import storage  # type: ignore
-
-        gcs = storage.Client(project=self.project)
+        gcs = self._create_client()
         bucket = gcs.bucket(self.bucket)
 
         source_filepath = self._convert_key_to_filepath(source_key)
@@ -875,14 +1011,18 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         _ = bucket.rename_blob(blob, dest_filepath)
 
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature
-        key_list = []
+        return list(self.iter_keys(prefix=prefix))
 
-        from google.cloud import storage  # type: ignore
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
+        gcs = self._create_client()
 
-        gcs = storage.Client(self.project)
+        listing_prefix: str = self._get_listing_prefix(prefix=prefix)
+        if self.prefix and listing_prefix:
+            listing_prefix = "/".join((self.prefix, listing_prefix))
+        else:
+            listing_prefix = listing_prefix or self.prefix
 
-        for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
+        for blob in gcs.list_blobs(self.bucket, prefix=listing_prefix):
             gcs_object_name = blob.name
             gcs_object_key = os.path.relpath(
                 gcs_object_name,
@@ -897,9 +1037,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             ):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
-            if key:
-                key_list.append(key)
-        return key_list
+            if self._key_has_prefix(key=key, prefix=prefix):
+                yield key
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
@@ -939,10 +1078,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return path_url
 
     def remove_key(self, key):
-        from google.cloud import storage
         from google.cloud.exceptions import NotFound
 
-        gcs = storage.Client(project=self.project)
+        gcs = self._create_client()
         bucket = gcs.bucket(self.bucket)
         try:
             bucket.delete_blobs(blobs=list(bucket.list_blobs(prefix=self.prefix)))
@@ -951,8 +1089,17 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return True
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.iter_keys(prefix=key)
+
+    def _create_client(self):
+        client = getattr(self._thread_local, "client", None)
+        if client is None:
+            from google.cloud import storage  # type: ignore
+
+            client = storage.Client(project=self.project)
+            self._thread_local.client = client
+
+        return client
 
 
 class TupleAzureBlobStoreBackend(TupleStoreBackend):
@@ -983,6 +1130,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
         store_name=None,
+        max_concurrent_requests: int = 16,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -994,6 +1142,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             suppress_store_backend_id=suppress_store_backend_id,
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             store_name=store_name,
+            max_concurrent_requests=max_concurrent_requests,
         )
         self.connection_string = connection_string or os.environ.get(
             "AZURE_STORAGE_CONNECTION_STRING"
@@ -1025,9 +1174,19 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         return blob_service_client.get_container_client(self.container)
 
     def _get(self, key):
+        from azure.core.exceptions import ResourceNotFoundError
+
         az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
-        return (
-            self._container_client.download_blob(az_blob_key).readall().decode("utf-8")
+        try:
+            blob_downloader = self._container_client.download_blob(az_blob_key)
+        except ResourceNotFoundError:
+            raise InvalidKeyError(
+                f"Unable to retrieve object from TupleAzureBlobStoreBackend with the following Key: {str(az_blob_key)}"
+            )
+
+        return self._decode_stored_value(
+            value=blob_downloader.readall(),
+            content_encoding="utf-8",
         )
 
     def _set(self, key, value, content_encoding="utf-8", **kwargs):
@@ -1054,16 +1213,34 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
                     overwrite=True,
                 )
         else:
-            self._container_client.upload_blob(
-                name=az_blob_key, data=value, overwrite=True
-            )
+            compression: Optional[str] = get_compression_of_bytes(value=value)
+            if compression:
+                my_content_settings = ContentSettings(
+                    content_type="application/json", content_encoding=compression
+                )
+                self._container_client.upload_blob(
+                    name=az_blob_key,
+                    data=value,
+                    overwrite=True,
+                    content_settings=my_content_settings,
+                )
+            else:
+                self._container_client.upload_blob(
+                    name=az_blob_key, data=value, overwrite=True
+                )
         return az_blob_key
 
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature
-        key_list = []
+        return list(self.iter_keys(prefix=prefix))
 
-        for obj in self._container_client.list_blobs(name_starts_with=self.prefix):  # type: ignore[attr-defined]
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
+        listing_prefix: str = self._get_listing_prefix(prefix=prefix)
+        if self.prefix and listing_prefix:
+            listing_prefix = "/".join((self.prefix, listing_prefix))
+        else:
+            listing_prefix = listing_prefix or self.prefix
+
+        for obj in self._container_client.list_blobs(name_starts_with=listing_prefix):  # type: ignore[attr-defined]
             az_blob_key = os.path.relpath(obj.name)
             if az_blob_key.startswith(f"{self.prefix}/"):
                 az_blob_key = az_blob_key[len(self.prefix) + 1 :]
@@ -1076,9 +1253,8 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             ):
                 continue
             key = self._convert_filepath_to_key(az_blob_key)
-
-            key_list.append(key)
-        return key_list
+            if self._key_has_prefix(key=key, prefix=prefix):
+                yield key
 
     def get_url_for_key(self, key, protocol=None):
         az_blob_key = self._convert_key_to_filepath(key)
@@ -1090,8 +1266,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         )
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.iter_keys(prefix=key)
 
     def _move(self, source_key, dest_key, **kwargs) -> None:
         source_blob_path = self._convert_key_to_filepath(source_key)
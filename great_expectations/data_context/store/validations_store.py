@@ -1,10 +1,13 @@
 import random
 import uuid
-from typing import Dict
+from typing import Dict, Optional
 
+import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
-    ExpectationSuiteValidationResultSchema,
+)
+from great_expectations.core.json_serializer import (
+    ExpectationSuiteValidationResultJsonSerializer,
 )
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
@@ -19,7 +22,12 @@ from great_expectations.data_context.types.resource_identifiers import (
     GeCloudIdentifier,
     ValidationResultIdentifier,
 )
-from great_expectations.data_context.util import load_class
+from great_expectations.data_context.util import (
+    compress_bytes,
+    decompress_bytes,
+    load_class,
+    validate_compression,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -93,15 +101,38 @@ class ValidationsStore(Store):
             bug_risk: Moderate
 
     --ge-feature-maturity-info--
+
+    Validation Results written with "COMPLETE" result formats can be very large; to reduce their footprint, the
+    ValidationsStore can be configured to write them in a compact (non-indented) JSON encoding, and/or compressed:
+
+        validations_store:
+            class_name: ValidationsStore
+            compression: gzip  # or "zstd" (requires the "zstandard" package)
+            compact: true
+            store_backend:
+                class_name: TupleFilesystemStoreBackend
+                base_directory: uncommitted/validations/
+
+    The compression format of every stored object is detected when it is read, so Validation Results written before
+    (or without) compression remain readable after these options are changed.
     """
 
     _key_class = ValidationResultIdentifier  # type: ignore[assignment]
 
     def __init__(
-        self, store_backend=None, runtime_environment=None, store_name=None
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        store_name=None,
+        compression: Optional[str] = None,
+        compact: bool = False,
     ) -> None:
-        self._expectationSuiteValidationResultSchema = (
-            ExpectationSuiteValidationResultSchema()
+        validate_compression(compression=compression)
+        self._compression = compression
+        self._compact = compact
+
+        self._expectationSuiteValidationResultSerializer = (
+            ExpectationSuiteValidationResultJsonSerializer()
         )
 
         if store_backend is not None:
@@ -123,6 +154,12 @@ class ValidationsStore(Store):
                     "filepath_suffix", ".json"
                 )
             elif issubclass(store_backend_class, DatabaseStoreBackend):
+                if compression:
+                    # Values are persisted in a String column, which cannot hold compressed bytes.
+                    raise ge_exceptions.StoreConfigurationError(
+                        f"Compression is not supported by {store_backend_class_name}."
+                    )
+
                 # Provide defaults for this common case
                 store_backend["table_name"] = store_backend.get(
                     "table_name", "ge_validations_store"
@@ -148,6 +185,8 @@ class ValidationsStore(Store):
             "store_backend": store_backend,
             "runtime_environment": runtime_environment,
             "store_name": store_name,
+            "compression": compression,
+            "compact": compact,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -166,18 +205,44 @@ class ValidationsStore(Store):
 
         return suite_validation_result_dict
 
+    @property
+    def compression(self) -> Optional[str]:
+        return self._compression
+
+    @property
+    def compact(self) -> bool:
+        return self._compact
+
     def serialize(self, value):
         if self.ge_cloud_mode:
             return value.to_json_dict()
-        return self._expectationSuiteValidationResultSchema.dumps(
-            value, indent=2, sort_keys=True
-        )
+
+        if self._compact:
+            serialized_value: str = (
+                self._expectationSuiteValidationResultSerializer.dumps(
+                    value, separators=(",", ":"), sort_keys=True
+                )
+            )
+        else:
+            serialized_value = self._expectationSuiteValidationResultSerializer.dumps(
+                value, indent=2, sort_keys=True
+            )
+
+        if self._compression:
+            return compress_bytes(
+                value=serialized_value.encode("utf-8"), compression=self._compression
+            )
+
+        return serialized_value
 
     def deserialize(self, value):
         if isinstance(value, dict):
-            return self._expectationSuiteValidationResultSchema.load(value)
-        else:
-            return self._expectationSuiteValidationResultSchema.loads(value)
+            return self._expectationSuiteValidationResultSerializer.load(value)
+
+        if isinstance(value, (bytes, bytearray)):
+            value = decompress_bytes(value=value).decode("utf-8")
+
+        return self._expectationSuiteValidationResultSerializer.loads(value)
 
     def self_check(self, pretty_print):
         return_obj = {}
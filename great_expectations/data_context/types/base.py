@@ -18,7 +18,7 @@ from marshmallow import (
     pre_dump,
     validates_schema,
 )
-from marshmallow.validate import OneOf
+from marshmallow.validate import OneOf, Range
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap
 from ruamel.yaml.compat import StringIO
@@ -1436,13 +1436,22 @@ class IncludeRenderedContentConfigSchema(Schema):
 class ConcurrencyConfig(DictDot):
     """WARNING: This class is experimental."""
 
-    def __init__(self, enabled: bool = False) -> None:
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_database_query_concurrency: Optional[int] = None,
+    ) -> None:
         """Initialize a concurrency configuration to control multithreaded execution.
 
         Args:
             enabled: Whether or not multithreading is enabled.
+            max_database_query_concurrency: Max number of concurrent database queries to execute with multithreading
+                (100 by default).
         """
         self._enabled = enabled
+        # Only set when configured, so that the configuration is serialized as before otherwise.
+        if max_database_query_concurrency is not None:
+            self._max_database_query_concurrency = max_database_query_concurrency
 
     @property
     def enabled(self):
@@ -1452,9 +1461,15 @@ class ConcurrencyConfig(DictDot):
     @property
     def max_database_query_concurrency(self) -> int:
         """Max number of concurrent database queries to execute with mulithreading."""
+        max_database_query_concurrency: Optional[int] = getattr(
+            self, "_max_database_query_concurrency", None
+        )
+        if max_database_query_concurrency is not None:
+            return max_database_query_concurrency
+
         # BigQuery has a limit of 100 for "Concurrent rate limit for interactive queries" as described at
-        # (https://cloud.google.com/bigquery/quotas#query_jobs). If necessary, this can later be tuned for other
-        # databases and/or be manually user configurable.
+        # (https://cloud.google.com/bigquery/quotas#query_jobs). If necessary, this can be tuned for other databases
+        # using the "max_database_query_concurrency" configuration.
         return 100
 
     def add_sqlalchemy_create_engine_parameters(
@@ -1482,6 +1497,30 @@ class ConcurrencyConfigSchema(Schema):
     """WARNING: This class is experimental."""
 
     enabled = fields.Boolean(default=False)
+    max_database_query_concurrency = fields.Integer(
+        attribute="_max_database_query_concurrency",
+        required=False,
+        allow_none=True,
+        validate=Range(min=1),
+    )
+
+    # noinspection PyUnusedLocal
+    @post_dump
+    def remove_max_database_query_concurrency_if_none(
+        self, data: dict, **kwargs
+    ) -> dict:
+        if data.get("max_database_query_concurrency") is None:
+            data.pop("max_database_query_concurrency", None)
+        return data
+
+    # noinspection PyUnusedLocal
+    @post_load
+    def rename_max_database_query_concurrency(self, data: dict, **kwargs) -> dict:
+        if "_max_database_query_concurrency" in data:
+            data["max_database_query_concurrency"] = data.pop(
+                "_max_database_query_concurrency"
+            )
+        return data
 
 
 class GeCloudConfig(DictDot):
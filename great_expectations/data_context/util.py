@@ -1,5 +1,6 @@
 import base64
 import copy
+import gzip
 import inspect
 import json
 import logging
@@ -35,6 +36,11 @@ try:
 except ImportError:
     secretmanager = None
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 import pyparsing as pp
 
 import great_expectations.exceptions as ge_exceptions
@@ -476,6 +482,89 @@ def substitute_all_config_variables(
     )
 
 
+# Leading "magic" bytes of each supported compression format; used to recognize compressed payloads independently of
+# configuration, so that stores can read both compressed and plain (legacy) objects transparently.
+COMPRESSION_MAGIC_BYTES = {
+    "gzip": b"\x1f\x8b",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+
+
+def validate_compression(compression: Optional[str]) -> None:
+    """
+    Ensure that the requested compression format is supported (and that the library it requires is installed).
+
+    :param compression: one of "gzip", "zstd", or None (no compression)
+    """
+    if compression is None:
+        return
+
+    if compression not in COMPRESSION_MAGIC_BYTES:
+        raise ge_exceptions.StoreConfigurationError(
+            f'Unsupported compression "{compression}"; must be one of {", ".join(COMPRESSION_MAGIC_BYTES.keys())}.'
+        )
+
+    if compression == "zstd" and zstandard is None:
+        raise ge_exceptions.StoreConfigurationError(
+            'Compression "zstd" requires the "zstandard" package; please install it with "pip install zstandard".'
+        )
+
+
+def get_compression_of_bytes(value: Any) -> Optional[str]:
+    """
+    Detect the compression format of a payload from its leading bytes.
+
+    :param value: a (possibly compressed) payload
+    :return: the name of the compression format (e.g., "gzip"), or None if the payload is not compressed
+    """
+    if not isinstance(value, (bytes, bytearray)):
+        return None
+
+    compression: str
+    magic_bytes: bytes
+    for compression, magic_bytes in COMPRESSION_MAGIC_BYTES.items():
+        if value.startswith(magic_bytes):
+            return compression
+
+    return None
+
+
+def compress_bytes(value: bytes, compression: str) -> bytes:
+    """
+    Compress a payload using the requested compression format.
+
+    :param value: payload to compress
+    :param compression: one of "gzip" or "zstd"
+    :return: compressed payload
+    """
+    validate_compression(compression=compression)
+
+    if compression == "zstd":
+        return zstandard.ZstdCompressor().compress(value)
+
+    # An mtime of 0 makes the output deterministic for identical payloads.
+    return gzip.compress(value, mtime=0)
+
+
+def decompress_bytes(value: bytes) -> bytes:
+    """
+    Decompress a payload whose compression format is detected from its leading bytes; uncompressed payloads are
+    returned unchanged.
+
+    :param value: a (possibly compressed) payload
+    :return: uncompressed payload
+    """
+    compression: Optional[str] = get_compression_of_bytes(value=value)
+    if compression is None:
+        return value
+
+    if compression == "zstd":
+        validate_compression(compression=compression)
+        return zstandard.ZstdDecompressor().decompressobj().decompress(value)
+
+    return gzip.decompress(value)
+
+
 def file_relative_path(dunderfile, relative_path):
     """
     This function is useful when one needs to load a file that is
@@ -520,6 +520,18 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
 
     --ge-feature-maturity-info--"""
 
+    # Column aggregates that "defer_column_aggregates" can batch into a single query
+    _deferrable_column_aggregates = (
+        "max",
+        "mean",
+        "min",
+        "nonnull_count",
+        "stdev",
+        "sum",
+        "unique_count",
+    )
+    _numeric_column_aggregates = ("max", "mean", "min", "stdev", "sum")
+
     @classmethod
     def from_dataset(cls, dataset=None):
         if isinstance(dataset, SqlAlchemyDataset):
@@ -537,6 +549,10 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         *args,
         **kwargs,
     ) -> None:
+        # Column aggregates registered through "defer_column_aggregates" and the raw values they produced.
+        self._pending_column_aggregates = {}
+        self._column_aggregates = {}
+
         if custom_sql and not table_name:
             # NOTE: Eugene 2020-01-31: @James, this is a not a proper fix, but without it the "public" schema
             # was used for a temp table and raising an error
@@ -776,64 +792,162 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def get_table_columns(self) -> List[str]:
         return [col["name"] for col in self.columns]
 
-    def get_column_nonnull_count(self, column):
-        ignore_values = [None]
-        count_query = sa.select(
-            [
-                sa.func.count().label("element_count"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.or_(
-                                    # first part of OR(IN (NULL)) gives error in teradata
-                                    sa.column(column).in_(ignore_values)
-                                    if self.engine.dialect.name.lower()
-                                    != GESqlDialect.TERADATASQL
-                                    else False,
-                                    # Below is necessary b/c sa.in_() uses `==` but None != None
-                                    # But we only consider this if None is actually in the list of ignore values
-                                    sa.column(column).is_(None)
-                                    if None in ignore_values
-                                    else False,
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
+    def defer_column_aggregates(self, aggregates, columns=None) -> None:
+        """Register column aggregates to be computed together, in a single query, the first time any one of them is
+        requested (e.g. by get_column_max); the values are then kept for the lifetime of the dataset.
+
+        Args:
+            aggregates: names of the aggregates to defer, among "max", "mean", "min", "nonnull_count", "stdev",
+                "sum" and "unique_count"
+            columns: the columns for which to compute the aggregates (all columns of the table by default)
+
+        "max", "mean", "min", "stdev" and "sum" are only deferred for columns reflected with a numeric type; any
+        aggregate that is not deferred is computed by its own query when requested, as usual.
+        """
+        unknown_aggregates = set(aggregates) - set(self._deferrable_column_aggregates)
+        if unknown_aggregates:
+            raise ValueError(
+                f"Unable to defer unknown column aggregates: {sorted(unknown_aggregates)}"
+            )
+
+        if columns is None:
+            columns = self.get_table_columns()
+
+        numeric_columns = set(self._get_numeric_columns())
+        for column in columns:
+            for aggregate in aggregates:
+                key = (aggregate, column)
+                if key in self._column_aggregates:
+                    continue
+                if (
+                    aggregate in self._numeric_column_aggregates
+                    and column not in numeric_columns
+                ):
+                    continue
+                self._pending_column_aggregates[key] = True
+
+    def _get_numeric_columns(self) -> List[str]:
+        return [
+            col["name"]
+            for col in self.columns
+            if isinstance(col.get("type"), (sa.types.Integer, sa.types.Numeric))
+        ]
+
+    def _get_column_aggregate_expression(self, aggregate, column):
+        if aggregate == "max":
+            return sa.func.max(sa.column(column))
+        if aggregate == "mean":
+            # column * 1.0 needed for correct calculation of avg in MSSQL
+            return sa.func.avg(sa.column(column) * 1.0)
+        if aggregate == "min":
+            return sa.func.min(sa.column(column))
+        if aggregate == "nonnull_count":
+            ignore_values = [None]
+            null_count = sa.func.sum(
+                sa.case(
+                    [
+                        (
+                            sa.or_(
+                                # first part of OR(IN (NULL)) gives error in teradata
+                                sa.column(column).in_(ignore_values)
+                                if self.engine.dialect.name.lower()
+                                != GESqlDialect.TERADATASQL
+                                else False,
+                                # Below is necessary b/c sa.in_() uses `==` but None != None
+                                # But we only consider this if None is actually in the list of ignore values
+                                sa.column(column).is_(None)
+                                if None in ignore_values
+                                else False,
+                            ),
+                            1,
+                        )
+                    ],
+                    else_=0,
+                )
+            )
+            # The sum of an empty table is NULL, which is handled by get_column_nonnull_count.
+            return sa.func.count() - null_count
+        if aggregate == "stdev":
+            if self.sql_engine_dialect.name.lower() == GESqlDialect.MSSQL:
+                # Note: "stdev_samp" is not a recognized built-in function name (but "stdev" does exist for "mssql").
+                # This function is used to compute statistical standard deviation from sample data (per the reference in
+                # https://sqlserverrider.wordpress.com/2013/03/06/standard-deviation-functions-stdev-and-stdevp-sql-server).
+                return sa.func.stdev(sa.column(column))
+            return sa.func.stddev_samp(sa.column(column))
+        if aggregate == "sum":
+            return sa.func.sum(sa.column(column))
+        if aggregate == "unique_count":
+            return sa.func.count(sa.func.distinct(sa.column(column)))
+        raise ValueError(f"Unknown column aggregate: {aggregate}")
+
+    def _get_column_aggregate(self, aggregate, column):
+        """Return the raw value of a column aggregate, computing every pending deferred aggregate along with it."""
+        key = (aggregate, column)
+        if key in self._pending_column_aggregates:
+            self._compute_pending_column_aggregates()
+
+        if key in self._column_aggregates:
+            if self.caching:
+                return self._column_aggregates[key]
+            return self._column_aggregates.pop(key)
+
+        return self.engine.execute(
+            sa.select(
+                [self._get_column_aggregate_expression(aggregate, column)]
+            ).select_from(self._table)
+        ).scalar()
+
+    def _compute_pending_column_aggregates(self) -> None:
+        keys = list(self._pending_column_aggregates)
+        self._pending_column_aggregates = {}
+        try:
+            self._compute_column_aggregates(keys)
+        except Exception as e:
+            logger.debug(
+                f"Unable to compute {len(keys)} column aggregates in a single query ({e}); computing them by aggregate"
+            )
+            # One unsupported aggregate (e.g. "stdev" on sqlite) fails the whole query; batch each aggregate
+            # separately so that the others are still computed together.  Aggregates that still fail are computed
+            # (and their errors raised) by their own query when requested.
+            keys_by_aggregate = {}
+            for key in keys:
+                keys_by_aggregate.setdefault(key[0], []).append(key)
+            for aggregate, aggregate_keys in keys_by_aggregate.items():
+                try:
+                    self._compute_column_aggregates(aggregate_keys)
+                except Exception as e:
+                    logger.debug(
+                        f"Unable to compute the {aggregate} column aggregate in a single query: {e}"
                     )
-                ).label("null_count"),
+
+    def _compute_column_aggregates(self, keys) -> None:
+        query = sa.select(
+            [
+                self._get_column_aggregate_expression(aggregate, column).label(
+                    f"aggregate_{idx}"
+                )
+                for idx, (aggregate, column) in enumerate(keys)
             ]
         ).select_from(self._table)
-        count_results = dict(self.engine.execute(count_query).fetchone())
-        element_count = int(count_results.get("element_count") or 0)
-        null_count = int(count_results.get("null_count") or 0)
-        return element_count - null_count
+        row = self.engine.execute(query).fetchone()
+        for idx, key in enumerate(keys):
+            self._column_aggregates[key] = row[idx]
+
+    def get_column_nonnull_count(self, column):
+        return int(self._get_column_aggregate("nonnull_count", column) or 0)
 
     def get_column_sum(self, column):
-        return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select([sa.func.sum(sa.column(column))]).select_from(self._table)
-            ).scalar()
-        )
+        return convert_to_json_serializable(self._get_column_aggregate("sum", column))
 
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
-        return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select([sa.func.max(sa.column(column))]).select_from(self._table)
-            ).scalar()
-        )
+        return convert_to_json_serializable(self._get_column_aggregate("max", column))
 
     def get_column_min(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
-        return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select([sa.func.min(sa.column(column))]).select_from(self._table)
-            ).scalar()
-        )
+        return convert_to_json_serializable(self._get_column_aggregate("min", column))
 
     def get_column_value_counts(self, column, sort="value", collate=None):
         if sort not in ["value", "count", "none"]:
@@ -869,22 +983,11 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return series
 
     def get_column_mean(self, column):
-        # column * 1.0 needed for correct calculation of avg in MSSQL
-        return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select([sa.func.avg(sa.column(column) * 1.0)]).select_from(
-                    self._table
-                )
-            ).scalar()
-        )
+        return convert_to_json_serializable(self._get_column_aggregate("mean", column))
 
     def get_column_unique_count(self, column):
         return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select(
-                    [sa.func.count(sa.func.distinct(sa.column(column)))]
-                ).select_from(self._table)
-            ).scalar()
+            self._get_column_aggregate("unique_count", column)
         )
 
     def get_column_median(self, column):
@@ -1194,23 +1297,9 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 )
 
     def get_column_stdev(self, column):
-        if self.sql_engine_dialect.name.lower() == GESqlDialect.MSSQL:
-            # Note: "stdev_samp" is not a recognized built-in function name (but "stdev" does exist for "mssql").
-            # This function is used to compute statistical standard deviation from sample data (per the reference in
-            # https://sqlserverrider.wordpress.com/2013/03/06/standard-deviation-functions-stdev-and-stdevp-sql-server).
-            res = self.engine.execute(
-                sa.select([sa.func.stdev(sa.column(column))])
-                .select_from(self._table)
-                .where(sa.column(column) is not None)
-            ).fetchone()
-        else:
-            res = self.engine.execute(
-                sa.select([sa.func.stddev_samp(sa.column(column))])
-                .select_from(self._table)
-                .where(sa.column(column) is not None)
-            ).fetchone()
+        res = self._get_column_aggregate("stdev", column)
         try:
-            result = float(res[0])
+            result = float(res)
         except TypeError:
             logger.warning(
                 f"Having issue with stddev_samp on {column}, schema: {self._table.schema} table: {self._table.name}"
@@ -1,5 +1,8 @@
 from typing import Dict, List, Optional, Union
 
+from great_expectations.core.sqlalchemy_metadata_cache import (
+    sqlalchemy_metadata_cache,
+)
 from great_expectations.datasource.data_connector.configured_asset_sql_data_connector import (
     ConfiguredAssetSqlDataConnector,
 )
@@ -8,11 +11,9 @@ from great_expectations.execution_engine.sqlalchemy_dialect import GESqlDialect
 from great_expectations.util import deep_filter_properties_iterable
 
 try:
-    import sqlalchemy as sa
     from sqlalchemy.engine import Engine
     from sqlalchemy.exc import OperationalError
 except ImportError:
-    sa = None
     Engine = None
     OperationalError = None
 
@@ -191,12 +192,11 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             system_tables = ["sqlite_master"]  # sqlite
 
         engine: Engine = self.execution_engine.engine
-        inspector = sa.inspect(engine)
 
         selected_schema_name = schema_name
 
         tables: List[Dict[str, str]] = []
-        for schema_name in inspector.get_schema_names():
+        for schema_name in sqlalchemy_metadata_cache.get_schema_names(engine=engine):
             if (
                 ignore_information_schemas_and_system_tables
                 and schema_name in information_schemas
@@ -206,7 +206,9 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             if selected_schema_name is not None and schema_name != selected_schema_name:
                 continue
 
-            for table_name in inspector.get_table_names(schema=schema_name):
+            for table_name in sqlalchemy_metadata_cache.get_table_names(
+                engine=engine, schema_name=schema_name
+            ):
                 if ignore_information_schemas_and_system_tables and (
                     table_name in system_tables
                 ):
@@ -224,7 +226,9 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             if include_views:
                 # Note: this is not implemented for bigquery
                 try:
-                    view_names = inspector.get_view_names(schema=schema_name)
+                    view_names = sqlalchemy_metadata_cache.get_view_names(
+                        engine=engine, schema_name=schema_name
+                    )
                 except NotImplementedError:
                     # Not implemented by Athena dialect
                     pass
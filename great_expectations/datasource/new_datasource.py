@@ -10,7 +10,7 @@ from great_expectations.core.batch import (
     BatchRequest,
     RuntimeBatchRequest,
 )
-from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.core.batch_spec import BatchSpec, PathBatchSpec
 from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.datasource.data_connector import DataConnector
@@ -189,6 +189,17 @@ class BaseDatasource:
                 batch_definition.batch_spec_passthrough = (
                     batch_request.batch_spec_passthrough
                 )
+                if self.execution_engine.max_loaded_batches is not None:
+                    # The number of loaded batches is bounded, so batches are only loaded when their data is needed.
+                    batches.append(
+                        self._get_lazy_batch(
+                            data_connector=data_connector,
+                            batch_request=batch_request,
+                            batch_definition=batch_definition,
+                        )
+                    )
+                    continue
+
                 batch_data: Any  # type: ignore[no-redef]
                 batch_spec: PathBatchSpec  # type: ignore[no-redef]
                 batch_markers: BatchMarkers  # type: ignore[no-redef]
@@ -209,6 +220,31 @@ class BaseDatasource:
                 batches.append(new_batch)
             return batches
 
+    def _get_lazy_batch(
+        self,
+        data_connector: DataConnector,
+        batch_request: BatchRequest,
+        batch_definition: BatchDefinition,
+    ) -> Batch:
+        batch_spec: BatchSpec = data_connector.build_batch_spec(
+            batch_definition=batch_definition
+        )
+        batch = Batch(
+            data=None,
+            batch_request=batch_request,
+            batch_definition=batch_definition,
+            batch_spec=batch_spec,
+            batch_data_loader=lambda: self.execution_engine.get_batch_data_and_markers(
+                batch_spec=batch_spec
+            ),
+        )
+        self.execution_engine.load_batch_data_lazily(
+            batch_id=batch.id,
+            batch_data_loader=lambda: batch.data,
+            batch_spec=batch_spec,
+        )
+        return batch
+
     def _build_data_connector_from_config(
         self,
         name: str,
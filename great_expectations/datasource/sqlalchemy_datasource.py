@@ -5,6 +5,9 @@ from pathlib import Path
 from string import Template
 
 from great_expectations.core.batch import Batch, BatchMarkers
+from great_expectations.core.sqlalchemy_engine_registry import (
+    sqlalchemy_engine_registry,
+)
 from great_expectations.core.usage_statistics.events import UsageStatsEvents
 from great_expectations.core.util import nested_update
 from great_expectations.data_context.types.base import ConcurrencyConfig
@@ -23,14 +26,12 @@ logger = logging.getLogger(__name__)
 
 try:
     import sqlalchemy
-    from sqlalchemy import create_engine
     from sqlalchemy.sql.elements import quoted_name
 
     make_url = import_make_url()
 
 except ImportError:
     sqlalchemy = None
-    create_engine = None
     logger.debug("Unable to import sqlalchemy.")
 
 
@@ -257,14 +258,16 @@ class SqlAlchemyDatasource(LegacyDatasource):
                 # If a connection string or url was provided, use that.
                 if "connection_string" in kwargs:
                     connection_string = kwargs.pop("connection_string")
-                    self.engine = create_engine(connection_string, **kwargs)
+                    self.engine = sqlalchemy_engine_registry.get_engine(
+                        connection_string, **kwargs
+                    )
                     connection = self.engine.connect()
                     connection.close()
                 elif "url" in credentials:
                     url = credentials.pop("url")
                     parsed_url = make_url(url)
                     self.drivername = parsed_url.drivername
-                    self.engine = create_engine(url, **kwargs)
+                    self.engine = sqlalchemy_engine_registry.get_engine(url, **kwargs)
                     connection = self.engine.connect()
                     connection.close()
 
@@ -276,7 +279,9 @@ class SqlAlchemyDatasource(LegacyDatasource):
                         drivername,
                     ) = self._get_sqlalchemy_connection_options(**kwargs)
                     self.drivername = drivername
-                    self.engine = create_engine(options, **create_engine_kwargs)
+                    self.engine = sqlalchemy_engine_registry.get_engine(
+                        options, **create_engine_kwargs
+                    )
                     connection = self.engine.connect()
                     connection.close()
 
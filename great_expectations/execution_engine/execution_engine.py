@@ -1,9 +1,21 @@
 import copy
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import MutableMapping
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 
@@ -36,6 +48,102 @@ class NoOpDict:
         return None
 
 
+class BatchDataDict(MutableMapping):
+    """The batch data loaded into an execution engine, by batch_id.
+
+    Besides batch data, a loader (a function returning the batch data) can be set for a batch_id, in which case the
+    batch data is only loaded when it is first accessed.  If "max_loaded_batches" is set, at most that many batches set
+    with a loader stay loaded: the least recently accessed one is unloaded (after calling "on_unload" with its batch_id)
+    when another one is loaded, and is loaded again if it is accessed later.  Batch data set directly is never unloaded.
+    """
+
+    def __init__(
+        self,
+        max_loaded_batches: Optional[int] = None,
+        on_unload: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        if max_loaded_batches is not None and max_loaded_batches < 1:
+            raise ValueError(
+                f'"max_loaded_batches" must be a positive integer (got {max_loaded_batches}).'
+            )
+
+        self._max_loaded_batches = max_loaded_batches
+        self._on_unload = on_unload
+        # Batch ids, in the order in which they were added.
+        self._batch_ids: Dict[str, None] = {}
+        # Loaded batch data, least recently accessed first.
+        self._batch_data: "OrderedDict[str, Any]" = OrderedDict()
+        self._batch_data_loaders: Dict[str, Callable[[], Any]] = {}
+
+    @property
+    def max_loaded_batches(self) -> Optional[int]:
+        return self._max_loaded_batches
+
+    def set_loader(self, batch_id: str, batch_data_loader: Callable[[], Any]) -> None:
+        self._batch_data.pop(batch_id, None)
+        self._batch_data_loaders[batch_id] = batch_data_loader
+        self._batch_ids[batch_id] = None
+
+    def is_loaded(self, batch_id: str) -> bool:
+        return batch_id in self._batch_data
+
+    def __getitem__(self, batch_id: str) -> Any:
+        if batch_id in self._batch_data:
+            if batch_id in self._batch_data_loaders:
+                self._batch_data.move_to_end(batch_id)
+            return self._batch_data[batch_id]
+
+        if batch_id not in self._batch_data_loaders:
+            raise KeyError(batch_id)
+
+        logger.debug(f"Loading the data of batch {batch_id}")
+        batch_data: Any = self._batch_data_loaders[batch_id]()
+        self._batch_data[batch_id] = batch_data
+        self._unload_least_recently_used_batches()
+        return batch_data
+
+    def __setitem__(self, batch_id: str, batch_data: Any) -> None:
+        self._batch_data_loaders.pop(batch_id, None)
+        self._batch_data[batch_id] = batch_data
+        self._batch_ids[batch_id] = None
+
+    def __delitem__(self, batch_id: str) -> None:
+        if batch_id not in self._batch_ids:
+            raise KeyError(batch_id)
+
+        del self._batch_ids[batch_id]
+        self._batch_data.pop(batch_id, None)
+        self._batch_data_loaders.pop(batch_id, None)
+
+    def __contains__(self, batch_id: object) -> bool:
+        # Unlike "get()", checking for a batch_id does not load its batch data.
+        return batch_id in self._batch_ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._batch_ids))
+
+    def __len__(self) -> int:
+        return len(self._batch_ids)
+
+    def _unload_least_recently_used_batches(self) -> None:
+        if self._max_loaded_batches is None:
+            return
+
+        unloadable_batch_ids: List[str] = [
+            batch_id
+            for batch_id in self._batch_data
+            if batch_id in self._batch_data_loaders
+        ]
+        batch_id: str
+        for batch_id in unloadable_batch_ids[
+            : max(len(unloadable_batch_ids) - self._max_loaded_batches, 0)
+        ]:
+            logger.debug(f"Unloading the data of batch {batch_id}")
+            if self._on_unload is not None:
+                self._on_unload(batch_id)
+            self._batch_data.pop(batch_id, None)
+
+
 class BatchData:
     def __init__(self, execution_engine) -> None:
         self._execution_engine = execution_engine
@@ -44,6 +152,11 @@ class BatchData:
     def execution_engine(self):
         return self._execution_engine
 
+    @property
+    def is_released(self) -> bool:
+        """Whether the execution engine has released resources the batch data depends on (which must be loaded again)."""
+        return False
+
     def head(self, *args, **kwargs):
         # CONFLICT ON PURPOSE. REMOVE.
         return pd.DataFrame({})
@@ -158,6 +271,7 @@ class ExecutionEngine(ABC):
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        max_loaded_batches: Optional[int] = None,
     ) -> None:
         self.name = name
         self._validator = validator
@@ -185,7 +299,14 @@ class ExecutionEngine(ABC):
             if key in self.recognized_batch_spec_defaults
         }
 
-        self._batch_data_dict = {}
+        # Batches loaded lazily (see load_batch_data_lazily()) are unloaded when more than "max_loaded_batches" of them
+        # are loaded, and are loaded again when they are needed.
+        self._batch_data_dict = BatchDataDict(
+            max_loaded_batches=max_loaded_batches,
+            on_unload=self._release_batch_data,
+        )
+        # Batch specs of the batches loaded lazily, which describe them without loading their data.
+        self._lazy_batch_specs: Dict[str, BatchSpec] = {}
         if batch_data_dict is None:
             batch_data_dict = {}
         self._active_batch_data_id = None
@@ -199,6 +320,7 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "max_loaded_batches": max_loaded_batches,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -249,6 +371,11 @@ class ExecutionEngine(ABC):
     def loaded_batch_data_ids(self):
         return list(self.loaded_batch_data_dict.keys())
 
+    @property
+    def max_loaded_batches(self) -> Optional[int]:
+        """The maximum number of lazily loaded batches kept in memory (None if it is not limited)."""
+        return self._batch_data_dict.max_loaded_batches
+
     @property
     def config(self) -> dict:
         return self._config
@@ -281,9 +408,72 @@ class ExecutionEngine(ABC):
         """
         Loads the specified batch_data into the execution engine
         """
+        batch_data = self._build_batch_data(batch_data=batch_data)
+        if (
+            self._batch_data_dict.is_loaded(batch_id)
+            and self._batch_data_dict[batch_id] is not batch_data
+        ):
+            # The batch is being replaced.
+            self._release_batch_data(batch_id=batch_id)
         self._batch_data_dict[batch_id] = batch_data
+        self._lazy_batch_specs.pop(batch_id, None)
         self._active_batch_data_id = batch_id
 
+    def load_batch_data_lazily(
+        self,
+        batch_id: str,
+        batch_data_loader: Callable[[], Any],
+        batch_spec: Optional[BatchSpec] = None,
+    ) -> None:
+        """
+        Registers a function loading the specified batch_data into the execution engine, which is only called when the
+        batch data is first needed (and again after it has been unloaded, if "max_loaded_batches" is set).  The batch
+        spec of the batch, if given, lets the execution engine plan metric computations without loading its data.
+        """
+        if self._batch_data_dict.is_loaded(batch_id):
+            self._release_batch_data(batch_id=batch_id)
+        if batch_spec is None:
+            self._lazy_batch_specs.pop(batch_id, None)
+        else:
+            self._lazy_batch_specs[batch_id] = batch_spec
+        self._batch_data_dict.set_loader(
+            batch_id=batch_id,
+            batch_data_loader=lambda: self._build_batch_data(
+                batch_data=batch_data_loader()
+            ),
+        )
+        self._active_batch_data_id = batch_id
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        """
+        Removes the specified batch_data from the execution engine
+        """
+        if self._batch_data_dict.is_loaded(batch_id):
+            self._release_batch_data(batch_id=batch_id)
+        self._batch_data_dict.pop(batch_id, None)
+        self._lazy_batch_specs.pop(batch_id, None)
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
+    def _build_batch_data(self, batch_data: Any) -> Any:
+        """
+        Converts data to be loaded into the execution engine into the execution engine's type of batch data
+        """
+        return batch_data
+
+    def _release_batch_data(self, batch_id: str) -> None:
+        """
+        Releases what the execution engine keeps about the data of a loaded batch, before it is unloaded or replaced
+        """
+        pass
+
+    def release_persisted_data(self, domain_records_only: bool = False) -> None:
+        """
+        Releases data kept by the execution engine to speed up metric computations (e.g., persisted Spark DataFrames).
+        Loaded batches remain available.  This is called by the Validator once its metrics have been computed.
+        """
+        pass
+
     def _load_batch_data_from_dict(self, batch_data_dict) -> None:
         """
         Loads all data in batch_data_dict into load_batch_data
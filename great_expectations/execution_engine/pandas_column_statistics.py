@@ -0,0 +1,337 @@
+"""
+Computes standard statistics (e.g., the minimum, mean, standard deviation, quantiles, and number of distinct values) of
+many columns of a pandas DataFrame at once, with NumPy reductions over 2-D arrays of the columns sharing a dtype, rather
+than column by column.  The values are those the column aggregate metrics of pandas compute one column at a time.
+
+WARNING: This module is experimental.
+"""
+
+import logging
+import warnings
+from collections import defaultdict
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_COLUMN_STATISTICS_METRIC_NAMES = {
+    "column.min",
+    "column.max",
+    "column.sum",
+    "column.mean",
+    "column.median",
+    "column.standard_deviation",
+    "column.quantile_values",
+    "column.distinct_values.count",
+}
+
+STRING_COLUMN_STATISTICS_METRIC_NAMES = {
+    "column_values.length.min",
+    "column_values.length.max",
+}
+
+COLUMN_STATISTICS_METRIC_NAMES = (
+    NUMERIC_COLUMN_STATISTICS_METRIC_NAMES | STRING_COLUMN_STATISTICS_METRIC_NAMES
+)
+
+NUMERIC_DTYPES = (np.dtype("int64"), np.dtype("float64"))
+
+QUANTILE_INTERPOLATION_OPTIONS = ("linear", "lower", "higher", "midpoint", "nearest")
+
+# NumPy 1.22 renamed the "interpolation" argument of percentile functions to "method".
+_PERCENTILE_METHOD_ARGUMENT = (
+    "method" if np.lib.NumpyVersion(np.__version__) >= "1.22.0" else "interpolation"
+)
+
+
+def compute_column_statistics(
+    df: pd.DataFrame, metric_configurations: List[MetricConfiguration]
+) -> Dict[Tuple[str, str, str], Any]:
+    """Compute column statistics metrics of (entire) columns of a DataFrame.
+
+    Only the statistics of int64 and float64 columns, and the lengths of (non-null) values of columns holding strings,
+    are computed; other metrics are left out of the result, to be computed one by one.
+
+    Args:
+        df: the DataFrame of a batch
+        metric_configurations: configurations of metrics among COLUMN_STATISTICS_METRIC_NAMES, of columns of "df"
+
+    Returns:
+        The values of the computed metrics, by metric configuration id
+    """
+    configurations_by_column: Dict[str, List[MetricConfiguration]] = defaultdict(list)
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metric_configurations:
+        configurations_by_column[
+            metric_configuration.metric_domain_kwargs["column"]
+        ].append(metric_configuration)
+
+    if len(df) == 0 or not df.columns.is_unique:
+        return {}
+
+    # Columns by the dtype of the 2-D array holding them.
+    columns_by_dtype: Dict[np.dtype, List[str]] = defaultdict(list)
+    column: str
+    for column, configurations in configurations_by_column.items():
+        if column not in df.columns:
+            continue
+
+        dtype: np.dtype = df[column].dtype
+        metric_names = {configuration.metric_name for configuration in configurations}
+        if dtype in NUMERIC_DTYPES and metric_names.issubset(
+            NUMERIC_COLUMN_STATISTICS_METRIC_NAMES
+        ):
+            columns_by_dtype[dtype].append(column)
+        elif dtype == np.dtype("object") and metric_names.issubset(
+            STRING_COLUMN_STATISTICS_METRIC_NAMES
+        ):
+            columns_by_dtype[dtype].append(column)
+
+    resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+    with warnings.catch_warnings(), np.errstate(all="ignore"):
+        # Reductions of all-null columns warn (and yield NaN, as pandas does).
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        columns: List[str]
+        for dtype, columns in columns_by_dtype.items():
+            values: np.ndarray = np.asfortranarray(df[columns].to_numpy(dtype=dtype))
+            if dtype == np.dtype("object"):
+                statistics = _StringColumnStatistics(values=values)
+            else:
+                statistics = _NumericColumnStatistics(values=values)
+
+            column_index: int
+            for column_index, column in enumerate(columns):
+                for metric_configuration in configurations_by_column[column]:
+                    try:
+                        resolved_metrics[
+                            metric_configuration.id
+                        ] = statistics.get_metric_value(
+                            metric_configuration=metric_configuration,
+                            column_index=column_index,
+                        )
+                    except _UnsupportedColumnStatisticError:
+                        continue
+
+    return resolved_metrics
+
+
+class _UnsupportedColumnStatisticError(Exception):
+    pass
+
+
+class _NumericColumnStatistics:
+    """Statistics of the columns of a 2-D int64 or float64 array, computed lazily, for all of the columns at once."""
+
+    def __init__(self, values: np.ndarray) -> None:
+        self._values = values
+        self._cache: Dict[Tuple, np.ndarray] = {}
+
+    def get_metric_value(
+        self, metric_configuration: MetricConfiguration, column_index: int
+    ) -> Any:
+        metric_name: str = metric_configuration.metric_name
+        metric_value_kwargs: dict = metric_configuration.metric_value_kwargs or {}
+        if metric_name in ("column.min", "column.max"):
+            if metric_value_kwargs.get("parse_strings_as_datetimes"):
+                raise _UnsupportedColumnStatisticError
+
+            if self._non_null_counts()[column_index] == 0:
+                return np.nan
+
+            return self._get(metric_name)[column_index]
+
+        if metric_name == "column.quantile_values":
+            if not {"quantiles", "allow_relative_error"}.issubset(metric_value_kwargs):
+                raise _UnsupportedColumnStatisticError
+
+            interpolation = metric_value_kwargs["allow_relative_error"] or "nearest"
+            if interpolation not in QUANTILE_INTERPOLATION_OPTIONS:
+                raise _UnsupportedColumnStatisticError
+
+            quantiles: tuple = tuple(metric_value_kwargs["quantiles"])
+            return self._get(metric_name, quantiles, interpolation)[
+                :, column_index
+            ].tolist()
+
+        if metric_name == "column.distinct_values.count":
+            return int(self._get(metric_name)[column_index])
+
+        if (
+            metric_name in ("column.mean", "column.median")
+            and self._non_null_counts()[column_index] == 0
+        ):
+            # Like pandas, return a (Python float) NaN for columns of nulls.
+            return np.nan
+
+        return self._get(metric_name)[column_index]
+
+    def _get(self, *key) -> np.ndarray:
+        if key not in self._cache:
+            self._cache[key] = getattr(self, f"_compute_{key[0].replace('.', '_')}")(
+                *key[1:]
+            )
+
+        return self._cache[key]
+
+    @property
+    def _is_float(self) -> bool:
+        return self._values.dtype == np.dtype("float64")
+
+    def _null_mask(self) -> np.ndarray:
+        if "null_mask" not in self._cache:
+            self._cache["null_mask"] = np.isnan(self._values)
+
+        return self._cache["null_mask"]
+
+    def _non_null_counts(self) -> np.ndarray:
+        if "non_null_counts" not in self._cache:
+            self._cache["non_null_counts"] = self._values.shape[0] - (
+                self._null_mask().sum(axis=0)
+                if self._is_float
+                else np.zeros(self._values.shape[1], dtype=np.int64)
+            )
+
+        return self._cache["non_null_counts"]
+
+    def _zero_filled_values(self) -> np.ndarray:
+        if not self._is_float:
+            return self._values
+
+        if "zero_filled_values" not in self._cache:
+            values: np.ndarray = self._values.copy(order="F")
+            values[self._null_mask()] = 0
+            self._cache["zero_filled_values"] = values
+
+        return self._cache["zero_filled_values"]
+
+    def _compute_column_min(self) -> np.ndarray:
+        return np.nanmin(self._values, axis=0)
+
+    def _compute_column_max(self) -> np.ndarray:
+        return np.nanmax(self._values, axis=0)
+
+    def _compute_column_sum(self) -> np.ndarray:
+        return self._zero_filled_values().sum(axis=0)
+
+    def _compute_column_mean(self) -> np.ndarray:
+        # As pandas does, sums are accumulated in float64 and divided by the numbers of non-null values.
+        return self._zero_filled_values().sum(
+            axis=0, dtype=np.float64
+        ) / self._non_null_counts().astype(np.float64)
+
+    def _compute_column_standard_deviation(self) -> np.ndarray:
+        # Sample standard deviations (ddof=1), with the two-pass algorithm of pandas (see pandas.core.nanops.nanvar).
+        counts: np.ndarray = self._non_null_counts().astype(np.float64)
+        degrees_of_freedom: np.ndarray = counts - 1.0
+        too_few_values: np.ndarray = counts <= 1
+        counts[too_few_values] = np.nan
+        degrees_of_freedom[too_few_values] = np.nan
+
+        values: np.ndarray = self._zero_filled_values()
+        means: np.ndarray = values.sum(axis=0, dtype=np.float64) / counts
+        squared_deviations: np.ndarray = (means - values) ** 2
+        if self._is_float:
+            squared_deviations[self._null_mask()] = 0
+
+        return np.sqrt(
+            squared_deviations.sum(axis=0, dtype=np.float64) / degrees_of_freedom
+        )
+
+    def _sorted_values(self) -> np.ndarray:
+        # Nulls are sorted last, after the non-null values of the columns.
+        if "sorted_values" not in self._cache:
+            self._cache["sorted_values"] = np.sort(self._values, axis=0)
+
+        return self._cache["sorted_values"]
+
+    def _reduce_sorted_non_null_values(
+        self, values: np.ndarray, reduce_fn: Callable[..., np.ndarray]
+    ) -> np.ndarray:
+        # Reduce the leading (non-null) values of the columns of sorted "values", in a single call if they have no nulls.
+        counts: np.ndarray = self._non_null_counts()
+        if (counts == values.shape[0]).all():
+            return reduce_fn(values, axis=0)
+
+        return np.stack(
+            [
+                # Reductions of columns of nulls return NaN (as pandas does).
+                reduce_fn(
+                    values[:count, column_index]
+                    if count > 0
+                    else values[:1, column_index],
+                    axis=0,
+                )
+                for column_index, count in enumerate(counts)
+            ],
+            axis=-1,
+        )
+
+    def _compute_column_median(self) -> np.ndarray:
+        return self._reduce_sorted_non_null_values(
+            values=self._sorted_values().astype(np.float64, copy=False),
+            reduce_fn=np.median,
+        )
+
+    def _compute_column_quantile_values(
+        self, quantiles: tuple, interpolation: str
+    ) -> np.ndarray:
+        return self._reduce_sorted_non_null_values(
+            values=self._sorted_values(),
+            reduce_fn=partial(
+                np.percentile,
+                q=np.asarray(quantiles, dtype=np.float64) * 100.0,
+                **{_PERCENTILE_METHOD_ARGUMENT: interpolation},
+            ),
+        )
+
+    def _compute_column_distinct_values_count(self) -> np.ndarray:
+        # Each distinct value starts a run of equal sorted values.
+        sorted_values: np.ndarray = self._sorted_values()
+        non_null: np.ndarray = (
+            np.arange(sorted_values.shape[0])[:, np.newaxis] < self._non_null_counts()
+        )
+        return non_null[0].astype(np.int64) + (
+            (sorted_values[1:] != sorted_values[:-1]) & non_null[1:]
+        ).sum(axis=0)
+
+
+def _string_length(value: Any) -> int:
+    return len(value) if isinstance(value, str) else -1
+
+
+class _StringColumnStatistics:
+    """Lengths of the non-null values of the columns of a 2-D object array, which must hold strings."""
+
+    def __init__(self, values: np.ndarray) -> None:
+        null_mask: np.ndarray = pd.isnull(values)
+        lengths: np.ndarray = (
+            np.frompyfunc(_string_length, 1, 1)(values).astype(np.int64)
+            if values.size > 0
+            else np.zeros(values.shape, dtype=np.int64)
+        )
+        # Columns holding non-null values other than strings do not have lengths.
+        self._has_lengths: np.ndarray = ~((lengths < 0) & ~null_mask).any(axis=0)
+        self._non_null_counts: np.ndarray = (~null_mask).sum(axis=0)
+        self._min_lengths: np.ndarray = np.where(
+            null_mask, np.iinfo(np.int64).max, lengths
+        ).min(axis=0)
+        self._max_lengths: np.ndarray = np.where(null_mask, -1, lengths).max(axis=0)
+
+    def get_metric_value(
+        self, metric_configuration: MetricConfiguration, column_index: int
+    ) -> Any:
+        if not self._has_lengths[column_index]:
+            raise _UnsupportedColumnStatisticError
+
+        if self._non_null_counts[column_index] == 0:
+            return np.nan
+
+        if metric_configuration.metric_name == "column_values.length.min":
+            return np.int64(self._min_lengths[column_index])
+
+        return np.int64(self._max_lengths[column_index])
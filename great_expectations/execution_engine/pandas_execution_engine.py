@@ -3,9 +3,9 @@ import hashlib
 import logging
 import pickle
 import warnings
-from functools import partial
+from functools import partial, reduce
 from io import BytesIO
-from typing import Any, Callable, Iterable, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -23,12 +23,18 @@ from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.pandas_column_statistics import (
+    COLUMN_STATISTICS_METRIC_NAMES,
+    compute_column_statistics,
+)
 from great_expectations.execution_engine.split_and_sample.pandas_data_sampler import (
     PandasDataSampler,
 )
 from great_expectations.execution_engine.split_and_sample.pandas_data_splitter import (
     PandasDataSplitter,
 )
+from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +73,9 @@ except ImportError:
 
 HASH_THRESHOLD = 1e9
 
+# Minimum number of columns of a batch whose statistics are computed at once (see pandas_column_statistics).
+MIN_COLUMN_STATISTICS_COLUMNS = 2
+
 
 class PandasExecutionEngine(ExecutionEngine):
     """
@@ -121,6 +130,11 @@ Notes:
         self._azure = None
         self._gcs = None
 
+        # Boolean masks of the rows of batches satisfying row conditions, by batch_id and conditions.
+        self._row_condition_masks_cache: Dict[
+            Tuple[str, Tuple[Tuple[str, str], ...]], pd.Series
+        ] = {}
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -184,16 +198,174 @@ Notes:
         super().configure_validator(validator)
         validator.expose_dataframe_methods = True
 
-    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+    def _build_batch_data(self, batch_data: Any) -> PandasBatchData:
         if isinstance(batch_data, pd.DataFrame):
-            batch_data = PandasBatchData(self, batch_data)
+            return PandasBatchData(self, batch_data)
         elif isinstance(batch_data, PandasBatchData):
-            pass
+            return batch_data
         else:
             raise ge_exceptions.GreatExpectationsError(
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"
             )
-        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+
+    def _release_batch_data(self, batch_id: str) -> None:
+        self._release_row_condition_masks(batch_id=batch_id)
+
+    def release_persisted_data(self, domain_records_only: bool = False) -> None:
+        """Discard the cached row condition masks of the loaded batches."""
+        self._row_condition_masks_cache.clear()
+
+    def get_row_condition_mask(
+        self,
+        data: pd.DataFrame,
+        batch_id: str,
+        row_conditions: Iterable[Tuple[str, str]],
+    ) -> pd.Series:
+        """Evaluate row conditions on the data of a batch, and combine them (using AND) into a single boolean mask.
+
+        Masks are cached by batch_id and conditions, so that each distinct condition is evaluated only once per batch.
+
+        Args:
+            data: the DataFrame of the batch
+            batch_id: the id of the batch
+            row_conditions: pairs of row_condition and condition_parser ("python" or "pandas")
+
+        Returns:
+            The boolean mask of the rows satisfying all of the row conditions
+        """
+        row_conditions = tuple(row_conditions)
+        row_condition_mask_key: Tuple[str, Tuple[Tuple[str, str], ...]] = (
+            batch_id,
+            row_conditions,
+        )
+        if row_condition_mask_key in self._row_condition_masks_cache:
+            return self._row_condition_masks_cache[row_condition_mask_key]
+
+        if len(row_conditions) == 1:
+            row_condition, condition_parser = row_conditions[0]
+            row_condition_mask = data.eval(row_condition, parser=condition_parser)
+        else:
+            row_condition_mask = reduce(
+                lambda a, b: a & b,
+                [
+                    self.get_row_condition_mask(
+                        data=data, batch_id=batch_id, row_conditions=[row_condition]
+                    )
+                    for row_condition in row_conditions
+                ],
+            )
+
+        self._row_condition_masks_cache[row_condition_mask_key] = row_condition_mask
+        return row_condition_mask
+
+    def _release_row_condition_masks(self, batch_id: str) -> None:
+        for row_condition_mask_key in list(self._row_condition_masks_cache.keys()):
+            if row_condition_mask_key[0] == batch_id:
+                del self._row_condition_masks_cache[row_condition_mask_key]
+
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricConfiguration]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Resolve metrics, computing the standard statistics of the columns of a batch (e.g., when profiling it) at
+        once (see pandas_column_statistics), and the other metrics one by one (see ExecutionEngine.resolve_metrics).
+        """
+        metrics_to_resolve = list(metrics_to_resolve)
+        resolved_metrics: Dict[
+            Tuple[str, str, str], Any
+        ] = self._resolve_column_statistics_metrics(
+            metrics_to_resolve=metrics_to_resolve
+        )
+        if self._caching:
+            self._metric_cache.update(resolved_metrics)
+
+        resolved_metrics.update(
+            super().resolve_metrics(
+                metrics_to_resolve=[
+                    metric_to_resolve
+                    for metric_to_resolve in metrics_to_resolve
+                    if metric_to_resolve.id not in resolved_metrics
+                ],
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+        )
+        return resolved_metrics
+
+    def _resolve_column_statistics_metrics(
+        self, metrics_to_resolve: List[MetricConfiguration]
+    ) -> Dict[Tuple[str, str, str], Any]:
+        # Column statistics metrics of entire columns, by batch_id.
+        metrics_by_batch_id: Dict[str, List[MetricConfiguration]] = {}
+        metric_to_resolve: MetricConfiguration
+        for metric_to_resolve in metrics_to_resolve:
+            if not self._is_column_statistics_metric(metric_to_resolve):
+                continue
+
+            batch_id: Optional[str] = (
+                metric_to_resolve.metric_domain_kwargs.get("batch_id")
+                or self.active_batch_data_id
+            )
+            if batch_id in self.loaded_batch_data_dict:
+                metrics_by_batch_id.setdefault(batch_id, []).append(metric_to_resolve)
+
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        batch_metrics: List[MetricConfiguration]
+        for batch_id, batch_metrics in metrics_by_batch_id.items():
+            # Statistics of a single column are computed as fast one by one.
+            if (
+                len(
+                    {
+                        metric_to_resolve.metric_domain_kwargs["column"]
+                        for metric_to_resolve in batch_metrics
+                    }
+                )
+                < MIN_COLUMN_STATISTICS_COLUMNS
+            ):
+                continue
+
+            try:
+                resolved_metrics.update(
+                    compute_column_statistics(
+                        df=self.loaded_batch_data_dict[batch_id].dataframe,
+                        metric_configurations=batch_metrics,
+                    )
+                )
+            except Exception as e:
+                logger.debug(
+                    f"Unable to compute the column statistics of batch {batch_id} at once ({e}); computing them one by one."
+                )
+
+        return resolved_metrics
+
+    def _is_column_statistics_metric(
+        self, metric_configuration: MetricConfiguration
+    ) -> bool:
+        if metric_configuration.metric_name not in COLUMN_STATISTICS_METRIC_NAMES:
+            return False
+
+        domain_kwargs: dict = metric_configuration.metric_domain_kwargs
+        if (
+            domain_kwargs.get("column") is None
+            or domain_kwargs.get("table")
+            or domain_kwargs.get("row_condition")
+            or domain_kwargs.get("filter_conditions")
+        ):
+            return False
+
+        # Metrics whose (pandas) implementations are overridden are computed by these implementations.
+        try:
+            metric_class, _ = get_metric_provider(
+                metric_name=metric_configuration.metric_name, execution_engine=self
+            )
+        except ge_exceptions.MetricProviderError:
+            return False
+
+        return metric_class.__module__.startswith(
+            "great_expectations.expectations.metrics."
+        )
 
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
@@ -461,6 +633,7 @@ Please check your config."""
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data_id is not None:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data.dataframe
             else:
                 raise ge_exceptions.ValidationError(
@@ -486,8 +659,16 @@ Please check your config."""
                     " and must be 'python' or 'pandas'"
                 )
             else:
-                # Querying row condition
-                data = data.query(row_condition, parser=condition_parser)
+                # Querying row condition (as "DataFrame.query" does, but with the mask evaluated once per batch)
+                row_condition_mask: pd.Series = self.get_row_condition_mask(
+                    data=data,
+                    batch_id=batch_id,
+                    row_conditions=[(row_condition, condition_parser)],
+                )
+                try:
+                    data = data.loc[row_condition_mask]
+                except ValueError:
+                    data = data[row_condition_mask]
 
         if "column" in domain_kwargs:
             return data
@@ -4,7 +4,7 @@ import logging
 import uuid
 import warnings
 from functools import reduce
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from dateutil.parser import parse
 
@@ -55,12 +55,13 @@ try:
 
     # noinspection SpellCheckingInspection
     import pyspark.sql.types as sparktypes
-    from pyspark import SparkContext
+    from pyspark import SparkContext, StorageLevel
     from pyspark.sql import DataFrame, Row, SparkSession
     from pyspark.sql.readwriter import DataFrameReader
 except ImportError:
     pyspark = None
     SparkContext = None
+    StorageLevel = None
     SparkSession = None
     Row = None
     DataFrame = None
@@ -153,6 +154,12 @@ class SparkDFExecutionEngine(ExecutionEngine):
             expectation_completeness: Moderate
 
     --ge-feature-maturity-info--
+
+    If "persist" is True (the default), the DataFrame of a batch is persisted (at "persist_storage_level", which defaults
+    to "MEMORY_AND_DISK") the first time metrics are computed on it, so that the data is read from its source only once.
+    Filtered domain DataFrames (e.g. those with a row_condition) are also persisted as soon as they are reused by more
+    than one metric computation.  Persisted domain DataFrames are released at the end of each validation, and batch
+    DataFrames when the validation of a suite finishes or when the batch is unloaded.
     """
 
     recognized_batch_definition_keys = {"limit"}
@@ -166,12 +173,21 @@ class SparkDFExecutionEngine(ExecutionEngine):
         self,
         *args,
         persist=True,
+        persist_storage_level: Optional[str] = None,
         spark_config=None,
         force_reuse_spark_context=False,
         **kwargs,
     ) -> None:
         # Creation of the Spark DataFrame is done outside this class
         self._persist = persist
+        # Batch ids and domain records keys of the DataFrames persisted by this execution engine.
+        self._persisted_batch_ids: Set[str] = set()
+        self._domain_records_cache: Dict[str, DataFrame] = {}
+        self._persisted_domain_records_keys: Set[str] = set()
+        # Predicates built from row conditions, by condition (parser, row_condition, and filter conditions).
+        self._row_condition_filters_cache: Dict[
+            Tuple[Optional[str], ...], "pyspark.sql.Column"
+        ] = {}
 
         if spark_config is None:
             spark_config = {}
@@ -187,6 +203,10 @@ class SparkDFExecutionEngine(ExecutionEngine):
         self._spark_config = spark_config
         self.spark = spark
 
+        self._storage_level = self._get_storage_level(
+            persist_storage_level=persist_storage_level
+        )
+
         azure_options: dict = kwargs.pop("azure_options", {})
         self._azure_options = azure_options
 
@@ -199,10 +219,25 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "azure_options": azure_options,
             }
         )
+        if persist_storage_level is not None:
+            self._config["persist_storage_level"] = persist_storage_level
 
         self._data_splitter = SparkDataSplitter()
         self._data_sampler = SparkDataSampler()
 
+    @staticmethod
+    def _get_storage_level(persist_storage_level: Optional[str]) -> "StorageLevel":
+        if persist_storage_level is None:
+            persist_storage_level = "MEMORY_AND_DISK"
+
+        storage_level = getattr(StorageLevel, persist_storage_level.upper(), None)
+        if not isinstance(storage_level, StorageLevel):
+            raise ExecutionEngineError(
+                f'Unrecognized persist_storage_level "{persist_storage_level}" for SparkDFExecutionEngine.'
+            )
+
+        return storage_level
+
     @property
     def dataframe(self):
         """If a batch has been loaded, returns a Spark Dataframe containing the data within the loaded batch"""
@@ -213,16 +248,57 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         return self.active_batch_data.dataframe
 
-    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+    def _build_batch_data(self, batch_data: Any) -> SparkDFBatchData:
         if isinstance(batch_data, DataFrame):
-            batch_data = SparkDFBatchData(self, batch_data)
+            return SparkDFBatchData(self, batch_data)
         elif isinstance(batch_data, SparkDFBatchData):
-            pass
+            return batch_data
         else:
             raise GreatExpectationsError(
                 "SparkDFExecutionEngine requires batch data that is either a DataFrame or a SparkDFBatchData object"
             )
-        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+
+    def _release_batch_data(self, batch_id: str) -> None:
+        self._release_batch_dataframe(batch_id=batch_id)
+
+    def release_persisted_data(self, domain_records_only: bool = False) -> None:
+        """Unpersist the DataFrames persisted by this execution engine (the batches remain loaded, and are persisted
+        again if metrics are computed on them later).
+
+        Args:
+            domain_records_only: If True, only filtered domain DataFrames are unpersisted, and batches stay persisted.
+        """
+        for domain_records_key in self._persisted_domain_records_keys:
+            self._domain_records_cache[domain_records_key].unpersist()
+
+        self._persisted_domain_records_keys.clear()
+        self._domain_records_cache.clear()
+
+        if domain_records_only:
+            return
+
+        for batch_id in list(self._persisted_batch_ids):
+            self._release_batch_dataframe(batch_id=batch_id)
+
+    def _get_batch_dataframe(self, batch_id: str) -> DataFrame:
+        dataframe: DataFrame = self.loaded_batch_data_dict[batch_id].dataframe
+        # DataFrames already cached by the user are left alone (and are not unpersisted by this execution engine).
+        if (
+            self._persist
+            and batch_id not in self._persisted_batch_ids
+            and not dataframe.is_cached
+        ):
+            dataframe.persist(self._storage_level)
+            self._persisted_batch_ids.add(batch_id)
+
+        return dataframe
+
+    def _release_batch_dataframe(self, batch_id: str) -> None:
+        # Filtered domain DataFrames may have been derived from the batch.
+        self.release_persisted_data(domain_records_only=True)
+        if batch_id in self._persisted_batch_ids:
+            self.loaded_batch_data_dict[batch_id].dataframe.unpersist()
+            self._persisted_batch_ids.discard(batch_id)
 
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
@@ -444,38 +520,75 @@ Please check your config."""
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data:
-                data = self.active_batch_data.dataframe
+                batch_id = self.active_batch_data_id
             else:
                 raise ValidationError(
                     "No batch is specified, but could not identify a loaded batch."
                 )
-        else:
-            if batch_id in self.loaded_batch_data_dict:
-                data = self.loaded_batch_data_dict[batch_id].dataframe
-            else:
-                raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
+        elif batch_id not in self.loaded_batch_data_dict:
+            raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
-        # Filtering by row condition.
-        row_condition = domain_kwargs.get("row_condition", None)
-        if row_condition:
-            condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
-            else:
-                raise GreatExpectationsError(
-                    f"unrecognized condition_parser {str(condition_parser)} for Spark execution engine"
-                )
+        data: DataFrame = self._get_batch_dataframe(batch_id=batch_id)
 
-        # Filtering by filter_conditions
-        filter_conditions: List[RowCondition] = domain_kwargs.get(
-            "filter_conditions", []
+        # Filtered domain DataFrames are reused by all metrics computed on the same domain records, and are persisted
+        # as soon as they are requested again.
+        domain_records_key: str = self._get_domain_records_key(
+            batch_id=batch_id, domain_kwargs=domain_kwargs
         )
-        if len(filter_conditions) > 0:
-            filter_condition = self._combine_row_conditions(filter_conditions)
-            data = data.filter(filter_condition.condition)
+        if domain_records_key in self._domain_records_cache:
+            data = self._domain_records_cache[domain_records_key]
+            if (
+                self._persist
+                and domain_records_key not in self._persisted_domain_records_keys
+            ):
+                data.persist(self._storage_level)
+                self._persisted_domain_records_keys.add(domain_records_key)
+
+            return data
+
+        filtered_data: DataFrame = self._filter_domain_records(
+            data=data, domain_kwargs=domain_kwargs
+        )
+        if filtered_data is not data:
+            self._domain_records_cache[domain_records_key] = filtered_data
+
+        return filtered_data
+
+    @staticmethod
+    def _get_domain_records_key(batch_id: str, domain_kwargs: dict) -> str:
+        """Identify the records returned by "get_domain_records()", using only the domain kwargs that filter them."""
+        filter_keys: List[str] = [
+            "row_condition",
+            "condition_parser",
+            "filter_conditions",
+        ]
+        if "column" not in domain_kwargs:
+            filter_keys.extend(["column_A", "column_B", "column_list", "ignore_row_if"])
+
+        return IDDict(
+            convert_to_json_serializable(
+                data={
+                    "batch_id": batch_id,
+                    **{
+                        key: domain_kwargs[key]
+                        for key in filter_keys
+                        if key in domain_kwargs
+                    },
+                }
+            )
+        ).to_id()
+
+    def _filter_domain_records(self, data: DataFrame, domain_kwargs: dict) -> DataFrame:
+        # Filtering by row condition and filter_conditions (combined into a single predicate).
+        row_condition_filter: Optional[
+            "pyspark.sql.Column"
+        ] = self._get_row_condition_filter(
+            row_condition=domain_kwargs.get("row_condition", None),
+            condition_parser=domain_kwargs.get("condition_parser", None),
+            filter_conditions=domain_kwargs.get("filter_conditions", []),
+        )
+        if row_condition_filter is not None:
+            data = data.filter(row_condition_filter)
 
         if "column" in domain_kwargs:
             return data
@@ -544,6 +657,54 @@ Please check your config."""
 
         return data
 
+    def _get_row_condition_filter(
+        self,
+        row_condition: Optional[str],
+        condition_parser: Optional[str],
+        filter_conditions: List[RowCondition],
+    ) -> Optional["pyspark.sql.Column"]:
+        """Build the predicate combining (using AND) a row_condition and filter_conditions; None if there are none.
+
+        Predicates are cached by condition, so that each distinct condition is only parsed once.
+        """
+        if row_condition and condition_parser not in [
+            "spark",
+            "great_expectations__experimental__",
+        ]:
+            raise GreatExpectationsError(
+                f"unrecognized condition_parser {str(condition_parser)} for Spark execution engine"
+            )
+
+        if not row_condition and len(filter_conditions) == 0:
+            return None
+
+        row_condition_filter_key: Tuple[Optional[str], ...] = (
+            condition_parser if row_condition else None,
+            row_condition or None,
+            *[filter_condition.condition for filter_condition in filter_conditions],
+        )
+        if row_condition_filter_key in self._row_condition_filters_cache:
+            return self._row_condition_filters_cache[row_condition_filter_key]
+
+        predicates: List["pyspark.sql.Column"] = []
+        if row_condition:
+            if condition_parser == "spark":
+                predicates.append(F.expr(row_condition))
+            else:
+                predicates.append(parse_condition_to_spark(row_condition))
+
+        if len(filter_conditions) > 0:
+            filter_condition = self._combine_row_conditions(filter_conditions)
+            predicates.append(F.expr(filter_condition.condition))
+
+        row_condition_filter: "pyspark.sql.Column" = reduce(
+            lambda a, b: a & b, predicates
+        )
+        self._row_condition_filters_cache[
+            row_condition_filter_key
+        ] = row_condition_filter
+        return row_condition_filter
+
     @staticmethod
     def _combine_row_conditions(row_conditions: List[RowCondition]) -> RowCondition:
         """Combine row conditions using AND if condition_type is SPARK_SQL
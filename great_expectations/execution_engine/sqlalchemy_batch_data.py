@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from great_expectations.execution_engine.execution_engine import BatchData
 from great_expectations.execution_engine.sqlalchemy_dialect import GESqlDialect
@@ -38,6 +39,7 @@ class SqlAlchemyBatchData(BatchData):
         use_quoted_name: bool = False,
         source_schema_name: str = None,
         source_table_name: str = None,
+        split_clause=None,
     ) -> None:
         """A Constructor used to initialize and SqlAlchemy Batch, create an id for it, and verify that all necessary
         parameters have been provided. If a Query is given, also builds a temporary table for this query
@@ -72,6 +74,11 @@ class SqlAlchemyBatchData(BatchData):
                 source_schema_name (str): \
                     For SqlAlchemyBatchData based on selectables, source_schema_name provides the name of the schema on which
                     the selectable is based. This is required for most kinds of table introspection (e.g. looking up column types)
+                split_clause (sqlalchemy BinaryExpression or BooleanClauseList or None): \
+                    For SqlAlchemyBatchData based on selectables that select the rows of the source table matching the
+                    batch identifiers of a splitter, split_clause is the WHERE clause built by the splitter.  It allows the
+                    execution engine to compute metrics of several batches of the same source table with a single query.
+                    Such queries read the source table, even for batches whose rows were copied to a temporary table.
 
         The query that will be executed against the DB can be determined in any of three ways:
 
@@ -98,6 +105,10 @@ class SqlAlchemyBatchData(BatchData):
         self._use_quoted_name = use_quoted_name
         self._source_table_name = source_table_name
         self._source_schema_name = source_schema_name
+        self._split_clause = split_clause
+        # The temporary table created for the batch (if any), which is dropped by "drop_temporary_table()".
+        self._temp_table_name: Optional[str] = None
+        self._is_released = False
 
         if sum(bool(x) for x in [table_name, query, selectable is not None]) != 1:
             raise ValueError(
@@ -162,6 +173,7 @@ class SqlAlchemyBatchData(BatchData):
                 query=query,
                 temp_table_schema_name=temp_table_schema_name,
             )
+            self._temp_table_name = generated_table_name
             self._selectable = sa.Table(
                 generated_table_name,
                 sa.MetaData(),
@@ -194,6 +206,10 @@ class SqlAlchemyBatchData(BatchData):
     def source_schema_name(self):
         return self._source_schema_name
 
+    @property
+    def split_clause(self):
+        return self._split_clause
+
     @property
     def selectable(self):
         return self._selectable
@@ -202,6 +218,34 @@ class SqlAlchemyBatchData(BatchData):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def temp_table_name(self) -> Optional[str]:
+        """The name of the temporary table created for the batch (None if it was not created, or has been dropped)."""
+        return self._temp_table_name
+
+    @property
+    def is_released(self) -> bool:
+        """Whether the temporary table created for the batch has been dropped (its selectable cannot be used)."""
+        return self._is_released
+
+    def drop_temporary_table(self) -> None:
+        """Drops the temporary table created for the batch, if any; the batch data cannot be used afterwards."""
+        if self._temp_table_name is None:
+            return
+
+        temp_table_name: str = self._temp_table_name
+        self._temp_table_name = None
+        self._is_released = True
+        try:
+            if self.dialect == GESqlDialect.DREMIO:
+                self._engine.execute(f"DROP VDS {temp_table_name}")
+            else:
+                self._selectable.drop(bind=self._engine)
+        except Exception as e:
+            logger.warning(
+                f"Unable to drop the temporary table {temp_table_name} of a batch: {e}"
+            )
+
     def _create_temporary_table(
         self, temp_table_name, query, temp_table_schema_name=None
     ) -> None:
@@ -3,6 +3,7 @@ import datetime
 import hashlib
 import logging
 import math
+import numbers
 import os
 import random
 import re
@@ -37,6 +38,13 @@ from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
     SqlAlchemyDatasourceBatchSpec,
 )
+from great_expectations.core.sqlalchemy_engine_registry import (
+    PoolStatistics,
+    sqlalchemy_engine_registry,
+)
+from great_expectations.core.sqlalchemy_metadata_cache import (
+    sqlalchemy_metadata_cache,
+)
 from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.exceptions import (
     DatasourceKeyPairAuthBadPassphraseError,
@@ -58,7 +66,7 @@ from great_expectations.execution_engine.sqlalchemy_dialect import GESqlDialect
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
-    parse_condition_to_sqlalchemy,
+    parse_conditions_to_sqlalchemy,
 )
 from great_expectations.util import (
     filter_properties_dict,
@@ -82,25 +90,40 @@ try:
     from sqlalchemy.engine import Dialect, Row
     from sqlalchemy.exc import OperationalError
     from sqlalchemy.sql import Selectable
+    from sqlalchemy.sql import operators
     from sqlalchemy.sql.elements import (
+        BinaryExpression,
+        BindParameter,
         BooleanClauseList,
+        ColumnClause,
         Label,
+        Over,
         TextClause,
+        UnaryExpression,
         quoted_name,
     )
-    from sqlalchemy.sql.selectable import Select, TextualSelect
+    from sqlalchemy.sql.functions import FunctionElement
+    from sqlalchemy.sql.selectable import Select, SelectBase, TextualSelect
 except ImportError:
+    BinaryExpression = None
+    BindParameter = None
     BooleanClauseList = None
+    ColumnClause = None
+    FunctionElement = None
+    UnaryExpression = None
     DefaultDialect = None
     Dialect = None
     Label = None
     OperationalError = None
+    Over = None
     reflection = None
     Row = None
     Select = None
+    SelectBase = None
     Selectable = None
     TextClause = None
     TextualSelect = None
+    operators = None
     quoted_name = None
 
 
@@ -138,6 +161,34 @@ except (ImportError, KeyError, AttributeError):
     snowflake = None
 
 _BIGQUERY_MODULE_NAME = "sqlalchemy_bigquery"
+
+# Aggregate functions ignoring NULL values, which compute the aggregates of the rows of a domain satisfying a condition
+# when their arguments are NULL for the other rows (i.e., "SUM(CASE WHEN condition THEN x END)").
+CONDITIONAL_AGGREGATE_FUNCTION_NAMES = {"avg", "count", "max", "min", "sum"}
+
+# Domain kwargs of the domains whose bundled metrics can be computed by a query over all the rows of their batch.
+MERGEABLE_DOMAIN_KWARGS = {
+    "batch_id",
+    "table",
+    "row_condition",
+    "condition_parser",
+    "filter_conditions",
+    "column",
+    "column_A",
+    "column_B",
+    "column_list",
+    "ignore_row_if",
+}
+
+# Dialects whose temporary tables only persist within a connection, so that execution engines hold a connection (for
+# their lifetime) instead of an engine.
+CONNECTION_HOLDING_DIALECTS = [
+    GESqlDialect.SQLITE,
+    GESqlDialect.MSSQL,
+    GESqlDialect.SNOWFLAKE,
+    GESqlDialect.MYSQL,
+]
+
 try:
     import sqlalchemy_bigquery as sqla_bigquery
 
@@ -185,6 +236,16 @@ except ImportError:
     teradatasqlalchemy = None
 
 
+def _holds_connection(url: Union[str, "sa.engine.url.URL"]) -> bool:
+    """Whether execution engines connecting to the given URL hold a connection (see CONNECTION_HOLDING_DIALECTS)."""
+    try:
+        backend_name: str = make_url(url).get_backend_name()
+    except Exception:
+        return False
+
+    return backend_name in CONNECTION_HOLDING_DIALECTS
+
+
 def _get_dialect_type_module(dialect):
     """Given a dialect, returns the dialect type, which is defines the engine/system that is used to communicates
     with the database/database implementation. Currently checks for RedShift/BigQuery dialects"""
@@ -241,6 +302,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
         concurrency: Optional[ConcurrencyConfig] = None,
+        max_loaded_batches: Optional[int] = None,
+        metadata_cache_ttl_seconds: Optional[float] = None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ) -> None:
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -268,8 +331,19 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
                 concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
+                max_loaded_batches (int): \
+                    If set, batches requested from datasources are loaded when they are first needed, and at most
+                    this many of them are kept loaded (the least recently used ones are loaded again if needed).
+                metadata_cache_ttl_seconds (float): \
+                    If set, catalog metadata of the database (e.g., the columns of tables) is cached for this many
+                    seconds and shared by all execution engines and data connectors of the database (see
+                    SqlAlchemyMetadataCache).  Changes to the structure of tables are not seen until it expires.
         """
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            max_loaded_batches=max_loaded_batches,
+        )
         self._name = name
 
         self._credentials = credentials
@@ -278,6 +352,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self._create_temp_table = create_temp_table
         os.environ["SF_PARTNER"] = "great_expectations_oss"
 
+        # Engines built from credentials, connection_string or url are shared through the process-wide registry
+        # (except for the dialects whose execution engines hold a connection, see below).
+        self._registered_engine = None
         if engine is not None:
             if credentials is not None:
                 logger.warning(
@@ -297,11 +374,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             if credentials is not None:
                 self.engine = self._build_engine(credentials=credentials, **kwargs)
             elif connection_string is not None:
-                self.engine = sa.create_engine(connection_string, **kwargs)
+                self.engine = self._create_engine(connection_string, **kwargs)
             elif url is not None:
                 parsed_url = make_url(url)
                 self.drivername = parsed_url.drivername
-                self.engine = sa.create_engine(url, **kwargs)
+                self.engine = self._create_engine(url, **kwargs)
             else:
                 raise InvalidConfigError(
                     "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
@@ -357,12 +434,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         # depending on the backend. This will need to be cleaned up in an upcoming refactor, so that Engine and
         # Connection can be handled separately.
         self._engine_backup = None
-        if self.engine and self.dialect_name in [
-            GESqlDialect.SQLITE,
-            GESqlDialect.MSSQL,
-            GESqlDialect.SNOWFLAKE,
-            GESqlDialect.MYSQL,
-        ]:
+        if self.engine and self.dialect_name in CONNECTION_HOLDING_DIALECTS:
             self._engine_backup = self.engine
             # sqlite/mssql temp tables only persist within a connection so override the engine
             self.engine = self.engine.connect()
@@ -380,6 +452,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     ],
                 )
 
+        if metadata_cache_ttl_seconds is not None:
+            sqlalchemy_metadata_cache.set_database_ttl_seconds(
+                engine=self.engine, ttl_seconds=metadata_cache_ttl_seconds
+            )
+
         # Send a connect event to provide dialect type
         if data_context is not None and getattr(
             data_context, "_usage_statistics_handler", None
@@ -404,6 +481,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "max_loaded_batches": max_loaded_batches,
+            "metadata_cache_ttl_seconds": metadata_cache_ttl_seconds,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -465,7 +544,19 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             options = get_sqlalchemy_url(drivername, **credentials)
 
         self.drivername = drivername
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = self._create_engine(options, **create_engine_kwargs)
+        return engine
+
+    def _create_engine(
+        self, url: Union[str, "sa.engine.url.URL"], **kwargs
+    ) -> "sa.engine.Engine":
+        """Creates an engine, which is shared through the process-wide registry unless execution engines connecting to
+        the URL hold a connection (execution engines sharing an engine would then exhaust its connection pool)."""
+        if _holds_connection(url=url):
+            return sa.create_engine(url, **kwargs)
+
+        engine = sqlalchemy_engine_registry.get_engine(url, **kwargs)
+        self._registered_engine = engine
         return engine
 
     @staticmethod
@@ -553,6 +644,15 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
+        return self._get_domain_records_for_batch_data(
+            data_object=data_object, domain_kwargs=domain_kwargs
+        )
+
+    def _get_domain_records_for_batch_data(
+        self,
+        data_object: SqlAlchemyBatchData,
+        domain_kwargs: Dict,
+    ) -> Selectable:
         selectable: Selectable
         if "table" in domain_kwargs and domain_kwargs["table"] is not None:
             # TODO: Add logic to handle record_set_name once implemented
@@ -581,6 +681,38 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         if TextClause and isinstance(selectable, TextClause):
             selectable = selectable.columns().subquery()
 
+        # The row condition and the filter condition (if any) are combined into a single WHERE clause.
+        row_conditions: List[str] = self._get_row_conditions(
+            domain_kwargs=domain_kwargs
+        )
+        if row_conditions:
+            selectable = (
+                sa.select([sa.text("*")])
+                .select_from(selectable)
+                .where(parse_conditions_to_sqlalchemy(tuple(row_conditions)))
+            )
+
+        if "column" in domain_kwargs:
+            return selectable
+
+        # Filtering by ignore_row_if directive
+        ignore_row_if_condition: Optional[Any] = self._get_ignore_row_if_condition(
+            domain_kwargs=domain_kwargs
+        )
+        if ignore_row_if_condition is not None:
+            selectable = get_sqlalchemy_selectable(
+                sa.select([sa.text("*")])
+                .select_from(get_sqlalchemy_selectable(selectable))
+                .where(ignore_row_if_condition)
+            )
+
+        return selectable
+
+    @staticmethod
+    def _get_row_conditions(domain_kwargs: Dict) -> List[str]:
+        """Returns the row condition and the filter condition (if any) restricting the rows of a domain."""
+        row_conditions: List[str] = []
+
         # Filtering by row condition.
         if (
             "row_condition" in domain_kwargs
@@ -588,14 +720,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         ):
             condition_parser = domain_kwargs["condition_parser"]
             if condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_sqlalchemy(
-                    domain_kwargs["row_condition"]
-                )
-                selectable = (
-                    sa.select([sa.text("*")])
-                    .select_from(selectable)
-                    .where(parsed_condition)
-                )
+                row_conditions.append(domain_kwargs["row_condition"])
             else:
                 raise GreatExpectationsError(
                     "SqlAlchemyExecutionEngine only supports the great_expectations condition_parser."
@@ -612,20 +737,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 filter_condition.condition_type == RowConditionParserType.GE
             ), "filter_condition must be of type GE for SqlAlchemyExecutionEngine"
 
-            selectable = (
-                sa.select([sa.text("*")])
-                .select_from(selectable)
-                .where(parse_condition_to_sqlalchemy(filter_condition.condition))
-            )
+            row_conditions.append(filter_condition.condition)
         elif len(filter_conditions) > 1:
             raise GreatExpectationsError(
                 "SqlAlchemyExecutionEngine currently only supports a single filter condition."
             )
 
-        if "column" in domain_kwargs:
-            return selectable
+        return row_conditions
 
-        # Filtering by ignore_row_if directive
+    def _get_ignore_row_if_condition(self, domain_kwargs: Dict) -> Optional[Any]:
+        """Returns the condition selecting the rows of a column pair or multicolumn domain that are not ignored by its
+        "ignore_row_if" directive, or None if no rows are ignored."""
         if (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
@@ -645,29 +767,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "both_values_are_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select([sa.text("*")])
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.and_(
-                                sa.column(column_A_name) == None,
-                                sa.column(column_B_name) == None,
-                            )
-                        )
+                return sa.not_(
+                    sa.and_(
+                        sa.column(column_A_name) == None,
+                        sa.column(column_B_name) == None,
                     )
                 )
             elif ignore_row_if == "either_value_is_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select([sa.text("*")])
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.or_(
-                                sa.column(column_A_name) == None,
-                                sa.column(column_B_name) == None,
-                            )
-                        )
+                return sa.not_(
+                    sa.or_(
+                        sa.column(column_A_name) == None,
+                        sa.column(column_B_name) == None,
                     )
                 )
             else:
@@ -685,7 +795,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                         DeprecationWarning,
                     )
 
-            return selectable
+            return None
 
         if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
             if self.active_batch_data.use_quoted_name:
@@ -699,33 +809,15 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "all_values_are_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select([sa.text("*")])
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.and_(
-                                *(
-                                    sa.column(column_name) == None
-                                    for column_name in column_list
-                                )
-                            )
-                        )
+                return sa.not_(
+                    sa.and_(
+                        *(sa.column(column_name) == None for column_name in column_list)
                     )
                 )
             elif ignore_row_if == "any_value_is_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select([sa.text("*")])
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.or_(
-                                *(
-                                    sa.column(column_name) == None
-                                    for column_name in column_list
-                                )
-                            )
-                        )
+                return sa.not_(
+                    sa.or_(
+                        *(sa.column(column_name) == None for column_name in column_list)
                     )
                 )
             else:
@@ -734,9 +826,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                         f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
                     )
 
-            return selectable
-
-        return selectable
+        return None
 
     def get_compute_domain(
         self,
@@ -956,7 +1046,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             queries[domain_id]["ids"].append(metric_to_resolve.id)
 
-        for query in queries.values():
+        # Domains of batches split from the same table by the same splitter are computed with one GROUP BY query.
+        unresolved_queries: List[dict] = self._resolve_multi_batch_queries(
+            queries=list(queries.values()), resolved_metrics=resolved_metrics
+        )
+
+        # Domains of the same batch (e.g., columns with different row conditions) are computed with one query.
+        unresolved_queries = self._resolve_batch_domain_queries(
+            queries=unresolved_queries, resolved_metrics=resolved_metrics
+        )
+
+        for query in unresolved_queries:
             domain_kwargs: dict = query["domain_kwargs"]
             selectable: Any = self.get_domain_records(
                 domain_kwargs=domain_kwargs,
@@ -965,27 +1065,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             assert len(query["select"]) == len(query["ids"])
 
             try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if TextClause and isinstance(selectable, TextClause):
-                    res = self.engine.execute(
-                        sa.select(query["select"]).select_from(
-                            selectable.columns().subquery()
-                        )
-                    ).fetchall()
-                elif (Select and isinstance(selectable, Select)) or (
-                    TextualSelect and isinstance(selectable, TextualSelect)
-                ):
-                    res = self.engine.execute(
-                        sa.select(query["select"]).select_from(selectable.subquery())
-                    ).fetchall()
-                else:
-                    res = self.engine.execute(
-                        sa.select(query["select"]).select_from(selectable)
-                    ).fetchall()
+                res = self.engine.execute(
+                    self._select_from_domain_records(
+                        columns=query["select"], selectable=selectable
+                    )
+                ).fetchall()
 
                 logger.debug(
                     f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict.convert_dictionary_to_id_dict(data=convert_to_json_serializable(data=domain_kwargs)).to_id()}"
@@ -1015,6 +1099,599 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    @staticmethod
+    def _select_from_domain_records(columns: List[Any], selectable: Any) -> Select:
+        """
+        If a custom query is passed, selectable will be TextClause and not formatted
+        as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+        to TextualSelect using sa.columns() before it can be converted to type Subquery
+        """
+        if TextClause and isinstance(selectable, TextClause):
+            return sa.select(columns).select_from(selectable.columns().subquery())
+
+        if (Select and isinstance(selectable, Select)) or (
+            TextualSelect and isinstance(selectable, TextualSelect)
+        ):
+            return sa.select(columns).select_from(selectable.subquery())
+
+        return sa.select(columns).select_from(selectable)
+
+    def _resolve_multi_batch_queries(
+        self,
+        queries: List[dict],
+        resolved_metrics: Dict[Tuple[str, str, str], Any],
+    ) -> List[dict]:
+        """Computes the bundled metrics of domains that only differ by the batch, for batches split from the same table
+        by the same splitter (e.g., the monthly batches used by "MetricMultiBatchParameterBuilder"), with a single query
+        grouping the rows of all these batches by the split key, and fans the resulting rows back out to the batches.
+
+        Args:
+            queries: bundled queries, as built by "resolve_metric_bundle()"
+            resolved_metrics: dictionary of resolved metrics, updated with the metrics computed by this method
+
+        Returns:
+            The queries whose metrics were not computed (e.g., domains of batches that were not split from a table, or
+            that are not part of a group of several batches), which must be executed one domain at a time.
+        """
+        unresolved_queries: List[dict] = []
+
+        groups: Dict[Tuple, List[Tuple[dict, List[Tuple[Any, Any]]]]] = {}
+
+        query: dict
+        for query in queries:
+            group_key: Optional[Tuple]
+            split_keys: Optional[List[Tuple[Any, Any]]]
+            group_key, split_keys = self._get_multi_batch_group_key(query=query)
+            if group_key is None:
+                unresolved_queries.append(query)
+            else:
+                groups.setdefault(group_key, []).append((query, split_keys))
+
+        group: List[Tuple[dict, List[Tuple[Any, Any]]]]
+        for group in groups.values():
+            unresolved_queries.extend(
+                self._resolve_multi_batch_query_group(
+                    group=group, resolved_metrics=resolved_metrics
+                )
+            )
+
+        return unresolved_queries
+
+    def _get_multi_batch_group_key(
+        self, query: dict
+    ) -> Tuple[Optional[Tuple], Optional[List[Tuple[Any, Any]]]]:
+        """Returns the key identifying the queries that can be computed together with this query (along with the split
+        keys of its batch), or (None, None) if this query must be executed on its own."""
+        domain_kwargs: dict = query["domain_kwargs"]
+        if domain_kwargs.get("table") is not None:
+            return None, None
+
+        batch_source: Optional[
+            Tuple[Optional[str], Optional[str], Optional[Any]]
+        ] = self._get_batch_source(
+            batch_id=domain_kwargs.get("batch_id") or self.active_batch_data_id
+        )
+        if batch_source is None:
+            return None, None
+
+        source_schema_name: Optional[str]
+        source_table_name: Optional[str]
+        split_clause: Optional[Any]
+        source_schema_name, source_table_name, split_clause = batch_source
+
+        split_keys: Optional[List[Tuple[Any, Any]]] = self._get_split_keys(
+            split_clause=split_clause
+        )
+        if not split_keys:
+            return None, None
+
+        # Aggregates computed with subqueries or window functions cannot be computed per group of rows.
+        column: Any
+        for column in query["select"]:
+            for element in sa.sql.visitors.iterate(column):
+                if isinstance(element, (SelectBase, Over)):
+                    return None, None
+
+        try:
+            compiled_split_key_expressions: Tuple[str, ...] = tuple(
+                str(
+                    expression.compile(
+                        dialect=self.dialect, compile_kwargs={"literal_binds": True}
+                    )
+                )
+                for expression, _ in split_keys
+            )
+            compiled_select: str = str(
+                sa.select(query["select"]).compile(
+                    dialect=self.dialect, compile_kwargs={"literal_binds": True}
+                )
+            )
+        except Exception:
+            return None, None
+
+        domain_kwargs_without_batch_id: dict = {
+            key: value for key, value in domain_kwargs.items() if key != "batch_id"
+        }
+        domain_id: str = IDDict.convert_dictionary_to_id_dict(
+            data=convert_to_json_serializable(data=domain_kwargs_without_batch_id)
+        ).to_id()
+
+        return (
+            source_schema_name,
+            source_table_name,
+            compiled_split_key_expressions,
+            domain_id,
+            compiled_select,
+        ), split_keys
+
+    def _resolve_multi_batch_query_group(
+        self,
+        group: List[Tuple[dict, List[Tuple[Any, Any]]]],
+        resolved_metrics: Dict[Tuple[str, str, str], Any],
+    ) -> List[dict]:
+        """Executes one GROUP BY query for a group of queries built by "_resolve_multi_batch_queries()", and returns the
+        queries whose metrics could not be obtained from its results (e.g., those of batches without any rows)."""
+        queries: List[dict] = [query for query, _ in group]
+        if len(group) < 2:
+            return queries
+
+        query_idx_by_split_key_values: Dict[Tuple, int] = {}
+
+        idx: int
+        split_keys: List[Tuple[Any, Any]]
+        for idx, (_, split_keys) in enumerate(group):
+            split_key_values: Tuple = tuple(
+                self._normalize_split_key_value(value=value) for _, value in split_keys
+            )
+            if split_key_values in query_idx_by_split_key_values:
+                return queries
+
+            query_idx_by_split_key_values[split_key_values] = idx
+
+        first_query: dict = queries[0]
+        first_batch_id: str = (
+            first_query["domain_kwargs"].get("batch_id") or self.active_batch_data_id
+        )
+        # The rows of the batches are selected from their source table, so batches loaded lazily need not be loaded;
+        # those described by their batch specs have the default record set name and quoting of names.
+        source_schema_name: Optional[str]
+        source_table_name: Optional[str]
+        source_schema_name, source_table_name, _ = self._get_batch_source(
+            batch_id=first_batch_id
+        )
+        record_set_name: Optional[str] = None
+        use_quoted_name: bool = False
+        if self._batch_data_dict.is_loaded(first_batch_id):
+            first_data_object: SqlAlchemyBatchData = self._batch_data_dict[
+                first_batch_id
+            ]
+            record_set_name = first_data_object.record_set_name
+            use_quoted_name = first_data_object.use_quoted_name
+
+        split_key_labels: List[Label] = [
+            expression.label(f"__ge_split_key_{key_idx}")
+            for key_idx, (expression, _) in enumerate(group[0][1])
+        ]
+        grouped_data_object = SqlAlchemyBatchData(
+            execution_engine=self,
+            record_set_name=record_set_name,
+            selectable=sa.select("*")
+            .select_from(sa.table(source_table_name, schema=source_schema_name))
+            .where(
+                sa.or_(
+                    *(
+                        sa.and_(
+                            *(expression == value for expression, value in split_keys)
+                        )
+                        for _, split_keys in group
+                    )
+                )
+            ),
+            create_temp_table=False,
+            use_quoted_name=use_quoted_name,
+            source_table_name=source_table_name,
+            source_schema_name=source_schema_name,
+        )
+        selectable: Any = self._get_domain_records_for_batch_data(
+            data_object=grouped_data_object,
+            domain_kwargs=first_query["domain_kwargs"],
+        )
+
+        try:
+            res: List[Row] = self.engine.execute(
+                self._select_from_domain_records(
+                    columns=split_key_labels + first_query["select"],
+                    selectable=selectable,
+                ).group_by(*split_key_labels)
+            ).fetchall()
+        except Exception as e:
+            logger.debug(
+                f"SqlAlchemyExecutionEngine could not compute metrics for {len(queries)} batches with one query ({e}); computing them one batch at a time."
+            )
+            return queries
+
+        rows_by_query_idx: Dict[int, Row] = {}
+        ambiguous_query_idxs: set = set()
+
+        row: Row
+        for row in res:
+            split_key_values = tuple(
+                self._normalize_split_key_value(value=value)
+                for value in row[: len(split_key_labels)]
+            )
+            query_idx: Optional[int] = query_idx_by_split_key_values.get(
+                split_key_values
+            )
+            if query_idx is None:
+                continue
+
+            if query_idx in rows_by_query_idx:
+                ambiguous_query_idxs.add(query_idx)
+
+            rows_by_query_idx[query_idx] = row
+
+        unresolved_queries: List[dict] = []
+
+        query: dict
+        for idx, query in enumerate(queries):
+            if idx not in rows_by_query_idx or idx in ambiguous_query_idxs:
+                unresolved_queries.append(query)
+                continue
+
+            row = rows_by_query_idx[idx]
+            metric_id: Tuple[str, str, str]
+            for metric_idx, metric_id in enumerate(query["ids"]):
+                resolved_metrics[metric_id] = convert_to_json_serializable(
+                    data=row[len(split_key_labels) + metric_idx]
+                )
+
+        logger.debug(
+            f"SqlAlchemyExecutionEngine computed {len(first_query['ids'])} metrics on {len(queries) - len(unresolved_queries)} batches with one query"
+        )
+
+        return unresolved_queries
+
+    def _resolve_batch_domain_queries(
+        self,
+        queries: List[dict],
+        resolved_metrics: Dict[Tuple[str, str, str], Any],
+    ) -> List[dict]:
+        """Computes the bundled metrics of the domains of a batch (which only differ by the conditions restricting their
+        rows, such as row conditions, filter conditions and "ignore_row_if" directives) with a single query scanning the
+        batch once.
+
+        Aggregates are restricted to the rows of their domains with conditional aggregation (e.g.,
+        "SUM(CASE WHEN condition THEN x END)").  Metrics that cannot be rewritten this way (e.g., aggregates other than
+        those of CONDITIONAL_AGGREGATE_FUNCTION_NAMES, which are not known to ignore NULL values, or expressions
+        referencing columns outside of an aggregate) are computed by scalar subqueries of the same query, over a common table expression of
+        the batch.
+
+        Args:
+            queries: bundled queries, as built by "resolve_metric_bundle()"
+            resolved_metrics: dictionary of resolved metrics, updated with the metrics computed by this method
+
+        Returns:
+            The queries whose metrics were not computed (e.g., the only domain of a batch), which must be executed one
+            domain at a time.
+        """
+        unresolved_queries: List[dict] = []
+
+        queries_by_batch_id: Dict[str, List[dict]] = {}
+
+        query: dict
+        for query in queries:
+            batch_id: Optional[str] = self._get_mergeable_domain_batch_id(
+                domain_kwargs=query["domain_kwargs"]
+            )
+            if batch_id is None or any(
+                isinstance(element, (SelectBase, Over))
+                for column in query["select"]
+                for element in sa.sql.visitors.iterate(column)
+            ):
+                unresolved_queries.append(query)
+            else:
+                queries_by_batch_id.setdefault(batch_id, []).append(query)
+
+        batch_queries: List[dict]
+        for batch_id, batch_queries in queries_by_batch_id.items():
+            if len(batch_queries) < 2:
+                unresolved_queries.extend(batch_queries)
+                continue
+
+            try:
+                self._resolve_batch_domain_query_group(
+                    data_object=self.loaded_batch_data_dict[batch_id],
+                    queries=batch_queries,
+                    resolved_metrics=resolved_metrics,
+                )
+            except Exception as e:
+                logger.debug(
+                    f"SqlAlchemyExecutionEngine could not compute metrics on {len(batch_queries)} domains of batch {batch_id} with one query ({e}); computing them one domain at a time."
+                )
+                unresolved_queries.extend(batch_queries)
+
+        return unresolved_queries
+
+    def _get_mergeable_domain_batch_id(self, domain_kwargs: dict) -> Optional[str]:
+        """Returns the id of the batch of a domain whose metrics can be computed with those of other domains of the
+        batch, or None if the metrics of this domain must be computed on their own."""
+        if domain_kwargs.get("table") is not None or not set(domain_kwargs).issubset(
+            MERGEABLE_DOMAIN_KWARGS
+        ):
+            return None
+
+        batch_id: Optional[str] = (
+            domain_kwargs.get("batch_id") or self.active_batch_data_id
+        )
+        if self._get_batch_source(batch_id=batch_id) is None:
+            return None
+
+        return batch_id
+
+    def _get_batch_source(
+        self, batch_id: Optional[str]
+    ) -> Optional[Tuple[Optional[str], Optional[str], Optional[Any]]]:
+        """Returns the schema and table names of the source table of a batch of SqlAlchemyBatchData, along with the
+        clause selecting its rows from that table if it was split from it (or None if the batch is not a batch of
+        SqlAlchemyBatchData).
+
+        Batches loaded lazily are described by their batch specs (see load_batch_data_lazily()) until they are loaded,
+        so that planning the computation of metrics does not load them (possibly unloading other batches).  Batches
+        without batch specs are only described once they are loaded.
+        """
+        if batch_id is None:
+            return None
+
+        if self._batch_data_dict.is_loaded(batch_id):
+            data_object: Any = self._batch_data_dict[batch_id]
+            if not isinstance(data_object, SqlAlchemyBatchData):
+                return None
+
+            return (
+                data_object.source_schema_name,
+                data_object.source_table_name,
+                data_object.split_clause,
+            )
+
+        batch_spec: Optional[BatchSpec] = self._lazy_batch_specs.get(batch_id)
+        if isinstance(batch_spec, RuntimeQueryBatchSpec):
+            return batch_spec.get("schema_name"), batch_spec.get("table_name"), None
+
+        if isinstance(batch_spec, SqlAlchemyDatasourceBatchSpec):
+            return (
+                batch_spec.get("schema_name"),
+                batch_spec.get("table_name"),
+                self._get_split_clause_from_batch_spec(batch_spec=batch_spec),
+            )
+
+        return None
+
+    def _resolve_batch_domain_query_group(
+        self,
+        data_object: SqlAlchemyBatchData,
+        queries: List[dict],
+        resolved_metrics: Dict[Tuple[str, str, str], Any],
+    ) -> None:
+        """Executes one query for the domains of a batch grouped by "_resolve_batch_domain_queries()"."""
+        batch_selectable: Any = self._get_domain_records_for_batch_data(
+            data_object=data_object, domain_kwargs={}
+        )
+
+        conditions: List[Optional[Any]] = [
+            self._get_domain_condition(domain_kwargs=query["domain_kwargs"])
+            for query in queries
+        ]
+        # Conditional aggregates of the metrics (None for the metrics which cannot be rewritten this way).
+        conditional_columns_by_query: List[List[Optional[Any]]] = [
+            [
+                self._apply_condition_to_aggregates(column=column, condition=condition)
+                for column in query["select"]
+            ]
+            for query, condition in zip(queries, conditions)
+        ]
+
+        # The other metrics are computed by scalar subqueries over a shared CTE of the batch.
+        batch_cte: Any = batch_selectable
+        if any(
+            column is None
+            for conditional_columns in conditional_columns_by_query
+            for column in conditional_columns
+        ):
+            # Batches selected by queries (e.g., from split or sampled tables) are aliased subqueries of these queries.
+            batch_query: Any = getattr(batch_selectable, "element", batch_selectable)
+            if isinstance(batch_query, (Select, TextualSelect)):
+                batch_cte = batch_query.cte()
+
+        select: List[Any] = []
+
+        query: dict
+        condition: Optional[Any]
+        conditional_columns: List[Optional[Any]]
+        for query, condition, conditional_columns in zip(
+            queries, conditions, conditional_columns_by_query
+        ):
+            column: Any
+            conditional_column: Optional[Any]
+            for column, conditional_column in zip(query["select"], conditional_columns):
+                if conditional_column is None:
+                    domain_selectable: Any = batch_cte
+                    if condition is not None:
+                        domain_selectable = (
+                            sa.select([sa.text("*")])
+                            .select_from(batch_cte)
+                            .where(condition)
+                        )
+
+                    conditional_column = self._select_from_domain_records(
+                        columns=[column], selectable=domain_selectable
+                    ).scalar_subquery()
+                elif Label and isinstance(conditional_column, Label):
+                    conditional_column = conditional_column.element
+
+                # Columns are labeled by position, since the metrics of different domains may have the same name.
+                select.append(conditional_column.label(f"__ge_metric_{len(select)}"))
+
+        res: List[Row] = self.engine.execute(
+            self._select_from_domain_records(columns=select, selectable=batch_cte)
+        ).fetchall()
+        assert (
+            len(res) == 1
+        ), "all bundle-computed metrics must be single-value statistics"
+
+        idx: int = 0
+        for query in queries:
+            metric_id: Tuple[str, str, str]
+            for metric_id in query["ids"]:
+                resolved_metrics[metric_id] = convert_to_json_serializable(
+                    data=res[0][idx]
+                )
+                idx += 1
+
+        logger.debug(
+            f"SqlAlchemyExecutionEngine computed {len(select)} metrics on {len(queries)} domains with one query"
+        )
+
+    def _get_domain_condition(self, domain_kwargs: dict) -> Optional[Any]:
+        """Returns the condition selecting the rows of a domain among the rows of its batch (see
+        "_get_domain_records_for_batch_data()"), or None if the domain has all of the rows of its batch."""
+        conditions: List[Any] = []
+
+        row_conditions: List[str] = self._get_row_conditions(
+            domain_kwargs=domain_kwargs
+        )
+        if row_conditions:
+            conditions.append(parse_conditions_to_sqlalchemy(tuple(row_conditions)))
+
+        if "column" not in domain_kwargs:
+            ignore_row_if_condition: Optional[Any] = self._get_ignore_row_if_condition(
+                domain_kwargs=domain_kwargs
+            )
+            if ignore_row_if_condition is not None:
+                conditions.append(ignore_row_if_condition)
+
+        if not conditions:
+            return None
+
+        return sa.and_(*conditions)
+
+    @staticmethod
+    def _apply_condition_to_aggregates(
+        column: Any, condition: Optional[Any]
+    ) -> Optional[Any]:
+        """Rewrites the aggregates of a metric, so that they only aggregate the rows satisfying a condition (e.g.,
+        "SUM(x)" becomes "SUM(CASE WHEN condition THEN x END)"), or returns None if the metric references columns outside
+        of aggregates ignoring NULL values (see CONDITIONAL_AGGREGATE_FUNCTION_NAMES)."""
+        if condition is None:
+            return column
+
+        conditional_aggregates: List[Any] = []
+
+        def replace(element: Any) -> Optional[Any]:
+            if not (
+                isinstance(element, FunctionElement)
+                and element.name.lower() in CONDITIONAL_AGGREGATE_FUNCTION_NAMES
+            ):
+                return None
+
+            arguments: List[Any] = list(element.clauses)
+            if len(arguments) != 1:
+                return None
+
+            argument: Any = arguments[0]
+            if isinstance(argument, ColumnClause) and argument.name == "*":
+                # COUNT(*) becomes COUNT(CASE WHEN condition THEN 1 END).
+                argument = sa.literal_column("1")
+
+            if (
+                isinstance(argument, UnaryExpression)
+                and argument.operator is operators.distinct_op
+            ):
+                argument = sa.distinct(sa.case([(condition, argument.element)]))
+            else:
+                argument = sa.case([(condition, argument)])
+
+            conditional_aggregate: Any = getattr(sa.func, element.name)(argument)
+            conditional_aggregates.append(conditional_aggregate)
+            return conditional_aggregate
+
+        conditional_column: Any = sa.sql.visitors.replacement_traverse(
+            column, {}, replace
+        )
+
+        def references_unconditional_columns(element: Any) -> bool:
+            if any(element is aggregate for aggregate in conditional_aggregates):
+                return False
+
+            if isinstance(element, (ColumnClause, TextClause)):
+                return True
+
+            return any(
+                references_unconditional_columns(child)
+                for child in element.get_children()
+            )
+
+        if references_unconditional_columns(conditional_column):
+            return None
+
+        return conditional_column
+
+    @staticmethod
+    def _get_split_keys(split_clause: Any) -> Optional[List[Tuple[Any, Any]]]:
+        """Decomposes the WHERE clause built by a splitter into its (expression, value) equality comparisons, or returns
+        None if it is not a conjunction of comparisons of expressions to values."""
+        if split_clause is None:
+            return None
+
+        comparisons: List[Any]
+        if isinstance(split_clause, BooleanClauseList):
+            if split_clause.operator is not operators.and_:
+                return None
+
+            comparisons = list(split_clause.clauses)
+        else:
+            comparisons = [split_clause]
+
+        split_keys: List[Tuple[Any, Any]] = []
+
+        comparison: Any
+        for comparison in comparisons:
+            if not (
+                isinstance(comparison, BinaryExpression)
+                and comparison.operator is operators.eq
+                and isinstance(comparison.right, BindParameter)
+                and comparison.right.value is not None
+            ):
+                return None
+
+            split_keys.append((comparison.left, comparison.right.value))
+
+        return split_keys or None
+
+    @staticmethod
+    def _normalize_split_key_value(value: Any) -> Any:
+        """Normalizes the value of a split key, so that the batch identifiers used by a splitter match the values of the
+        split key returned by the database, whose types depend on the database driver."""
+        if isinstance(value, bool):
+            return value
+
+        if isinstance(value, numbers.Number):
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return str(value)
+
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+
+        return str(value)
+
+    def _release_batch_data(self, batch_id: str) -> None:
+        # Batches are unloaded (e.g., the least recently used ones, if "max_loaded_batches" is set) or replaced along
+        # with their temporary tables, which are created again if unloaded batches are loaded again.
+        batch_data: Any = self.loaded_batch_data_dict[batch_id]
+        if isinstance(batch_data, SqlAlchemyBatchData):
+            batch_data.drop_temporary_table()
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1035,9 +1712,25 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """
         if self._engine_backup:
             self.engine.close()
-            self._engine_backup.dispose()
+            engine = self._engine_backup
+        else:
+            engine = self.engine
+
+        if engine is self._registered_engine:
+            # The engine may still be used by other execution engines, datasources or stores.
+            self._registered_engine = None
+            sqlalchemy_engine_registry.release_engine(engine)
         else:
-            self.engine.dispose()
+            engine.dispose()
+
+    @property
+    def pool_statistics(self) -> Optional[PoolStatistics]:
+        """Connection checkout statistics of the (possibly shared) connection pool of this execution engine; None if
+        the engine was provided rather than built by the execution engine, or is not shared (see
+        CONNECTION_HOLDING_DIALECTS)."""
+        if self._registered_engine is None:
+            return None
+        return sqlalchemy_engine_registry.get_pool_statistics(self._registered_engine)
 
     def _get_splitter_method(self, splitter_method_name: str) -> Callable:
         """Get the appropriate splitter method from the method name.
@@ -1094,16 +1787,37 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             splitter_kwargs=splitter_kwargs,
         )
 
+    def _build_split_clause_from_batch_spec(self, batch_spec: BatchSpec) -> Any:
+        splitter_fn: Callable = self._get_splitter_method(
+            splitter_method_name=batch_spec["splitter_method"]
+        )
+        return splitter_fn(
+            batch_identifiers=batch_spec["batch_identifiers"],
+            **batch_spec["splitter_kwargs"],
+        )
+
+    def _get_split_clause_from_batch_spec(self, batch_spec: BatchSpec) -> Optional[Any]:
+        """Returns the clause selecting the rows of a batch split from a table, or None if the batch is not split from a
+        table (or is sampled).
+
+        Batches of the rows of a table that match the batch identifiers of a splitter can be computed together with the
+        other batches split from that table; whether or not their rows are copied to temporary tables, such groups of
+        batches are computed from the (source) table itself.
+        """
+        if (
+            "splitter_method" not in batch_spec
+            or batch_spec.get("sampling_method") is not None
+        ):
+            return None
+
+        return self._build_split_clause_from_batch_spec(batch_spec=batch_spec)
+
     def _build_selectable_from_batch_spec(
         self, batch_spec: BatchSpec
     ) -> Union[Selectable, str]:
         if "splitter_method" in batch_spec:
-            splitter_fn: Callable = self._get_splitter_method(
-                splitter_method_name=batch_spec["splitter_method"]
-            )
-            split_clause = splitter_fn(
-                batch_identifiers=batch_spec["batch_identifiers"],
-                **batch_spec["splitter_kwargs"],
+            split_clause = self._build_split_clause_from_batch_spec(
+                batch_spec=batch_spec
             )
 
         else:
@@ -1213,6 +1927,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 create_temp_table=create_temp_table,
                 source_table_name=source_table_name,
                 source_schema_name=source_schema_name,
+                split_clause=self._get_split_clause_from_batch_spec(
+                    batch_spec=batch_spec
+                ),
             )
 
         return batch_data, batch_markers
@@ -13,6 +13,7 @@ from great_expectations.expectations.metrics.util import parse_value_set
 from great_expectations.expectations.util import (
     add_values_with_json_schema_from_list_in_params,
     render_evaluation_parameter_string,
+    replace_value_counts_with_distinct_values_set_membership,
 )
 from great_expectations.render.renderer.renderer import renderer
 from great_expectations.render.types import (
@@ -377,6 +378,22 @@ class ExpectColumnDistinctValuesToBeInSet(ColumnExpectation):
         except AssertionError as e:
             raise InvalidExpectationConfigurationError(str(e))
 
+    def get_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> dict:
+        dependencies: dict = super().get_validation_dependencies(
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        return replace_value_counts_with_distinct_values_set_membership(
+            dependencies=dependencies,
+            success_kwargs=self.get_success_kwargs(configuration),
+        )
+
     def _validate(
         self,
         configuration: ExpectationConfiguration,
@@ -387,6 +404,23 @@ class ExpectColumnDistinctValuesToBeInSet(ColumnExpectation):
         parse_strings_as_datetimes = self.get_success_kwargs(configuration).get(
             "parse_strings_as_datetimes"
         )
+        set_membership: Optional[dict] = metrics.get(
+            "column.distinct_values.set_membership"
+        )
+        if set_membership is not None:
+            value_set = self.get_success_kwargs(configuration).get("value_set") or []
+            return {
+                "success": not value_set or set_membership["unexpected_count"] == 0,
+                "result": {
+                    "details": {
+                        "unexpected_count": set_membership["unexpected_count"],
+                        "partial_unexpected_list": set_membership[
+                            "partial_unexpected_list"
+                        ],
+                    }
+                },
+            }
+
         observed_value_counts = metrics.get("column.value_counts")
         observed_value_set = set(observed_value_counts.index)
         value_set = self.get_success_kwargs(configuration).get("value_set") or []
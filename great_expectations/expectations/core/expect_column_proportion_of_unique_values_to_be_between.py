@@ -3,6 +3,9 @@ from typing import Dict, List, Optional
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.expectations.expectation import ColumnExpectation
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values import (
+    ColumnDistinctValuesCountApproximate,
+)
 from great_expectations.expectations.util import render_evaluation_parameter_string
 from great_expectations.render.renderer.renderer import renderer
 from great_expectations.render.types import RenderedStringTemplateContent
@@ -23,6 +26,7 @@ from great_expectations.rule_based_profiler.parameter_container import (
     PARAMETER_KEY,
     VARIABLES_KEY,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
@@ -47,6 +51,9 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
             If True, the minimum proportion of unique values must be strictly larger than min_value, default=False
         strict_max (boolean):
             If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
+        approximate (boolean):
+            If True, estimate the number of unique values with HyperLogLog sketches (or the approximate distinct \
+            count function of the database), instead of counting them exactly, default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -104,6 +111,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         "strict_min",
         "max_value",
         "strict_max",
+        "approximate",
         "auto",
         "profiler_config",
     )
@@ -185,6 +193,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
+        "approximate": False,
         "auto": False,
         "profiler_config": default_profiler_config,
     }
@@ -408,6 +417,31 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         else:
             return [template_string_object, f"{100 * observed_value:.1f}%"]
 
+    def get_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> dict:
+        dependencies: dict = super().get_validation_dependencies(
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        if self.get_success_kwargs(configuration).get("approximate"):
+            # The number of distinct values is estimated with HyperLogLog sketches, instead of being counted exactly.
+            exact_metric: MetricConfiguration = dependencies["metrics"].pop(
+                "column.unique_proportion"
+            )
+            dependencies["metrics"][
+                "column.unique_proportion.approximate"
+            ] = MetricConfiguration(
+                metric_name="column.unique_proportion.approximate",
+                metric_domain_kwargs=exact_metric.metric_domain_kwargs,
+            )
+
+        return dependencies
+
     def _validate(
         self,
         configuration: ExpectationConfiguration,
@@ -415,10 +449,26 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         runtime_configuration: dict = None,
         execution_engine: ExecutionEngine = None,
     ):
-        return self._validate_metric_value_between(
-            metric_name="column.unique_proportion",
+        if not self.get_success_kwargs(configuration).get("approximate"):
+            return self._validate_metric_value_between(
+                metric_name="column.unique_proportion",
+                configuration=configuration,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+                execution_engine=execution_engine,
+            )
+
+        validation_result: dict = self._validate_metric_value_between(
+            metric_name="column.unique_proportion.approximate",
             configuration=configuration,
             metrics=metrics,
             runtime_configuration=runtime_configuration,
             execution_engine=execution_engine,
         )
+        validation_result["result"]["details"] = {
+            "approximate": True,
+            "relative_standard_error": ColumnDistinctValuesCountApproximate.get_relative_standard_error(
+                execution_engine=execution_engine
+            ),
+        }
+        return validation_result
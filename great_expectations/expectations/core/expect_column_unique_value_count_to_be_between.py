@@ -3,6 +3,9 @@ from typing import Dict, List, Optional
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.expectations.expectation import ColumnExpectation
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values import (
+    ColumnDistinctValuesCountApproximate,
+)
 from great_expectations.expectations.util import render_evaluation_parameter_string
 from great_expectations.render.renderer.renderer import renderer
 from great_expectations.render.types import RenderedStringTemplateContent
@@ -24,6 +27,7 @@ from great_expectations.rule_based_profiler.parameter_container import (
     PARAMETER_KEY,
     VARIABLES_KEY,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
@@ -40,6 +44,9 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
                     The minimum number of unique values allowed.
                 max_value (int or None): \
                     The maximum number of unique values allowed.
+                approximate (boolean): \
+                    If True, estimate the number of unique values with HyperLogLog sketches (or the approximate \
+                    distinct count function of the database), instead of counting them exactly, default=False
 
             Other Parameters:
                 result_format (str or None): \
@@ -95,6 +102,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
     success_keys = (
         "min_value",
         "max_value",
+        "approximate",
         "auto",
         "profiler_config",
     )
@@ -176,6 +184,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
+        "approximate": False,
         "auto": False,
         "profiler_config": default_profiler_config,
     }
@@ -412,6 +421,31 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         else:
             return [template_string_object, observed_value]
 
+    def get_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> dict:
+        dependencies: dict = super().get_validation_dependencies(
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        if self.get_success_kwargs(configuration).get("approximate"):
+            # The number of distinct values is estimated with HyperLogLog sketches, instead of being counted exactly.
+            exact_metric: MetricConfiguration = dependencies["metrics"].pop(
+                "column.distinct_values.count"
+            )
+            dependencies["metrics"][
+                "column.distinct_values.count.approximate"
+            ] = MetricConfiguration(
+                metric_name="column.distinct_values.count.approximate",
+                metric_domain_kwargs=exact_metric.metric_domain_kwargs,
+            )
+
+        return dependencies
+
     def _validate(
         self,
         configuration: ExpectationConfiguration,
@@ -419,10 +453,26 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         runtime_configuration: dict = None,
         execution_engine: ExecutionEngine = None,
     ):
-        return self._validate_metric_value_between(
-            metric_name="column.distinct_values.count",
+        if not self.get_success_kwargs(configuration).get("approximate"):
+            return self._validate_metric_value_between(
+                metric_name="column.distinct_values.count",
+                configuration=configuration,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+                execution_engine=execution_engine,
+            )
+
+        validation_result: dict = self._validate_metric_value_between(
+            metric_name="column.distinct_values.count.approximate",
             configuration=configuration,
             metrics=metrics,
             runtime_configuration=runtime_configuration,
             execution_engine=execution_engine,
         )
+        validation_result["result"]["details"] = {
+            "approximate": True,
+            "relative_standard_error": ColumnDistinctValuesCountApproximate.get_relative_standard_error(
+                execution_engine=execution_engine
+            ),
+        }
+        return validation_result
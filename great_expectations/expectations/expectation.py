@@ -80,6 +80,7 @@ from great_expectations.render.types import (
 )
 from great_expectations.render.util import num_to_str
 from great_expectations.self_check.util import (
+    ExpectationTestDataCache,
     evaluate_json_test_cfe,
     generate_expectation_tests,
 )
@@ -954,6 +955,7 @@ class Expectation(metaclass=MetaExpectation):
         debug_logger: Optional[logging.Logger] = None,
         only_consider_these_backends: Optional[List[str]] = None,
         context: Optional["DataContext"] = None,  # noqa: F821
+        test_data_cache: Optional[ExpectationTestDataCache] = None,
     ) -> ExpectationDiagnostics:
         """Produce a diagnostic report about this Expectation.
 
@@ -974,6 +976,10 @@ class Expectation(metaclass=MetaExpectation):
         If errors are encountered in the process of running the diagnostics, they are assumed to be due to
         incompleteness of the Expectation's implementation (e.g., declaring a dependency on Metrics
         that do not exist). These errors are added under "errors" key in the report.
+
+        When diagnostics are run for several Expectations, passing the same ExpectationTestDataCache loads each
+        distinct test dataset into each backend only once (see great_expectations.self_check.diagnostics_runner to
+        run diagnostics in parallel processes).
         """
 
         _debug = lambda x: x
@@ -1036,6 +1042,7 @@ class Expectation(metaclass=MetaExpectation):
             debug_logger=debug_logger,
             only_consider_these_backends=only_consider_these_backends,
             context=context,
+            test_data_cache=test_data_cache,
         )
 
         backend_test_result_counts: List[
@@ -1341,6 +1348,7 @@ class Expectation(metaclass=MetaExpectation):
         debug_logger: Optional[logging.Logger] = None,
         only_consider_these_backends: Optional[List[str]] = None,
         context: Optional["DataContext"] = None,  # noqa: F821
+        test_data_cache: Optional[ExpectationTestDataCache] = None,
     ) -> List[ExpectationTestDiagnostics]:
         """Generate test results. This is an internal method for run_diagnostics."""
 
@@ -1363,6 +1371,7 @@ class Expectation(metaclass=MetaExpectation):
             debug_logger=debug_logger,
             only_consider_these_backends=only_consider_these_backends,
             context=context,
+            test_data_cache=test_data_cache,
         )
 
         backend_test_times = defaultdict(list)
@@ -2632,6 +2641,19 @@ def _format_map_output(
     # Incrementally add to result and return when all values for the specified level are present
     return_obj = {"success": success}
 
+    # Unexpected lists and unexpected index lists written to files (see "unexpected_rows_sink" result format) are
+    # references to the files, which hold the first values (and index labels) as well.
+    partial_unexpected_list = (
+        unexpected_list.get("partial_unexpected_list")
+        if isinstance(unexpected_list, dict)
+        else unexpected_list
+    )
+    partial_unexpected_index_list = (
+        unexpected_index_list.get("partial_unexpected_index_list")
+        if isinstance(unexpected_index_list, dict)
+        else unexpected_index_list
+    )
+
     if result_format["result_format"] == "BOOLEAN_ONLY":
         return return_obj
 
@@ -2664,7 +2686,7 @@ def _format_map_output(
         "element_count": element_count,
         "unexpected_count": unexpected_count,
         "unexpected_percent": unexpected_percent_nonmissing,
-        "partial_unexpected_list": unexpected_list[
+        "partial_unexpected_list": partial_unexpected_list[
             : result_format["partial_unexpected_count"]
         ],
     }
@@ -2687,29 +2709,36 @@ def _format_map_output(
     if result_format["result_format"] == "BASIC":
         return return_obj
 
-    if len(unexpected_list) and isinstance(unexpected_list[0], dict):
+    if len(partial_unexpected_list) and isinstance(partial_unexpected_list[0], dict):
         # in the case of multicolumn map expectations `unexpected_list` contains dicts,
         # which will throw an exception when we hash it to count unique members.
         # As a workaround, we flatten the values out to tuples.
         immutable_unexpected_list = [
-            tuple([val for val in item.values()]) for item in unexpected_list
+            tuple([val for val in item.values()]) for item in partial_unexpected_list
         ]
     else:
-        immutable_unexpected_list = unexpected_list
+        immutable_unexpected_list = partial_unexpected_list
 
     # Try to return the most common values, if possible.
     partial_unexpected_counts = None
     if 0 < result_format.get("partial_unexpected_count"):
         try:
-            partial_unexpected_counts = [
-                {"value": key, "count": value}
-                for key, value in sorted(
-                    Counter(immutable_unexpected_list).most_common(
-                        result_format["partial_unexpected_count"]
-                    ),
-                    key=lambda x: (-x[1], x[0]),
-                )
-            ]
+            # Unexpected values written to files are counted (all of them) as they are written.
+            if (
+                isinstance(unexpected_list, dict)
+                and "partial_unexpected_counts" in unexpected_list
+            ):
+                partial_unexpected_counts = unexpected_list["partial_unexpected_counts"]
+            else:
+                partial_unexpected_counts = [
+                    {"value": key, "count": value}
+                    for key, value in sorted(
+                        Counter(immutable_unexpected_list).most_common(
+                            result_format["partial_unexpected_count"]
+                        ),
+                        key=lambda x: (-x[1], x[0]),
+                    )
+                ]
         except TypeError:
             partial_unexpected_counts = [
                 {"error": "partial_exception_counts requires a hashable type"}
@@ -2717,10 +2746,10 @@ def _format_map_output(
         finally:
             return_obj["result"].update(
                 {
-                    "partial_unexpected_index_list": unexpected_index_list[
+                    "partial_unexpected_index_list": partial_unexpected_index_list[
                         : result_format["partial_unexpected_count"]
                     ]
-                    if unexpected_index_list is not None
+                    if partial_unexpected_index_list is not None
                     else None,
                     "partial_unexpected_counts": partial_unexpected_counts,
                 }
@@ -1,7 +1,9 @@
 from .column_distinct_values import (
     ColumnDistinctValues,
     ColumnDistinctValuesCount,
+    ColumnDistinctValuesCountApproximate,
     ColumnDistinctValuesCountUnderThreshold,
+    ColumnDistinctValuesSetMembership,
 )
 from .column_histogram import ColumnHistogram
 from .column_max import ColumnMax
@@ -13,7 +15,10 @@ from .column_parameterized_distribution_ks_test_p_value import (
     ColumnParameterizedDistributionKSTestPValue,
 )
 from .column_partition import ColumnPartition
-from .column_proportion_of_unique_values import ColumnUniqueProportion
+from .column_proportion_of_unique_values import (
+    ColumnApproximateUniqueProportion,
+    ColumnUniqueProportion,
+)
 from .column_quantile_values import ColumnQuantileValues
 from .column_standard_deviation import ColumnStandardDeviation
 from .column_sum import ColumnSum
@@ -1,8 +1,9 @@
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.hyperloglog import HyperLogLog, estimate_distinct_count
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.execution_engine import (
     ExecutionEngine,
@@ -10,6 +11,7 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.sqlalchemy_dialect import GESqlDialect
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
@@ -25,6 +27,7 @@ from great_expectations.expectations.metrics.import_manager import (
     sa_sql_expression_ColumnClause,
     sa_sql_expression_Selectable,
     sqlalchemy_engine_Engine,
+    sqlalchemy_engine_Row,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.validator.metric_configuration import MetricConfiguration
@@ -129,6 +132,284 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
         return F.countDistinct(column)
 
 
+# Native approximate distinct count functions (all of which use HyperLogLog sketches), and the relative standard error
+# of their estimates, by dialect.
+APPROXIMATE_DISTINCT_COUNT_FUNCTIONS: Dict[str, Tuple[str, float]] = {
+    GESqlDialect.AWSATHENA.value: ("approx_distinct", 0.023),
+    # HyperLogLog++ sketches of precision 15.
+    GESqlDialect.BIGQUERY.value: ("APPROX_COUNT_DISTINCT", 0.0058),
+    GESqlDialect.SNOWFLAKE.value: ("APPROX_COUNT_DISTINCT", 0.0163),
+    GESqlDialect.TRINO.value: ("approx_distinct", 0.023),
+}
+
+SPARK_APPROXIMATE_DISTINCT_COUNT_RELATIVE_STANDARD_DEVIATION = 0.01
+
+
+class ColumnDistinctValuesCountApproximate(ColumnAggregateMetricProvider):
+    """Estimates the number of distinct values of a column with HyperLogLog sketches, which (unlike
+    column.distinct_values.count) does not require holding every distinct value: pandas uses an in-process sketch,
+    Spark and the databases listed in APPROXIMATE_DISTINCT_COUNT_FUNCTIONS use their native approximate distinct count
+    functions, and other databases count the distinct values exactly.
+
+    The relative standard error of the estimates is given by get_relative_standard_error().  Estimates are capped at
+    the number of non-null values, which they may otherwise exceed (e.g., for columns of unique values).
+    """
+
+    metric_name = "column.distinct_values.count.approximate"
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column: pd.Series, **kwargs) -> int:
+        return min(estimate_distinct_count(column), int(column.count()))
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        column: sa_sql_expression_ColumnClause,
+        _dialect,
+        **kwargs,
+    ) -> sa_func_count:
+        function: Optional[
+            Tuple[str, float]
+        ] = APPROXIMATE_DISTINCT_COUNT_FUNCTIONS.get(_dialect.name.lower())
+        if function is None:
+            return sa.func.count(sa.distinct(column))
+
+        return sa.func.least(
+            getattr(sa.func, function[0])(column), sa.func.count(column)
+        )
+
+    @column_aggregate_partial(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        column: pyspark_sql_Column,
+        **kwargs,
+    ) -> pyspark_sql_Column:
+        return F.least(
+            F.approx_count_distinct(
+                column, rsd=SPARK_APPROXIMATE_DISTINCT_COUNT_RELATIVE_STANDARD_DEVIATION
+            ),
+            F.count(column),
+        )
+
+    @staticmethod
+    def get_relative_standard_error(execution_engine: ExecutionEngine) -> float:
+        """The relative standard error of the estimates computed by an execution engine (0 if they are exact)."""
+        if isinstance(execution_engine, PandasExecutionEngine):
+            return HyperLogLog().relative_standard_error
+
+        if isinstance(execution_engine, SparkDFExecutionEngine):
+            return SPARK_APPROXIMATE_DISTINCT_COUNT_RELATIVE_STANDARD_DEVIATION
+
+        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+            function: Optional[
+                Tuple[str, float]
+            ] = APPROXIMATE_DISTINCT_COUNT_FUNCTIONS.get(execution_engine.dialect_name)
+            if function is not None:
+                return function[1]
+
+        return 0.0
+
+
+class ColumnDistinctValuesSetMembership(ColumnAggregateMetricProvider):
+    """Compares the distinct (non-null) values of a column with "value_set" in the execution engine, returning:
+        - "unexpected_count": the number of distinct values that are not in "value_set",
+        - "partial_unexpected_list": at most "partial_unexpected_count" of these distinct values,
+        - "observed_expected_values": the values of "value_set" that occur in the column.
+
+    Unlike column.value_counts, whose result has a row per distinct value, only results bounded by the sizes of
+    "value_set" and "partial_unexpected_count" are transferred from the database (or Spark cluster).
+    """
+
+    metric_name = "column.distinct_values.set_membership"
+    value_keys = ("value_set", "partial_unexpected_count")
+
+    default_kwarg_values = {"value_set": None, "partial_unexpected_count": 20}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: PandasExecutionEngine,
+        metric_domain_kwargs: Dict[str, str],
+        metric_value_kwargs: Dict[str, Any],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        value_set: List[Any] = cls._get_value_set(metric_value_kwargs)
+        partial_unexpected_count: int = cls._get_partial_unexpected_count(
+            metric_value_kwargs
+        )
+
+        df: pd.DataFrame
+        accessor_domain_kwargs: Dict[str, str]
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, MetricDomainTypes.COLUMN
+        )
+        distinct_values = pd.Series(
+            df[accessor_domain_kwargs["column"]].dropna().unique(), dtype="object"
+        )
+        expected_value_mask: pd.Series = distinct_values.isin(value_set)
+        unexpected_values: pd.Series = distinct_values[~expected_value_mask]
+
+        return {
+            "unexpected_count": len(unexpected_values),
+            "partial_unexpected_list": unexpected_values[
+                :partial_unexpected_count
+            ].tolist(),
+            "observed_expected_values": distinct_values[expected_value_mask].tolist(),
+        }
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: Dict[str, str],
+        metric_value_kwargs: Dict[str, Any],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        value_set: List[Any] = cls._get_value_set(metric_value_kwargs)
+        partial_unexpected_count: int = cls._get_partial_unexpected_count(
+            metric_value_kwargs
+        )
+
+        selectable: sa_sql_expression_Selectable
+        accessor_domain_kwargs: Dict[str, str]
+        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, MetricDomainTypes.COLUMN
+        )
+        column: sa_sql_expression_ColumnClause = sa.column(
+            accessor_domain_kwargs["column"]
+        )
+
+        # The distinct values are grouped by the value of "value_set" they are equal to (NULL for unexpected values),
+        # so that a single scan yields both the values of "value_set" that occur and the number of unexpected values.
+        # The grouping is done in a subquery, since some databases (e.g., PostgreSQL) do not group by expressions with
+        # bound parameters, such as that of the IN operator.
+        expected_values = (
+            sa.select(
+                [
+                    sa.case([(column.in_(value_set), column)], else_=None).label(
+                        "expected_value"
+                    ),
+                    column.label("value"),
+                ]
+            )
+            .select_from(selectable)
+            .where(column.is_not(None))
+            .alias("expected_values")
+        )
+        rows: List[sqlalchemy_engine_Row] = execution_engine.engine.execute(
+            sa.select(
+                [
+                    expected_values.c.expected_value,
+                    sa.func.count(sa.distinct(expected_values.c.value)),
+                ]
+            ).group_by(expected_values.c.expected_value)
+        ).fetchall()
+
+        unexpected_count: int = 0
+        observed_expected_values: List[Any] = []
+        row: sqlalchemy_engine_Row
+        for row in rows:
+            if row[0] is None:
+                unexpected_count = row[1]
+            else:
+                observed_expected_values.append(row[0])
+
+        partial_unexpected_list: List[Any] = []
+        if unexpected_count > 0 and partial_unexpected_count > 0:
+            partial_unexpected_list = [
+                row[0]
+                for row in execution_engine.engine.execute(
+                    sa.select([column])
+                    .select_from(selectable)
+                    .where(sa.and_(column.is_not(None), sa.not_(column.in_(value_set))))
+                    .distinct()
+                    .limit(partial_unexpected_count)
+                ).fetchall()
+            ]
+
+        return {
+            "unexpected_count": unexpected_count,
+            "partial_unexpected_list": partial_unexpected_list,
+            "observed_expected_values": observed_expected_values,
+        }
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: Dict[str, str],
+        metric_value_kwargs: Dict[str, Any],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        value_set: List[Any] = cls._get_value_set(metric_value_kwargs)
+        partial_unexpected_count: int = cls._get_partial_unexpected_count(
+            metric_value_kwargs
+        )
+
+        df: pyspark_sql_DataFrame
+        accessor_domain_kwargs: Dict[str, str]
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, MetricDomainTypes.COLUMN
+        )
+        column: pyspark_sql_Column = F.col(accessor_domain_kwargs["column"])
+        is_expected: pyspark_sql_Column = (
+            column.isin(value_set) if value_set else F.lit(False)
+        )
+
+        df = df.where(column.isNotNull())
+        rows: List[pyspark_sql_Row] = (
+            df.select(
+                F.when(is_expected, column).alias("expected_value"),
+                column.alias("value"),
+            )
+            .groupBy("expected_value")
+            .agg(F.countDistinct("value"))
+            .collect()
+        )
+
+        unexpected_count: int = 0
+        observed_expected_values: List[Any] = []
+        row: pyspark_sql_Row
+        for row in rows:
+            if row[0] is None:
+                unexpected_count = row[1]
+            else:
+                observed_expected_values.append(row[0])
+
+        partial_unexpected_list: List[Any] = []
+        if unexpected_count > 0 and partial_unexpected_count > 0:
+            partial_unexpected_list = [
+                row[0]
+                for row in df.where(~is_expected)
+                .select(column)
+                .distinct()
+                .limit(partial_unexpected_count)
+                .collect()
+            ]
+
+        return {
+            "unexpected_count": unexpected_count,
+            "partial_unexpected_list": partial_unexpected_list,
+            "observed_expected_values": observed_expected_values,
+        }
+
+    @classmethod
+    def _get_value_set(cls, metric_value_kwargs: Dict[str, Any]) -> List[Any]:
+        value_set: Optional[Iterable[Any]] = metric_value_kwargs.get(
+            "value_set", cls.default_kwarg_values["value_set"]
+        )
+        return list(value_set or [])
+
+    @classmethod
+    def _get_partial_unexpected_count(cls, metric_value_kwargs: Dict[str, Any]) -> int:
+        partial_unexpected_count: Optional[int] = metric_value_kwargs.get(
+            "partial_unexpected_count"
+        )
+        if partial_unexpected_count is None:
+            return cls.default_kwarg_values["partial_unexpected_count"]
+        return partial_unexpected_count
+
+
 class ColumnDistinctValuesCountUnderThreshold(ColumnAggregateMetricProvider):
     metric_name = "column.distinct_values.count.under_threshold"
     condition_keys = ("threshold",)
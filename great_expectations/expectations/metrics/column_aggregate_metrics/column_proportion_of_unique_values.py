@@ -14,10 +14,12 @@ from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
-def unique_proportion(_metrics):
+def unique_proportion(
+    _metrics, distinct_values_count_metric_name="column.distinct_values.count"
+):
     """Computes the proportion of unique non-null values out of all non-null values"""
     total_values = _metrics.get("table.row_count")
-    unique_values = _metrics.get("column.distinct_values.count")
+    unique_values = _metrics.get(distinct_values_count_metric_name)
     null_count = _metrics.get("column_values.nonnull.unexpected_count")
 
     # Ensuring that we do not divide by 0, returning 0 if all values are nulls (we only consider non-nulls unique values)
@@ -27,6 +29,14 @@ def unique_proportion(_metrics):
         return 0
 
 
+def approximate_unique_proportion(_metrics):
+    """Computes the proportion of unique non-null values from the estimated number of distinct values, which is capped
+    at 1, since estimates may exceed the number of non-null values"""
+    return min(
+        unique_proportion(_metrics, "column.distinct_values.count.approximate"), 1.0
+    )
+
+
 class ColumnUniqueProportion(ColumnAggregateMetricProvider):
     metric_name = "column.unique_proportion"
 
@@ -68,3 +78,49 @@ class ColumnUniqueProportion(ColumnAggregateMetricProvider):
         )
 
         return dependencies
+
+
+class ColumnApproximateUniqueProportion(ColumnAggregateMetricProvider):
+    """The proportion of unique values, computed from the estimated number of distinct values of
+    column.distinct_values.count.approximate."""
+
+    metric_name = "column.unique_proportion.approximate"
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(*args, metrics, **kwargs):
+        return approximate_unique_proportion(metrics)
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(*args, metrics, **kwargs):
+        return approximate_unique_proportion(metrics)
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(*args, metrics, **kwargs):
+        return approximate_unique_proportion(metrics)
+
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        dependencies["column.distinct_values.count.approximate"] = MetricConfiguration(
+            metric_name="column.distinct_values.count.approximate",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+        )
+
+        dependencies["column_values.nonnull.unexpected_count"] = MetricConfiguration(
+            metric_name="column_values.nonnull.unexpected_count",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+        )
+
+        return dependencies
@@ -1,9 +1,11 @@
 import inspect
+import itertools
 import logging
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 import numpy as np
+import pandas as pd
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core import ExpectationConfiguration
@@ -24,11 +26,20 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     OperationalError,
 )
 from great_expectations.expectations.metrics import MetaMetricProvider
-from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.import_manager import (
+    F,
+    pyspark_sql_DataFrame,
+    sa,
+)
 from great_expectations.expectations.metrics.metric_provider import (
     MetricProvider,
     metric_partial,
 )
+from great_expectations.expectations.metrics.unexpected_rows_sink import (
+    UnexpectedRowsSink,
+    get_unexpected_rows_sink,
+    iter_chunk_slices,
+)
 from great_expectations.expectations.metrics.util import Engine, Insert, Label, Select
 from great_expectations.expectations.registry import (
     get_metric_provider,
@@ -42,6 +53,9 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 
 logger = logging.getLogger(__name__)
 
+# Number of rows of a boolean mask of unexpected values scanned at a time when only some unexpected values are needed.
+UNEXPECTED_POSITIONS_CHUNK_SIZE = 65536
+
 
 def column_function_partial(
     engine: Type[ExecutionEngine],
@@ -1373,6 +1387,62 @@ def _pandas_map_condition_unexpected_count(
     return np.count_nonzero(metrics["unexpected_condition"][0])
 
 
+def _pandas_unexpected_positions(
+    boolean_mapped_unexpected_values: Union[pd.Series, np.ndarray],
+    domain_records: Union[pd.Series, pd.DataFrame],
+    result_format: dict,
+) -> Optional[np.ndarray]:
+    """Returns the positions (in the domain records) of the unexpected values required by the result format: all of
+    them for the "COMPLETE" result format, and only the first "partial_unexpected_count" ones otherwise, in which case
+    the boolean mask is scanned in chunks, until enough unexpected values are found.
+
+    Returns None if the boolean mask is not aligned with the domain records (the unexpected values must then be looked
+    up by index label).
+    """
+    if len(boolean_mapped_unexpected_values) != len(domain_records):
+        return None
+
+    if isinstance(boolean_mapped_unexpected_values, pd.Series):
+        if not boolean_mapped_unexpected_values.index.equals(domain_records.index):
+            return None
+
+        boolean_mapped_unexpected_values = boolean_mapped_unexpected_values.to_numpy()
+
+    if boolean_mapped_unexpected_values.dtype != bool:
+        boolean_mapped_unexpected_values = boolean_mapped_unexpected_values == True
+
+    if result_format["result_format"] == "COMPLETE":
+        return np.flatnonzero(boolean_mapped_unexpected_values)
+
+    partial_unexpected_count: int = result_format["partial_unexpected_count"]
+
+    unexpected_positions: List[np.ndarray] = []
+    num_unexpected_positions: int = 0
+
+    start: int
+    for start in range(
+        0, len(boolean_mapped_unexpected_values), UNEXPECTED_POSITIONS_CHUNK_SIZE
+    ):
+        if num_unexpected_positions >= partial_unexpected_count:
+            break
+
+        chunk_unexpected_positions: np.ndarray = (
+            np.flatnonzero(
+                boolean_mapped_unexpected_values[
+                    start : start + UNEXPECTED_POSITIONS_CHUNK_SIZE
+                ]
+            )
+            + start
+        )[: partial_unexpected_count - num_unexpected_positions]
+        unexpected_positions.append(chunk_unexpected_positions)
+        num_unexpected_positions += len(chunk_unexpected_positions)
+
+    if not unexpected_positions:
+        return np.array([], dtype=np.intp)
+
+    return np.concatenate(unexpected_positions)
+
+
 def _pandas_column_map_condition_values(
     cls,
     execution_engine: PandasExecutionEngine,
@@ -1418,10 +1488,30 @@ def _pandas_column_map_condition_values(
 
     domain_values = df[column_name]
 
-    domain_values = domain_values[boolean_mapped_unexpected_values == True]
-
     result_format = metric_value_kwargs["result_format"]
 
+    unexpected_positions: Optional[np.ndarray] = _pandas_unexpected_positions(
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        domain_records=domain_values,
+        result_format=result_format,
+    )
+    if unexpected_positions is not None:
+        domain_values = domain_values.iloc[unexpected_positions]
+    else:
+        domain_values = domain_values[boolean_mapped_unexpected_values == True]
+
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format, name="unexpected_list", count_values=True
+    )
+    if sink is not None:
+        return _pandas_write_unexpected_values(
+            sink=sink,
+            unexpected_values=domain_values,
+            partial_unexpected_list=list(
+                domain_values.iloc[: result_format["partial_unexpected_count"]]
+            ),
+        )
+
     if result_format["result_format"] == "COMPLETE":
         return list(domain_values)
     else:
@@ -1473,10 +1563,36 @@ def _pandas_column_pair_map_condition_values(
 
     domain_values = df[column_list]
 
-    domain_values = domain_values[boolean_mapped_unexpected_values == True]
-
     result_format = metric_value_kwargs["result_format"]
 
+    unexpected_positions: Optional[np.ndarray] = _pandas_unexpected_positions(
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        domain_records=domain_values,
+        result_format=result_format,
+    )
+    if unexpected_positions is not None:
+        domain_values = domain_values.iloc[unexpected_positions]
+    else:
+        domain_values = domain_values[boolean_mapped_unexpected_values == True]
+
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format, name="unexpected_list", count_values=True
+    )
+    if sink is not None:
+        partial_domain_values: pd.DataFrame = domain_values.iloc[
+            : result_format["partial_unexpected_count"]
+        ]
+        return _pandas_write_unexpected_values(
+            sink=sink,
+            unexpected_values=domain_values,
+            partial_unexpected_list=list(
+                zip(
+                    partial_domain_values[column_A_name].values,
+                    partial_domain_values[column_B_name].values,
+                )
+            ),
+        )
+
     unexpected_list = [
         value_pair
         for value_pair in zip(
@@ -1571,10 +1687,30 @@ def _pandas_multicolumn_map_condition_values(
 
     domain_values = df[column_list]
 
-    domain_values = domain_values[boolean_mapped_unexpected_values == True]
-
     result_format = metric_value_kwargs["result_format"]
 
+    unexpected_positions: Optional[np.ndarray] = _pandas_unexpected_positions(
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        domain_records=domain_values,
+        result_format=result_format,
+    )
+    if unexpected_positions is not None:
+        domain_values = domain_values.iloc[unexpected_positions]
+    else:
+        domain_values = domain_values[boolean_mapped_unexpected_values == True]
+
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format, name="unexpected_list", count_values=True
+    )
+    if sink is not None:
+        return _pandas_write_unexpected_values(
+            sink=sink,
+            unexpected_values=domain_values,
+            partial_unexpected_list=domain_values.iloc[
+                : result_format["partial_unexpected_count"]
+            ].to_dict("records"),
+        )
+
     if result_format["result_format"] == "COMPLETE":
         return domain_values.to_dict("records")
     else:
@@ -1676,11 +1812,25 @@ def _pandas_column_map_series_and_domain_values(
 
     domain_values = df[column_name]
 
+    result_format = metric_value_kwargs["result_format"]
+
+    if isinstance(map_series, pd.Series) and map_series.index.equals(
+        domain_values.index
+    ):
+        unexpected_positions: Optional[np.ndarray] = _pandas_unexpected_positions(
+            boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+            domain_records=domain_values,
+            result_format=result_format,
+        )
+        if unexpected_positions is not None:
+            return (
+                list(domain_values.iloc[unexpected_positions]),
+                list(map_series.iloc[unexpected_positions]),
+            )
+
     domain_values = domain_values[boolean_mapped_unexpected_values == True]
     map_series = map_series[boolean_mapped_unexpected_values == True]
 
-    result_format = metric_value_kwargs["result_format"]
-
     if result_format["result_format"] == "COMPLETE":
         return (
             list(domain_values),
@@ -1745,14 +1895,82 @@ def _pandas_map_condition_index(
 
     result_format = metric_value_kwargs["result_format"]
 
+    unexpected_positions: Optional[np.ndarray] = _pandas_unexpected_positions(
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        domain_records=df,
+        result_format=result_format,
+    )
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format, name="unexpected_index_list"
+    )
+
+    if unexpected_positions is not None:
+        if sink is not None:
+            return _pandas_write_unexpected_index(
+                sink=sink,
+                unexpected_index=df.index[unexpected_positions],
+                result_format=result_format,
+            )
+
+        return list(df.index[unexpected_positions])
+
     df = df[boolean_mapped_unexpected_values]
 
+    if sink is not None:
+        return _pandas_write_unexpected_index(
+            sink=sink, unexpected_index=df.index, result_format=result_format
+        )
+
     if result_format["result_format"] == "COMPLETE":
         return list(df.index)
 
     return list(df.index[: result_format["partial_unexpected_count"]])
 
 
+def _pandas_write_unexpected_index(
+    sink: UnexpectedRowsSink, unexpected_index: pd.Index, result_format: dict
+) -> Dict[str, Any]:
+    """Writes the index labels of unexpected rows to "sink" and returns the reference to them, along with the first
+    "partial_unexpected_count" labels (for the "partial_unexpected_index_list" of validation results).
+    """
+    index_names: List[str] = [
+        name if name is not None else f"index_{level}" if level else "index"
+        for level, name in enumerate(unexpected_index.names)
+    ]
+
+    chunk: slice
+    for chunk in iter_chunk_slices(len(unexpected_index), sink.chunk_size):
+        chunk_frame: pd.DataFrame = unexpected_index[chunk].to_frame(index=False)
+        chunk_frame.columns = index_names
+        sink.write(chunk_frame)
+
+    reference: Dict[str, Any] = sink.close()
+    reference["partial_unexpected_index_list"] = list(
+        unexpected_index[: result_format["partial_unexpected_count"]]
+    )
+    return reference
+
+
+def _pandas_write_unexpected_values(
+    sink: UnexpectedRowsSink,
+    unexpected_values: Union[pd.Series, pd.DataFrame],
+    partial_unexpected_list: list,
+) -> Dict[str, Any]:
+    """Writes the unexpected values (of the domain columns) to "sink" and returns the reference to them, along with
+    "partial_unexpected_list" (the first unexpected values, for the "partial_unexpected_list" of validation results).
+    """
+    if isinstance(unexpected_values, pd.Series):
+        unexpected_values = unexpected_values.to_frame()
+
+    chunk: slice
+    for chunk in iter_chunk_slices(len(unexpected_values), sink.chunk_size):
+        sink.write(unexpected_values.iloc[chunk])
+
+    reference: Dict[str, Any] = sink.close()
+    reference["partial_unexpected_list"] = partial_unexpected_list
+    return reference
+
+
 def _pandas_column_map_condition_value_counts(
     cls,
     execution_engine: PandasExecutionEngine,
@@ -1874,8 +2092,33 @@ def _pandas_map_condition_rows(
 
     result_format = metric_value_kwargs["result_format"]
 
+    unexpected_positions: Optional[np.ndarray] = _pandas_unexpected_positions(
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        domain_records=df,
+        result_format=result_format,
+    )
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format, index=True
+    )
+
+    if unexpected_positions is not None:
+        if sink is not None:
+            chunk: slice
+            for chunk in iter_chunk_slices(len(unexpected_positions), sink.chunk_size):
+                sink.write(df.iloc[unexpected_positions[chunk]])
+
+            return sink.close()
+
+        return df.iloc[unexpected_positions]
+
     df = df[boolean_mapped_unexpected_values]
 
+    if sink is not None:
+        for chunk in iter_chunk_slices(len(df), sink.chunk_size):
+            sink.write(df.iloc[chunk])
+
+        return sink.close()
+
     if result_format["result_format"] == "COMPLETE":
         return df
 
@@ -2057,6 +2300,24 @@ def _sqlalchemy_column_map_condition_values(
         )
         query = query.limit(10000)  # BigQuery upper bound on query parameters
 
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format, name="unexpected_list", count_values=True
+    )
+    if sink is not None:
+        reference: Dict[str, Any]
+        partial_rows: list
+        reference, partial_rows = _sqlalchemy_write_unexpected_rows(
+            execution_engine=execution_engine,
+            query=query,
+            sink=sink,
+            partial_unexpected_count=result_format["partial_unexpected_count"],
+            columns=[column_name],
+        )
+        reference["partial_unexpected_list"] = [
+            val.unexpected_values for val in partial_rows
+        ]
+        return reference
+
     return [
         val.unexpected_values
         for val in execution_engine.engine.execute(query).fetchall()
@@ -2113,6 +2374,24 @@ def _sqlalchemy_column_pair_map_condition_values(
     if result_format["result_format"] != "COMPLETE":
         query = query.limit(result_format["partial_unexpected_count"])
 
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format, name="unexpected_list", count_values=True
+    )
+    if sink is not None:
+        reference: Dict[str, Any]
+        partial_rows: list
+        reference, partial_rows = _sqlalchemy_write_unexpected_rows(
+            execution_engine=execution_engine,
+            query=query,
+            sink=sink,
+            partial_unexpected_count=result_format["partial_unexpected_count"],
+            columns=column_list,
+        )
+        reference["partial_unexpected_list"] = [
+            (val.unexpected_values_A, val.unexpected_values_B) for val in partial_rows
+        ]
+        return reference
+
     unexpected_list = [
         (val.unexpected_values_A, val.unexpected_values_B)
         for val in execution_engine.engine.execute(query).fetchall()
@@ -2205,6 +2484,21 @@ def _sqlalchemy_multicolumn_map_condition_values(
     if result_format["result_format"] != "COMPLETE":
         query = query.limit(result_format["partial_unexpected_count"])
 
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format, name="unexpected_list", count_values=True
+    )
+    if sink is not None:
+        reference: Dict[str, Any]
+        partial_rows: list
+        reference, partial_rows = _sqlalchemy_write_unexpected_rows(
+            execution_engine=execution_engine,
+            query=query,
+            sink=sink,
+            partial_unexpected_count=result_format["partial_unexpected_count"],
+        )
+        reference["partial_unexpected_list"] = [dict(val) for val in partial_rows]
+        return reference
+
     return [dict(val) for val in execution_engine.engine.execute(query).fetchall()]
 
 
@@ -2290,6 +2584,10 @@ def _sqlalchemy_column_map_condition_value_counts(
     if not MapMetricProvider.is_sqlalchemy_metric_selectable(map_metric_provider=cls):
         query = query.select_from(selectable)
 
+    result_format = metric_value_kwargs["result_format"]
+    if result_format["result_format"] != "COMPLETE":
+        query = query.limit(result_format["partial_unexpected_count"])
+
     return execution_engine.engine.execute(query).fetchall()
 
 
@@ -2327,7 +2625,18 @@ def _sqlalchemy_map_condition_rows(
     result_format = metric_value_kwargs["result_format"]
     if result_format["result_format"] != "COMPLETE":
         query = query.limit(result_format["partial_unexpected_count"])
+
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format
+    )
     try:
+        if sink is not None:
+            reference: Dict[str, Any]
+            reference, _ = _sqlalchemy_write_unexpected_rows(
+                execution_engine=execution_engine, query=query, sink=sink
+            )
+            return reference
+
         return execution_engine.engine.execute(query).fetchall()
     except OperationalError as oe:
         exception_message: str = f"An SQL execution Exception occurred: {str(oe)}."
@@ -2336,6 +2645,38 @@ def _sqlalchemy_map_condition_rows(
         )
 
 
+def _sqlalchemy_write_unexpected_rows(
+    execution_engine: SqlAlchemyExecutionEngine,
+    query: Select,
+    sink: UnexpectedRowsSink,
+    partial_unexpected_count: int = 0,
+    columns: Optional[List[str]] = None,
+) -> Tuple[Dict[str, Any], list]:
+    """Writes the rows returned by "query" to "sink" (with the given column names, if any) and returns the reference to
+    them, along with the first "partial_unexpected_count" rows.
+
+    Rows are fetched (with server side cursors, where dialects support them) and written a chunk at a time.
+    """
+    partial_rows: list = []
+    result = execution_engine.engine.execute(
+        query.execution_options(stream_results=True)
+    )
+    try:
+        if columns is None:
+            columns = list(result.keys())
+
+        while True:
+            rows: list = result.fetchmany(sink.chunk_size)
+            partial_rows.extend(rows[: partial_unexpected_count - len(partial_rows)])
+            sink.write(pd.DataFrame.from_records(rows, columns=columns))
+            if len(rows) < sink.chunk_size:
+                break
+    finally:
+        result.close()
+
+    return sink.close(), partial_rows
+
+
 def _spark_map_condition_unexpected_count_aggregate_fn(
     cls,
     execution_engine: SparkDFExecutionEngine,
@@ -2417,6 +2758,23 @@ def _spark_column_map_condition_values(
     filtered = data.filter(F.col("__unexpected") == True).drop(F.col("__unexpected"))
 
     result_format = metric_value_kwargs["result_format"]
+
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format, name="unexpected_list", count_values=True
+    )
+    if sink is not None:
+        reference: Dict[str, Any]
+        partial_rows: list
+        reference, partial_rows = _spark_write_unexpected_rows(
+            df=filtered.select(F.col(column_name).alias(column_name)),
+            sink=sink,
+            partial_unexpected_count=result_format["partial_unexpected_count"],
+        )
+        reference["partial_unexpected_list"] = [
+            row[column_name] for row in partial_rows
+        ]
+        return reference
+
     if result_format["result_format"] == "COMPLETE":
         rows = filtered.select(
             F.col(column_name).alias(column_name)
@@ -2471,7 +2829,7 @@ def _spark_column_map_condition_value_counts(
     if result_format["result_format"] == "COMPLETE":
         rows = value_counts.collect()
     else:
-        rows = value_counts.collect()[: result_format["partial_unexpected_count"]]
+        rows = value_counts.limit(result_format["partial_unexpected_count"]).collect()
     return rows
 
 
@@ -2501,12 +2859,42 @@ def _spark_map_condition_rows(
 
     result_format = metric_value_kwargs["result_format"]
 
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format
+    )
+    if sink is not None:
+        reference: Dict[str, Any]
+        reference, _ = _spark_write_unexpected_rows(df=filtered, sink=sink)
+        return reference
+
     if result_format["result_format"] == "COMPLETE":
         return filtered.collect()
     else:
         return filtered.limit(result_format["partial_unexpected_count"]).collect()
 
 
+def _spark_write_unexpected_rows(
+    df: pyspark_sql_DataFrame,
+    sink: UnexpectedRowsSink,
+    partial_unexpected_count: int = 0,
+) -> Tuple[Dict[str, Any], list]:
+    """Writes the rows of "df" to "sink" and returns the reference to them, along with the first
+    "partial_unexpected_count" rows.
+
+    Rows are brought to the driver a partition at a time and written a chunk at a time.
+    """
+    partial_rows: list = []
+    rows: Iterator = df.toLocalIterator()
+    while True:
+        chunk_rows: list = list(itertools.islice(rows, sink.chunk_size))
+        partial_rows.extend(chunk_rows[: partial_unexpected_count - len(partial_rows)])
+        sink.write(pd.DataFrame.from_records(chunk_rows, columns=df.columns))
+        if len(chunk_rows) < sink.chunk_size:
+            break
+
+    return sink.close(), partial_rows
+
+
 def _spark_column_pair_map_condition_values(
     cls,
     execution_engine: SparkDFExecutionEngine,
@@ -2548,6 +2936,28 @@ def _spark_column_pair_map_condition_values(
     filtered = data.filter(F.col("__unexpected") == True).drop(F.col("__unexpected"))
 
     result_format = metric_value_kwargs["result_format"]
+
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format, name="unexpected_list", count_values=True
+    )
+    if sink is not None:
+        reference: Dict[str, Any]
+        partial_rows: list
+        reference, partial_rows = _spark_write_unexpected_rows(
+            df=filtered.select(
+                [
+                    F.col(column_A_name).alias(column_A_name),
+                    F.col(column_B_name).alias(column_B_name),
+                ]
+            ),
+            sink=sink,
+            partial_unexpected_count=result_format["partial_unexpected_count"],
+        )
+        reference["partial_unexpected_list"] = [
+            (row[column_A_name], row[column_B_name]) for row in partial_rows
+        ]
+        return reference
+
     if result_format["result_format"] == "COMPLETE":
         rows = filtered.select(
             [
@@ -2655,6 +3065,24 @@ def _spark_multicolumn_map_condition_values(
     domain_values = filtered.select(column_selector)
 
     result_format = metric_value_kwargs["result_format"]
+
+    sink: Optional[UnexpectedRowsSink] = get_unexpected_rows_sink(
+        result_format=result_format, name="unexpected_list", count_values=True
+    )
+    if sink is not None:
+        reference: Dict[str, Any]
+        partial_rows: list
+        reference, partial_rows = _spark_write_unexpected_rows(
+            df=domain_values,
+            sink=sink,
+            partial_unexpected_count=result_format["partial_unexpected_count"],
+        )
+        reference["partial_unexpected_list"] = [
+            {column_name: row[column_name] for column_name in column_list}
+            for row in partial_rows
+        ]
+        return reference
+
     if result_format["result_format"] == "COMPLETE":
         domain_values = (
             domain_values.select(column_selector).toPandas().to_dict("records")
@@ -0,0 +1,248 @@
+"""
+Writes the unexpected rows (and unexpected lists and unexpected index lists) of map metrics incrementally, a chunk at a
+time, to local CSV or Parquet files, so that "COMPLETE" results need not hold every failing row in memory.  The
+validation result then keeps only a reference to each file, with the number of rows written (and, for unexpected lists,
+the first unexpected values and the counts of the most common ones, counted as they are written, for the
+"partial_unexpected_list" and "partial_unexpected_counts" of the result).
+
+Sinks are configured with the "unexpected_rows_sink" key of the "COMPLETE" result format:
+
+    result_format = {
+        "result_format": "COMPLETE",
+        "unexpected_rows_sink": {
+            "directory": "/path/to/directory",
+            "file_format": "csv",  # or "parquet" (requires pyarrow)
+            "chunk_size": 10000,
+        },
+    }
+
+WARNING: This module is experimental.
+"""
+
+import logging
+import os
+import uuid
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+import great_expectations.exceptions as ge_exceptions
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+    logger.debug(
+        "Unable to load pyarrow; only CSV unexpected rows sinks are available."
+    )
+
+UNEXPECTED_ROWS_SINK_FILE_FORMATS = ("csv", "parquet")
+
+# Number of unexpected rows written to a file at a time.
+DEFAULT_UNEXPECTED_ROWS_SINK_CHUNK_SIZE = 10000
+
+
+class UnexpectedRowsSink:
+    """Appends chunks (DataFrames) of unexpected rows to a new file of the given directory."""
+
+    def __init__(
+        self,
+        directory: str,
+        file_format: str = "csv",
+        chunk_size: int = DEFAULT_UNEXPECTED_ROWS_SINK_CHUNK_SIZE,
+        name: str = "unexpected_rows",
+        index: bool = False,
+        partial_unexpected_count: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            directory: the directory of the file (created if it does not exist)
+            file_format: "csv" or "parquet"
+            chunk_size: the number of rows to write at a time
+            name: the prefix of the (uniquely suffixed) name of the file
+            index: whether to write the index of the DataFrames written
+            partial_unexpected_count: if set, the rows written (unexpected values) are counted, and the reference to
+                the file holds the "partial_unexpected_counts" of the most common ones
+        """
+        if file_format not in UNEXPECTED_ROWS_SINK_FILE_FORMATS:
+            raise ge_exceptions.MetricComputationError(
+                f"""Unknown unexpected rows sink file format "{file_format}" (supported file formats are \
+{", ".join(UNEXPECTED_ROWS_SINK_FILE_FORMATS)}).
+"""
+            )
+
+        if file_format == "parquet" and pyarrow is None:
+            raise ge_exceptions.MetricComputationError(
+                'Writing unexpected rows to Parquet files requires pyarrow; please "pip install pyarrow".'
+            )
+
+        if chunk_size < 1:
+            raise ge_exceptions.MetricComputationError(
+                f"The chunk size of unexpected rows sinks must be positive (got {chunk_size})."
+            )
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._file_format = file_format
+        self._chunk_size = chunk_size
+        self._index = index
+        self._path = os.path.join(directory, f"{name}_{uuid.uuid4().hex}.{file_format}")
+        self._count = 0
+        self._is_open = False
+        self._parquet_writer = None
+        self._partial_unexpected_count = partial_unexpected_count
+        self._value_counts: Optional[Counter] = (
+            None if partial_unexpected_count is None else Counter()
+        )
+        self._is_value_countable = True
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Appends the rows of "df" (and, on the first write, its header, even if "df" has no rows) to the file."""
+        if self._is_open and len(df) == 0:
+            return
+
+        if self._file_format == "csv":
+            df.to_csv(
+                self._path,
+                mode="a" if self._is_open else "w",
+                header=not self._is_open,
+                index=self._index,
+            )
+        else:
+            table = pyarrow.Table.from_pandas(df, preserve_index=self._index)
+            if not self._is_open:
+                self._parquet_writer = pyarrow.parquet.ParquetWriter(
+                    self._path, _get_parquet_file_schema(table.schema)
+                )
+
+            self._parquet_writer.write_table(table.cast(self._parquet_writer.schema))
+
+        self._is_open = True
+        self._count += len(df)
+        self._count_values(df=df)
+
+    def _count_values(self, df: pd.DataFrame) -> None:
+        # Values of single columns are counted as such, and values of several columns as tuples (as they are by
+        # "_format_map_output()").
+        if self._value_counts is None or not self._is_value_countable:
+            return
+
+        rows: Iterator[tuple] = df.itertuples(index=False, name=None)
+        try:
+            if len(df.columns) == 1:
+                self._value_counts.update(row[0] for row in rows)
+            else:
+                self._value_counts.update(rows)
+        except TypeError:
+            self._is_value_countable = False
+
+    def close(self) -> Dict[str, Any]:
+        """Closes the file and returns the reference to it kept by validation results."""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+        reference: Dict[str, Any] = {
+            "path": self._path,
+            "file_format": self._file_format,
+            "count": self._count,
+        }
+        if self._value_counts is not None:
+            reference[
+                "partial_unexpected_counts"
+            ] = self._get_partial_unexpected_counts()
+
+        return reference
+
+    def _get_partial_unexpected_counts(self) -> List[Dict[str, Any]]:
+        # The most common values first (sorted as by "_format_map_output()").
+        error: List[Dict[str, Any]] = [
+            {"error": "partial_exception_counts requires a hashable type"}
+        ]
+        if not self._is_value_countable:
+            return error
+
+        try:
+            return [
+                {"value": key, "count": value}
+                for key, value in sorted(
+                    self._value_counts.most_common(self._partial_unexpected_count),
+                    key=lambda x: (-x[1], x[0]),
+                )
+            ]
+        except TypeError:
+            return error
+
+
+def _get_parquet_file_schema(schema: "pyarrow.Schema") -> "pyarrow.Schema":
+    """Returns the schema of a Parquet file whose first chunk has the given schema.
+
+    Columns of the first chunk holding only nulls (or no rows) have no type, so they are stored as strings, to which
+    the values of later chunks can be cast.
+    """
+    field: "pyarrow.Field"
+    return pyarrow.schema(
+        [
+            field.with_type(pyarrow.string())
+            if pyarrow.types.is_null(field.type)
+            else field
+            for field in schema
+        ],
+        metadata=schema.metadata,
+    )
+
+
+def get_unexpected_rows_sink(
+    result_format: dict,
+    name: str = "unexpected_rows",
+    index: bool = False,
+    count_values: bool = False,
+) -> Optional[UnexpectedRowsSink]:
+    """Returns the sink configured by the "COMPLETE" result format, or None if unexpected rows are to be returned.
+
+    If "count_values" is True, the sink counts the values written, for the "partial_unexpected_counts" of results.
+    """
+    if result_format.get("result_format") != "COMPLETE":
+        return None
+
+    sink_config: Optional[dict] = result_format.get("unexpected_rows_sink")
+    if not sink_config:
+        return None
+
+    if isinstance(sink_config, str):
+        sink_config = {"directory": sink_config}
+
+    return UnexpectedRowsSink(
+        directory=sink_config["directory"],
+        file_format=sink_config.get("file_format", "csv"),
+        chunk_size=sink_config.get(
+            "chunk_size", DEFAULT_UNEXPECTED_ROWS_SINK_CHUNK_SIZE
+        ),
+        name=name,
+        index=index,
+        partial_unexpected_count=result_format["partial_unexpected_count"]
+        if count_values
+        else None,
+    )
+
+
+def iter_chunk_slices(length: int, chunk_size: int) -> Iterator[slice]:
+    """Yields the slices of consecutive chunks of "length" items (a single, empty slice if "length" is zero)."""
+    if length == 0:
+        yield slice(0, 0)
+
+    start: int
+    for start in range(0, length, chunk_size):
+        yield slice(start, start + chunk_size)
@@ -6,6 +6,9 @@ import numpy as np
 from dateutil.parser import parse
 from packaging import version
 
+from great_expectations.core.sqlalchemy_metadata_cache import (
+    sqlalchemy_metadata_cache,
+)
 from great_expectations.execution_engine.util import check_sql_engine_dialect
 from great_expectations.util import get_sqlalchemy_inspector
 
@@ -328,46 +331,67 @@ def get_sqlalchemy_column_metadata(
     engine: Engine, table_selectable: Select, schema_name: Optional[str] = None
 ) -> Optional[List[Dict[str, Any]]]:
     try:
-        columns: List[Dict[str, Any]]
-
-        inspector: reflection.Inspector = get_sqlalchemy_inspector(engine)
-        try:
-            # if a custom query was passed
-            if isinstance(table_selectable, TextClause):
-                columns = table_selectable.selected_columns.columns
-            else:
-                columns = inspector.get_columns(
-                    table_selectable,
-                    schema=schema_name,
-                )
-        except (
-            KeyError,
-            AttributeError,
-            sa.exc.NoSuchTableError,
-            sa.exc.ProgrammingError,
-        ):
-            # we will get a KeyError for temporary tables, since
-            # reflection will not find the temporary schema
-            columns = column_reflection_fallback(
-                selectable=table_selectable,
-                dialect=engine.dialect,
-                sqlalchemy_engine=engine,
-            )
-
-        # Use fallback because for mssql and trino reflection mechanisms do not throw an error but return an empty list
-        if len(columns) == 0:
-            columns = column_reflection_fallback(
-                selectable=table_selectable,
-                dialect=engine.dialect,
-                sqlalchemy_engine=engine,
+        # Columns of tables are cached (by database, schema and table name) for all batches and validators.
+        if isinstance(table_selectable, str):
+            return sqlalchemy_metadata_cache.get_columns(
+                engine=engine,
+                table_name=table_selectable,
+                schema_name=schema_name,
+                loader=lambda: _reflect_sqlalchemy_column_metadata(
+                    engine=engine,
+                    table_selectable=table_selectable,
+                    schema_name=schema_name,
+                ),
             )
 
-        return columns
+        return _reflect_sqlalchemy_column_metadata(
+            engine=engine, table_selectable=table_selectable, schema_name=schema_name
+        )
     except AttributeError as e:
         logger.debug(f"Error while introspecting columns: {str(e)}")
         return None
 
 
+def _reflect_sqlalchemy_column_metadata(
+    engine: Engine, table_selectable: Select, schema_name: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    columns: List[Dict[str, Any]]
+
+    inspector: reflection.Inspector = get_sqlalchemy_inspector(engine)
+    try:
+        # if a custom query was passed
+        if isinstance(table_selectable, TextClause):
+            columns = table_selectable.selected_columns.columns
+        else:
+            columns = inspector.get_columns(
+                table_selectable,
+                schema=schema_name,
+            )
+    except (
+        KeyError,
+        AttributeError,
+        sa.exc.NoSuchTableError,
+        sa.exc.ProgrammingError,
+    ):
+        # we will get a KeyError for temporary tables, since
+        # reflection will not find the temporary schema
+        columns = column_reflection_fallback(
+            selectable=table_selectable,
+            dialect=engine.dialect,
+            sqlalchemy_engine=engine,
+        )
+
+    # Use fallback because for mssql and trino reflection mechanisms do not throw an error but return an empty list
+    if len(columns) == 0:
+        columns = column_reflection_fallback(
+            selectable=table_selectable,
+            dialect=engine.dialect,
+            sqlalchemy_engine=engine,
+        )
+
+    return columns
+
+
 def column_reflection_fallback(
     selectable: Select, dialect: Dialect, sqlalchemy_engine: Engine
 ) -> List[Dict[str, str]]:
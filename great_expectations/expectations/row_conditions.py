@@ -1,5 +1,7 @@
 import enum
+import functools
 from dataclasses import dataclass
+from typing import Tuple
 
 from pyparsing import (
     CaselessLiteral,
@@ -106,16 +108,24 @@ class RowCondition(SerializableDictDot):
         return convert_to_json_serializable(data=self.to_dict())
 
 
-def _parse_great_expectations_condition(row_condition: str):
+def _parse_great_expectations_condition(row_condition: str) -> dict:
+    return dict(_parse_great_expectations_condition_cached(row_condition))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_great_expectations_condition_cached(row_condition: str) -> dict:
+    # The grammar is only run once per distinct condition; callers get a copy of the cached result.
     try:
-        return condition.parseString(row_condition)
+        return condition.parseString(row_condition).asDict()
     except ParseException:
         raise ConditionParserError(f"unable to parse condition: {row_condition}")
 
 
 # noinspection PyUnresolvedReferences
 def parse_condition_to_spark(row_condition: str) -> "pyspark.sql.Column":
-    parsed = _parse_great_expectations_condition(row_condition)
+    # Spark Columns are bound to the active SparkContext, so only the parsed condition is cached here; the
+    # SparkDFExecutionEngine caches the resulting predicates for as long as it is in use.
+    parsed = _parse_great_expectations_condition_cached(row_condition)
     column = parsed["column"]
     if "condition_value" in parsed:
         if parsed["op"] == "==":
@@ -146,10 +156,12 @@ def parse_condition_to_spark(row_condition: str) -> "pyspark.sql.Column":
         raise ConditionParserError(f"unrecognized column condition: {row_condition}")
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_condition_to_sqlalchemy(
     row_condition: str,
 ) -> "sqlalchemy.sql.expression.ColumnElement":
-    parsed = _parse_great_expectations_condition(row_condition)
+    # SQLAlchemy clauses are immutable, so the compiled predicate is cached and shared by all queries using it.
+    parsed = _parse_great_expectations_condition_cached(row_condition)
     column = parsed["column"]
     if "condition_value" in parsed:
         if parsed["op"] == "==":
@@ -178,3 +190,19 @@ def parse_condition_to_sqlalchemy(
         return sa.not_(sa.column(column).is_(None))
     else:
         raise ConditionParserError(f"unrecognized column condition: {row_condition}")
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_conditions_to_sqlalchemy(
+    row_conditions: Tuple[str, ...],
+) -> "sqlalchemy.sql.expression.ColumnElement":
+    """Combine several great_expectations conditions, using AND, into a single (cached) SQLAlchemy predicate."""
+    if len(row_conditions) == 1:
+        return parse_condition_to_sqlalchemy(row_conditions[0])
+
+    return sa.and_(
+        *[
+            parse_condition_to_sqlalchemy(row_condition)
+            for row_condition in row_conditions
+        ]
+    )
@@ -5,6 +5,7 @@ from typing import Set
 
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.render.types import RenderedStringTemplateContent
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +79,36 @@ def add_values_with_json_schema_from_list_in_params(
     return params_with_json_schema
 
 
+def replace_value_counts_with_distinct_values_set_membership(
+    dependencies: dict, success_kwargs: dict
+) -> dict:
+    """
+    Utility function used in get_validation_dependencies() of the expect_column_distinct_values_to_* expectations.
+    If only the verdict is needed ("BOOLEAN_ONLY" result format), the distinct values are compared with the value set by
+    the execution engine (the "column.distinct_values.set_membership" metric), instead of fetching all of them (and
+    their counts) with "column.value_counts".  No unexpected values are requested, so that a single query is issued.
+    """
+    if dependencies["result_format"][
+        "result_format"
+    ] != "BOOLEAN_ONLY" or success_kwargs.get("parse_strings_as_datetimes"):
+        return dependencies
+
+    value_counts_metric: MetricConfiguration = dependencies["metrics"].pop(
+        "column.value_counts"
+    )
+    dependencies["metrics"][
+        "column.distinct_values.set_membership"
+    ] = MetricConfiguration(
+        metric_name="column.distinct_values.set_membership",
+        metric_domain_kwargs=value_counts_metric.metric_domain_kwargs,
+        metric_value_kwargs={
+            "value_set": success_kwargs.get("value_set") or [],
+            "partial_unexpected_count": 0,
+        },
+    )
+    return dependencies
+
+
 class ValidSqlTokens(Enum):
     SELECT = "SELECT"
     ASTERISK = "*"
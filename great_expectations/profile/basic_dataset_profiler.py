@@ -30,6 +30,22 @@ class BasicDatasetProfilerBase(DatasetProfiler):
     BOOLEAN_TYPE_NAMES = ProfilerTypeMapping.BOOLEAN_TYPE_NAMES
     DATETIME_TYPE_NAMES = ProfilerTypeMapping.DATETIME_TYPE_NAMES
 
+    @classmethod
+    def _defer_column_aggregates(cls, df, columns) -> None:
+        # Datasets that can batch aggregate queries (e.g. SqlAlchemyDataset) compute these together when first needed.
+        if hasattr(df, "defer_column_aggregates"):
+            df.defer_column_aggregates(
+                aggregates=[
+                    "nonnull_count",
+                    "unique_count",
+                    "min",
+                    "max",
+                    "mean",
+                    "stdev",
+                ],
+                columns=columns,
+            )
+
     @classmethod
     def _get_column_type(cls, df, column):
 
@@ -134,6 +150,7 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
         df.set_config_value("interactive_evaluation", False)
 
         columns = df.get_table_columns()
+        cls._defer_column_aggregates(df, columns)
 
         meta_columns = {}
         for column in columns:
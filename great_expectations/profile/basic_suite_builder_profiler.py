@@ -601,6 +601,7 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
             included_expectations=included_expectations,
         )
 
+        cls._defer_column_aggregates(dataset, selected_columns)
         column_cache = {}
         if selected_columns:
             with tqdm(
@@ -697,6 +698,7 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
         dataset = cls._build_table_column_expectations(dataset)
 
         columns = dataset.get_table_columns()
+        cls._defer_column_aggregates(dataset, columns)
 
         column_cache = {}
         profiled_columns = {"numeric": [], "low_card": [], "string": [], "datetime": []}
@@ -1,6 +1,7 @@
 import logging
 import math
-from typing import Callable, Dict, List, Optional, Union, cast
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, List, Optional, Union, cast
 
 from dateutil.parser import parse
 from tqdm.auto import tqdm
@@ -190,11 +191,16 @@ class UserConfigurableProfiler:
             if column_name not in self.ignored_columns
         ]
 
-        for column_name in included_columns:
-            self._add_column_cardinality_to_column_info(
-                self.profile_dataset, column_name
+        with self._prefetch_metrics(
+            expectation_configurations=self._build_column_info_expectation_configurations(
+                columns=included_columns
             )
-            self._add_column_type_to_column_info(self.profile_dataset, column_name)
+        ):
+            for column_name in included_columns:
+                self._add_column_cardinality_to_column_info(
+                    self.profile_dataset, column_name
+                )
+                self._add_column_type_to_column_info(self.profile_dataset, column_name)
 
         if self.semantic_types_dict is not None:
             self._validate_semantic_types_dict()
@@ -209,6 +215,13 @@ class UserConfigurableProfiler:
             "VALUE_SET": self._build_expectations_value_set,
             "BOOLEAN": self._build_expectations_value_set,
         }
+        self.semantic_type_expectation_configuration_functions = {
+            "DATETIME": self._build_datetime_expectation_configurations,
+            "NUMERIC": self._build_numeric_expectation_configurations,
+            "STRING": self._build_string_expectation_configurations,
+            "VALUE_SET": self._build_value_set_expectation_configurations,
+            "BOOLEAN": self._build_value_set_expectation_configurations,
+        }
 
     def build_suite(self) -> ExpectationSuite:
         """
@@ -230,10 +243,15 @@ class UserConfigurableProfiler:
                 expectation_suite_name=suite_name, data_context=None
             )
 
-        if self.semantic_types_dict:
-            expectation_suite = self._build_expectation_suite_from_semantic_types_dict()
-        else:
-            expectation_suite = self._profile_and_build_expectation_suite()
+        with self._prefetch_metrics(
+            expectation_configurations=self._build_suite_expectation_configurations()
+        ):
+            if self.semantic_types_dict:
+                expectation_suite = (
+                    self._build_expectation_suite_from_semantic_types_dict()
+                )
+            else:
+                expectation_suite = self._profile_and_build_expectation_suite()
 
         self._send_usage_stats_message()
 
@@ -283,6 +301,372 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
             success=True,
         )
 
+    def _prefetch_metrics(
+        self, expectation_configurations: List[ExpectationConfiguration]
+    ) -> ContextManager:
+        """
+        Computes, all at once, the metrics needed by the given expectations, which lets the execution engine bundle
+        their computation (rather than computing them expectation by expectation, as the profiler calls expectations).
+        Only applies to Validator objects.
+        Args:
+            expectation_configurations: The expectations (e.g. with no bounds) that the profiler is about to call
+
+        Returns:
+            A context within which the expectations of the Validator use the prefetched metrics
+        """
+        if (
+            not isinstance(self.profile_dataset, Validator)
+            or not self.profile_dataset.interactive_evaluation
+            or not expectation_configurations
+        ):
+            return nullcontext()
+
+        metrics: dict = self.profile_dataset.compute_expectation_metrics(
+            configurations=expectation_configurations
+        )
+        return self.profile_dataset.precomputed_metrics(metrics=metrics)
+
+    @staticmethod
+    def _build_column_info_expectation_configurations(
+        columns: List[str],
+    ) -> List[ExpectationConfiguration]:
+        """
+        Builds the expectations used to determine the cardinality and the type of columns (see `_get_column_type` and
+        `_get_column_cardinality`)
+        Args:
+            columns: The columns to be profiled
+
+        Returns:
+            A list of expectation configurations
+        """
+        expectation_configurations: List[ExpectationConfiguration] = []
+        for column in columns:
+            expectation_configurations.extend(
+                UserConfigurableProfiler._build_column_cardinality_expectation_configurations(
+                    column=column
+                )
+            )
+            expectation_configurations.extend(
+                UserConfigurableProfiler._build_column_type_expectation_configurations(
+                    column=column
+                ).values()
+            )
+
+        return expectation_configurations
+
+    @staticmethod
+    def _build_column_cardinality_expectation_configurations(
+        column: str,
+    ) -> List[ExpectationConfiguration]:
+        """
+        Builds the expectations that `_get_column_cardinality` calls for a given column
+        Args:
+            column: The column for which to build the expectations
+
+        Returns:
+            A list of expectation configurations (of the unique value count and of the proportion of unique values)
+        """
+        return [
+            ExpectationConfiguration(
+                expectation_type=expectation_type,
+                kwargs={"column": column, "min_value": None, "max_value": None},
+            )
+            for expectation_type in (
+                "expect_column_unique_value_count_to_be_between",
+                "expect_column_proportion_of_unique_values_to_be_between",
+            )
+        ]
+
+    @staticmethod
+    def _build_column_type_expectation_configurations(
+        column: str,
+    ) -> Dict[str, ExpectationConfiguration]:
+        """
+        Builds the expectations that `_get_column_type` calls for a given column
+        Args:
+            column: The column for which to build the expectations
+
+        Returns:
+            A dictionary of expectation configurations, by the data type that they test for
+        """
+        return {
+            type_: ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_type_list",
+                kwargs={"column": column, "type_list": sorted(list(type_names))},
+            )
+            for type_, type_names in (
+                ("INT", ProfilerTypeMapping.INT_TYPE_NAMES),
+                ("FLOAT", ProfilerTypeMapping.FLOAT_TYPE_NAMES),
+                ("STRING", ProfilerTypeMapping.STRING_TYPE_NAMES),
+                ("BOOLEAN", ProfilerTypeMapping.BOOLEAN_TYPE_NAMES),
+                ("DATETIME", ProfilerTypeMapping.DATETIME_TYPE_NAMES),
+            )
+        }
+
+    def _build_suite_expectation_configurations(self) -> List[ExpectationConfiguration]:
+        """
+        Builds the (exploratory) expectations that `build_suite` will call to determine the observed values of the
+        table and of each column, according to the column_info on self.  These are the expectations that the
+        `_build_expectations_*` methods call, for the semantic types that they are called for.
+        Args:
+
+        Returns:
+            A list of expectation configurations
+        """
+        expectation_configurations: List[
+            ExpectationConfiguration
+        ] = self._build_table_expectation_configurations()
+
+        for column_name, column_info in self.column_info.items():
+            for semantic_type in self._get_semantic_types(column_info=column_info):
+                semantic_type_configuration_fn = (
+                    self.semantic_type_expectation_configuration_functions.get(
+                        semantic_type
+                    )
+                )
+                if semantic_type_configuration_fn is not None:
+                    expectation_configurations.extend(
+                        semantic_type_configuration_fn(column=column_name)
+                    )
+
+            expectation_configurations.extend(
+                self._build_all_column_types_expectation_configurations(
+                    column=column_name
+                )
+            )
+
+        return expectation_configurations
+
+    def _get_semantic_types(self, column_info: dict) -> List[str]:
+        """
+        Determines the semantic types of a column, for which expectations are built: those of the semantic_types dict
+        if there is one, or else those inferred from the type and the cardinality of the column
+        Args:
+            column_info: The column_info entry of the column
+
+        Returns:
+            A list of semantic types
+        """
+        if self.semantic_types_dict:
+            return column_info.get("semantic_types") or []
+
+        semantic_types: List[str] = []
+        if column_info.get("type") in ("FLOAT", "INT", "NUMERIC"):
+            semantic_types.append("NUMERIC")
+
+        if column_info.get("type") == "DATETIME":
+            semantic_types.append("DATETIME")
+
+        if (
+            OrderedProfilerCardinality[self.value_set_threshold]
+            >= OrderedProfilerCardinality[column_info.get("cardinality")]
+        ):
+            semantic_types.append("VALUE_SET")
+
+        return semantic_types
+
+    @staticmethod
+    def _validate_expectation_configuration(
+        profile_dataset, expectation_configuration: ExpectationConfiguration
+    ):
+        """
+        Calls the expectation of a given expectation configuration on a dataset
+        Args:
+            profile_dataset: A GE Dataset
+            expectation_configuration: The expectation configuration to call
+
+        Returns:
+            The validation result of the expectation
+        """
+        return getattr(profile_dataset, expectation_configuration.expectation_type)(
+            **expectation_configuration.kwargs
+        )
+
+    def _build_table_expectation_configurations(
+        self,
+    ) -> List[ExpectationConfiguration]:
+        """
+        Builds the (exploratory) expectations that `_build_expectations_table` will call
+        Args:
+
+        Returns:
+            A list of expectation configurations
+        """
+        if "expect_table_row_count_to_be_between" in self.excluded_expectations:
+            return []
+
+        return [
+            ExpectationConfiguration(
+                expectation_type="expect_table_row_count_to_be_between",
+                kwargs={"min_value": 0, "max_value": None},
+            )
+        ]
+
+    def _build_numeric_expectation_configurations(
+        self, column: str
+    ) -> List[ExpectationConfiguration]:
+        """
+        Builds the (exploratory) expectations that `_build_expectations_numeric` will call for a given column
+        Args:
+            column: The column for which to build the expectations
+
+        Returns:
+            A list of expectation configurations
+        """
+        expectation_configurations: List[ExpectationConfiguration] = [
+            ExpectationConfiguration(
+                expectation_type=expectation_type,
+                kwargs={
+                    "column": column,
+                    "min_value": None,
+                    "max_value": None,
+                    "result_format": "SUMMARY",
+                },
+            )
+            for expectation_type in (
+                "expect_column_min_to_be_between",
+                "expect_column_max_to_be_between",
+                "expect_column_mean_to_be_between",
+                "expect_column_median_to_be_between",
+            )
+            if expectation_type not in self.excluded_expectations
+        ]
+
+        if (
+            "expect_column_quantile_values_to_be_between"
+            not in self.excluded_expectations
+        ):
+            expectation_configurations.append(
+                ExpectationConfiguration(
+                    expectation_type="expect_column_quantile_values_to_be_between",
+                    kwargs={
+                        "column": column,
+                        "quantile_ranges": {
+                            "quantiles": [0.05, 0.25, 0.5, 0.75, 0.95],
+                            "value_ranges": [
+                                [None, None],
+                                [None, None],
+                                [None, None],
+                                [None, None],
+                                [None, None],
+                            ],
+                        },
+                        "allow_relative_error": self._get_allow_relative_error(
+                            profile_dataset=self.profile_dataset
+                        ),
+                        "result_format": "SUMMARY",
+                    },
+                )
+            )
+
+        return expectation_configurations
+
+    def _build_datetime_expectation_configurations(
+        self, column: str
+    ) -> List[ExpectationConfiguration]:
+        """
+        Builds the (exploratory) expectations that `_build_expectations_datetime` will call for a given column
+        Args:
+            column: The column for which to build the expectations
+
+        Returns:
+            A list of expectation configurations
+        """
+        if "expect_column_values_to_be_between" in self.excluded_expectations:
+            return []
+
+        return [
+            ExpectationConfiguration(
+                expectation_type=expectation_type,
+                kwargs={
+                    "column": column,
+                    "min_value": None,
+                    "max_value": None,
+                    "result_format": "SUMMARY",
+                    "parse_strings_as_datetimes": False,
+                },
+            )
+            for expectation_type in (
+                "expect_column_min_to_be_between",
+                "expect_column_max_to_be_between",
+            )
+        ]
+
+    # noinspection PyUnusedLocal
+    @staticmethod
+    def _build_string_expectation_configurations(
+        column: str,
+    ) -> List[ExpectationConfiguration]:
+        """
+        Builds the (exploratory) expectations that `_build_expectations_string` will call for a given column (none)
+        Args:
+            column: The column for which to build the expectations
+
+        Returns:
+            A list of expectation configurations
+        """
+        return []
+
+    def _build_value_set_expectation_configurations(
+        self, column: str
+    ) -> List[ExpectationConfiguration]:
+        """
+        Builds the (exploratory) expectations that `_build_expectations_value_set` will call for a given column
+        Args:
+            column: The column for which to build the expectations
+
+        Returns:
+            A list of expectation configurations
+        """
+        if "expect_column_values_to_be_in_set" in self.excluded_expectations:
+            return []
+
+        return [
+            ExpectationConfiguration(
+                expectation_type="expect_column_distinct_values_to_be_in_set",
+                kwargs={
+                    "column": column,
+                    "value_set": None,
+                    "result_format": "SUMMARY",
+                },
+            )
+        ]
+
+    def _build_all_column_types_expectation_configurations(
+        self, column: str
+    ) -> List[ExpectationConfiguration]:
+        """
+        Builds the (exploratory) expectations that `_build_expectations_for_all_column_types` will call for a given
+        column
+        Args:
+            column: The column for which to build the expectations
+
+        Returns:
+            A list of expectation configurations
+        """
+        expectation_configurations: List[ExpectationConfiguration] = []
+
+        if "expect_column_values_to_not_be_null" not in self.excluded_expectations:
+            expectation_configurations.append(
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_not_be_null",
+                    kwargs={"column": column},
+                )
+            )
+
+        if (
+            "expect_column_proportion_of_unique_values_to_be_between"
+            not in self.excluded_expectations
+        ):
+            expectation_configurations.append(
+                ExpectationConfiguration(
+                    expectation_type="expect_column_proportion_of_unique_values_to_be_between",
+                    kwargs={"column": column, "min_value": None, "max_value": None},
+                )
+            )
+
+        return expectation_configurations
+
     def _build_expectation_suite_from_semantic_types_dict(self):
         """
         Uses a semantic_type dict to determine which expectations to add to the suite, then builds the suite
@@ -319,20 +703,8 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
         ) as pbar:
             for column_name, column_info in self.column_info.items():
                 pbar.set_postfix_str(f"Column={column_name}")
-                semantic_types = column_info.get("semantic_types")
-                for semantic_type in semantic_types:
-                    semantic_type_fn = self.semantic_type_functions.get(semantic_type)
-                    if semantic_type_fn is None or not isinstance(
-                        semantic_type_fn, Callable
-                    ):
-                        raise ValueError(
-                            f'Callable function for semantic type "{semantic_type}" could not be found.'
-                        )
-                    semantic_type_fn(
-                        profile_dataset=self.profile_dataset, column=column_name
-                    )
-                self._build_expectations_for_all_column_types(
-                    self.profile_dataset, column_name
+                self._build_expectations_for_column(
+                    column_name=column_name, column_info=column_info
                 )
                 pbar.update()
 
@@ -368,31 +740,8 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
         ) as pbar:
             for column_name, column_info in self.column_info.items():
                 pbar.set_postfix_str(f"Column={column_name}")
-                data_type = column_info.get("type")
-                cardinality = column_info.get("cardinality")
-
-                if data_type in ("FLOAT", "INT", "NUMERIC"):
-                    self._build_expectations_numeric(
-                        profile_dataset=self.profile_dataset,
-                        column=column_name,
-                    )
-
-                if data_type == "DATETIME":
-                    self._build_expectations_datetime(
-                        profile_dataset=self.profile_dataset,
-                        column=column_name,
-                    )
-
-                if (
-                    OrderedProfilerCardinality[self.value_set_threshold]
-                    >= OrderedProfilerCardinality[cardinality]
-                ):
-                    self._build_expectations_value_set(
-                        profile_dataset=self.profile_dataset, column=column_name
-                    )
-
-                self._build_expectations_for_all_column_types(
-                    profile_dataset=self.profile_dataset, column=column_name
+                self._build_expectations_for_column(
+                    column_name=column_name, column_info=column_info
                 )
                 pbar.update()
 
@@ -406,6 +755,31 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
 
         return expectation_suite
 
+    def _build_expectations_for_column(self, column_name: str, column_info: dict):
+        """
+        Adds the expectations of each semantic type of a column (see `_get_semantic_types`), and those for all column
+        types
+        Args:
+            column_name: The column for which to add expectations
+            column_info: The column_info entry of the column
+
+        Returns:
+            The GE Dataset
+        """
+        for semantic_type in self._get_semantic_types(column_info=column_info):
+            semantic_type_fn = self.semantic_type_functions.get(semantic_type)
+            if semantic_type_fn is None or not isinstance(semantic_type_fn, Callable):
+                raise ValueError(
+                    f'Callable function for semantic type "{semantic_type}" could not be found.'
+                )
+            semantic_type_fn(profile_dataset=self.profile_dataset, column=column_name)
+
+        self._build_expectations_for_all_column_types(
+            profile_dataset=self.profile_dataset, column=column_name
+        )
+
+        return self.profile_dataset
+
     def _validate_semantic_types_dict(self):
         """
         Validates a semantic_types dict to ensure correct formatting, that all semantic_types are recognized, and that
@@ -516,45 +890,36 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
             The data type of the specified column
         """
         # list of types is used to support pandas and sqlalchemy
-        try:
-
-            if (
-                profile_dataset.expect_column_values_to_be_in_type_list(
-                    column, type_list=sorted(list(ProfilerTypeMapping.INT_TYPE_NAMES))
-                ).success
-                and profile_dataset.expect_column_values_to_be_in_type_list(
-                    column, type_list=sorted(list(ProfilerTypeMapping.FLOAT_TYPE_NAMES))
-                ).success
-            ):
-                type_ = "NUMERIC"
-
-            elif profile_dataset.expect_column_values_to_be_in_type_list(
-                column, type_list=sorted(list(ProfilerTypeMapping.INT_TYPE_NAMES))
-            ).success:
-                type_ = "INT"
-
-            elif profile_dataset.expect_column_values_to_be_in_type_list(
-                column, type_list=sorted(list(ProfilerTypeMapping.FLOAT_TYPE_NAMES))
-            ).success:
-                type_ = "FLOAT"
-
-            elif profile_dataset.expect_column_values_to_be_in_type_list(
-                column, type_list=sorted(list(ProfilerTypeMapping.STRING_TYPE_NAMES))
-            ).success:
-                type_ = "STRING"
-
-            elif profile_dataset.expect_column_values_to_be_in_type_list(
-                column, type_list=sorted(list(ProfilerTypeMapping.BOOLEAN_TYPE_NAMES))
-            ).success:
-                type_ = "BOOLEAN"
+        expectation_configurations: Dict[
+            str, ExpectationConfiguration
+        ] = UserConfigurableProfiler._build_column_type_expectation_configurations(
+            column=column
+        )
 
-            elif profile_dataset.expect_column_values_to_be_in_type_list(
-                column, type_list=sorted(list(ProfilerTypeMapping.DATETIME_TYPE_NAMES))
-            ).success:
-                type_ = "DATETIME"
+        def is_of_type(type_: str) -> bool:
+            return UserConfigurableProfiler._validate_expectation_configuration(
+                profile_dataset=profile_dataset,
+                expectation_configuration=expectation_configurations[type_],
+            ).success
 
+        try:
+            if is_of_type("INT") and is_of_type("FLOAT"):
+                type_ = "NUMERIC"
             else:
-                type_ = "UNKNOWN"
+                type_ = next(
+                    (
+                        candidate_type
+                        for candidate_type in (
+                            "INT",
+                            "FLOAT",
+                            "STRING",
+                            "BOOLEAN",
+                            "DATETIME",
+                        )
+                        if is_of_type(candidate_type)
+                    ),
+                    "UNKNOWN",
+                )
         except NotImplementedError:
             type_ = "unknown"
 
@@ -622,18 +987,25 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
         Returns:
             The cardinality of the specified column
         """
+        (
+            unique_value_count_configuration,
+            proportion_of_unique_values_configuration,
+        ) = UserConfigurableProfiler._build_column_cardinality_expectation_configurations(
+            column=column
+        )
+
         num_unique = None
         pct_unique = None
 
         try:
-            num_unique = profile_dataset.expect_column_unique_value_count_to_be_between(
-                column, None, None
+            num_unique = UserConfigurableProfiler._validate_expectation_configuration(
+                profile_dataset=profile_dataset,
+                expectation_configuration=unique_value_count_configuration,
+            ).result["observed_value"]
+            pct_unique = UserConfigurableProfiler._validate_expectation_configuration(
+                profile_dataset=profile_dataset,
+                expectation_configuration=proportion_of_unique_values_configuration,
             ).result["observed_value"]
-            pct_unique = (
-                profile_dataset.expect_column_proportion_of_unique_values_to_be_between(
-                    column, None, None
-                ).result["observed_value"]
-            )
         except KeyError:  # if observed_value value is not set
             logger.error(
                 f"Failed to get cardinality of column {column:s} - continuing..."
@@ -796,9 +1168,12 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
         Returns:
             The GE Dataset
         """
-        if "expect_column_values_to_be_in_set" not in self.excluded_expectations:
-            value_set = profile_dataset.expect_column_distinct_values_to_be_in_set(
-                column, value_set=None, result_format="SUMMARY"
+        for (
+            expectation_configuration
+        ) in self._build_value_set_expectation_configurations(column=column):
+            value_set = self._validate_expectation_configuration(
+                profile_dataset=profile_dataset,
+                expectation_configuration=expectation_configuration,
             ).result["observed_value"]
 
             profile_dataset._expectation_suite.remove_expectation(
@@ -826,178 +1201,102 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
             The GE Dataset
         """
 
-        # min
-        if "expect_column_min_to_be_between" not in self.excluded_expectations:
-            observed_min = profile_dataset.expect_column_min_to_be_between(
-                column, min_value=None, max_value=None, result_format="SUMMARY"
-            ).result["observed_value"]
-            if not is_nan(observed_min):
-
-                profile_dataset.expect_column_min_to_be_between(
-                    column,
-                    min_value=observed_min,
-                    max_value=observed_min,
-                )
+        for expectation_configuration in self._build_numeric_expectation_configurations(
+            column=column
+        ):
+            expectation_type: str = expectation_configuration.expectation_type
+            result = self._validate_expectation_configuration(
+                profile_dataset=profile_dataset,
+                expectation_configuration=expectation_configuration,
+            )
 
-            else:
-                profile_dataset._expectation_suite.remove_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_min_to_be_between",
-                        kwargs={"column": column},
-                    ),
-                    match_type="domain",
-                )
-                logger.debug(
-                    f"Skipping expect_column_min_to_be_between because observed value is nan: {observed_min}"
-                )
+            if expectation_type == "expect_column_quantile_values_to_be_between":
+                allow_relative_error: Union[
+                    bool, str, float
+                ] = expectation_configuration.kwargs["allow_relative_error"]
+                if result.exception_info and (
+                    result.exception_info["exception_traceback"]
+                    or result.exception_info["exception_message"]
+                ):
+                    profile_dataset._expectation_suite.remove_expectation(
+                        ExpectationConfiguration(
+                            expectation_type=expectation_type,
+                            kwargs={"column": column},
+                        ),
+                        match_type="domain",
+                    )
+                    logger.debug(result.exception_info["exception_traceback"])
+                    logger.debug(result.exception_info["exception_message"])
+                else:
 
-        # max
-        if "expect_column_max_to_be_between" not in self.excluded_expectations:
-            observed_max = profile_dataset.expect_column_max_to_be_between(
-                column, min_value=None, max_value=None, result_format="SUMMARY"
-            ).result["observed_value"]
-            if not is_nan(observed_max):
-                profile_dataset.expect_column_max_to_be_between(
-                    column,
-                    min_value=observed_max,
-                    max_value=observed_max,
-                )
+                    profile_dataset.expect_column_quantile_values_to_be_between(
+                        column,
+                        quantile_ranges={
+                            "quantiles": result.result["observed_value"]["quantiles"],
+                            "value_ranges": [
+                                [v, v]
+                                for v in result.result["observed_value"]["values"]
+                            ],
+                        },
+                        allow_relative_error=allow_relative_error,
+                    )
 
-            else:
-                profile_dataset._expectation_suite.remove_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_max_to_be_between",
-                        kwargs={"column": column},
-                    ),
-                    match_type="domain",
-                )
-                logger.debug(
-                    f"Skipping expect_column_max_to_be_between because observed value is nan: {observed_max}"
-                )
+                continue
 
-        # mean
-        if "expect_column_mean_to_be_between" not in self.excluded_expectations:
-            observed_mean = profile_dataset.expect_column_mean_to_be_between(
-                column, min_value=None, max_value=None, result_format="SUMMARY"
-            ).result["observed_value"]
-            if not is_nan(observed_mean):
-                profile_dataset.expect_column_mean_to_be_between(
+            # min, max, mean, and median
+            observed_value = result.result["observed_value"]
+            if not is_nan(observed_value):
+                getattr(profile_dataset, expectation_type)(
                     column,
-                    min_value=observed_mean,
-                    max_value=observed_mean,
+                    min_value=observed_value,
+                    max_value=observed_value,
                 )
 
             else:
                 profile_dataset._expectation_suite.remove_expectation(
                     ExpectationConfiguration(
-                        expectation_type="expect_column_mean_to_be_between",
+                        expectation_type=expectation_type,
                         kwargs={"column": column},
                     ),
                     match_type="domain",
                 )
                 logger.debug(
-                    f"Skipping expect_column_mean_to_be_between because observed value is nan: {observed_mean}"
+                    f"Skipping {expectation_type} because observed value is nan: {observed_value}"
                 )
 
-        # median
-        if "expect_column_median_to_be_between" not in self.excluded_expectations:
-            observed_median = profile_dataset.expect_column_median_to_be_between(
-                column, min_value=None, max_value=None, result_format="SUMMARY"
-            ).result["observed_value"]
-            if not is_nan(observed_median):
-
-                profile_dataset.expect_column_median_to_be_between(
-                    column,
-                    min_value=observed_median,
-                    max_value=observed_median,
-                )
+        return profile_dataset
 
-            else:
-                profile_dataset._expectation_suite.remove_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_median_to_be_between",
-                        kwargs={"column": column},
-                    ),
-                    match_type="domain",
-                )
-                logger.debug(
-                    f"Skipping expect_column_median_to_be_between because observed value is nan: {observed_median}"
-                )
+    @staticmethod
+    def _get_allow_relative_error(profile_dataset) -> Union[bool, str, float]:
+        """
+        Determines the allow_relative_error argument of `expect_column_quantile_values_to_be_between` for the backend
+        of a dataset
+        Args:
+            profile_dataset: A GE Dataset
 
+        Returns:
+            The allow_relative_error value
+        """
         allow_relative_error: Union[bool, str, float] = False
-        if (
-            "expect_column_quantile_values_to_be_between"
-            not in self.excluded_expectations
-        ):
-            if isinstance(profile_dataset, Dataset):
-                if isinstance(profile_dataset, PandasDataset):
-                    allow_relative_error = "lower"
-                else:
-                    allow_relative_error = (
-                        profile_dataset.attempt_allowing_relative_error()
-                    )
-            elif isinstance(profile_dataset, Validator):
-                if isinstance(profile_dataset.execution_engine, PandasExecutionEngine):
-                    allow_relative_error = "lower"
-                if isinstance(profile_dataset.execution_engine, SparkDFExecutionEngine):
-                    allow_relative_error = 0.0
-                if isinstance(
-                    profile_dataset.execution_engine, SqlAlchemyExecutionEngine
-                ):
-                    sqlalchemy_execution_engine: SqlAlchemyExecutionEngine = cast(
-                        SqlAlchemyExecutionEngine, profile_dataset.execution_engine
-                    )
-                    allow_relative_error = attempt_allowing_relative_error(
-                        sqlalchemy_execution_engine.engine.dialect
-                    )
-
-            quantile_result = (
-                profile_dataset.expect_column_quantile_values_to_be_between(
-                    column,
-                    quantile_ranges={
-                        "quantiles": [0.05, 0.25, 0.5, 0.75, 0.95],
-                        "value_ranges": [
-                            [None, None],
-                            [None, None],
-                            [None, None],
-                            [None, None],
-                            [None, None],
-                        ],
-                    },
-                    allow_relative_error=allow_relative_error,
-                    result_format="SUMMARY",
-                )
-            )
-            if quantile_result.exception_info and (
-                quantile_result.exception_info["exception_traceback"]
-                or quantile_result.exception_info["exception_message"]
-            ):
-                profile_dataset._expectation_suite.remove_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_quantile_values_to_be_between",
-                        kwargs={"column": column},
-                    ),
-                    match_type="domain",
-                )
-                logger.debug(quantile_result.exception_info["exception_traceback"])
-                logger.debug(quantile_result.exception_info["exception_message"])
+        if isinstance(profile_dataset, Dataset):
+            if isinstance(profile_dataset, PandasDataset):
+                allow_relative_error = "lower"
             else:
-
-                profile_dataset.expect_column_quantile_values_to_be_between(
-                    column,
-                    quantile_ranges={
-                        "quantiles": quantile_result.result["observed_value"][
-                            "quantiles"
-                        ],
-                        "value_ranges": [
-                            [v, v]
-                            for v in quantile_result.result["observed_value"]["values"]
-                        ],
-                    },
-                    allow_relative_error=allow_relative_error,
+                allow_relative_error = profile_dataset.attempt_allowing_relative_error()
+        elif isinstance(profile_dataset, Validator):
+            if isinstance(profile_dataset.execution_engine, PandasExecutionEngine):
+                allow_relative_error = "lower"
+            if isinstance(profile_dataset.execution_engine, SparkDFExecutionEngine):
+                allow_relative_error = 0.0
+            if isinstance(profile_dataset.execution_engine, SqlAlchemyExecutionEngine):
+                sqlalchemy_execution_engine: SqlAlchemyExecutionEngine = cast(
+                    SqlAlchemyExecutionEngine, profile_dataset.execution_engine
+                )
+                allow_relative_error = attempt_allowing_relative_error(
+                    sqlalchemy_execution_engine.engine.dialect
                 )
 
-        return profile_dataset
+        return allow_relative_error
 
     def _build_expectations_primary_or_compound_key(self, profile_dataset, column_list):
         """
@@ -1060,56 +1359,42 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
             The GE Dataset
         """
 
-        if "expect_column_values_to_be_between" not in self.excluded_expectations:
-            min_value = profile_dataset.expect_column_min_to_be_between(
-                column,
-                min_value=None,
-                max_value=None,
-                result_format="SUMMARY",
-                parse_strings_as_datetimes=False,
+        expectation_configurations: List[
+            ExpectationConfiguration
+        ] = self._build_datetime_expectation_configurations(column=column)
+        if not expectation_configurations:
+            return profile_dataset
+
+        # the observed min and max values
+        observed_values: list = []
+        for expectation_configuration in expectation_configurations:
+            observed_value = self._validate_expectation_configuration(
+                profile_dataset=profile_dataset,
+                expectation_configuration=expectation_configuration,
             ).result["observed_value"]
-
-            if min_value is not None:
+            if observed_value is not None:
                 try:
-                    min_value = parse(min_value)
+                    observed_value = parse(observed_value)
                 except TypeError:
                     pass
 
             profile_dataset._expectation_suite.remove_expectation(
                 ExpectationConfiguration(
-                    expectation_type="expect_column_min_to_be_between",
+                    expectation_type=expectation_configuration.expectation_type,
                     kwargs={"column": column},
                 ),
                 match_type="domain",
             )
+            observed_values.append(observed_value)
 
-            max_value = profile_dataset.expect_column_max_to_be_between(
+        min_value, max_value = observed_values
+        if min_value is not None or max_value is not None:
+            profile_dataset.expect_column_values_to_be_between(
                 column,
-                min_value=None,
-                max_value=None,
-                result_format="SUMMARY",
+                min_value=min_value,
+                max_value=max_value,
                 parse_strings_as_datetimes=False,
-            ).result["observed_value"]
-            if max_value is not None:
-                try:
-                    max_value = parse(max_value)
-                except TypeError:
-                    pass
-
-            profile_dataset._expectation_suite.remove_expectation(
-                ExpectationConfiguration(
-                    expectation_type="expect_column_max_to_be_between",
-                    kwargs={"column": column},
-                ),
-                match_type="domain",
             )
-            if min_value is not None or max_value is not None:
-                profile_dataset.expect_column_values_to_be_between(
-                    column,
-                    min_value=min_value,
-                    max_value=max_value,
-                    parse_strings_as_datetimes=False,
-                )
 
         return profile_dataset
 
@@ -1126,9 +1411,19 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
         Returns:
             The GE Dataset
         """
-        if "expect_column_values_to_not_be_null" not in self.excluded_expectations:
-            not_null_result = profile_dataset.expect_column_values_to_not_be_null(
-                column
+        expectation_configurations: Dict[str, ExpectationConfiguration] = {
+            expectation_configuration.expectation_type: expectation_configuration
+            for expectation_configuration in self._build_all_column_types_expectation_configurations(
+                column=column
+            )
+        }
+
+        if "expect_column_values_to_not_be_null" in expectation_configurations:
+            not_null_result = self._validate_expectation_configuration(
+                profile_dataset=profile_dataset,
+                expectation_configuration=expectation_configurations[
+                    "expect_column_values_to_not_be_null"
+                ],
             )
             if not not_null_result.success:
                 unexpected_percent = float(not_null_result.result["unexpected_percent"])
@@ -1164,13 +1459,14 @@ type detected is "{str(type(self.profile_dataset))}", which is illegal.
                     )
         if (
             "expect_column_proportion_of_unique_values_to_be_between"
-            not in self.excluded_expectations
+            in expectation_configurations
         ):
-            pct_unique = (
-                profile_dataset.expect_column_proportion_of_unique_values_to_be_between(
-                    column, None, None
-                ).result["observed_value"]
-            )
+            pct_unique = self._validate_expectation_configuration(
+                profile_dataset=profile_dataset,
+                expectation_configuration=expectation_configurations[
+                    "expect_column_proportion_of_unique_values_to_be_between"
+                ],
+            ).result["observed_value"]
 
             if not is_nan(pct_unique):
                 profile_dataset.expect_column_proportion_of_unique_values_to_be_between(
@@ -1222,9 +1518,10 @@ nan: {pct_unique}
             columns = self.all_table_columns
             profile_dataset.expect_table_columns_to_match_ordered_list(columns)
 
-        if "expect_table_row_count_to_be_between" not in self.excluded_expectations:
-            row_count = profile_dataset.expect_table_row_count_to_be_between(
-                min_value=0, max_value=None
+        for expectation_configuration in self._build_table_expectation_configurations():
+            row_count = self._validate_expectation_configuration(
+                profile_dataset=profile_dataset,
+                expectation_configuration=expectation_configuration,
             ).result["observed_value"]
             min_value = max(0, int(row_count))
             max_value = int(row_count)
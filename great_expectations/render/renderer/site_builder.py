@@ -1,12 +1,17 @@
+import hashlib
+import json
 import logging
 import os
 import traceback
 from collections import OrderedDict
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import great_expectations.exceptions as exceptions
-from great_expectations.core import ExpectationSuite
-from great_expectations.core.util import nested_update
+from great_expectations import __version__ as ge_version
+from great_expectations.core import ExpectationSuite, ExpectationSuiteValidationResult
+from great_expectations.core.async_executor import AsyncExecutor
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.store.ge_cloud_store_backend import (
     GeCloudRESTResource,
 )
@@ -15,6 +20,7 @@ from great_expectations.data_context.store.html_site_store import (
     SiteSectionIdentifier,
 )
 from great_expectations.data_context.store.json_site_store import JsonSiteStore
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     GeCloudIdentifier,
@@ -110,6 +116,19 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
+
+    Large sites can be built incrementally. In this mode, the site keeps a manifest of the rendered resources (with
+    hashes of their content); only new or changed resources are rendered, and the index page is built from the
+    manifest instead of listing (and reading) every resource in the source stores. Pages can also be rendered by
+    several worker threads::
+
+        local_site:
+            class_name: SiteBuilder
+            incremental: true
+            max_render_workers: 4
+            store_backend:
+                class_name: TupleFilesystemStoreBackend
+                base_directory: uncommitted/data_docs/local_site/
     """
 
     def __init__(
@@ -122,6 +141,8 @@ class SiteBuilder:
         site_section_builders=None,
         runtime_environment=None,
         ge_cloud_mode=False,
+        incremental=False,
+        max_render_workers=1,
         **kwargs,
     ) -> None:
         self.site_name = site_name
@@ -129,6 +150,8 @@ class SiteBuilder:
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
         self.ge_cloud_mode = ge_cloud_mode
+        # GE Cloud renders documents on the server side, so there is nothing to keep track of locally.
+        self.incremental = incremental and not ge_cloud_mode
 
         usage_statistics_config = data_context.anonymous_usage_statistics
         data_context_id = None
@@ -236,6 +259,7 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "ge_cloud_mode": self.ge_cloud_mode,
+                    "max_render_workers": max_render_workers,
                 },
                 config_defaults={"name": site_section_name, "module_name": module_name},
             )
@@ -302,6 +326,11 @@ class SiteBuilder:
         :return:
         """
 
+        if self.incremental:
+            return self._build_incrementally(
+                resource_identifiers=resource_identifiers, build_index=build_index
+            )
+
         # copy static assets
         for site_section_builder in self.site_section_builders.values():
             site_section_builder.build(resource_identifiers=resource_identifiers)
@@ -319,6 +348,33 @@ class SiteBuilder:
             index_links_dict,
         )
 
+    def _build_incrementally(self, resource_identifiers=None, build_index: bool = True):
+        render_manifest = RenderManifest.from_json(
+            self.target_store.get_render_manifest()
+        )
+        if render_manifest.is_new:
+            # Without a manifest, nothing is known about the pages already in the site, so all of them are rendered.
+            resource_identifiers = None
+
+        for site_section_builder in self.site_section_builders.values():
+            site_section_builder.build(
+                resource_identifiers=resource_identifiers,
+                render_manifest=render_manifest,
+            )
+
+        self.target_store.set_render_manifest(render_manifest.to_json())
+
+        if render_manifest.is_new:
+            self.target_store.copy_static_assets()
+
+        _, index_links_dict = self.site_index_builder.build(
+            build_index=build_index, render_manifest=render_manifest
+        )
+        return (
+            self.get_resource_url(only_if_exists=False),
+            index_links_dict,
+        )
+
     def get_resource_url(self, resource_identifier=None, only_if_exists=True):
         """
         Return the URL of the HTML document that renders a resource
@@ -352,6 +408,7 @@ class DefaultSiteSectionBuilder:
         view=None,
         data_context_id=None,
         ge_cloud_mode=False,
+        max_render_workers=1,
         **kwargs,
     ) -> None:
         self.name = name
@@ -363,6 +420,7 @@ class DefaultSiteSectionBuilder:
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
         self.ge_cloud_mode = ge_cloud_mode
+        self.max_render_workers = max_render_workers
         if renderer is None:
             raise exceptions.InvalidConfigError(
                 "SiteSectionBuilder requires a renderer configuration "
@@ -405,13 +463,28 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:
+    def build(self, resource_identifiers=None, render_manifest=None) -> None:
+        """
+        :param resource_identifiers: if specified, only the pages of the resources in this list are rendered
+        :param render_manifest: RenderManifest of the site; if specified, the site is built incrementally (only new or
+        changed resources are rendered, and the manifest is updated accordingly)
+        """
+        if render_manifest is not None:
+            self._build_incrementally(
+                resource_identifiers=resource_identifiers,
+                render_manifest=render_manifest,
+            )
+            return
+
         source_store_keys = self.source_store.list_keys()
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        if resource_identifiers:
+            resource_identifiers = set(resource_identifiers)
+
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -499,6 +572,181 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 )
                 logger.error(exception_message)
 
+    def _build_incrementally(self, resource_identifiers, render_manifest) -> None:
+        if resource_identifiers:
+            # Only the requested resources are considered, so the (potentially very large) source store is not listed.
+            source_store_keys = [
+                resource_key
+                for resource_key in set(resource_identifiers)
+                if isinstance(resource_key, self.source_store.key_class)
+                and self.source_store.has_key(resource_key)  # noqa: W601
+            ]
+        else:
+            source_store_keys = self.source_store.list_keys()
+            self._remove_missing_resources(
+                render_manifest=render_manifest,
+                source_store_keys=set(source_store_keys),
+            )
+
+        if self.name == "validations" and self.validation_results_limit:
+            source_store_keys = sorted(
+                source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
+            )[: self.validation_results_limit]
+
+        if self.run_name_filter:
+            source_store_keys = [
+                resource_key
+                for resource_key in source_store_keys
+                if resource_key_passes_run_name_filter(
+                    resource_key, self.run_name_filter
+                )
+            ]
+
+        rendered_resources = []
+        with AsyncExecutor(
+            concurrency_config=ConcurrencyConfig(enabled=True),
+            max_workers=self.max_render_workers,
+        ) as async_executor:
+            for resource_key in source_store_keys:
+                # Validation results are never modified once stored (their keys include the run), so unless they are
+                # requested explicitly, there is no need to read them back in order to find out whether they changed.
+                if (
+                    not resource_identifiers
+                    and isinstance(resource_key, ValidationResultIdentifier)
+                    and render_manifest.get_entry(
+                        section_name=self.name, resource_key=resource_key
+                    )
+                    is not None
+                ):
+                    continue
+
+                rendered_resources.append(
+                    (
+                        resource_key,
+                        async_executor.submit(
+                            self._render_resource_if_changed,
+                            resource_key=resource_key,
+                            render_manifest=render_manifest,
+                        ),
+                    )
+                )
+
+        for resource_key, async_result in rendered_resources:
+            manifest_entry: Optional[dict] = async_result.result()
+            if manifest_entry is not None:
+                render_manifest.set_entry(
+                    section_name=self.name,
+                    resource_key=resource_key,
+                    **manifest_entry,
+                )
+
+    def _render_resource_if_changed(
+        self, resource_key, render_manifest
+    ) -> Optional[dict]:
+        """Render the page of the resource, unless its content is unchanged since it was last rendered.
+
+        Returns:
+            the manifest entry for the rendered page (or None, if nothing was rendered)
+        """
+        try:
+            serialized_resource = self.source_store.store_backend.get(
+                self.source_store.key_to_tuple(resource_key)
+            )
+        except exceptions.InvalidKeyError:
+            logger.warning(
+                f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+            )
+            return None
+
+        content_hash: str = RenderManifest.get_content_hash(serialized_resource)
+        manifest_entry: Optional[dict] = render_manifest.get_entry(
+            section_name=self.name, resource_key=resource_key
+        )
+        if (
+            manifest_entry is not None
+            and manifest_entry["content_hash"] == content_hash
+        ):
+            return None
+
+        resource = self.source_store.deserialize(serialized_resource)
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            resource = ExpectationSuite(**resource, data_context=self.data_context)
+
+        logger.debug(f"        Rendering {self.name} page for {str(resource_key)}")
+        try:
+            rendered_content = self.renderer_class.render(resource)
+            viewable_content = self.view_class.render(
+                rendered_content,
+                data_context_id=self.data_context_id,
+                show_how_to_buttons=self.show_how_to_buttons,
+            )
+            self.target_store.set(
+                SiteSectionIdentifier(
+                    site_section_name=self.name,
+                    resource_identifier=resource_key,
+                ),
+                viewable_content,
+            )
+        except Exception as e:
+            exception_message = """\
+An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
+not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
+diagnose and repair the underlying issue.  Detailed information follows:
+                """
+            exception_traceback = traceback.format_exc()
+            exception_message += (
+                f'{type(e).__name__}: "{str(e)}".  '
+                f'Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)
+            return None
+
+        return {
+            "content_hash": content_hash,
+            "index_link": self._get_index_link(
+                resource_key=resource_key, resource=resource
+            ),
+        }
+
+    def _get_index_link(self, resource_key, resource) -> dict:
+        """Collect the (JSON-serializable) arguments of DefaultSiteIndexBuilder.add_resource_info_to_index_links_dict()
+        for the resource, so that the index page can be built without reading the resource again.
+        """
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            return {"expectation_suite_name": resource_key.expectation_suite_name}
+
+        batch_kwargs = resource.meta.get("batch_kwargs", {})
+        batch_spec = resource.meta.get("batch_spec", {})
+        index_link: dict = {
+            "expectation_suite_name": resource_key.expectation_suite_identifier.expectation_suite_name,
+            "batch_identifier": resource_key.batch_identifier,
+            "run_name": resource_key.run_id.run_name,
+            "run_time": resource_key.run_id.run_time.isoformat(),
+            "asset_name": batch_kwargs.get("data_asset_name")
+            or batch_spec.get("data_asset_name"),
+            "batch_kwargs": convert_to_json_serializable(batch_kwargs),
+            "batch_spec": convert_to_json_serializable(batch_spec),
+        }
+        if self.name != "profiling":
+            index_link["validation_success"] = resource.success
+
+        return index_link
+
+    def _remove_missing_resources(self, render_manifest, source_store_keys) -> None:
+        """Remove pages (and manifest entries) of resources that no longer exist in the source store."""
+        for resource_key in render_manifest.get_resource_keys(
+            section_name=self.name, key_class=self.source_store.key_class
+        ):
+            if resource_key in source_store_keys:
+                continue
+
+            render_manifest.remove_entry(
+                section_name=self.name, resource_key=resource_key
+            )
+            target_store_backend = self.target_store.store_backends[type(resource_key)]
+            if target_store_backend.has_key(resource_key.to_tuple()):  # noqa: W601
+                target_store_backend.remove_key(resource_key.to_tuple())
+
 
 class DefaultSiteIndexBuilder:
     def __init__(
@@ -715,12 +963,17 @@ class DefaultSiteIndexBuilder:
 
     # TODO: deprecate dual batch api support
     def build(
-        self, skip_and_clean_missing=True, build_index: bool = True
+        self,
+        skip_and_clean_missing=True,
+        build_index: bool = True,
+        render_manifest: Optional["RenderManifest"] = None,
     ) -> Tuple[Any, Optional[OrderedDict]]:
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param render_manifest: if specified, the index links are taken from this RenderManifest (which is kept up to
+        date by the site section builders) instead of listing the source and target stores
         :return: tuple(index_page_url, index_links_dict)
         """
 
@@ -736,18 +989,23 @@ class DefaultSiteIndexBuilder:
         if self.show_how_to_buttons:
             index_links_dict["cta_object"] = self.get_calls_to_action()
 
-        self._add_expectations_to_index_links(index_links_dict, skip_and_clean_missing)
-        validation_and_profiling_result_site_keys = (
-            self._build_validation_and_profiling_result_site_keys(
-                skip_and_clean_missing
+        if render_manifest is not None:
+            self._add_render_manifest_to_index_links(index_links_dict, render_manifest)
+        else:
+            self._add_expectations_to_index_links(
+                index_links_dict, skip_and_clean_missing
+            )
+            validation_and_profiling_result_site_keys = (
+                self._build_validation_and_profiling_result_site_keys(
+                    skip_and_clean_missing
+                )
+            )
+            self._add_profiling_to_index_links(
+                index_links_dict, validation_and_profiling_result_site_keys
+            )
+            self._add_validations_to_index_links(
+                index_links_dict, validation_and_profiling_result_site_keys
             )
-        )
-        self._add_profiling_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
-        )
-        self._add_validations_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
-        )
 
         viewable_content = ""
         try:
@@ -771,6 +1029,43 @@ diagnose and repair the underlying issue.  Detailed information follows:
 
         return self.target_store.write_index_page(viewable_content), index_links_dict
 
+    def _add_render_manifest_to_index_links(
+        self, index_links_dict: OrderedDict, render_manifest: "RenderManifest"
+    ) -> None:
+        for section_name in ["expectations", "profiling", "validations"]:
+            section_config = self.site_section_builders_config.get(section_name, "None")
+            if not section_config or section_config in FALSEY_YAML_STRINGS:
+                continue
+
+            index_links: List[dict] = [
+                manifest_entry["index_link"]
+                for manifest_entry in render_manifest.get_entries(
+                    section_name=section_name
+                )
+            ]
+            if section_name == "validations":
+                index_links = sorted(
+                    index_links, key=lambda x: x["run_time"], reverse=True
+                )
+                if self.validation_results_limit:
+                    index_links = index_links[: self.validation_results_limit]
+
+            index_link: dict
+            for index_link in index_links:
+                index_link = dict(index_link)
+                if "run_time" in index_link:
+                    run_id = RunIdentifier(
+                        run_name=index_link["run_name"],
+                        run_time=index_link["run_time"],
+                    )
+                    index_link.update(run_id=run_id, run_time=run_id.run_time)
+
+                self.add_resource_info_to_index_links_dict(
+                    index_links_dict=index_links_dict,
+                    section_name=section_name,
+                    **index_link,
+                )
+
     def _add_expectations_to_index_links(
         self, index_links_dict: OrderedDict, skip_and_clean_missing: bool
     ) -> None:
@@ -850,6 +1145,32 @@ diagnose and repair the underlying issue.  Detailed information follows:
 
         return validation_and_profiling_result_site_keys
 
+    def _get_validation_results(
+        self,
+        validation_result_keys: List[ValidationResultIdentifier],
+        validations_store_name: Optional[str] = None,
+    ) -> List[Optional[ExpectationSuiteValidationResult]]:
+        """Fetch the validation results needed by the index page in bulk, so that remote stores can fetch them
+        concurrently.  Results that cannot be loaded are returned as None."""
+        if validations_store_name is None:
+            validations_store_name = self.data_context.validations_store_name
+        validations_store = self.data_context.stores[validations_store_name]
+
+        try:
+            return validations_store.get_many(validation_result_keys)
+        except Exception as e:
+            logger.debug(
+                f"Unable to fetch validation results in bulk ({e}) - fetching them one at a time."
+            )
+
+        validation_results: List[Optional[ExpectationSuiteValidationResult]] = []
+        for validation_result_key in validation_result_keys:
+            try:
+                validation_results.append(validations_store.get(validation_result_key))
+            except Exception:
+                validation_results.append(None)
+        return validation_results
+
     def _add_profiling_to_index_links(
         self,
         index_links_dict: OrderedDict,
@@ -867,15 +1188,14 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     validation_result_key, profiling_run_name_filter
                 )
             ]
-            for profiling_result_key in profiling_result_site_keys:
+            profiling_results = self._get_validation_results(
+                validation_result_keys=profiling_result_site_keys,
+                validations_store_name=self.source_stores.get("profiling"),
+            )
+            for profiling_result_key, validation in zip(
+                profiling_result_site_keys, profiling_results
+            ):
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
-                    )
-
                     batch_kwargs = validation.meta.get("batch_kwargs", {})
                     batch_spec = validation.meta.get("batch_spec", {})
 
@@ -922,15 +1242,14 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 validation_result_site_keys = validation_result_site_keys[
                     : self.validation_results_limit
                 ]
-            for validation_result_key in validation_result_site_keys:
+            validation_results = self._get_validation_results(
+                validation_result_keys=validation_result_site_keys,
+                validations_store_name=self.source_stores.get("validations"),
+            )
+            for validation_result_key, validation in zip(
+                validation_result_site_keys, validation_results
+            ):
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
-                    )
-
                     validation_success = validation.success
                     batch_kwargs = validation.meta.get("batch_kwargs", {})
                     batch_spec = validation.meta.get("batch_spec", {})
@@ -954,6 +1273,95 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     logger.warning(error_msg)
 
 
+class RenderManifest:
+    """Record of the resources rendered into the pages of a data docs site, which makes incremental builds possible.
+
+    For every site section, the manifest keeps the hash of the (serialized) content each page was rendered from, as
+    well as the information the index page needs about the resource.  A manifest written by a different version of
+    Great Expectations is discarded, since its pages would need to be rendered again anyway.
+    """
+
+    def __init__(
+        self,
+        sections: Optional[Dict[str, Dict[Tuple[str, ...], dict]]] = None,
+        is_new: bool = True,
+    ) -> None:
+        self._sections = sections or {}
+        self._is_new = is_new
+
+    @property
+    def is_new(self) -> bool:
+        """True if the site had no (usable) manifest, i.e., nothing is known about the pages already in the site."""
+        return self._is_new
+
+    @staticmethod
+    def get_content_hash(serialized_resource: Any) -> str:
+        if not isinstance(serialized_resource, bytes):
+            serialized_resource = str(serialized_resource).encode("utf-8")
+
+        return hashlib.md5(serialized_resource).hexdigest()
+
+    @classmethod
+    def from_json(cls, serialized_manifest: Optional[str]) -> "RenderManifest":
+        if not serialized_manifest:
+            return cls()
+
+        try:
+            manifest: dict = json.loads(serialized_manifest)
+        except ValueError:
+            logger.warning("The render manifest of the site is invalid; ignoring it.")
+            return cls()
+
+        if manifest.get("ge_version") != ge_version:
+            return cls()
+
+        return cls(
+            sections={
+                section_name: {
+                    tuple(manifest_entry["resource_key"]): manifest_entry
+                    for manifest_entry in manifest_entries
+                }
+                for section_name, manifest_entries in manifest["sections"].items()
+            },
+            is_new=False,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "ge_version": ge_version,
+                "sections": {
+                    section_name: list(manifest_entries.values())
+                    for section_name, manifest_entries in self._sections.items()
+                },
+            }
+        )
+
+    def get_entry(self, section_name: str, resource_key) -> Optional[dict]:
+        return self._sections.get(section_name, {}).get(resource_key.to_tuple())
+
+    def get_entries(self, section_name: str) -> List[dict]:
+        return list(self._sections.get(section_name, {}).values())
+
+    def get_resource_keys(self, section_name: str, key_class) -> list:
+        return [
+            key_class.from_tuple(resource_key_tuple)
+            for resource_key_tuple in self._sections.get(section_name, {})
+        ]
+
+    def set_entry(
+        self, section_name: str, resource_key, content_hash: str, index_link: dict
+    ) -> None:
+        self._sections.setdefault(section_name, {})[resource_key.to_tuple()] = {
+            "resource_key": list(resource_key.to_tuple()),
+            "content_hash": content_hash,
+            "index_link": index_link,
+        }
+
+    def remove_entry(self, section_name: str, resource_key) -> None:
+        self._sections.get(section_name, {}).pop(resource_key.to_tuple(), None)
+
+
 class CallToActionButton:
     def __init__(self, title, link) -> None:
         self.title = title
@@ -15,6 +15,7 @@ from great_expectations.rule_based_profiler.data_assistant_result import (
 )
 from great_expectations.rule_based_profiler.domain_builder import DomainBuilder
 from great_expectations.rule_based_profiler.helpers.util import (
+    METRIC_HISTORY_STORE_NAME_VARIABLE,
     convert_variables_to_dict,
     get_validator_with_expectation_suite,
 )
@@ -98,6 +99,7 @@ class DataAssistantRunner:
         def run(
             batch_request: Optional[Union[BatchRequestBase, dict]] = None,
             estimation: Optional[Union[str, NumericRangeEstimatorType]] = None,
+            metric_history_store_name: Optional[str] = None,
             **kwargs,
         ) -> DataAssistantResult:
             """
@@ -110,6 +112,8 @@ class DataAssistantRunner:
                     If set to "exact" (default), all "Rule" objects using "NumericMetricRangeMultiBatchParameterBuilder"
                     will have the value of "estimator" property (referred to by "$variables.estimator") equal "exact".
                     If set to "flag_outliers", then "bootstrap" estimator (default in "Rule" variables) takes effect.
+                metric_history_store_name: Optional name of "BatchMetricStore" of data context, in which metrics of
+                    "Batch" objects are looked up (and recorded), so that only metrics of new "Batch" objects are computed.
                 kwargs: placeholder for "makefun.create_function()" to propagate dynamically generated signature
 
             Returns:
@@ -162,7 +166,14 @@ class DataAssistantRunner:
             domain_type_directives_list: List[
                 RuntimeEnvironmentDomainTypeDirectives
             ] = build_domain_type_directives(**domain_type_directives_kwargs)
+            variables: Optional[Dict[str, Any]] = None
+            if metric_history_store_name is not None:
+                variables = {
+                    METRIC_HISTORY_STORE_NAME_VARIABLE: metric_history_store_name,
+                }
+
             data_assistant_result: DataAssistantResult = data_assistant.run(
+                variables=variables,
                 variables_directives_list=variables_directives_list,
                 domain_type_directives_list=domain_type_directives_list,
             )
@@ -180,6 +191,12 @@ class DataAssistantRunner:
                 default="exact",
                 annotation=Optional[Union[str, NumericRangeEstimatorType]],
             ),
+            Parameter(
+                name="metric_history_store_name",
+                kind=Parameter.POSITIONAL_OR_KEYWORD,
+                default=None,
+                annotation=Optional[str],
+            ),
         ]
 
         parameters.extend(
@@ -1,5 +1,6 @@
 import copy
 import datetime
+import itertools
 import json
 import os
 import warnings
@@ -144,6 +145,10 @@ class DataAssistantResult(SerializableDictDot):
     citation: Optional[dict] = None
     # Reference to "UsageStatisticsHandler" object for this "DataAssistantResult" object (if configured).
     _usage_statistics_handler: Optional[UsageStatisticsHandler] = field(default=None)
+    # Charting "DataFrame" objects, built once and shared by all charts of single "plot_metrics()" (or similar) call.
+    _chart_df_cache: Optional[Dict[Any, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def metric_expectation_map(self) -> Dict[Union[str, Tuple[str]], str]:
@@ -565,30 +570,36 @@ class DataAssistantResult(SerializableDictDot):
             ExpectationConfiguration
         ] = self.expectation_configurations
 
-        table_domain_charts: List[
-            Union[alt.Chart, alt.LayerChart]
-        ] = self._plot_table_domain_charts(
-            expectation_configurations=expectation_configurations,
-            plot_mode=plot_mode,
-            sequential=sequential,
-            include_column_names=include_column_names,
-            exclude_column_names=exclude_column_names,
-        )
-        display_charts.extend(table_domain_charts)
-        return_charts.extend(table_domain_charts)
-
-        column_domain_display_charts: List[alt.VConcatChart]
-        column_domain_return_charts: List[alt.Chart]
-        (
-            column_domain_display_charts,
-            column_domain_return_charts,
-        ) = self._plot_column_domain_charts(
-            expectation_configurations=expectation_configurations,
-            plot_mode=plot_mode,
-            sequential=sequential,
-            include_column_names=include_column_names,
-            exclude_column_names=exclude_column_names,
-        )
+        # Charting "DataFrame" objects are shared by display charts and return charts (and across metrics of a domain).
+        self._chart_df_cache = {}
+        try:
+            table_domain_charts: List[
+                Union[alt.Chart, alt.LayerChart]
+            ] = self._plot_table_domain_charts(
+                expectation_configurations=expectation_configurations,
+                plot_mode=plot_mode,
+                sequential=sequential,
+                include_column_names=include_column_names,
+                exclude_column_names=exclude_column_names,
+            )
+            display_charts.extend(table_domain_charts)
+            return_charts.extend(table_domain_charts)
+
+            column_domain_display_charts: List[alt.VConcatChart]
+            column_domain_return_charts: List[alt.Chart]
+            (
+                column_domain_display_charts,
+                column_domain_return_charts,
+            ) = self._plot_column_domain_charts(
+                expectation_configurations=expectation_configurations,
+                plot_mode=plot_mode,
+                sequential=sequential,
+                include_column_names=include_column_names,
+                exclude_column_names=exclude_column_names,
+            )
+        finally:
+            self._chart_df_cache = None
+
         display_charts.extend(column_domain_display_charts)
         return_charts.extend(column_domain_return_charts)
 
@@ -619,14 +630,10 @@ class DataAssistantResult(SerializableDictDot):
         else:
             altair_theme = copy.deepcopy(AltairThemes.DEFAULT_THEME.value)
 
-        themed_charts: List[alt.Chart] = self._apply_theme(
-            charts=charts, theme=altair_theme
-        )
-
-        chart_titles: List[str] = self._get_chart_titles(charts=themed_charts)
+        chart_titles: List[str] = self._get_chart_titles(charts=charts)
 
         if len(chart_titles) > 0:
-            metric_plot_count = self._get_metric_plot_count(charts=themed_charts)
+            metric_plot_count = self._get_metric_plot_count(charts=charts)
             if plot_mode == plot_mode.DIAGNOSTIC:
                 print(
                     f"""{len(self.expectation_configurations)} Expectations produced, {metric_plot_count} Expectation and Metric plots implemented
@@ -645,8 +652,9 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
             display_chart_dict: Dict[str, Union[alt.Chart, alt.LayerChart]] = {
                 " ": None
             }
+            # the theme is applied lazily, only to the chart selected for display
             for idx in range(len(chart_titles)):
-                display_chart_dict[chart_titles[idx]] = themed_charts[idx]
+                display_chart_dict[chart_titles[idx]] = charts[idx]
 
             dropdown_title_color: str = altair_theme["legend"]["titleColor"]
             dropdown_font: str = altair_theme["font"]
@@ -718,14 +726,20 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                 DataAssistantResult._display_chart_from_dict,
                 display_chart_dict=widgets.fixed(display_chart_dict),
                 chart_title=dropdown_selection,
+                theme=widgets.fixed(altair_theme),
             )
 
     @staticmethod
     def _display_chart_from_dict(
         display_chart_dict: Dict[str, Union[alt.Chart, alt.LayerChart]],
         chart_title: str,
+        theme: Optional[Dict[str, Any]] = None,
     ) -> None:
-        display_chart_dict[chart_title].display()
+        chart: Union[alt.Chart, alt.LayerChart] = display_chart_dict[chart_title]
+        if theme is not None:
+            chart = chart.configure(**theme)
+
+        chart.display()
 
     @staticmethod
     def _get_chart_layer_title(
@@ -797,16 +811,24 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
         theme = DataAssistantResult._get_theme(theme=theme)
         return [chart.configure(**theme) for chart in charts]
 
+    @staticmethod
+    def _get_list_column_names(df: pd.DataFrame) -> List[str]:
+        """Returns names of columns of given DataFrame, which contain at least one value of type "list"."""
+        column_name: str
+        column: pd.Series
+        return [
+            column_name
+            for column_name, column in df.items()
+            # only "object" columns can hold lists
+            if column.dtype == object
+            and any(type(value) == list for value in column.values)
+        ]
+
     @staticmethod
     def _transform_column_lists_to_rows(
         df: pd.DataFrame,
     ) -> pd.DataFrame:
-        col_has_list: pd.DataFrame = pd.DataFrame(
-            {"column_name": df.columns, "has_list": (df.applymap(type) == list).any()}
-        )
-        list_column_names: List[str] = list(
-            col_has_list[col_has_list["has_list"]]["column_name"]
-        )
+        list_column_names: List[str] = DataAssistantResult._get_list_column_names(df=df)
 
         if (
             "table_columns" in list_column_names
@@ -819,9 +841,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
             for idx, column_name in enumerate(list_column_names):
                 # explode list of column names into separate rows for each name in list
                 # flatten columns of lists
-                cols_flat.append(
-                    [item for sublist in df[column_name] for item in sublist]
-                )
+                cols_flat.append(list(itertools.chain.from_iterable(df[column_name])))
 
             # row numbers to repeat
             ilocations: List[int] = list(
@@ -1818,7 +1838,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
         for metric_plot_component in metric_plot_components:
             if quantiles in df.columns:
                 line: alt.Chart = (
-                    alt.Chart(data=df, title=title)
+                    alt.Chart(title=title)
                     .mark_line()
                     .encode(
                         x=batch_plot_component.plot_on_axis(),
@@ -1829,7 +1849,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                 )
             else:
                 line: alt.Chart = (
-                    alt.Chart(data=df, title=title)
+                    alt.Chart(title=title)
                     .mark_line()
                     .encode(
                         x=batch_plot_component.plot_on_axis(),
@@ -1839,7 +1859,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                 )
 
             points: alt.Chart = (
-                alt.Chart(data=df, title=title)
+                alt.Chart(title=title)
                 .mark_point()
                 .encode(
                     x=batch_plot_component.plot_on_axis(),
@@ -1850,7 +1870,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
 
             lines_and_points_list.append(line + points)
 
-        return alt.layer(*lines_and_points_list)
+        return alt.layer(*lines_and_points_list, data=df)
 
     @staticmethod
     def _get_bar_chart(
@@ -1874,7 +1894,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
         bars_list: List[alt.Chart] = []
         for metric_plot_component in metric_plot_components:
             bars = (
-                alt.Chart(data=df, title=title)
+                alt.Chart(title=title)
                 .mark_bar()
                 .encode(
                     x=alt.X(
@@ -1890,7 +1910,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
 
             bars_list.append(bars)
 
-        return alt.layer(*bars_list)
+        return alt.layer(*bars_list, data=df)
 
     @staticmethod
     def _get_range_chart(
@@ -1913,7 +1933,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
         lines_and_points_list: List[alt.Chart] = []
         for metric_plot_component in metric_plot_components:
             line: alt.Chart = (
-                alt.Chart(data=df, title=title)
+                alt.Chart(title=title)
                 .mark_line()
                 .encode(
                     x=alt.X(
@@ -1929,7 +1949,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
             )
 
             points: alt.Chart = (
-                alt.Chart(data=df, title=title)
+                alt.Chart(title=title)
                 .mark_point()
                 .encode(
                     x=alt.X(
@@ -1945,7 +1965,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
 
             lines_and_points_list.append(line + points)
 
-        return alt.layer(*lines_and_points_list)
+        return alt.layer(*lines_and_points_list, data=df)
 
     @staticmethod
     def _get_expect_domain_values_to_be_between_line_chart(
@@ -1998,7 +2018,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
         upper_limit: alt.Chart
         lower_limit, upper_limit = (
             (
-                alt.Chart(data=df)
+                alt.Chart(title=title)
                 .mark_line(
                     color=expectation_kwarg_line_color,
                     strokeWidth=expectation_kwarg_line_stroke_width,
@@ -2008,7 +2028,6 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                     y=expectation_kwarg_plot_component.plot_on_axis(),
                     tooltip=tooltip,
                 )
-                .properties(title=title)
             )
             for expectation_kwarg_plot_component in (
                 min_value_plot_component,
@@ -2017,7 +2036,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
         )
 
         band: alt.Chart = (
-            alt.Chart(data=df)
+            alt.Chart(title=title)
             .mark_area()
             .encode(
                 x=batch_plot_component.plot_on_axis(),
@@ -2026,7 +2045,6 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                     max_value_plot_component.name, title=max_value_plot_component.title
                 ),
             )
-            .properties(title=title)
         )
 
         if "quantiles" in df.columns:
@@ -2054,7 +2072,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                 if_true=alt.value(Colors.PINK.value),
             )
 
-            anomaly_coded_base = alt.Chart(data=df, title=title)
+            anomaly_coded_base = alt.Chart(title=title)
 
             anomaly_coded_line = anomaly_coded_base.mark_line().encode(
                 x=batch_plot_component.plot_on_axis(),
@@ -2073,7 +2091,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
             )
             anomaly_coded_lines.append(anomaly_coded_line + anomaly_coded_points)
 
-        return alt.layer(band, lower_limit, upper_limit, *anomaly_coded_lines)
+        return alt.layer(band, lower_limit, upper_limit, *anomaly_coded_lines, data=df)
 
     @staticmethod
     def _get_expect_domain_values_to_be_between_bar_chart(
@@ -2126,7 +2144,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
         upper_limit: alt.Chart
         lower_limit, upper_limit = (
             (
-                alt.Chart(data=df)
+                alt.Chart(title=title)
                 .mark_line(
                     color=expectation_kwarg_line_color,
                     strokeWidth=expectation_kwarg_line_stroke_width,
@@ -2141,7 +2159,6 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                     y=expectation_kwarg_plot_component.plot_on_axis(),
                     tooltip=tooltip,
                 )
-                .properties(title=title)
             )
             for expectation_kwarg_plot_component in (
                 min_value_plot_component,
@@ -2150,7 +2167,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
         )
 
         band: alt.Chart = (
-            alt.Chart(data=df)
+            alt.Chart(title=title)
             .mark_area()
             .encode(
                 x=alt.X(
@@ -2164,7 +2181,6 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                     max_value_plot_component.name, title=max_value_plot_component.title
                 ),
             )
-            .properties(title=title)
         )
 
         if "quantiles" in df.columns:
@@ -2192,7 +2208,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                 if_true=alt.value(Colors.PINK.value),
             )
 
-            anomaly_coded_base = alt.Chart(data=df, title=title)
+            anomaly_coded_base = alt.Chart(title=title)
 
             anomaly_coded_bar = anomaly_coded_base.mark_bar().encode(
                 x=batch_plot_component.plot_on_axis(),
@@ -2202,7 +2218,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
             )
             anomaly_coded_bars.append(anomaly_coded_bar)
 
-        return alt.layer(band, lower_limit, upper_limit, *anomaly_coded_bars)
+        return alt.layer(band, lower_limit, upper_limit, *anomaly_coded_bars, data=df)
 
     @staticmethod
     def _get_expect_domain_values_to_be_between_range_chart(
@@ -2255,7 +2271,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
         upper_limit: alt.Chart
         lower_limit, upper_limit = (
             (
-                alt.Chart(data=df)
+                alt.Chart(title=title)
                 .mark_line(
                     color=expectation_kwarg_line_color,
                     strokeWidth=expectation_kwarg_line_stroke_width,
@@ -2270,7 +2286,6 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                     y=expectation_kwarg_plot_component.plot_on_axis(),
                     tooltip=tooltip,
                 )
-                .properties(title=title)
             )
             for expectation_kwarg_plot_component in (
                 min_value_plot_component,
@@ -2279,7 +2294,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
         )
 
         band: alt.Chart = (
-            alt.Chart(data=df)
+            alt.Chart(title=title)
             .mark_area()
             .encode(
                 x=alt.X(
@@ -2293,7 +2308,6 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                     max_value_plot_component.name, title=max_value_plot_component.title
                 ),
             )
-            .properties(title=title)
         )
 
         if "quantiles" in df.columns:
@@ -2321,7 +2335,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                 if_true=alt.value(Colors.PINK.value),
             )
 
-            anomaly_coded_base = alt.Chart(data=df, title=title)
+            anomaly_coded_base = alt.Chart(title=title)
 
             anomaly_coded_line = anomaly_coded_base.mark_line().encode(
                 x=alt.X(
@@ -2348,7 +2362,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
             )
             anomaly_coded_lines.append(anomaly_coded_line + anomaly_coded_points)
 
-        return alt.layer(band, lower_limit, upper_limit, *anomaly_coded_lines)
+        return alt.layer(band, lower_limit, upper_limit, *anomaly_coded_lines, data=df)
 
     @staticmethod
     def _get_interactive_line_chart(
@@ -3456,17 +3470,9 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
             Tuple[str], str
         ] = self._get_metric_expectation_map()
 
-        sanitized_metric_names: Set[
-            str
-        ] = self._get_sanitized_metric_names_from_metric_names(
-            metric_names=metric_names
-        )
-
         expectation_configuration: ExpectationConfiguration
         attributed_metrics: Dict[str, List[ParameterNode]]
         df: pd.DataFrame
-        attributed_values: List[ParameterNode]
-        metric_df: pd.DataFrame
         return_charts: List[alt.Chart] = []
         for domain, attributed_metrics in attributed_metrics_by_domain.items():
             for expectation_configuration in expectation_configurations:
@@ -3477,26 +3483,12 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                     metric_expectation_map.get(metric_names)
                     == expectation_configuration.expectation_type
                 ):
-                    df = pd.DataFrame()
-                    for metric_name in metric_names:
-                        attributed_values = attributed_metrics[metric_name]
-                        metric_df = self._create_df_for_charting(
-                            metric_name=metric_name,
-                            attributed_values=attributed_values,
-                            expectation_configuration=expectation_configuration,
-                            plot_mode=plot_mode,
-                        )
-                        if len(df.index) == 0:
-                            df = metric_df.copy()
-                        else:
-                            join_keys = [
-                                column
-                                for column in metric_df.columns
-                                if column not in sanitized_metric_names
-                            ]
-                            df = df.merge(metric_df, on=join_keys).reset_index(
-                                drop=True
-                            )
+                    df = self._create_merged_df_for_charting(
+                        metric_names=metric_names,
+                        attributed_values_by_metric_name=attributed_metrics,
+                        expectation_configuration=expectation_configuration,
+                        plot_mode=plot_mode,
+                    )
 
                     column_name: str = domain.domain_kwargs.column
                     subtitle = f"Column: {column_name}"
@@ -3637,6 +3629,16 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
         expectation_configuration: Optional[ExpectationConfiguration],
         plot_mode: PlotMode,
     ) -> pd.DataFrame:
+        cache_key: tuple = (
+            metric_name,
+            id(attributed_values[0]),
+            id(expectation_configuration),
+            plot_mode,
+        )
+        df: Optional[pd.DataFrame] = self._get_cached_chart_df(cache_key=cache_key)
+        if df is not None:
+            return df
+
         batch_ids: KeysView[str] = attributed_values[0].keys()
         metric_values: MetricValues = [
             value[0] if len(value) == 1 else value
@@ -3645,7 +3647,7 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
 
         sanitized_metric_name: str = sanitize_parameter_name(name=metric_name)
 
-        df: pd.DataFrame = pd.DataFrame({sanitized_metric_name: metric_values})
+        df = pd.DataFrame({sanitized_metric_name: metric_values})
 
         if (
             metric_name == "column.quantile_values"
@@ -3658,54 +3660,13 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                 quantiles = quantiles[0]
             df["quantiles"] = [quantiles for idx in df.index]
 
-        batch_identifier_list: List[Set[Tuple[str, str]]] = [
-            self._batch_id_to_batch_identifier_display_name_map[batch_id]
-            for batch_id in batch_ids
-        ]
-
-        batch_identifier_set: Set
-        batch_identifier_list_sorted: List
-        batch_identifier_key: str
-        batch_identifier_value: str
-        batch_identifier_keys: Set[str] = set()
-        batch_identifier_record: List
-        batch_identifier_records: List[List] = []
-        for batch_identifier_set in batch_identifier_list:
-            # make sure batch_identifier keys are sorted the same from batch to batch
-            # e.g. prevent batch 1 from displaying keys "month", "year" and batch 2 from displaying keys "year", "month"
-            batch_identifier_list_sorted = sorted(
-                batch_identifier_set,
-                key=lambda batch_identifier_tuple: batch_identifier_tuple[0].casefold(),
-            )
-            batch_identifier_record = []
-            for (
-                batch_identifier_key,
-                batch_identifier_value,
-            ) in batch_identifier_list_sorted:
-                batch_identifier_keys.add(batch_identifier_key)
-                # if dictionary type batch_identifier values are detected, format them as a string for tooltip display
-                if isinstance(batch_identifier_value, dict):
-                    batch_identifier_value = str(
-                        {
-                            str(key).title(): value
-                            for key, value in batch_identifier_value.items()
-                        }
-                    ).replace("'", "")
-                batch_identifier_record.append(batch_identifier_value)
-
-            batch_identifier_records.append(batch_identifier_record)
+        df["batch"] = np.arange(1, len(df.index) + 1)
 
-        batch_identifier_keys_sorted: List[str] = sorted(batch_identifier_keys)
-        batch_identifier_df: pd.DataFrame = pd.DataFrame(
-            batch_identifier_records, columns=batch_identifier_keys_sorted
+        df = pd.concat(
+            [df, self._create_batch_identifier_df_for_charting(batch_ids=batch_ids)],
+            axis=1,
         )
 
-        idx: int
-        batch_numbers: List[int] = [idx + 1 for idx in range(len(batch_identifier_df))]
-        df["batch"] = batch_numbers
-
-        df = pd.concat([df, batch_identifier_df], axis=1)
-
         if plot_mode == PlotMode.DIAGNOSTIC:
             if expectation_configuration is not None:
                 for kwarg_name in expectation_configuration.kwargs:
@@ -3729,34 +3690,148 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                 return pd.DataFrame()
 
         # if there are any lists in the dataframe
-        if (df.applymap(type) == list).any().any():
+        if len(DataAssistantResult._get_list_column_names(df=df)) > 0:
             df = DataAssistantResult._transform_column_lists_to_rows(
                 df=df,
             )
 
         df = df.reset_index(drop=True)
 
+        self._set_cached_chart_df(cache_key=cache_key, df=df)
+
         return df
 
-    def _create_column_dfs_for_charting(
+    def _create_batch_identifier_df_for_charting(
+        self, batch_ids: Iterable[str]
+    ) -> pd.DataFrame:
+        """
+        Returns display ("friendly") names of batch_identifiers of given batches (one row per batch, one column per
+        batch_identifier key, in sorted order), using "_batch_id_to_batch_identifier_display_name_map".
+        """
+        batch_identifier_records_by_batch_id: Optional[Dict[str, Dict[str, Any]]] = None
+        if self._chart_df_cache is not None:
+            batch_identifier_records_by_batch_id = self._chart_df_cache.get(
+                "batch_identifier_records"
+            )
+
+        if batch_identifier_records_by_batch_id is None:
+            batch_identifier_records_by_batch_id = {}
+            batch_id: str
+            batch_identifier_set: Set[Tuple[str, Any]]
+            batch_identifier_key: str
+            batch_identifier_value: Any
+            for (
+                batch_id,
+                batch_identifier_set,
+            ) in self._batch_id_to_batch_identifier_display_name_map.items():
+                batch_identifier_record: Dict[str, Any] = {}
+                for (
+                    batch_identifier_key,
+                    batch_identifier_value,
+                ) in batch_identifier_set:
+                    # if dictionary type batch_identifier values are detected, format them as a string for tooltip display
+                    if isinstance(batch_identifier_value, dict):
+                        batch_identifier_value = str(
+                            {
+                                str(key).title(): value
+                                for key, value in batch_identifier_value.items()
+                            }
+                        ).replace("'", "")
+                    batch_identifier_record[
+                        batch_identifier_key
+                    ] = batch_identifier_value
+
+                batch_identifier_records_by_batch_id[batch_id] = batch_identifier_record
+
+            if self._chart_df_cache is not None:
+                self._chart_df_cache[
+                    "batch_identifier_records"
+                ] = batch_identifier_records_by_batch_id
+
+        batch_identifier_records: List[Dict[str, Any]] = [
+            batch_identifier_records_by_batch_id[batch_id] for batch_id in batch_ids
+        ]
+        batch_identifier_keys: Set[str] = set()
+        for batch_identifier_record in batch_identifier_records:
+            batch_identifier_keys.update(batch_identifier_record.keys())
+
+        return pd.DataFrame(
+            batch_identifier_records, columns=sorted(batch_identifier_keys)
+        )
+
+    def _create_merged_df_for_charting(
         self,
         metric_names: Tuple[str],
-        attributed_metrics_by_domain: Dict[Domain, Dict[str, List[ParameterNode]]],
-        expectation_configurations: List[ExpectationConfiguration],
+        attributed_values_by_metric_name: Dict[str, List[ParameterNode]],
+        expectation_configuration: Optional[ExpectationConfiguration],
         plot_mode: PlotMode,
-    ) -> List[ColumnDataFrame]:
+    ) -> pd.DataFrame:
+        cache_key: tuple = (
+            metric_names,
+            tuple(
+                id(attributed_values_by_metric_name[metric_name][0])
+                for metric_name in metric_names
+            ),
+            id(expectation_configuration),
+            plot_mode,
+        )
+        df: Optional[pd.DataFrame] = self._get_cached_chart_df(cache_key=cache_key)
+        if df is not None:
+            return df
+
         sanitized_metric_names: Set[
             str
         ] = self._get_sanitized_metric_names_from_metric_names(
             metric_names=metric_names
         )
 
+        metric_df: pd.DataFrame
+        join_keys: List[str]
+        df = pd.DataFrame()
+        for metric_name in metric_names:
+            metric_df = self._create_df_for_charting(
+                metric_name=metric_name,
+                attributed_values=attributed_values_by_metric_name[metric_name],
+                expectation_configuration=expectation_configuration,
+                plot_mode=plot_mode,
+            )
+            if len(metric_df) > 0:
+                if len(df.index) == 0:
+                    df = metric_df
+                else:
+                    join_keys = [
+                        column
+                        for column in metric_df.columns
+                        if column not in sanitized_metric_names
+                    ]
+                    df = df.merge(metric_df, on=join_keys).reset_index(drop=True)
+
+        self._set_cached_chart_df(cache_key=cache_key, df=df)
+
+        return df
+
+    def _get_cached_chart_df(self, cache_key: tuple) -> Optional[pd.DataFrame]:
+        if self._chart_df_cache is None or cache_key not in self._chart_df_cache:
+            return None
+
+        # charting methods may modify DataFrame objects passed to them, so each caller receives its own copy
+        return self._chart_df_cache[cache_key].copy()
+
+    def _set_cached_chart_df(self, cache_key: tuple, df: pd.DataFrame) -> None:
+        if self._chart_df_cache is not None:
+            self._chart_df_cache[cache_key] = df.copy()
+
+    def _create_column_dfs_for_charting(
+        self,
+        metric_names: Tuple[str],
+        attributed_metrics_by_domain: Dict[Domain, Dict[str, List[ParameterNode]]],
+        expectation_configurations: List[ExpectationConfiguration],
+        plot_mode: PlotMode,
+    ) -> List[ColumnDataFrame]:
         metric_domains: Set[Domain] = set(attributed_metrics_by_domain.keys())
 
         column_name: str
         column_domain: Domain
-        metric_df: pd.DataFrame
-        join_keys: List[str]
         df: pd.DataFrame
         column_df: ColumnDataFrame
         column_dfs: List[ColumnDataFrame] = []
@@ -3773,24 +3848,12 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
                 if expectation_configuration.kwargs["column"] == column_name:
                     metric_domain_expectation_configuration = expectation_configuration
 
-            df = pd.DataFrame()
-            for metric_name in metric_names:
-                metric_df = self._create_df_for_charting(
-                    metric_name=metric_name,
-                    attributed_values=attributed_values_by_metric_name[metric_name],
-                    expectation_configuration=metric_domain_expectation_configuration,
-                    plot_mode=plot_mode,
-                )
-                if len(metric_df) > 0:
-                    if len(df.index) == 0:
-                        df = metric_df.copy()
-                    else:
-                        join_keys = [
-                            column
-                            for column in metric_df.columns
-                            if column not in sanitized_metric_names
-                        ]
-                        df = df.merge(metric_df, on=join_keys).reset_index(drop=True)
+            df = self._create_merged_df_for_charting(
+                metric_names=metric_names,
+                attributed_values_by_metric_name=attributed_values_by_metric_name,
+                expectation_configuration=metric_domain_expectation_configuration,
+                plot_mode=plot_mode,
+            )
             if len(df.index) > 0:
                 column_df = ColumnDataFrame(column_name, df)
                 column_dfs.append(column_df)
@@ -3814,24 +3877,15 @@ Use DataAssistantResult.metrics_by_domain to show all calculated Metrics"""
             metric_names=metric_names
         )
 
-        metric_df: pd.DataFrame
-        df: pd.DataFrame = pd.DataFrame()
-        for metric_name in metric_names:
-            metric_df = self._create_df_for_charting(
-                metric_name=metric_name,
-                attributed_values=attributed_values[0],
-                expectation_configuration=expectation_configuration,
-                plot_mode=plot_mode,
-            )
-            if len(df.index) == 0:
-                df = metric_df.copy()
-            else:
-                join_keys = [
-                    column
-                    for column in metric_df.columns
-                    if column not in sanitized_metric_names
-                ]
-                df = df.merge(metric_df, on=join_keys).reset_index(drop=True)
+        metric_name: str
+        df: pd.DataFrame = self._create_merged_df_for_charting(
+            metric_names=metric_names,
+            attributed_values_by_metric_name={
+                metric_name: attributed_values[0] for metric_name in metric_names
+            },
+            expectation_configuration=expectation_configuration,
+            plot_mode=plot_mode,
+        )
 
         # If columns are included/excluded we need to filter them out for table level metrics here
         table_column_metrics: List[str] = ["table_columns"]
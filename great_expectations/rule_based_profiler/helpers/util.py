@@ -31,6 +31,7 @@ from great_expectations.rule_based_profiler.estimators.numeric_range_estimation_
 )
 from great_expectations.rule_based_profiler.parameter_container import (
     FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER,
+    VARIABLES_KEY,
     VARIABLES_PREFIX,
     Domain,
     ParameterContainer,
@@ -58,6 +59,10 @@ TEMPORARY_EXPECTATION_SUITE_NAME_PATTERN: re.Pattern = re.compile(
     rf"^{TEMPORARY_EXPECTATION_SUITE_NAME_PREFIX}\..+\.{TEMPORARY_EXPECTATION_SUITE_NAME_STEM}\.\w{8}"
 )
 
+# Name of the (optional) variable, holding the name of the "BatchMetricStore" of the data context, in which the values
+# of metrics computed for every "Batch" are looked up (and recorded) by "ParameterBuilder" objects.
+METRIC_HISTORY_STORE_NAME_VARIABLE: str = "metric_history_store_name"
+
 RECOGNIZED_QUANTILE_STATISTIC_INTERPOLATION_METHODS: set = {
     "auto",
     "nearest",
@@ -160,6 +165,78 @@ def get_batch_ids(
     return batch_ids
 
 
+def get_batch_fingerprints(
+    validator: "Validator",  # noqa: F821
+    batch_ids: List[str],
+) -> Dict[str, Any]:
+    """
+    This method returns the fingerprints of the data of the given Batches (their row counts), by batch_id, with which
+    the metric values recorded in a "BatchMetricStore" are looked up.  Batches of runtime data (which are not identified
+    by their batch_id across runs) have no fingerprints.
+    """
+    batch_ids = [
+        batch_id
+        for batch_id in batch_ids
+        if batch_id in validator.batches
+        and isinstance(validator.batches[batch_id].batch_request, BatchRequest)
+    ]
+    metric_configurations: List[MetricConfiguration] = [
+        MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs={"batch_id": batch_id},
+            metric_value_kwargs=None,
+        )
+        for batch_id in batch_ids
+    ]
+    if not metric_configurations:
+        return {}
+
+    row_counts: Dict[Tuple[str, str, str], Any] = validator.compute_metrics(
+        metric_configurations=metric_configurations
+    )
+    return {
+        batch_id: row_counts[metric_configuration.id]
+        for batch_id, metric_configuration in zip(batch_ids, metric_configurations)
+    }
+
+
+def get_metric_history_store(
+    data_context: Optional["BaseDataContext"] = None,  # noqa: F821
+    variables: Optional[ParameterContainer] = None,
+) -> Optional["BatchMetricStore"]:  # noqa: F821
+    """
+    This method returns the "BatchMetricStore" of "data_context", whose name is the value of the optional
+    "$variables.metric_history_store_name" variable, or None, if this variable is not set.
+    """
+    if data_context is None or variables is None:
+        return None
+
+    try:
+        store_name: Optional[
+            str
+        ] = get_parameter_value_by_fully_qualified_parameter_name(
+            fully_qualified_parameter_name=f"{VARIABLES_KEY}{METRIC_HISTORY_STORE_NAME_VARIABLE}",
+            variables=variables,
+        )
+    except KeyError:
+        return None
+
+    if not store_name:
+        return None
+
+    # postpone importing to avoid circular imports
+    from great_expectations.data_context.store import BatchMetricStore
+
+    store: Optional["Store"] = data_context.stores.get(store_name)  # noqa: F821
+    if not isinstance(store, BatchMetricStore):
+        raise ge_exceptions.ProfilerExecutionError(
+            message=f"""The "{METRIC_HISTORY_STORE_NAME_VARIABLE}" variable must be the name of a BatchMetricStore \
+of the data context ("{store_name}" was detected)."""
+        )
+
+    return store
+
+
 def build_batch_request(
     batch_request: Optional[Union[str, BatchRequestBase, dict]] = None,
     domain: Optional[Domain] = None,
@@ -27,6 +27,10 @@ from great_expectations.rule_based_profiler.helpers.util import (
 from great_expectations.rule_based_profiler.helpers.util import (
     get_batch_ids as get_batch_ids_from_batch_list_or_batch_request,
 )
+from great_expectations.rule_based_profiler.helpers.util import (
+    get_batch_fingerprints,
+    get_metric_history_store,
+)
 from great_expectations.rule_based_profiler.helpers.util import (
     get_parameter_value_and_validate_return_type,
 )
@@ -393,18 +397,64 @@ specified (empty "metric_name" value detected)."""
             ),
         )
 
-        # Step-5: Resolve all metrics in one operation simultaneously.
+        # Step-5: Resolve all metrics in one operation simultaneously.  If a metric history store is configured (using
+        # the "$variables.metric_history_store_name" variable), then metrics already computed for the same data of the
+        # same "Batch" objects (Batches of runtime data excepted) are looked up in it, and only the remaining metrics are
+        # computed (and recorded in it).
 
-        # The Validator object used for metric calculation purposes.
-        validator: "Validator" = self.get_validator(  # noqa: F821
-            domain=domain,
+        metric_history_store: Optional[
+            "BatchMetricStore"  # noqa: F821
+        ] = get_metric_history_store(
+            data_context=self.data_context,
             variables=variables,
-            parameters=parameters,
         )
 
-        resolved_metrics: Dict[Tuple[str, str, str], Any] = validator.compute_metrics(
-            metric_configurations=metrics_to_resolve,
-        )
+        # The Validator object used for metric calculation purposes.
+        validator: Optional["Validator"] = None  # noqa: F821
+
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        metrics_to_compute: List[MetricConfiguration] = metrics_to_resolve
+        batch_fingerprints: Dict[str, Any] = {}
+        if metric_history_store is not None:
+            validator = self.get_validator(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+            batch_fingerprints = get_batch_fingerprints(
+                validator=validator, batch_ids=batch_ids
+            )
+            resolved_metrics = metric_history_store.get_metric_values(
+                metric_configurations=metrics_to_resolve,
+                batch_fingerprints=batch_fingerprints,
+            )
+            metrics_to_compute = [
+                metric_configuration
+                for metric_configuration in metrics_to_resolve
+                if metric_configuration.id not in resolved_metrics
+            ]
+
+        if metrics_to_compute:
+            if validator is None:
+                validator = self.get_validator(
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+
+            computed_metrics: Dict[
+                Tuple[str, str, str], Any
+            ] = validator.compute_metrics(
+                metric_configurations=metrics_to_compute,
+            )
+            if metric_history_store is not None:
+                metric_history_store.set_metric_values(
+                    metric_configurations=metrics_to_compute,
+                    resolved_metrics=computed_metrics,
+                    batch_fingerprints=batch_fingerprints,
+                )
+
+            resolved_metrics.update(computed_metrics)
 
         # Step-6: Sort resolved metrics according to same sort order as was applied to "MetricConfiguration" directives.
 
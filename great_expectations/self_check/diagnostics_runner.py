@@ -0,0 +1,134 @@
+"""
+Runs the diagnostics of many Expectations (e.g., to build the Expectation Gallery, or in CI), fanning them out over a
+pool of processes.  Each process keeps its own execution engines and loads each distinct test dataset into each backend
+only once, reusing the loaded data for all the Expectations it runs diagnostics for.
+
+WARNING: This module is experimental.
+"""
+
+import logging
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from great_expectations.core.expectation_diagnostics.expectation_diagnostics import (
+    ExpectationDiagnostics,
+)
+from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.self_check.util import ExpectationTestDataCache
+
+logger = logging.getLogger(__name__)
+
+# Test data loaded by the current (worker) process.
+_test_data_cache: Optional[ExpectationTestDataCache] = None
+
+
+@dataclass
+class ExpectationDiagnosticsRunResult:
+    """The diagnostics of an Expectation (None if they could not be run, in which case "error" holds the traceback),
+    and the number of seconds it took to run them."""
+
+    expectation_type: str
+    diagnostics: Optional[ExpectationDiagnostics]
+    duration: float
+    error: Optional[str] = None
+
+
+def run_expectation_diagnostics(
+    expectation_types: List[str],
+    processes: Optional[int] = None,
+    ignore_suppress: bool = False,
+    ignore_only_for: bool = False,
+    only_consider_these_backends: Optional[List[str]] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple = (),
+) -> List[ExpectationDiagnosticsRunResult]:
+    """Run the diagnostics of registered Expectations, in parallel processes.
+
+    Args:
+        expectation_types: snake_case names of the (registered) Expectations whose diagnostics are run
+        processes: number of worker processes (defaults to the number of CPUs); diagnostics are run in the current
+            process if it is 1
+        ignore_suppress: if True, ignore the suppress_test_for list of the Expectations' test cases
+        ignore_only_for: if True, ignore the only_for list of the Expectations' test cases
+        only_consider_these_backends: optional list of backends to run tests against
+        initializer: optional callable run by each worker process before running diagnostics (e.g., importing the
+            modules registering contrib Expectations, when worker processes are not forked)
+        initargs: arguments of "initializer"
+
+    Returns:
+        The results of the Expectations, in the order of "expectation_types"
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    run_kwargs: dict = {
+        "ignore_suppress": ignore_suppress,
+        "ignore_only_for": ignore_only_for,
+        "only_consider_these_backends": only_consider_these_backends,
+    }
+
+    results: List[ExpectationDiagnosticsRunResult]
+    if processes <= 1 or len(expectation_types) <= 1:
+        _initialize_worker(initializer, initargs)
+        results = [
+            _run_diagnostics(expectation_type, run_kwargs)
+            for expectation_type in expectation_types
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(processes, len(expectation_types)),
+            initializer=_initialize_worker,
+            initargs=(initializer, initargs),
+        ) as executor:
+            results = list(
+                executor.map(
+                    _run_diagnostics,
+                    expectation_types,
+                    [run_kwargs] * len(expectation_types),
+                )
+            )
+
+    result: ExpectationDiagnosticsRunResult
+    for result in sorted(results, key=lambda result: result.duration, reverse=True):
+        logger.info(
+            f"Took {result.duration:.2f} seconds to run diagnostics for {result.expectation_type}"
+        )
+
+    return results
+
+
+def _initialize_worker(
+    initializer: Optional[Callable[..., None]], initargs: Tuple
+) -> None:
+    global _test_data_cache
+    _test_data_cache = ExpectationTestDataCache()
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_diagnostics(
+    expectation_type: str, run_kwargs: dict
+) -> ExpectationDiagnosticsRunResult:
+    start: float = time.time()
+    try:
+        diagnostics: ExpectationDiagnostics = get_expectation_impl(
+            expectation_type
+        )().run_diagnostics(test_data_cache=_test_data_cache, **run_kwargs)
+    except Exception:
+        logger.error(f"Failed to run diagnostics for {expectation_type}")
+        return ExpectationDiagnosticsRunResult(
+            expectation_type=expectation_type,
+            diagnostics=None,
+            duration=time.time() - start,
+            error=traceback.format_exc(),
+        )
+
+    return ExpectationDiagnosticsRunResult(
+        expectation_type=expectation_type,
+        diagnostics=diagnostics,
+        duration=time.time() - start,
+    )
@@ -1,4 +1,5 @@
 import copy
+import json
 import locale
 import logging
 import os
@@ -14,6 +15,8 @@ from functools import wraps
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -530,6 +533,70 @@ class LockingConnectionCheck:
             return self._is_valid
 
 
+class ExpectationTestDataCache:
+    """Keeps the data of Expectation test data cases loaded into each backend, so that a dataset shared by several
+    test data cases (or several Expectations) is loaded into a backend (e.g., with "df.to_sql") only once.
+
+    Each call to get_validator() returns a new Validator, whose batch is the dataset loaded by the first call for the
+    same backend, data and schemas; validators over the same dataset share their execution engine (and its metric
+    cache).  Caches are not shared between processes: each process running diagnostics loads its own data.
+
+    WARNING: This class is experimental.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Any, List[Batch]]] = {}
+        self._hit_count = 0
+        self._miss_count = 0
+
+    @property
+    def hit_count(self) -> int:
+        return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        return self._miss_count
+
+    def get_validator(
+        self,
+        backend: str,
+        data: Any,
+        schemas: Optional[dict],
+        loader: Callable[[], Optional[Validator]],
+        context: Optional["DataContext"] = None,
+    ) -> Optional[Validator]:
+        """Return a Validator over the given data loaded into "backend", calling "loader" to load the data (and build a
+        Validator) if it has not been loaded into this backend yet.  Exceptions raised by "loader" are not cached."""
+        key: str = json.dumps([backend, data, schemas], default=str)
+        with self._lock:
+            entry: Optional[Tuple[Any, List[Batch]]] = self._entries.get(key)
+            if entry is not None:
+                self._hit_count += 1
+                execution_engine, batches = entry
+                return Validator(
+                    execution_engine=execution_engine,
+                    batches=batches,
+                    data_context=context,
+                )
+
+            self._miss_count += 1
+
+        validator: Optional[Validator] = loader()
+        if validator is not None:
+            with self._lock:
+                self._entries[key] = (
+                    validator.execution_engine,
+                    list(validator.batches.values()),
+                )
+
+        return validator
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+
+
 def get_sqlite_connection_url(sqlite_db_path):
     url = "sqlite://"
     if sqlite_db_path is not None:
@@ -2205,6 +2272,7 @@ def generate_expectation_tests(  # noqa: C901 - 43
     debug_logger: Optional[logging.Logger] = None,
     only_consider_these_backends: Optional[List[str]] = None,
     context: Optional["DataContext"] = None,
+    test_data_cache: Optional[ExpectationTestDataCache] = None,
 ):
     """Determine tests to run
 
@@ -2216,6 +2284,7 @@ def generate_expectation_tests(  # noqa: C901 - 43
     :param ignore_only_for: bool object that when True will ignore the only_for list on Expectation sample tests
     :param debug_logger: optional logging.Logger object to use for sending debug messages to
     :param only_consider_these_backends: optional list of backends to consider
+    :param test_data_cache: optional ExpectationTestDataCache reusing the data loaded into backends by earlier calls
     :return: list of parametrized tests with loaded validators and accessible backends
     """
     _debug = lambda x: x  # noqa: E731
@@ -2372,34 +2441,16 @@ def generate_expectation_tests(  # noqa: C901 - 43
                 )
                 continue
 
-            datasets = []
-
             try:
-                if isinstance(d["data"], list):
-                    sqlite_db_path = generate_sqlite_db_path()
-                    for dataset in d["data"]:
-                        datasets.append(
-                            get_test_validator_with_data(
-                                c,
-                                dataset["data"],
-                                dataset.get("schemas"),
-                                table_name=dataset.get("dataset_name"),
-                                sqlite_db_path=sqlite_db_path,
-                                extra_debug_info=expectation_type,
-                                debug_logger=debug_logger,
-                                context=context,
-                            )
-                        )
-                    validator_with_data = datasets[0]
-                else:
-                    validator_with_data = get_test_validator_with_data(
-                        c,
-                        d["data"],
-                        d["schemas"],
-                        extra_debug_info=expectation_type,
-                        debug_logger=debug_logger,
-                        context=context,
-                    )
+                validator_with_data = _get_test_data_case_validator(
+                    backend=c,
+                    test_data_case=d,
+                    data_key="data",
+                    expectation_type=expectation_type,
+                    debug_logger=debug_logger,
+                    context=context,
+                    test_data_cache=test_data_cache,
+                )
             except Exception as e:
                 _error(
                     f"PROBLEM with get_test_validator_with_data in backend {c} for {expectation_type} {repr(e)[:300]}"
@@ -2417,31 +2468,15 @@ def generate_expectation_tests(  # noqa: C901 - 43
                 if "data_alt" in d and d["data_alt"] is not None:
                     # print("There is alternate data to try!!")
                     try:
-                        if isinstance(d["data_alt"], list):
-                            sqlite_db_path = generate_sqlite_db_path()
-                            for dataset in d["data_alt"]:
-                                datasets.append(
-                                    get_test_validator_with_data(
-                                        c,
-                                        dataset["data_alt"],
-                                        dataset.get("schemas"),
-                                        table_name=dataset.get("dataset_name"),
-                                        sqlite_db_path=sqlite_db_path,
-                                        extra_debug_info=expectation_type,
-                                        debug_logger=debug_logger,
-                                        context=context,
-                                    )
-                                )
-                            validator_with_data = datasets[0]
-                        else:
-                            validator_with_data = get_test_validator_with_data(
-                                c,
-                                d["data_alt"],
-                                d["schemas"],
-                                extra_debug_info=expectation_type,
-                                debug_logger=debug_logger,
-                                context=context,
-                            )
+                        validator_with_data = _get_test_data_case_validator(
+                            backend=c,
+                            test_data_case=d,
+                            data_key="data_alt",
+                            expectation_type=expectation_type,
+                            debug_logger=debug_logger,
+                            context=context,
+                            test_data_cache=test_data_cache,
+                        )
                     except Exception:
                         # print(
                         #     "\n[[ STILL Problem calling get_test_validator_with_data ]]"
@@ -2516,6 +2551,59 @@ def generate_expectation_tests(  # noqa: C901 - 43
     return parametrized_tests
 
 
+def _get_test_data_case_validator(
+    backend: str,
+    test_data_case: ExpectationTestDataCases,
+    data_key: str,
+    expectation_type: str,
+    debug_logger: Optional[logging.Logger] = None,
+    context: Optional["DataContext"] = None,
+    test_data_cache: Optional[ExpectationTestDataCache] = None,
+) -> Optional[Validator]:
+    """Build a Validator over the data (or the alternate data, if "data_key" is "data_alt") of a test data case.  The
+    data may be a list of named datasets, which are loaded into the same database, and the first of which is validated.
+    """
+    data = test_data_case[data_key]
+
+    def _load() -> Optional[Validator]:
+        if isinstance(data, list):
+            sqlite_db_path = generate_sqlite_db_path()
+            datasets = [
+                get_test_validator_with_data(
+                    backend,
+                    dataset[data_key],
+                    dataset.get("schemas"),
+                    table_name=dataset.get("dataset_name"),
+                    sqlite_db_path=sqlite_db_path,
+                    extra_debug_info=expectation_type,
+                    debug_logger=debug_logger,
+                    context=context,
+                )
+                for dataset in data
+            ]
+            return datasets[0]
+
+        return get_test_validator_with_data(
+            backend,
+            data,
+            test_data_case["schemas"],
+            extra_debug_info=expectation_type,
+            debug_logger=debug_logger,
+            context=context,
+        )
+
+    if test_data_cache is None:
+        return _load()
+
+    return test_data_cache.get_validator(
+        backend=backend,
+        data=data,
+        schemas=test_data_case["schemas"],
+        loader=_load,
+        context=context,
+    )
+
+
 def should_we_generate_this_test(
     backend: str,
     expectation_test_case: ExpectationTestCase,
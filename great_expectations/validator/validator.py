@@ -8,7 +8,19 @@ import traceback
 import warnings
 from collections import OrderedDict, defaultdict, namedtuple
 from collections.abc import Hashable
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from dateutil.parser import parse
 from marshmallow import ValidationError
@@ -16,6 +28,9 @@ from tqdm.auto import tqdm
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.batch import Batch, BatchDefinition, BatchMarkers
+from great_expectations.core.evaluation_parameters import (
+    resolve_evaluation_parameter_urns,
+)
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_suite import (
     ExpectationSuite,
@@ -181,6 +196,9 @@ class Validator:
 
         self._include_rendered_content = include_rendered_content
 
+        # Already resolved metrics, used (see "precomputed_metrics()") rather than computing them again.
+        self._precomputed_metrics: Dict[Tuple[str, str, str], Any] = {}
+
     def __dir__(self) -> List[str]:
         """
         This custom magic method is used to enable expectation tab completion on Validator objects.
@@ -892,6 +910,82 @@ class Validator:
             metrics={metric.metric_name: metric},
         )[metric.metric_name]
 
+    def compute_expectation_metrics(
+        self,
+        configurations: List[ExpectationConfiguration],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Resolves, in a single validation graph, all metrics needed to validate the given expectation configurations.
+
+        Resolving them together lets the execution engine bundle their computation (e.g., into a few queries), rather
+        than computing them expectation by expectation.  Metrics that cannot be resolved are left out (they are computed
+        again, and their errors reported, when the corresponding expectations are validated).
+
+        Args:
+            configurations: Expectation configurations whose metrics are to be resolved.
+            runtime_configuration: The runtime configuration with which the expectations will be validated (it can
+            affect which metrics are needed); defaults to that of expectations validated with this Validator.
+
+        Returns:
+            Dictionary with resolved metrics, with unique metric ID as key and computed metric as value.
+        """
+        if runtime_configuration is None:
+            runtime_configuration = {
+                k: v
+                for k, v in self.default_expectation_args.items()
+                if k in Validator.RUNTIME_KEYS
+            }
+
+        expectation_validation_graphs: List[ExpectationValidationGraph] = []
+        self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+            expectation_configurations=configurations,
+            expectation_validation_graphs=expectation_validation_graphs,
+            processed_configurations=[],
+            catch_exceptions=True,
+            runtime_configuration=runtime_configuration,
+        )
+
+        graph: ValidationGraph = (
+            self._generate_suite_level_graph_from_expectation_level_sub_graphs(
+                expectation_validation_graphs=expectation_validation_graphs
+            )
+        )
+
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        try:
+            self.resolve_validation_graph(
+                graph=graph,
+                metrics=resolved_metrics,
+                runtime_configuration={
+                    **runtime_configuration,
+                    "catch_exceptions": True,
+                },
+            )
+        finally:
+            self._execution_engine.release_persisted_data(domain_records_only=True)
+
+        return resolved_metrics
+
+    @contextmanager
+    def precomputed_metrics(
+        self, metrics: Dict[Tuple[str, str, str], Any]
+    ) -> Iterator[None]:
+        """Within this context, expectations are validated using the given (already resolved) metrics, which are then
+        not computed again.
+
+        Args:
+            metrics: Dictionary with resolved metrics (e.g., as returned by "compute_expectation_metrics()"), with
+            unique metric ID as key and computed metric as value.
+        """
+        previous_precomputed_metrics: Dict[
+            Tuple[str, str, str], Any
+        ] = self._precomputed_metrics
+        self._precomputed_metrics = {**previous_precomputed_metrics, **metrics}
+        try:
+            yield
+        finally:
+            self._precomputed_metrics = previous_precomputed_metrics
+
     def graph_validate(
         self,
         configurations: List[ExpectationConfiguration],
@@ -937,7 +1031,7 @@ class Validator:
         )
 
         if metrics is None:
-            metrics = {}
+            metrics = dict(self._precomputed_metrics)
 
         graph: ValidationGraph = (
             self._generate_suite_level_graph_from_expectation_level_sub_graphs(
@@ -971,6 +1065,8 @@ class Validator:
                 return evrs
             else:
                 raise err
+        finally:
+            self._execution_engine.release_persisted_data(domain_records_only=True)
 
         configuration: ExpectationConfiguration
         result: ExpectationValidationResult
@@ -1406,7 +1502,14 @@ aborting graph resolution.
                 ), "batches provided to Validator must be Great Expectations Batch objects"
             except AssertionError as e:
                 logger.warning(str(e))
-            self._execution_engine.load_batch_data(batch.id, batch.data)
+            if batch.is_lazy:
+                self._execution_engine.load_batch_data_lazily(
+                    batch_id=batch.id,
+                    batch_data_loader=lambda batch=batch: batch.data,
+                    batch_spec=batch.batch_spec,
+                )
+            else:
+                self._execution_engine.load_batch_data(batch.id, batch.data)
             self._batches[batch.id] = batch
             # We set the active_batch_id in each iteration of the loop to keep in sync with the active_batch_id for the
             # execution_engine. The final active_batch_id will be that of the final batch loaded.
@@ -1921,6 +2024,24 @@ set as active.
                 runtime_evaluation_parameters
             )
 
+            # Resolve the store URNs referenced by the suite once, rather than once per expectation
+            substitution_evaluation_parameters = copy.copy(
+                runtime_evaluation_parameters
+            )
+            if self.interactive_evaluation:
+                substitution_evaluation_parameters.update(
+                    resolve_evaluation_parameter_urns(
+                        parameter_expressions=[
+                            value["$PARAMETER"]
+                            for expectation in expectation_suite.expectations
+                            for value in expectation.kwargs.values()
+                            if isinstance(value, dict) and "$PARAMETER" in value
+                        ],
+                        evaluation_parameters=runtime_evaluation_parameters,
+                        data_context=self._data_context,
+                    )
+                )
+
             # Warn if our version is different from the version in the configuration
             # TODO: Deprecate "great_expectations.__version__"
 
@@ -1929,7 +2050,7 @@ set as active.
 
             for expectation in expectation_suite.expectations:
                 expectation.process_evaluation_parameters(
-                    evaluation_parameters=runtime_evaluation_parameters,
+                    evaluation_parameters=substitution_evaluation_parameters,
                     interactive_evaluation=self.interactive_evaluation,
                     data_context=self._data_context,
                 )
@@ -1952,10 +2073,13 @@ set as active.
                 catch_exceptions=catch_exceptions, result_format=result_format
             )
 
-            results = self.graph_validate(
-                configurations=expectations_to_evaluate,
-                runtime_configuration=runtime_configuration,
-            )
+            try:
+                results = self.graph_validate(
+                    configurations=expectations_to_evaluate,
+                    runtime_configuration=runtime_configuration,
+                )
+            finally:
+                self._execution_engine.release_persisted_data()
 
             if self._include_rendered_content:
                 for validation_result in results:
@@ -1,6 +1,8 @@
 import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from timeit import timeit
+from unittest import mock
 
 import dateutil
 import pandas
@@ -10,8 +12,11 @@ from great_expectations.core import ExpectationValidationResult
 from great_expectations.core.batch import RuntimeBatchRequest
 from great_expectations.core.evaluation_parameters import (
     _deduplicate_evaluation_parameter_dependencies,
+    _parse_ge_urn,
+    compile_evaluation_parameter_expression,
     find_evaluation_parameter_dependencies,
     parse_evaluation_parameter,
+    resolve_evaluation_parameter_urns,
 )
 from great_expectations.exceptions import DataContextError, EvaluationParameterError
 
@@ -187,6 +192,89 @@ def test_parser_timing():
     )
 
 
+@pytest.mark.unit
+def test_compile_evaluation_parameter_expression():
+    compiled = compile_evaluation_parameter_expression("x * 2 + 1")
+    assert compiled.parse_error is None
+    assert compiled.expr_stack == ("x", "2", "*", "1", "+")
+
+    # Compiled expressions are cached by expression text
+    assert compile_evaluation_parameter_expression("x * 2 + 1") is compiled
+
+    compiled = compile_evaluation_parameter_expression("1 +")
+    assert compiled.parse_result == ()
+    assert compiled.parse_error[1:] == ("1 +", 3)
+
+
+@pytest.mark.unit
+def test_parse_ge_urn_returns_shared_read_only_mappings():
+    urn = "urn:great_expectations:stores:my_query_store:col_count:a=1"
+    res = _parse_ge_urn(urn)
+    assert dict(res) == {
+        "urn_type": "stores",
+        "store_name": "my_query_store",
+        "metric_name": "col_count",
+        "metric_kwargs": "a=1",
+    }
+
+    # Parsed URNs are cached, so callers cannot modify them
+    assert _parse_ge_urn(urn) is res
+    with pytest.raises(TypeError):
+        res["store_name"] = "other_store"
+
+    assert _parse_ge_urn("not_a_urn") is None
+
+
+@pytest.mark.unit
+def test_parse_evaluation_parameter_is_thread_safe():
+    def parse(value: int) -> float:
+        return parse_evaluation_parameter("(x + 1) * 2 - y", {"x": value, "y": value})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parse, range(500)))
+
+    assert results == [value + 2 for value in range(500)]
+
+
+@pytest.mark.unit
+def test_resolve_evaluation_parameter_urns():
+    store = mock.Mock()
+    store.get_query_result.side_effect = lambda metric_name, metric_kwargs: {
+        "col_count": 10,
+        "dist_col_count": 4,
+    }[metric_name]
+    data_context = mock.Mock()
+    data_context.stores = {"my_query_store": store}
+
+    resolved_urns = resolve_evaluation_parameter_urns(
+        parameter_expressions=[
+            "urn:great_expectations:stores:my_query_store:col_count * 2",
+            "urn:great_expectations:stores:my_query_store:col_count - urn:great_expectations:stores:my_query_store:dist_col_count",
+            "urn:great_expectations:stores:my_query_store:col_count",
+            "urn:great_expectations:validations:my_suite:expect_table_row_count_to_be_between.result.observed_value",
+            "1 +",
+        ],
+        evaluation_parameters={
+            "urn:great_expectations:stores:my_query_store:dist_col_count": 5
+        },
+        data_context=data_context,
+    )
+
+    # Each store URN is queried once, and URNs already among the evaluation parameters are not queried
+    assert resolved_urns == {
+        "urn:great_expectations:stores:my_query_store:col_count": 10
+    }
+    store.get_query_result.assert_called_once_with("col_count", {})
+
+    assert (
+        parse_evaluation_parameter(
+            "urn:great_expectations:stores:my_query_store:col_count * 2",
+            evaluation_parameters=resolved_urns,
+        )
+        == 20
+    )
+
+
 @pytest.mark.unit
 def test_math_evaluation_paramaters():
     assert parse_evaluation_parameter("sin(2*PI)") == math.sin(math.pi * 2)
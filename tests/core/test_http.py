@@ -2,7 +2,11 @@ from typing import Dict
 
 import pytest
 
-from great_expectations.core.http import DEFAULT_TIMEOUT, create_session
+from great_expectations.core.http import (
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT,
+    create_session,
+)
 
 
 @pytest.mark.unit
@@ -31,3 +35,15 @@ def test_session_factory_contains_appropriate_adapters() -> None:
         retries = adapter.max_retries
         assert retries.total == retry_count
         assert retries.backoff_factor == backoff_factor
+        assert adapter._pool_maxsize == DEFAULT_POOL_MAXSIZE
+
+
+@pytest.mark.unit
+def test_session_factory_pool_maxsize() -> None:
+    session = create_session(
+        access_token="05f23701-d8e3-4c0a-8e38-2ad7bf16cb58", pool_maxsize=32
+    )
+
+    for adapter in session.adapters.values():
+        assert adapter._pool_maxsize == 32
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.hyperloglog import HyperLogLog, estimate_distinct_count
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("distinct_count", [1, 100, 10_000, 200_000])
+def test_estimate_distinct_count_is_within_error_bounds(distinct_count):
+    values = pd.Series(np.arange(distinct_count)).repeat(3)
+    sketch = HyperLogLog()
+    sketch.update(values)
+
+    assert abs(sketch.count() - distinct_count) <= max(
+        1, 3 * sketch.relative_standard_error * distinct_count
+    )
+
+
+@pytest.mark.unit
+def test_nulls_are_ignored_and_integral_floats_are_counted_as_integers():
+    assert estimate_distinct_count(pd.Series([1.0, 2.0, None, np.nan, 1])) == 2
+    assert estimate_distinct_count([1, 2, None, "a", "a"]) == 3
+    assert estimate_distinct_count([]) == 0
+
+    integers = HyperLogLog()
+    integers.update(pd.Series([1, 2, 3]))
+    floats = HyperLogLog()
+    floats.update(pd.Series([1.0, 2.0, 3.0, None]))
+    integers.merge(floats)
+    assert integers.count() == 3
+
+
+@pytest.mark.unit
+def test_merged_sketches_estimate_the_union():
+    first = HyperLogLog(precision=12)
+    first.update(pd.Series(np.arange(0, 60_000)))
+    second = HyperLogLog(precision=12)
+    second.update(pd.Series(np.arange(40_000, 100_000)))
+    first.merge(second)
+
+    assert abs(first.count() - 100_000) <= 3 * first.relative_standard_error * 100_000
+
+    with pytest.raises(ValueError):
+        first.merge(HyperLogLog(precision=14))
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=3)
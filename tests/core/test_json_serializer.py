@@ -0,0 +1,205 @@
+import datetime
+import json
+import uuid
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from marshmallow import ValidationError
+
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuite,
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+from great_expectations.core.expectation_suite import ExpectationSuiteSchema
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResultSchema,
+)
+from great_expectations.core.json_serializer import (
+    ExpectationSuiteJsonSerializer,
+    ExpectationSuiteValidationResultJsonSerializer,
+)
+from great_expectations.core.util import convert_to_json_serializable
+
+
+@pytest.fixture
+def expectation_suite() -> ExpectationSuite:
+    return ExpectationSuite(
+        expectation_suite_name="my_suite",
+        ge_cloud_id=str(uuid.uuid4()).upper(),
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={
+                    "column": "a",
+                    "value_set": [np.int64(1), 2, 3],
+                    "mostly": np.float64(0.95),
+                },
+                meta={"notes": "Ünïcödé"},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_table_row_count_to_be_between",
+                kwargs={"min_value": {"$PARAMETER": "urn:great_expectations:x"}},
+                ge_cloud_id=uuid.uuid4(),
+            ),
+        ],
+        evaluation_parameters={"x": np.float64(1.5), "when": datetime.date(2022, 1, 1)},
+        data_asset_type="Dataset",
+        meta={"great_expectations_version": "0.15.0", "nan": float("nan")},
+    )
+
+
+@pytest.fixture
+def expectation_suite_validation_result() -> ExpectationSuiteValidationResult:
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "a", "value_set": [1, 2, 3], "mostly": 0.95},
+            meta={"notes": "Ünïcödé"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 1},
+            ge_cloud_id=uuid.uuid4(),
+        ),
+    ]
+    return ExpectationSuiteValidationResult(
+        success=False,
+        results=[
+            ExpectationValidationResult(
+                success=bool(idx % 2),
+                expectation_config=expectation_configuration,
+                result={
+                    "element_count": np.int64(10),
+                    "unexpected_percent": np.float64(10.0),
+                    "partial_unexpected_list": [np.int64(4), None, "a", 1.5],
+                    "details": {1: float("nan")},
+                },
+                meta={"batch": datetime.datetime(2022, 1, 1).isoformat()},
+            )
+            for idx, expectation_configuration in enumerate(expectation_configurations)
+        ],
+        evaluation_parameters={"x": np.float64(1.5)},
+        statistics={"evaluated_expectations": np.int64(2), "success_percent": 50.0},
+        meta={
+            "expectation_suite_name": "my_suite",
+            "run_id": {"run_name": "my_run", "run_time": "20220101T000000.000000Z"},
+        },
+        ge_cloud_id=uuid.uuid4(),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dumps_kwargs",
+    [{}, {"indent": 2, "sort_keys": True}, {"separators": (",", ":")}],
+)
+def test_expectation_suite_json_serializer_matches_schema(
+    expectation_suite: ExpectationSuite, dumps_kwargs: dict
+):
+    serializer = ExpectationSuiteJsonSerializer()
+    schema = ExpectationSuiteSchema()
+
+    assert serializer.dumps(expectation_suite, **dumps_kwargs) == schema.dumps(
+        expectation_suite, **dumps_kwargs
+    )
+
+    # Empty evaluation parameters and meta are removed by the schema.
+    expectation_suite.evaluation_parameters = {}
+    expectation_suite.meta = {}
+    assert serializer.dumps(expectation_suite) == schema.dumps(expectation_suite)
+
+    # Inputs other than ExpectationSuite objects are delegated to the schema.
+    expectation_suite_dict: dict = schema.dump(expectation_suite)
+    assert serializer.dump(expectation_suite_dict) == schema.dump(
+        expectation_suite_dict
+    )
+
+
+@pytest.mark.unit
+def test_expectation_suite_json_serializer_load_matches_schema(
+    expectation_suite: ExpectationSuite,
+):
+    serializer = ExpectationSuiteJsonSerializer()
+    schema = ExpectationSuiteSchema()
+
+    serialized_value: str = schema.dumps(expectation_suite)
+    expected: dict = schema.loads(serialized_value)
+    actual: dict = serializer.loads(serialized_value)
+
+    assert actual == expected
+    assert list(actual.keys()) == list(expected.keys())
+    assert isinstance(actual["ge_cloud_id"], uuid.UUID)
+    assert all(
+        isinstance(expectation, ExpectationConfiguration)
+        for expectation in actual["expectations"]
+    )
+
+    # Documents requiring validation are delegated to the schema (and rejected by it).
+    invalid_document: dict = json.loads(serialized_value)
+    invalid_document["unknown_field"] = 1
+    with pytest.raises(ValidationError):
+        serializer.load(invalid_document)
+
+    invalid_document = json.loads(serialized_value)
+    invalid_document["expectations"][0].pop("expectation_type")
+    with pytest.raises(ValidationError):
+        serializer.load(invalid_document)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dumps_kwargs",
+    [{}, {"indent": 2, "sort_keys": True}, {"separators": (",", ":")}],
+)
+def test_expectation_suite_validation_result_json_serializer_matches_schema(
+    expectation_suite_validation_result: ExpectationSuiteValidationResult,
+    dumps_kwargs: dict,
+):
+    serializer = ExpectationSuiteValidationResultJsonSerializer()
+    schema = ExpectationSuiteValidationResultSchema()
+
+    assert serializer.dumps(
+        expectation_suite_validation_result, **dumps_kwargs
+    ) == schema.dumps(expectation_suite_validation_result, **dumps_kwargs)
+
+
+@pytest.mark.unit
+def test_expectation_suite_validation_result_to_json_dict_matches_schema(
+    expectation_suite_validation_result: ExpectationSuiteValidationResult,
+):
+    # This is how "ExpectationSuiteValidationResult.to_json_dict()" used to build its output.
+    expected = deepcopy(expectation_suite_validation_result)
+    expected["evaluation_parameters"] = convert_to_json_serializable(
+        expected["evaluation_parameters"]
+    )
+    expected["statistics"] = convert_to_json_serializable(expected["statistics"])
+    expected["meta"] = convert_to_json_serializable(expected["meta"])
+    expected = ExpectationSuiteValidationResultSchema().dump(expected)
+
+    actual: dict = expectation_suite_validation_result.to_json_dict()
+
+    assert json.dumps(actual) == json.dumps(expected)
+
+
+@pytest.mark.unit
+def test_expectation_suite_validation_result_json_serializer_load_matches_schema(
+    expectation_suite_validation_result: ExpectationSuiteValidationResult,
+):
+    serializer = ExpectationSuiteValidationResultJsonSerializer()
+    schema = ExpectationSuiteValidationResultSchema()
+
+    serialized_value: str = schema.dumps(expectation_suite_validation_result)
+    expected: ExpectationSuiteValidationResult = schema.loads(serialized_value)
+    actual: ExpectationSuiteValidationResult = serializer.loads(serialized_value)
+
+    assert actual == expected
+    assert actual.to_json_dict() == expected.to_json_dict()
+
+    # Documents requiring validation are delegated to the schema (and rejected by it).
+    invalid_document: dict = json.loads(serialized_value)
+    invalid_document["results"][0]["success"] = "not a boolean"
+    with pytest.raises(ValidationError):
+        serializer.load(invalid_document)
@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+from great_expectations.core.sqlalchemy_engine_registry import (
+    SqlAlchemyEngineRegistry,
+)
+
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
+
+
+pytestmark = pytest.mark.skipif(sa is None, reason="sqlalchemy is not installed")
+
+
+@pytest.fixture
+def sqlite_url(tmp_path) -> str:
+    return f"sqlite:///{tmp_path / 'test.db'}"
+
+
+@pytest.mark.unit
+def test_engines_are_shared_by_url_and_options(sqlite_url: str):
+    registry = SqlAlchemyEngineRegistry()
+
+    engine = registry.get_engine(sqlite_url, pool_pre_ping=True)
+    assert registry.get_engine(sqlite_url, pool_pre_ping=True) is engine
+    assert (
+        registry.get_engine(sa.engine.url.make_url(sqlite_url), pool_pre_ping=True)
+        is engine
+    )
+    assert registry.get_engine(sqlite_url) is not engine
+    assert registry.get_engine(sqlite_url, pool_pre_ping=False) is not engine
+
+    # In-memory sqlite engines are distinct databases.
+    assert registry.get_engine("sqlite://") is not registry.get_engine("sqlite://")
+
+    # Options that cannot be compared prevent sharing.
+    creator_kwargs = {"creator": lambda: None}
+    assert registry.get_engine(sqlite_url, **creator_kwargs) is not registry.get_engine(
+        sqlite_url, **creator_kwargs
+    )
+
+
+@pytest.mark.unit
+def test_engines_are_disposed_of_once_released_by_all_users(sqlite_url: str):
+    registry = SqlAlchemyEngineRegistry()
+
+    engine = registry.get_engine(sqlite_url)
+    assert registry.get_engine(sqlite_url) is engine
+
+    registry.release_engine(engine)
+    assert registry.get_pool_statistics(engine) is not None
+
+    registry.release_engine(engine)
+    assert registry.get_pool_statistics(engine) is None
+    assert registry.get_engine(sqlite_url) is not engine
+
+
+@pytest.mark.unit
+def test_pool_statistics_record_checkouts(sqlite_url: str):
+    registry = SqlAlchemyEngineRegistry()
+    engine = registry.get_engine(sqlite_url)
+
+    def run_queries():
+        for _ in range(5):
+            with engine.connect() as connection:
+                assert connection.execute(sa.text("SELECT 1")).scalar() == 1
+
+    threads = [threading.Thread(target=run_queries) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    pool_statistics = registry.get_pool_statistics(engine)
+    assert pool_statistics.checkouts == 20
+    assert pool_statistics.max_wait_seconds >= pool_statistics.mean_wait_seconds > 0
+
+    # Checkouts from the pool that replaces the disposed one are still recorded.
+    engine.dispose()
+    run_queries()
+    assert pool_statistics.checkouts == 25
+    assert pool_statistics.to_json_dict()["checkouts"] == 25
@@ -0,0 +1,265 @@
+from typing import List
+
+import pytest
+
+from great_expectations.core.sqlalchemy_metadata_cache import (
+    SqlAlchemyMetadataCache,
+    sqlalchemy_metadata_cache,
+)
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.expectations.metrics.util import (
+    get_sqlalchemy_column_metadata,
+)
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy.dialects.postgresql.base import PGDialect
+except ImportError:
+    sa = None
+    PGDialect = None
+
+
+pytestmark = pytest.mark.skipif(sa is None, reason="sqlalchemy is not installed")
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path) -> "sa.engine.Engine":
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    engine.execute("CREATE TABLE table_1 (a INTEGER, b VARCHAR)")
+    engine.execute("CREATE TABLE table_2 (c FLOAT)")
+    engine.execute("CREATE VIEW view_1 AS SELECT a FROM table_1")
+    yield engine
+    engine.dispose()
+
+
+def _record_statements(engine: "sa.engine.Engine") -> List[str]:
+    statements: List[str] = []
+    sa.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+@pytest.mark.unit
+def test_metadata_is_cached_until_it_expires_or_is_invalidated(
+    sqlite_engine, monkeypatch
+):
+    cache = SqlAlchemyMetadataCache(ttl_seconds=60)
+    now: List[float] = [1000.0]
+    monkeypatch.setattr(
+        "great_expectations.core.sqlalchemy_metadata_cache.time.monotonic",
+        lambda: now[0],
+    )
+
+    assert cache.get_table_names(engine=sqlite_engine) == ["table_1", "table_2"]
+    assert [
+        column["name"]
+        for column in cache.get_columns(engine=sqlite_engine, table_name="table_1")
+    ] == ["a", "b"]
+
+    statements: List[str] = _record_statements(sqlite_engine)
+    sqlite_engine.execute("ALTER TABLE table_1 ADD COLUMN d INTEGER")
+    sqlite_engine.execute("CREATE TABLE table_3 (e INTEGER)")
+    statements.clear()
+
+    # Cached metadata does not reflect the changes, and is not looked up again.
+    assert cache.get_table_names(engine=sqlite_engine) == ["table_1", "table_2"]
+    columns = cache.get_columns(engine=sqlite_engine, table_name="table_1")
+    assert [column["name"] for column in columns] == ["a", "b"]
+    assert statements == []
+
+    # Callers cannot modify cached metadata.
+    columns[0]["name"] = "z"
+    columns.pop()
+    assert [
+        column["name"]
+        for column in cache.get_columns(engine=sqlite_engine, table_name="table_1")
+    ] == ["a", "b"]
+
+    cache.invalidate(engine=sqlite_engine, table_name="table_2")
+    assert cache.get_table_names(engine=sqlite_engine) == [
+        "table_1",
+        "table_2",
+        "table_3",
+    ]
+    assert [
+        column["name"]
+        for column in cache.get_columns(engine=sqlite_engine, table_name="table_1")
+    ] == ["a", "b"]
+
+    now[0] += 61
+    assert [
+        column["name"]
+        for column in cache.get_columns(engine=sqlite_engine, table_name="table_1")
+    ] == ["a", "b", "d"]
+
+
+@pytest.mark.unit
+def test_metadata_is_shared_by_connections_to_the_same_database(sqlite_engine):
+    cache = SqlAlchemyMetadataCache(ttl_seconds=60)
+    assert cache.get_schema_names(engine=sqlite_engine) == ["main"]
+
+    other_engine = sa.create_engine(sqlite_engine.url)
+    statements: List[str] = _record_statements(other_engine)
+    with other_engine.connect() as connection:
+        assert cache.get_schema_names(engine=connection) == ["main"]
+    assert statements == []
+
+
+@pytest.mark.unit
+def test_metadata_is_not_cached_for_in_memory_databases_or_without_ttl(
+    sqlite_engine,
+):
+    loads: List[int] = []
+
+    def loader() -> List[str]:
+        loads.append(1)
+        return ["main"]
+
+    cache = SqlAlchemyMetadataCache(ttl_seconds=60)
+    in_memory_engine = sa.create_engine("sqlite://")
+    for _ in range(2):
+        cache.get(engine=in_memory_engine, metadata_type="schema_names", loader=loader)
+    assert len(loads) == 2
+
+    # Caching is disabled by default, unless enabled for a database.
+    cache = SqlAlchemyMetadataCache()
+    for _ in range(2):
+        cache.get(engine=sqlite_engine, metadata_type="schema_names", loader=loader)
+    assert len(loads) == 4
+
+    cache.set_database_ttl_seconds(engine=sqlite_engine, ttl_seconds=60)
+    for _ in range(2):
+        cache.get(engine=sqlite_engine, metadata_type="schema_names", loader=loader)
+    assert len(loads) == 5
+
+    cache.set_database_ttl_seconds(engine=sqlite_engine, ttl_seconds=0)
+    cache.get(engine=sqlite_engine, metadata_type="schema_names", loader=loader)
+    assert len(loads) == 6
+
+
+@pytest.mark.unit
+def test_expired_and_oldest_entries_are_evicted(sqlite_engine, monkeypatch):
+    cache = SqlAlchemyMetadataCache(ttl_seconds=60, max_entries=10)
+    now: List[float] = [1000.0]
+    monkeypatch.setattr(
+        "great_expectations.core.sqlalchemy_metadata_cache.time.monotonic",
+        lambda: now[0],
+    )
+
+    def cache_columns(table_name: str) -> None:
+        cache.get_columns(
+            engine=sqlite_engine, table_name=table_name, loader=lambda: []
+        )
+
+    for idx in range(5):
+        cache_columns(table_name=f"table_{idx}")
+    now[0] += 61
+    for idx in range(5, 10):
+        cache_columns(table_name=f"table_{idx}")
+    assert len(cache._entries) == 10
+
+    # Expired entries are discarded when the cache is full, whether or not they are looked up again.
+    cache_columns(table_name="table_10")
+    assert len(cache._entries) == 6
+
+    for idx in range(11, 20):
+        cache_columns(table_name=f"table_{idx}")
+    assert len(cache._entries) <= 10
+    assert "table_19" in {key[-1] for key in cache._entries}
+
+    # Columns of temporary tables created for batches are not cached.
+    cache.clear()
+    cache_columns(table_name="ge_temp_0123abcd")
+    assert cache._entries == {}
+
+
+@pytest.mark.unit
+def test_execution_engine_enables_caching_for_its_database(sqlite_engine):
+    execution_engine = SqlAlchemyExecutionEngine(url=str(sqlite_engine.url))
+    assert [
+        column["name"]
+        for column in get_sqlalchemy_column_metadata(
+            engine=execution_engine.engine, table_selectable="table_1"
+        )
+    ] == ["a", "b"]
+    # Without "metadata_cache_ttl_seconds", columns are reflected every time.
+    sqlite_engine.execute("ALTER TABLE table_1 ADD COLUMN d INTEGER")
+    assert [
+        column["name"]
+        for column in get_sqlalchemy_column_metadata(
+            engine=execution_engine.engine, table_selectable="table_1"
+        )
+    ] == ["a", "b", "d"]
+    execution_engine.close()
+
+    execution_engine = SqlAlchemyExecutionEngine(
+        url=str(sqlite_engine.url), metadata_cache_ttl_seconds=60
+    )
+    try:
+        assert execution_engine.config["metadata_cache_ttl_seconds"] == 60
+        # Execution engines of sqlite databases hold a connection.
+        statements: List[str] = _record_statements(execution_engine.engine.engine)
+        num_statements: List[int] = []
+        for idx in range(2):
+            assert [
+                column["name"]
+                for column in get_sqlalchemy_column_metadata(
+                    engine=execution_engine.engine, table_selectable="table_1"
+                )
+            ] == ["a", "b", "d"]
+            num_statements.append(len(statements))
+            sqlite_engine.execute(f"ALTER TABLE table_1 ADD COLUMN e_{idx} INTEGER")
+
+        # Columns were reflected once, and then read from the cache.
+        assert num_statements[0] > 0
+        assert num_statements[1] == num_statements[0]
+    finally:
+        execution_engine.close()
+        sqlalchemy_metadata_cache.set_database_ttl_seconds(
+            engine=sqlite_engine, ttl_seconds=0
+        )
+        sqlalchemy_metadata_cache.invalidate(engine=sqlite_engine)
+
+
+@pytest.mark.unit
+def test_prefetch_columns(sqlite_engine):
+    cache = SqlAlchemyMetadataCache(ttl_seconds=60)
+    assert cache.prefetch_columns(engine=sqlite_engine) == 3
+
+    statements: List[str] = _record_statements(sqlite_engine)
+    assert [
+        column["name"]
+        for column in cache.get_columns(engine=sqlite_engine, table_name="view_1")
+    ] == ["a"]
+    assert [
+        column["name"]
+        for column in cache.get_columns(engine=sqlite_engine, table_name="table_2")
+    ] == ["c"]
+    assert statements == []
+
+
+@pytest.mark.unit
+def test_build_columns_from_information_schema_rows():
+    columns_by_table_name = (
+        SqlAlchemyMetadataCache._build_columns_from_information_schema_rows(
+            dialect=PGDialect(),
+            rows=[
+                ("table_1", "a", "integer", "NO", None),
+                ("table_1", "b", "character varying", "YES", "'x'::text"),
+                ("table_2", "c", "no_such_type", "YES", None),
+                ("table_2", "d", "integer", "YES", None),
+            ],
+        )
+    )
+
+    # Tables with types that cannot be mapped are left to be reflected individually.
+    assert list(columns_by_table_name) == ["table_1"]
+    columns = columns_by_table_name["table_1"]
+    assert [column["name"] for column in columns] == ["a", "b"]
+    assert isinstance(columns[0]["type"], sa.INTEGER)
+    assert isinstance(columns[1]["type"], sa.VARCHAR)
+    assert [column["nullable"] for column in columns] == [False, True]
+    assert columns[1]["default"] == "'x'::text"
@@ -29,6 +29,8 @@ class FakeAbstractDataContext(AbstractDataContext):
         self._datasource_store = StubDatasourceStore()
         self._variables: Optional[DataContextVariables] = None
         self._cached_datasources: dict = {}
+        self._substitutions_cache: dict = {}
+        self._config_substitution_cache: dict = {}
 
     def _init_variables(self):
         """Using EphemeralDataContextVariables to store in memory."""
@@ -0,0 +1,180 @@
+import datetime
+from typing import List
+
+import pytest
+
+from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.core.sqlalchemy_engine_registry import (
+    sqlalchemy_engine_registry,
+)
+from great_expectations.data_context.store import (
+    ColumnarMetricStoreBackend,
+    MetricStore,
+)
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+)
+from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.exceptions import InvalidConfigError
+
+try:
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+except ImportError:
+    sqlalchemy = None
+
+
+def _build_metric_key(
+    day: int,
+    metric_name: str = "column.mean",
+    metric_kwargs_id: str = "column=a",
+    data_asset_name: str = "asset",
+) -> ValidationMetricIdentifier:
+    return ValidationMetricIdentifier(
+        run_id=RunIdentifier(
+            run_name=f"run_{day}",
+            run_time=datetime.datetime(2022, 1, day, tzinfo=datetime.timezone.utc),
+        ),
+        data_asset_name=data_asset_name,
+        expectation_suite_identifier=ExpectationSuiteIdentifier("my.suite"),
+        metric_name=metric_name,
+        metric_kwargs_id=metric_kwargs_id,
+    )
+
+
+@pytest.fixture(params=["ColumnarMetricStoreBackend", "InMemoryStoreBackend"])
+def metric_store(request, tmp_path) -> MetricStore:
+    store_backend: dict = {"class_name": request.param}
+    if request.param == "ColumnarMetricStoreBackend":
+        store_backend["filepath"] = "uncommitted/metrics.db"
+
+    store: MetricStore = instantiate_class_from_config(
+        config={"class_name": "MetricStore", "store_backend": store_backend},
+        runtime_environment={"root_directory": str(tmp_path)},
+        config_defaults={"module_name": "great_expectations.data_context.store"},
+    )
+    store.set_many(
+        [(_build_metric_key(day=day), float(day)) for day in range(1, 11)]
+        + [
+            (_build_metric_key(day=day, data_asset_name="other_asset"), -1.0)
+            for day in range(1, 3)
+        ]
+        + [
+            (_build_metric_key(day=day, metric_name="column.max"), 100.0)
+            for day in range(1, 11)
+        ]
+        + [
+            (
+                _build_metric_key(
+                    day=day,
+                    metric_name="statistics.success_percent",
+                    metric_kwargs_id=None,
+                ),
+                50.0,
+            )
+            for day in range(1, 3)
+        ]
+    )
+    return store
+
+
+@pytest.mark.integration
+def test_columnar_metric_store_backend_get_set_and_list_keys(tmp_path):
+    store_backend = ColumnarMetricStoreBackend(
+        filepath=str(tmp_path / "metrics.db"), table_name="metrics"
+    )
+    key: tuple = _build_metric_key(day=1).to_fixed_length_tuple()
+    other_key: tuple = _build_metric_key(day=2).to_fixed_length_tuple()
+
+    store_backend.set(key, "1")
+    store_backend.set(key, "2")
+    store_backend.set_many([(other_key, "3")])
+    assert store_backend.get(key) == "2"
+    assert store_backend.has_key(key)
+    assert store_backend.get_many([other_key, ("a",) * 6, key]) == ["3", None, "2"]
+    assert store_backend.list_keys() == [key, other_key]
+    assert store_backend.list_keys(prefix=other_key[:2]) == [other_key]
+
+    store_backend.remove_key(key)
+    assert not store_backend.has_key(key)
+
+    # Stored values persist in the database file.
+    assert ColumnarMetricStoreBackend(
+        filepath=str(tmp_path / "metrics.db"), table_name="metrics"
+    ).list_keys() == [other_key]
+
+    with pytest.raises(InvalidConfigError):
+        ColumnarMetricStoreBackend(filepath="metrics.db")
+
+
+@pytest.mark.integration
+def test_columnar_metric_store_backend_close_releases_shared_engine(tmp_path):
+    filepath: str = str(tmp_path / "metrics.db")
+    store_backend = ColumnarMetricStoreBackend(filepath=filepath)
+    other_store: MetricStore = MetricStore(
+        store_backend={
+            "class_name": "ColumnarMetricStoreBackend",
+            "filepath": filepath,
+        }
+    )
+    # Store backends of the same database share the engine of the engine registry.
+    engine = store_backend.engine
+    assert other_store.store_backend.engine is engine
+
+    store_backend.close()
+    assert sqlalchemy_engine_registry.get_pool_statistics(engine) is not None
+
+    other_store.close()
+    assert sqlalchemy_engine_registry.get_pool_statistics(engine) is None
+
+    # Engines provided to store backends are not released.
+    provided_engine = sqlalchemy_engine_registry.get_engine(f"sqlite:///{filepath}")
+    ColumnarMetricStoreBackend(engine=provided_engine).close()
+    assert sqlalchemy_engine_registry.get_pool_statistics(provided_engine) is not None
+    sqlalchemy_engine_registry.release_engine(provided_engine)
+
+
+@pytest.mark.integration
+def test_metric_store_get_metric_history(metric_store):
+    history = metric_store.get_metric_history(
+        expectation_suite_name="my.suite",
+        metric_name="column.mean",
+        metric_kwargs_id="column=a",
+        data_asset_name="asset",
+    )
+    assert list(history["value"]) == [float(day) for day in range(1, 11)]
+    assert list(history["run_name"]) == [f"run_{day}" for day in range(1, 11)]
+    assert history["run_time"].iloc[0] == datetime.datetime(
+        2022, 1, 1, tzinfo=datetime.timezone.utc
+    )
+
+    last_values: List[float] = list(
+        metric_store.get_metric_history(
+            expectation_suite_name="my.suite",
+            metric_name="column.mean",
+            metric_kwargs_id="column=a",
+            data_asset_name="asset",
+            end_time=datetime.datetime(2022, 1, 9, tzinfo=datetime.timezone.utc),
+            limit=3,
+        )["value"]
+    )
+    assert last_values == [6.0, 7.0, 8.0]
+
+    history = metric_store.get_metric_history(
+        expectation_suite_name="my.suite",
+        metric_name="column.mean",
+        metric_kwargs_id="column=a",
+        start_time=datetime.datetime(2022, 1, 2, tzinfo=datetime.timezone.utc),
+        end_time=datetime.datetime(2022, 1, 3, tzinfo=datetime.timezone.utc),
+    )
+    assert sorted(history["value"]) == [-1.0, 2.0]
+
+    history = metric_store.get_metric_history(
+        expectation_suite_name="my.suite", metric_name="statistics.success_percent"
+    )
+    assert list(history["value"]) == [50.0, 50.0]
+    assert list(history["metric_kwargs_id"]) == ["__", "__"]
+
+    assert metric_store.get_metric_history(
+        expectation_suite_name="other_suite", metric_name="column.mean"
+    ).empty
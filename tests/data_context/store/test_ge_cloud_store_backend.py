@@ -10,12 +10,18 @@ matter here but we leverage an existing fixture to mimic the contents of request
 in production. The same logic applies to all UUIDs in this test.
 """
 
+import hashlib
+import http.server
+import json
+import threading
 from collections import OrderedDict
 from typing import Callable, Optional, Set, Union
 from unittest import mock
 
 import pytest
+import requests
 
+from great_expectations.core.async_executor import AsyncExecutor
 from great_expectations.data_context.store.ge_cloud_store_backend import (
     GeCloudRESTResource,
     GeCloudStoreBackend,
@@ -23,6 +29,7 @@ from great_expectations.data_context.store.ge_cloud_store_backend import (
     construct_url,
 )
 from great_expectations.data_context.types.base import CheckpointConfig
+from great_expectations.exceptions import StoreBackendError
 
 
 @pytest.fixture
@@ -197,7 +204,7 @@ def test_construct_json_payload(
             organization_id=organization_id,
             attributes_key=attributes_key,
             attributes_value=attributes_value,
-            **kwargs
+            **kwargs,
         )
         == expected
     )
@@ -409,3 +416,212 @@ def test_config_property_and_defaults(
         "module_name": "great_expectations.data_context.store.ge_cloud_store_backend",
         "suppress_store_backend_id": True,
     }
+
+
+@pytest.fixture
+def local_ge_cloud_server(ge_cloud_access_token: str):
+    """A local stand-in for the GE Cloud checkpoints API, which supports ETags and records the requests it receives."""
+    organization_id = "51379b8b-86d3-4fe7-84e9-e1a52f4a414c"
+    prefix = f"/organizations/{organization_id}/checkpoints"
+    checkpoints = {
+        f"checkpoint-{idx}": {
+            "id": f"checkpoint-{idx}",
+            "type": "checkpoint",
+            "attributes": {"checkpoint_config": {"name": f"my_checkpoint_{idx}"}},
+        }
+        for idx in range(5)
+    }
+    requests_received = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, *args) -> None:
+            pass
+
+        def _respond(self, status: int, payload: Optional[dict] = None) -> None:
+            body = json.dumps(payload).encode() if payload is not None else b""
+            self.send_response(status)
+            if payload is not None:
+                self.send_header("ETag", f'"{hashlib.md5(body).hexdigest()}"')
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            path = self.path.split("?")[0]
+            requests_received.append(("GET", path))
+            if path == prefix:
+                payload = {"data": list(checkpoints.values())}
+            elif path.startswith(f"{prefix}/") and path[len(prefix) + 1 :] in (
+                checkpoints
+            ):
+                payload = {"data": checkpoints[path[len(prefix) + 1 :]]}
+            else:
+                self._respond(404, {"errors": [{"detail": "Not found"}]})
+                return
+
+            body = json.dumps(payload).encode()
+            if (
+                self.headers.get("If-None-Match")
+                == f'"{hashlib.md5(body).hexdigest()}"'
+            ):
+                requests_received[-1] = ("GET (not modified)", path)
+                self._respond(304)
+            else:
+                self._respond(200, payload)
+
+        def do_PUT(self) -> None:
+            path = self.path.split("?")[0]
+            requests_received.append(("PUT", path))
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            checkpoint = json.loads(body)["data"]
+            checkpoints[checkpoint["id"]]["attributes"] = {
+                "checkpoint_config": checkpoint["attributes"]["checkpoint_config"]
+            }
+            self._respond(200, {"data": checkpoint})
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        store_backend = GeCloudStoreBackend(
+            ge_cloud_base_url=f"http://127.0.0.1:{server.server_address[1]}/",
+            ge_cloud_credentials={
+                "access_token": ge_cloud_access_token,
+                "organization_id": organization_id,
+            },
+            ge_cloud_resource_type=GeCloudRESTResource.CHECKPOINT,
+            max_concurrent_requests=4,
+        )
+        yield store_backend, requests_received
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.cloud
+@pytest.mark.unit
+def test_get_revalidates_cached_responses_with_etags(local_ge_cloud_server) -> None:
+    store_backend, requests_received = local_ge_cloud_server
+    key = (GeCloudRESTResource.CHECKPOINT, "checkpoint-1")
+
+    value = store_backend.get(key)
+    assert value["data"]["attributes"]["checkpoint_config"] == {
+        "name": "my_checkpoint_1"
+    }
+    # Callers may modify the values they get.
+    value["data"]["attributes"] = {}
+
+    assert store_backend.get(key)["data"]["attributes"]["checkpoint_config"] == {
+        "name": "my_checkpoint_1"
+    }
+    assert requests_received == [
+        (
+            "GET",
+            "/organizations/51379b8b-86d3-4fe7-84e9-e1a52f4a414c/checkpoints/checkpoint-1",
+        ),
+        (
+            "GET (not modified)",
+            "/organizations/51379b8b-86d3-4fe7-84e9-e1a52f4a414c/checkpoints/checkpoint-1",
+        ),
+    ]
+
+    # Writes invalidate the cached responses.
+    store_backend.set(key, {"name": "my_renamed_checkpoint_1"})
+    assert store_backend.get(key)["data"]["attributes"]["checkpoint_config"] == {
+        "name": "my_renamed_checkpoint_1"
+    }
+    assert [method for method, _ in requests_received[2:]] == ["PUT", "GET"]
+
+
+@pytest.mark.cloud
+@pytest.mark.unit
+def test_get_many_reads_resources_in_bulk(local_ge_cloud_server) -> None:
+    store_backend, requests_received = local_ge_cloud_server
+    # Listing the keys of the collection (5 checkpoints) reads it.
+    assert len(store_backend.list_keys()) == 5
+    keys = [
+        (GeCloudRESTResource.CHECKPOINT, "checkpoint-3"),
+        (GeCloudRESTResource.CHECKPOINT, "checkpoint-0"),
+        (GeCloudRESTResource.CHECKPOINT, "checkpoint-3"),
+        (GeCloudRESTResource.CHECKPOINT, "checkpoint-1"),
+    ]
+    del requests_received[:]
+
+    values = store_backend.get_many(keys)
+
+    assert values == [store_backend.get(key) for key in keys]
+    assert values[0]["data"] is not values[2]["data"]
+    assert requests_received[0] == (
+        "GET (not modified)",
+        "/organizations/51379b8b-86d3-4fe7-84e9-e1a52f4a414c/checkpoints",
+    )
+    assert len(requests_received) == 1 + len(keys)
+
+
+@pytest.mark.cloud
+@pytest.mark.unit
+def test_get_many_reads_few_resources_individually(local_ge_cloud_server) -> None:
+    store_backend, requests_received = local_ge_cloud_server
+    keys = [
+        (GeCloudRESTResource.CHECKPOINT, "checkpoint-3"),
+        (GeCloudRESTResource.CHECKPOINT, "checkpoint-missing"),
+    ]
+
+    # The size of the collection is not known yet, and both resources can be read concurrently.
+    values = store_backend.get_many(keys)
+    assert values == [store_backend.get(keys[0]), None]
+    assert sorted(path for _, path in requests_received) == [
+        "/organizations/51379b8b-86d3-4fe7-84e9-e1a52f4a414c/checkpoints/checkpoint-3",
+        "/organizations/51379b8b-86d3-4fe7-84e9-e1a52f4a414c/checkpoints/checkpoint-3",
+        "/organizations/51379b8b-86d3-4fe7-84e9-e1a52f4a414c/checkpoints/checkpoint-missing",
+    ]
+
+    # Two of the five resources of the collection are not worth reading it.
+    store_backend.list_keys()
+    del requests_received[:]
+    assert store_backend.get_many(keys) == values
+    assert (
+        "GET",
+        "/organizations/51379b8b-86d3-4fe7-84e9-e1a52f4a414c/checkpoints",
+    ) not in requests_received
+
+    # Other errors are not ignored.
+    with mock.patch.object(
+        store_backend, "_get_json", side_effect=requests.Timeout()
+    ), pytest.raises(StoreBackendError):
+        store_backend.get_many(keys)
+
+
+@pytest.mark.cloud
+@pytest.mark.unit
+def test_get_many_fetches_resources_concurrently(local_ge_cloud_server) -> None:
+    store_backend, requests_received = local_ge_cloud_server
+    keys = [
+        (GeCloudRESTResource.CHECKPOINT, "checkpoint-2"),
+        (GeCloudRESTResource.CHECKPOINT, "checkpoint-4"),
+    ]
+
+    with mock.patch.object(
+        GeCloudStoreBackend, "BULK_READ_RESOURCE_TYPES", set()
+    ), mock.patch(
+        "great_expectations.data_context.store.ge_cloud_store_backend.AsyncExecutor",
+        wraps=AsyncExecutor,
+    ) as mock_async_executor:
+        values = store_backend.get_many(keys)
+
+    assert [value["data"]["id"] for value in values] == [
+        "checkpoint-2",
+        "checkpoint-4",
+    ]
+    assert mock_async_executor.call_args.kwargs["max_workers"] == 2
+    assert sorted(requests_received) == [
+        (
+            "GET",
+            "/organizations/51379b8b-86d3-4fe7-84e9-e1a52f4a414c/checkpoints/checkpoint-2",
+        ),
+        (
+            "GET",
+            "/organizations/51379b8b-86d3-4fe7-84e9-e1a52f4a414c/checkpoints/checkpoint-4",
+        ),
+    ]
@@ -1,10 +1,17 @@
 import os
 
+import numpy as np
+import pandas as pd
 import pytest
 
 import tests.test_utils as test_utils
-from great_expectations.data_context.store.metric_store import MetricStore
+from great_expectations.core.metric import BatchMetricIdentifier
+from great_expectations.data_context.store.metric_store import (
+    BatchMetricStore,
+    MetricStore,
+)
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 @pytest.fixture(
@@ -112,6 +119,83 @@ def test_metric_store_deserialize() -> None:
     assert store.deserialize(value=value) == {"foo": "bar"}
 
 
+@pytest.mark.unit
+def test_batch_metric_store_get_and_set_metric_values() -> None:
+    store = BatchMetricStore()
+
+    def build_metric_configuration(
+        metric_name: str, batch_id: str = "my_batch_id"
+    ) -> MetricConfiguration:
+        return MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"batch_id": batch_id, "column": "a"},
+            metric_value_kwargs=None,
+        )
+
+    metric_configurations = [
+        build_metric_configuration("column.mean"),
+        build_metric_configuration("column.quantile_values"),
+        build_metric_configuration("column.value_counts"),
+        build_metric_configuration("column.min"),
+    ]
+    store.set_metric_values(
+        metric_configurations=metric_configurations,
+        resolved_metrics={
+            metric_configurations[0].id: np.float64(1.5),
+            metric_configurations[1].id: np.array([1, 2, 3]),
+            metric_configurations[2].id: pd.Series([2, 1], index=["x", "y"]),
+            metric_configurations[3].id: pd.Timestamp("2022-01-01"),
+        },
+        batch_fingerprints={"my_batch_id": 10},
+    )
+
+    # Values that would not be restored with their original type are not stored.
+    assert store.get_metric_values(
+        metric_configurations=metric_configurations
+        + [build_metric_configuration("column.mean", batch_id="other_batch_id")],
+        batch_fingerprints={"my_batch_id": 10, "other_batch_id": 10},
+    ) == {
+        metric_configurations[0].id: 1.5,
+        metric_configurations[1].id: [1, 2, 3],
+    }
+
+    # Values stored for different data of their Batch (e.g., to which rows were appended) are not looked up.
+    assert (
+        store.get_metric_values(
+            metric_configurations=metric_configurations,
+            batch_fingerprints={"my_batch_id": 11},
+        )
+        == {}
+    )
+
+    # Neither are the values of Batches without fingerprints (e.g., of runtime data) looked up or stored.
+    assert (
+        store.get_metric_values(
+            metric_configurations=metric_configurations, batch_fingerprints={}
+        )
+        == {}
+    )
+    store.set_metric_values(
+        metric_configurations=[
+            build_metric_configuration("column.mean", batch_id="runtime_batch_id")
+        ],
+        resolved_metrics={
+            build_metric_configuration(
+                "column.mean", batch_id="runtime_batch_id"
+            ).id: 1.0
+        },
+        batch_fingerprints={},
+    )
+    assert len(store.list_keys()) == 2
+
+    assert store.list_keys()[0] == BatchMetricIdentifier(
+        batch_id="my_batch_id",
+        metric_name="column.mean",
+        metric_domain_kwargs_id=metric_configurations[0].metric_domain_kwargs_id,
+        metric_value_kwargs_id=None,
+    )
+
+
 @pytest.mark.unit
 def test_evaluation_parameter_store_get_bind_params() -> None:
     pass
@@ -1,6 +1,9 @@
+from typing import Any, List, Tuple
+
 import pytest
 
 from great_expectations.core.configuration import AbstractConfig
+from great_expectations.core.data_context_key import DataContextVariableKey
 from great_expectations.data_context.store.store import Store
 
 
@@ -29,3 +32,45 @@ def test_store_deserialize() -> None:
     store = Store()
     value = {"a": "b"}
     assert store.deserialize(value) == value
+
+
+@pytest.mark.unit
+def test_store_get_many() -> None:
+    store = Store()
+    store._key_class = DataContextVariableKey
+    store.set(DataContextVariableKey(resource_name="a"), {"a": 1})
+    store.set(DataContextVariableKey(resource_name="b"), {"b": 2})
+
+    assert store.get_many(
+        [
+            DataContextVariableKey(resource_name="b"),
+            DataContextVariableKey(resource_name="missing"),
+            DataContextVariableKey(resource_name="a"),
+        ]
+    ) == [{"b": 2}, None, {"a": 1}]
+
+
+@pytest.mark.unit
+def test_store_set_many_uses_overridden_set() -> None:
+    class ValidatingStore(Store):
+        def __init__(self) -> None:
+            super().__init__()
+            self._key_class = DataContextVariableKey
+            self.set_items: List[Tuple[DataContextVariableKey, Any]] = []
+
+        def set(self, key: DataContextVariableKey, value: Any, **kwargs) -> None:
+            self.set_items.append((key, value))
+            super().set(key, {"validated": value}, **kwargs)
+
+    store = ValidatingStore()
+    items = [
+        (DataContextVariableKey(resource_name="a"), 1),
+        (DataContextVariableKey(resource_name="b"), 2),
+    ]
+    store.set_many(items)
+
+    assert store.set_items == items
+    assert store.get_many([key for key, _ in items]) == [
+        {"validated": 1},
+        {"validated": 2},
+    ]
@@ -1004,6 +1004,53 @@ def test_TupleS3StoreBackend_with_empty_prefixes():
     )
 
 
+@mock_s3
+@pytest.mark.integration
+def test_TupleS3StoreBackend_get_many_and_list_keys_with_prefix():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+    conn = boto3.client("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        bucket=bucket,
+        prefix=prefix,
+        filepath_prefix="validations",
+        filepath_suffix=".json",
+        max_concurrent_requests=4,
+    )
+    assert my_store.config["max_concurrent_requests"] == 4
+
+    for suite_name in ["suite_a", "suite_ab", "suite_b"]:
+        for run_name in ["run_1", "run_2"]:
+            my_store.set((suite_name, run_name), f"{suite_name}/{run_name}")
+
+    assert my_store.get_many(
+        [("suite_a", "run_2"), ("suite_missing", "run_1"), ("suite_b", "run_1")]
+    ) == ["suite_a/run_2", None, "suite_b/run_1"]
+    assert my_store.get_many([]) == []
+
+    # Only objects sharing the filepath of the key prefix are listed, but keys merely sharing a string prefix
+    # (e.g. "suite_ab") are not returned.
+    client = my_store._create_client()
+    paginator = client.get_paginator("list_objects_v2")
+    with patch.object(client, "get_paginator", return_value=paginator), patch.object(
+        paginator, "paginate", wraps=paginator.paginate
+    ) as mock_paginate:
+        assert sorted(my_store.list_keys(prefix=("suite_a",))) == [
+            ("suite_a", "run_1"),
+            ("suite_a", "run_2"),
+        ]
+        mock_paginate.assert_called_once_with(
+            Bucket=bucket, Prefix="this_is_a_test_prefix/validations/suite_a"
+        )
+
+    assert len(my_store.list_keys()) == 6
+    assert my_store.has_key(("suite_a", "run_1"))
+    assert not my_store.has_key(("suite_a", "run_3"))
+    assert not my_store.has_key(("suite", "run_1"))
+
+
 @mock_s3
 @pytest.mark.integration
 def test_TupleS3StoreBackend_with_s3_put_options():
@@ -1135,37 +1182,16 @@ def test_TupleGCSStoreBackend():
             b"aaa", content_type="text/html"
         )
 
-    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
-        mock_client = mock_gcs_client.return_value
-        mock_bucket = mock_client.bucket.return_value
-        mock_blob = mock_bucket.blob.return_value
-
-        my_store_with_no_filepath_template = TupleGCSStoreBackend(
-            filepath_template=None, bucket=bucket, prefix=prefix, project=project
-        )
-
-        my_store_with_no_filepath_template.set(
-            ("AAA",), b"aaa", content_encoding=None, content_type="image/png"
-        )
-
-        mock_gcs_client.assert_called_with("dummy-project")
-        mock_client.bucket.assert_called_with("leakybucket")
-        mock_bucket.blob.assert_called_with("this_is_a_test_prefix/AAA")
-        # mock_bucket.blob.assert_any_call("this_is_a_test_prefix/.ge_store_backend_id")
-        mock_blob.upload_from_string.assert_called_with(
-            b"aaa", content_type="image/png"
-        )
-
-    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
-
-        mock_client = mock_gcs_client.return_value
-        mock_bucket = mock_client.bucket.return_value
+        # The client is created once and then reused.
+        mock_gcs_client.reset_mock()
+        mock_client.reset_mock()
+        mock_bucket.reset_mock()
         mock_blob = mock_bucket.get_blob.return_value
         mock_str = mock_blob.download_as_string.return_value
 
         my_store.get(("BBB",))
 
-        mock_gcs_client.assert_called_once_with("dummy-project")
+        mock_gcs_client.assert_not_called()
         mock_client.bucket.assert_called_once_with("leakybucket")
         mock_bucket.get_blob.assert_called_once_with(
             "this_is_a_test_prefix/my_file_BBB"
@@ -1173,9 +1199,7 @@ def test_TupleGCSStoreBackend():
         mock_blob.download_as_string.assert_called_once()
         mock_str.decode.assert_called_once_with("utf-8")
 
-    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
-
-        mock_client = mock_gcs_client.return_value
+        mock_client.reset_mock()
 
         my_store.list_keys()
 
@@ -1183,6 +1207,17 @@ def test_TupleGCSStoreBackend():
             "leakybucket", prefix="this_is_a_test_prefix"
         )
 
+        # Listing keys with a key prefix narrows the listing down server-side.
+        mock_client.reset_mock()
+
+        my_store.list_keys(prefix=("BBB",))
+
+        mock_client.list_blobs.assert_called_once_with(
+            "leakybucket", prefix="this_is_a_test_prefix/my_file_BBB"
+        )
+
+        mock_client.reset_mock()
+
         my_store.remove_key("leakybucket")
 
         from google.cloud.exceptions import NotFound
@@ -1192,11 +1227,31 @@ def test_TupleGCSStoreBackend():
         except NotFound:
             pass
 
-    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
-        mock_gcs_client.side_effect = InvalidKeyError("Hi I am an InvalidKeyError")
+        mock_bucket.get_blob.return_value = None
         with pytest.raises(InvalidKeyError):
             my_store.get(("non_existent_key",))
 
+    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
+        mock_client = mock_gcs_client.return_value
+        mock_bucket = mock_client.bucket.return_value
+        mock_blob = mock_bucket.blob.return_value
+
+        my_store_with_no_filepath_template = TupleGCSStoreBackend(
+            filepath_template=None, bucket=bucket, prefix=prefix, project=project
+        )
+
+        my_store_with_no_filepath_template.set(
+            ("AAA",), b"aaa", content_encoding=None, content_type="image/png"
+        )
+
+        mock_gcs_client.assert_called_with("dummy-project")
+        mock_client.bucket.assert_called_with("leakybucket")
+        mock_bucket.blob.assert_called_with("this_is_a_test_prefix/AAA")
+        # mock_bucket.blob.assert_any_call("this_is_a_test_prefix/.ge_store_backend_id")
+        mock_blob.upload_from_string.assert_called_with(
+            b"aaa", content_type="image/png"
+        )
+
     run_id = RunIdentifier("my_run_id", datetime.datetime.utcnow())
     key = ValidationResultIdentifier(
         ExpectationSuiteIdentifier(expectation_suite_name="my_suite_name"),
@@ -1,4 +1,6 @@
 import datetime
+import gzip
+import os
 from unittest import mock
 
 import boto3
@@ -6,6 +8,7 @@ import pytest
 from freezegun import freeze_time
 from moto import mock_s3
 
+import great_expectations.exceptions as ge_exceptions
 import tests.test_utils as test_utils
 from great_expectations.core import ExpectationSuiteValidationResult
 from great_expectations.core.expectation_validation_result import (
@@ -103,6 +106,46 @@ def test_ValidationsStore_with_TupleS3StoreBackend():
     assert test_utils.validate_uuid4(my_store.store_backend_id)
 
 
+@freeze_time("09/26/2019 13:42:41")
+@mock_s3
+@pytest.mark.integration
+def test_ValidationsStore_with_compression_and_TupleS3StoreBackend():
+    bucket = "test_validation_store_bucket"
+    prefix = "test/prefix"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = ValidationsStore(
+        store_backend={
+            "class_name": "TupleS3StoreBackend",
+            "bucket": bucket,
+            "prefix": prefix,
+        },
+        compression="gzip",
+    )
+
+    ns_1 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(
+            expectation_suite_name="asset.quarantine",
+        ),
+        run_id="20191007T151224.1234Z_prod_100",
+        batch_identifier="batch_id",
+    )
+    my_store.set(ns_1, ExpectationSuiteValidationResult(success=True))
+    assert my_store.get(ns_1) == ExpectationSuiteValidationResult(
+        success=True, statistics={}, results=[]
+    )
+
+    s3_object = boto3.client("s3").get_object(
+        Bucket=bucket,
+        Key="test/prefix/asset/quarantine/20191007T151224.1234Z_prod_100/20190926T134241.000000Z/batch_id.json",
+    )
+    assert s3_object["ContentEncoding"] == "gzip"
+    assert s3_object["Body"].read().startswith(b"\x1f\x8b")
+
+
 @freeze_time("09/26/2019 13:42:41")
 @pytest.mark.integration
 def test_ValidationsStore_with_InMemoryStoreBackend():
@@ -252,6 +295,92 @@ def test_ValidationsStore_with_TupleFileSystemStoreBackend(tmp_path_factory):
     assert my_store.store_backend_id == my_store_duplicate.store_backend_id
 
 
+@pytest.mark.integration
+@freeze_time("09/26/2019 13:42:41")
+def test_ValidationsStore_with_compression_and_TupleFileSystemStoreBackend(
+    tmp_path_factory,
+):
+    path = str(
+        tmp_path_factory.mktemp(
+            "test_ValidationsStore_with_compression_and_TupleFileSystemStoreBackend__dir"
+        )
+    )
+    store_backend_config = {
+        "module_name": "great_expectations.data_context.store",
+        "class_name": "TupleFilesystemStoreBackend",
+        "base_directory": "my_store/",
+    }
+
+    ns_1 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-100",
+        batch_identifier="batch_id",
+    )
+    ns_2 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-200",
+        batch_identifier="batch_id",
+    )
+
+    # A Validation Result written before compression was enabled
+    plain_store = ValidationsStore(
+        store_backend=dict(store_backend_config),
+        runtime_environment={"root_directory": path},
+    )
+    plain_store.set(ns_1, ExpectationSuiteValidationResult(success=True))
+
+    compressed_store = ValidationsStore(
+        store_backend=dict(store_backend_config),
+        runtime_environment={"root_directory": path},
+        compression="gzip",
+        compact=True,
+    )
+    assert compressed_store.config["compression"] == "gzip"
+    assert compressed_store.config["compact"] is True
+
+    compressed_store.set(ns_2, ExpectationSuiteValidationResult(success=False))
+
+    with open(
+        os.path.join(
+            path,
+            "my_store",
+            compressed_store.store_backend._convert_key_to_filepath(ns_2.to_tuple()),
+        ),
+        "rb",
+    ) as infile:
+        contents: bytes = infile.read()
+    assert contents.startswith(b"\x1f\x8b")
+    decompressed: str = gzip.decompress(contents).decode("utf-8")
+    assert "\n" not in decompressed
+    assert decompressed.startswith('{"evaluation_parameters":{},')
+
+    # Both compressed and legacy plain objects are readable by either store
+    for store in (plain_store, compressed_store):
+        assert store.get(ns_1) == ExpectationSuiteValidationResult(
+            success=True, statistics={}, results=[]
+        )
+        assert store.get(ns_2) == ExpectationSuiteValidationResult(
+            success=False, statistics={}, results=[]
+        )
+
+    assert set(compressed_store.list_keys()) == {ns_1, ns_2}
+
+
+@pytest.mark.unit
+def test_ValidationsStore_with_invalid_compression():
+    with pytest.raises(ge_exceptions.StoreConfigurationError):
+        ValidationsStore(compression="lzma")
+
+    with pytest.raises(ge_exceptions.StoreConfigurationError):
+        ValidationsStore(
+            store_backend={
+                "class_name": "DatabaseStoreBackend",
+                "credentials": {"drivername": "sqlite"},
+            },
+            compression="gzip",
+        )
+
+
 @pytest.mark.filterwarnings(
     "ignore:String run_ids are deprecated*:DeprecationWarning:great_expectations.data_context.types.resource_identifiers"
 )
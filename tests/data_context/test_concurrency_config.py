@@ -29,3 +29,19 @@ def test_data_context_concurrency_property():
         )
     )
     assert data_context.concurrency.enabled
+
+
+def test_concurrency_max_database_query_concurrency():
+    assert ConcurrencyConfig().max_database_query_concurrency == 100
+
+    data_context_config = DataContextConfig(
+        concurrency={"enabled": True, "max_database_query_concurrency": 8}
+    )
+    assert data_context_config.concurrency.max_database_query_concurrency == 8
+    assert data_context_config.to_json_dict()["concurrency"] == {
+        "enabled": True,
+        "max_database_query_concurrency": 8,
+    }
+    assert DataContextConfig(concurrency={"enabled": True}).to_json_dict()[
+        "concurrency"
+    ] == {"enabled": True}
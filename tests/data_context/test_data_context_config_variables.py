@@ -2,6 +2,8 @@ import os
 import shutil
 from collections import OrderedDict
 
+from unittest import mock
+
 import pytest
 from ruamel.yaml import YAML
 
@@ -296,6 +298,91 @@ def test_runtime_environment_are_used_preferentially(tmp_path_factory, monkeypat
         del os.environ["replace_me"]
 
 
+def test_config_with_variables_substituted_is_memoized_until_inputs_change(
+    empty_data_context_with_config_variables, monkeypatch
+):
+    context = empty_data_context_with_config_variables
+
+    def _reader_options(config: DataContextConfig) -> dict:
+        return config.datasources["mydatasource"]["batch_kwargs_generators"][
+            "mygenerator"
+        ]["reader_options"]
+
+    config = context.get_config_with_variables_substituted()
+    assert _reader_options(config)["test_variable_sub3"] == "BAR"
+
+    # Unchanged inputs reuse the previously substituted config, which is handed out as a copy.
+    with mock.patch(
+        "great_expectations.data_context.data_context.abstract_data_context.substitute_all_config_variables"
+    ) as mock_substitute_all_config_variables:
+        assert (
+            context.get_config_with_variables_substituted().to_json_dict()
+            == config.to_json_dict()
+        )
+        assert context.get_config_with_variables_substituted() is not config
+    assert not mock_substitute_all_config_variables.called
+
+    _reader_options(config)["test_variable_sub3"] = "changed"
+    assert (
+        _reader_options(context.project_config_with_variables_substituted)[
+            "test_variable_sub3"
+        ]
+        == "BAR"
+    )
+
+    # Environment changes invalidate the cache.
+    monkeypatch.setenv("FOO", "BAZ")
+    config = context.get_config_with_variables_substituted()
+    assert _reader_options(config)["test_variable_sub3"] == "BAZ"
+
+    # Runtime environment changes invalidate the cache.
+    context.runtime_environment["replace_me_1"] = "from_runtime"
+    config = context.get_config_with_variables_substituted()
+    assert _reader_options(config)["test_variable_sub3"] == "from_runtime"
+    del context.runtime_environment["replace_me_1"]
+
+    # Config variable changes invalidate the cache.
+    context.save_config_variable("replace_me", "new_value")
+    config = context.get_config_with_variables_substituted()
+    assert _reader_options(config)["test_variable_sub1"] == "new_value"
+
+    # Changes to the project config made by the DataContext invalidate the cache.
+    context.add_store(
+        "my_expectations_store",
+        {
+            "class_name": "ExpectationsStore",
+            "store_backend": {"class_name": "InMemoryStoreBackend"},
+        },
+    )
+    config = context.get_config_with_variables_substituted()
+    assert "my_expectations_store" in config.stores
+
+    # So do changes to the top-level values of the project config.
+    context.variables.plugins_directory = "${FOO}"
+    config = context.get_config_with_variables_substituted()
+    assert config.plugins_directory == "BAZ"
+
+
+def test_config_section_with_variables_substituted(
+    empty_data_context_with_config_variables,
+):
+    context = empty_data_context_with_config_variables
+
+    datasources: dict = context.get_config_section_with_variables_substituted(
+        section="datasources"
+    )
+    assert datasources == context.get_config_with_variables_substituted().datasources
+    assert datasources["mydatasource"]["batch_kwargs_generators"]["mygenerator"][
+        "reader_options"
+    ]["test_variable_sub4"] == {"inner_env_sub": "BAR"}
+
+    # Sections are returned as copies, so that consumers cannot corrupt the cache.
+    datasources.pop("mydatasource")
+    assert "mydatasource" in context.get_config_section_with_variables_substituted(
+        section="datasources"
+    )
+
+
 def test_substitute_config_variable():
     config_variables_dict = {
         "arg0": "val_of_arg_0",
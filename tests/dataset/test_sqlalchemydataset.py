@@ -119,6 +119,75 @@ def test_sqlalchemydataset_raises_error_on_missing_table_name(sa):
     assert str(ve.value) == "No table_name provided."
 
 
+def test_defer_column_aggregates_computes_aggregates_in_a_single_query(sa):
+    engine = sa.create_engine("sqlite://")
+    data = pd.DataFrame(
+        {
+            "c1": [2, 2, 2, 2, 0],
+            "c2": [4, 4, 5, None, 7],
+            "c3": ["cat", "dog", "fish", "tiger", "elephant"],
+        }
+    )
+    data.to_sql(name="test_data", con=engine, index=False)
+    dataset = SqlAlchemyDataset("test_data", engine=engine)
+    reference_dataset = SqlAlchemyDataset("test_data", engine=engine)
+
+    queries = []
+    sa.event.listen(
+        dataset.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: queries.append(statement),
+    )
+
+    dataset.defer_column_aggregates(
+        aggregates=["nonnull_count", "unique_count", "min", "max", "mean", "sum"]
+    )
+    assert queries == []
+
+    for column in ["c1", "c2", "c3"]:
+        assert dataset.get_column_nonnull_count(
+            column
+        ) == reference_dataset.get_column_nonnull_count(column)
+        assert dataset.get_column_unique_count(
+            column
+        ) == reference_dataset.get_column_unique_count(column)
+    for column in ["c1", "c2"]:
+        assert dataset.get_column_min(column) == reference_dataset.get_column_min(
+            column
+        )
+        assert dataset.get_column_max(column) == reference_dataset.get_column_max(
+            column
+        )
+        assert dataset.get_column_mean(column) == reference_dataset.get_column_mean(
+            column
+        )
+        assert dataset.get_column_sum(column) == reference_dataset.get_column_sum(
+            column
+        )
+    assert len(queries) == 1
+
+    # Numeric aggregates are not deferred for non-numeric columns.
+    assert dataset.get_column_min("c3") == "cat"
+    assert len(queries) == 2
+
+    with pytest.raises(ValueError):
+        dataset.defer_column_aggregates(aggregates=["median"])
+
+
+def test_defer_column_aggregates_with_unsupported_aggregate(sa):
+    engine = sa.create_engine("sqlite://")
+    data = pd.DataFrame({"c1": [1, 2, 3], "c2": [4.0, 5.0, None]})
+    data.to_sql(name="test_data", con=engine, index=False)
+    dataset = SqlAlchemyDataset("test_data", engine=engine)
+
+    # sqlite has no "stddev_samp" function, which fails the wide query; the other aggregates are still batched.
+    dataset.defer_column_aggregates(aggregates=["max", "stdev"])
+    assert dataset.get_column_max("c1") == 3
+    assert dataset.get_column_max("c2") == 5.0
+    with pytest.raises(sa.exc.OperationalError):
+        dataset.get_column_stdev("c1")
+
+
 def test_sqlalchemydataset_builds_guid_for_table_name_on_custom_sql(sa):
     engine = sa.create_engine("sqlite://")
     with mock.patch("uuid.uuid4") as mock_uuid:
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Tuple
 
 import pandas as pd
 import pytest
@@ -7,6 +7,7 @@ import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchMarkers
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.execution_engine.execution_engine import BatchData
+from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -170,6 +171,69 @@ def test_add_column_row_condition_with_unsupported_no_column_provided(
         _ = e.add_column_row_condition({})
 
 
+def test_unload_batch_data(test_execution_engine):
+    e = test_execution_engine
+    e.load_batch_data(batch_id="1", batch_data=BatchData(execution_engine=e))
+    e.load_batch_data(batch_id="2", batch_data=BatchData(execution_engine=e))
+    assert e.active_batch_data_id == "2"
+
+    e.unload_batch_data(batch_id="2")
+    assert e.loaded_batch_data_ids == ["1"]
+    # With a single batch loaded, it becomes the active batch.
+    assert e.active_batch_data_id == "1"
+
+    e.unload_batch_data(batch_id="1")
+    assert e.loaded_batch_data_ids == []
+    assert e.active_batch_data_id is None
+
+
+def test_load_batch_data_lazily_with_max_loaded_batches():
+    loads: List[str] = []
+
+    def get_batch_data_loader(batch_id: str):
+        def load_batch_data() -> pd.DataFrame:
+            loads.append(batch_id)
+            return pd.DataFrame({"a": [len(loads)]})
+
+        return load_batch_data
+
+    engine = PandasExecutionEngine(max_loaded_batches=2)
+    assert engine.max_loaded_batches == 2
+    assert engine.config["max_loaded_batches"] == 2
+
+    engine.load_batch_data(batch_id="0", batch_data=pd.DataFrame({"a": [0]}))
+    for batch_id in ["1", "2", "3"]:
+        engine.load_batch_data_lazily(
+            batch_id=batch_id, batch_data_loader=get_batch_data_loader(batch_id)
+        )
+
+    # Registering batches does not load them.
+    assert engine.loaded_batch_data_ids == ["0", "1", "2", "3"]
+    assert engine.active_batch_data_id == "3"
+    assert loads == []
+
+    for batch_id in ["1", "2", "1", "3"]:
+        assert isinstance(engine.loaded_batch_data_dict[batch_id], PandasBatchData)
+    # Batch "2", the least recently used one, was unloaded when batch "3" was loaded.
+    assert loads == ["1", "2", "3"]
+    assert [
+        batch_id
+        for batch_id in engine.loaded_batch_data_ids
+        if engine.loaded_batch_data_dict.is_loaded(batch_id)
+    ] == ["0", "1", "3"]
+
+    # Unloaded batches are loaded again when they are needed.
+    assert engine.loaded_batch_data_dict["2"].dataframe["a"].tolist() == [4]
+    assert loads == ["1", "2", "3", "2"]
+    assert not engine.loaded_batch_data_dict.is_loaded("1")
+
+    engine.unload_batch_data(batch_id="2")
+    assert engine.loaded_batch_data_ids == ["0", "1", "3"]
+
+    with pytest.raises(ValueError):
+        PandasExecutionEngine(max_loaded_batches=0)
+
+
 def test_resolve_metrics_with_aggregates_and_column_map():
     # Testing resolve metric function for a variety of cases - test from test_core used
     df = pd.DataFrame({"a": [1, 2, 3, None]})
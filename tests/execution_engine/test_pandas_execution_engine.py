@@ -1,6 +1,8 @@
 import os
+from typing import List
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -15,6 +17,10 @@ except:
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.pandas_column_statistics import (
+    compute_column_statistics,
+)
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
     storage,
@@ -332,6 +338,44 @@ def test_get_compute_domain_with_row_condition():
     assert accessor_kwargs == {}, "Accessor kwargs have been modified"
 
 
+def test_get_row_condition_mask_combines_and_caches_conditions():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    row_conditions = [("b > 2", "pandas"), ("a < 4", "python")]
+    mask = engine.get_row_condition_mask(
+        data=df, batch_id="1234", row_conditions=row_conditions
+    )
+    assert mask.tolist() == [False, True, True, False]
+
+    # Masks are computed once per batch and conditions.
+    assert (
+        engine.get_row_condition_mask(
+            data=df, batch_id="1234", row_conditions=row_conditions
+        )
+        is mask
+    )
+    with mock.patch.object(pd.DataFrame, "eval") as mock_eval:
+        engine.get_domain_records(
+            domain_kwargs={"row_condition": "b > 2", "condition_parser": "pandas"}
+        )
+        mock_eval.assert_not_called()
+
+    # Replacing or releasing batches discards their masks.
+    engine.load_batch_data(batch_data=df.iloc[:2], batch_id="1234")
+    assert engine.get_domain_records(
+        domain_kwargs={"row_condition": "b > 2", "condition_parser": "pandas"}
+    )["a"].tolist() == [2]
+    engine.release_persisted_data()
+    assert (
+        engine.get_row_condition_mask(
+            data=df, batch_id="1234", row_conditions=row_conditions
+        )
+        is not mask
+    )
+
+
 # What happens when we filter such that no value meets the condition?
 def test_get_compute_domain_with_unmeetable_row_condition():
     engine = PandasExecutionEngine()
@@ -407,6 +451,108 @@ def test_resolve_metric_bundle():
     )
 
 
+def test_resolve_metrics_computes_column_statistics_of_columns_at_once():
+    df = pd.DataFrame(
+        {
+            "int_a": [3, 1, 2, 2, 7, -4],
+            "int_b": [10, 10, 10, 10, 10, 10],
+            "float_a": [1.5, None, 2.25, 2.25, -0.1, 1e10],
+            "float_b": [None, None, None, None, None, 1.0],
+            "float_c": [None] * 6,
+            "str_a": ["a", "bb", None, "", "dddd", "cc"],
+            "str_b": [None] * 6,
+            "mixed": ["a", 1, None, "b", "c", "d"],
+        }
+    ).astype({"float_c": "float64", "str_b": "object"})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+
+    metrics_to_resolve: List[MetricConfiguration] = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=metric_value_kwargs,
+            metric_dependencies={"table.columns": table_columns_metric},
+        )
+        for column in ["int_a", "int_b", "float_a", "float_b", "float_c"]
+        for metric_name, metric_value_kwargs in [
+            ("column.min", None),
+            ("column.max", None),
+            ("column.sum", None),
+            ("column.mean", None),
+            ("column.median", None),
+            ("column.standard_deviation", None),
+            ("column.distinct_values.count", None),
+            (
+                "column.quantile_values",
+                {"quantiles": [0.0, 0.25, 0.5, 1.0], "allow_relative_error": None},
+            ),
+            (
+                "column.quantile_values",
+                {"quantiles": [0.1, 0.9], "allow_relative_error": "linear"},
+            ),
+        ]
+    ] + [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=None,
+            metric_dependencies={"table.columns": table_columns_metric},
+        )
+        for column in ["str_a", "str_b"]
+        for metric_name in ["column_values.length.min", "column_values.length.max"]
+    ]
+
+    with mock.patch(
+        "great_expectations.execution_engine.pandas_execution_engine.compute_column_statistics",
+        wraps=compute_column_statistics,
+    ) as mock_compute_column_statistics:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=metrics_to_resolve, metrics=results
+        )
+
+    assert mock_compute_column_statistics.call_count == 1
+    assert len(results) == len(metrics_to_resolve)
+    assert compute_column_statistics(
+        df=df, metric_configurations=metrics_to_resolve
+    ).keys() == {metric_to_resolve.id for metric_to_resolve in metrics_to_resolve}
+
+    # The statistics are those computed column by column.
+    expected_results: dict = ExecutionEngine.resolve_metrics(
+        PandasExecutionEngine(batch_data_dict={"my_id": df}),
+        metrics_to_resolve=metrics_to_resolve,
+        metrics={table_columns_metric.id: list(df.columns)},
+    )
+    assert len(expected_results) == len(metrics_to_resolve)
+    for metric_id, expected_value in expected_results.items():
+        value = results[metric_id]
+        assert type(value) == type(expected_value), metric_id
+        if isinstance(expected_value, list):
+            np.testing.assert_array_equal(value, expected_value)
+        else:
+            assert value == expected_value or (
+                np.isnan(value) and np.isnan(expected_value)
+            ), metric_id
+
+    # Lengths of values other than strings are computed (and fail) column by column.
+    with pytest.raises(ge_exceptions.MetricResolutionError):
+        engine.resolve_metrics(
+            metrics_to_resolve=[
+                metrics_to_resolve[-1],
+                MetricConfiguration(
+                    metric_name="column_values.length.max",
+                    metric_domain_kwargs={"column": "mixed"},
+                    metric_value_kwargs=None,
+                    metric_dependencies={"table.columns": table_columns_metric},
+                ),
+            ],
+            metrics={table_columns_metric.id: list(df.columns)},
+        )
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
 def test_resolve_metric_bundle_with_nonexistent_metric():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
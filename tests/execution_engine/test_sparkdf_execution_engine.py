@@ -552,6 +552,113 @@ def test_get_compute_domain_with_unmeetable_row_condition(
     assert accessor_kwargs == {}
 
 
+def test_get_domain_records_persists_batch_and_reused_domain_records(
+    spark_session, basic_spark_df_execution_engine, spark_df_from_pandas_df
+):
+    pd_df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    df = spark_df_from_pandas_df(spark_session, pd_df)
+
+    engine = basic_spark_df_execution_engine
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+    assert not df.is_cached
+
+    data = engine.get_domain_records(domain_kwargs={})
+    assert data is df
+    assert df.storageLevel == pyspark.StorageLevel.MEMORY_AND_DISK
+
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "spark"}
+    filtered_data = engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert not filtered_data.is_cached
+
+    # Filtered domain records are persisted once they are reused.
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs) is filtered_data
+    assert filtered_data.is_cached
+    assert (
+        engine.get_domain_records(domain_kwargs={**domain_kwargs, "column": "a"})
+        is not filtered_data
+    )
+
+    engine.release_persisted_data(domain_records_only=True)
+    assert not filtered_data.is_cached
+    assert df.is_cached
+
+    engine.unload_batch_data(batch_id="1234")
+    assert not df.is_cached
+    assert engine.loaded_batch_data_ids == []
+
+
+def test_get_row_condition_filter_combines_and_caches_conditions(
+    spark_session, basic_spark_df_execution_engine
+):
+    engine = basic_spark_df_execution_engine
+    filter_conditions = [
+        RowCondition(
+            condition="b IS NOT NULL", condition_type=RowConditionParserType.SPARK_SQL
+        )
+    ]
+
+    row_condition_filter = engine._get_row_condition_filter(
+        row_condition='col("a")<2',
+        condition_parser="great_expectations__experimental__",
+        filter_conditions=filter_conditions,
+    )
+    assert str(row_condition_filter) in [
+        "Column<b'((a < 2) AND (b IS NOT NULL))'>",
+        "Column<'((a < 2) AND (b IS NOT NULL))'>",
+    ]
+    assert (
+        engine._get_row_condition_filter(
+            row_condition='col("a")<2',
+            condition_parser="great_expectations__experimental__",
+            filter_conditions=filter_conditions,
+        )
+        is row_condition_filter
+    )
+
+    assert (
+        engine._get_row_condition_filter(
+            row_condition=None, condition_parser=None, filter_conditions=[]
+        )
+        is None
+    )
+
+    with pytest.raises(ge_exceptions.GreatExpectationsError):
+        engine._get_row_condition_filter(
+            row_condition="a < 2", condition_parser="pandas", filter_conditions=[]
+        )
+
+
+def test_get_domain_records_does_not_persist_when_disabled(
+    spark_session, spark_df_from_pandas_df
+):
+    pd_df = pd.DataFrame({"a": [1, 2, 3, 4]})
+    df = spark_df_from_pandas_df(spark_session, pd_df)
+
+    engine = SparkDFExecutionEngine(
+        persist=False,
+        spark_config=dict(spark_session.sparkContext.getConf().getAll()),
+    )
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+
+    engine.get_domain_records(domain_kwargs={})
+    assert not df.is_cached
+
+
+def test_persist_storage_level(spark_session):
+    engine = SparkDFExecutionEngine(
+        persist_storage_level="disk_only",
+        spark_config=dict(spark_session.sparkContext.getConf().getAll()),
+    )
+    assert engine._storage_level == pyspark.StorageLevel.DISK_ONLY
+    assert engine.config["persist_storage_level"] == "disk_only"
+
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        SparkDFExecutionEngine(
+            persist_storage_level="NOT_A_STORAGE_LEVEL",
+            spark_config=dict(spark_session.sparkContext.getConf().getAll()),
+        )
+
+
 def test_basic_setup(
     spark_session, basic_spark_df_execution_engine, spark_df_from_pandas_df
 ):
@@ -1,16 +1,21 @@
 import logging
 import os
+from typing import List, Tuple
 
 import pandas as pd
 import pytest
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.batch import Batch
 from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
     SqlAlchemyDatasourceBatchSpec,
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.execution_engine.bundled_metric_configuration import (
+    BundledMetricConfiguration,
+)
 from great_expectations.execution_engine.sqlalchemy_dialect import GESqlDialect
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
@@ -71,6 +76,44 @@ def test_instantiation_via_url(sa):
     )
 
 
+def test_instantiation_via_url_of_connection_holding_dialect_does_not_share_engine(
+    sa,
+):
+    db_file = file_relative_path(
+        __file__,
+        os.path.join("..", "test_sets", "test_cases_for_sql_data_connector.db"),
+    )
+    # Execution engines of sqlite databases hold a connection, so that sharing their engines (and connection pools)
+    # would exhaust the pools.
+    execution_engines: List[SqlAlchemyExecutionEngine] = [
+        SqlAlchemyExecutionEngine(url="sqlite:///" + db_file, pool_pre_ping=True)
+        for _ in range(20)
+    ]
+    assert all(
+        execution_engine._registered_engine is None
+        and execution_engine.pool_statistics is None
+        for execution_engine in execution_engines
+    )
+    assert (
+        len({id(execution_engine.engine) for execution_engine in execution_engines})
+        == 20
+    )
+
+    execution_engines[0].close()
+    execution_engine: SqlAlchemyExecutionEngine = execution_engines[1]
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(
+            table_name="table_partitioned_by_date_column__A",
+            sampling_method="_sample_using_limit",
+            sampling_kwargs={"n": 5},
+        )
+    )
+    execution_engine.load_batch_data("__", batch_data)
+    assert len(Validator(execution_engine).head(fetch_all=True)) == 5
+    for execution_engine in execution_engines[1:]:
+        execution_engine.close()
+
+
 @pytest.mark.integration
 def test_instantiation_via_url_and_retrieve_data_with_other_dialect(sa):
     """Ensure that we can still retrieve data when the dialect is not recognized."""
@@ -859,6 +902,96 @@ def test_resolve_metric_bundle_with_compute_domain_kwargs_json_serialization(sa)
         assert False, str(e)
 
 
+def test_resolve_metric_bundle_of_domains_of_same_batch_with_one_query(sa, monkeypatch):
+    def resolve_metric_bundle() -> Tuple[dict, int]:
+        engine = build_sa_engine(
+            pd.DataFrame(
+                {
+                    "a": [1, 2, 3, 4, 5, 6],
+                    "b": [6, 5, 4, None, 2, 2],
+                    "g": [1, 1, 2, 2, 3, 3],
+                }
+            ),
+            sa,
+            batch_id="1234",
+        )
+
+        g_is_1: dict = {
+            "row_condition": 'col("g")==1',
+            "condition_parser": "great_expectations__experimental__",
+        }
+        g_is_not_1: dict = {
+            "row_condition": 'col("g")>1',
+            "condition_parser": "great_expectations__experimental__",
+        }
+        column_pair: dict = {
+            "column_A": "a",
+            "column_B": "b",
+            "ignore_row_if": "either_value_is_missing",
+        }
+        metric_fn_bundle: List[BundledMetricConfiguration] = [
+            BundledMetricConfiguration(
+                metric_configuration=MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs={"batch_id": "1234", **domain_kwargs},
+                    metric_value_kwargs=None,
+                ),
+                metric_fn=metric_fn,
+                compute_domain_kwargs={"batch_id": "1234", **domain_kwargs},
+                accessor_domain_kwargs={},
+                metric_provider_kwargs={},
+            )
+            for metric_name, domain_kwargs, metric_fn in [
+                ("max", {}, sa.func.max(sa.column("a"))),
+                ("count", {}, sa.func.count()),
+                ("max", g_is_1, sa.func.max(sa.column("a"))),
+                ("count", g_is_1, sa.func.count()),
+                ("distinct_count", g_is_1, sa.func.count(sa.distinct(sa.column("b")))),
+                ("sum", g_is_not_1, sa.func.sum(sa.column("a"))),
+                # Aggregates that may not ignore NULL values are computed with scalar subqueries.
+                ("total", g_is_not_1, sa.func.total(sa.column("a"))),
+                ("count", column_pair, sa.func.count()),
+                (
+                    "distinct_count",
+                    column_pair,
+                    sa.func.count(sa.distinct(sa.column("b"))),
+                ),
+            ]
+        ]
+
+        statements: List[str] = []
+        sa.event.listen(
+            engine.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        results: dict = engine.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
+        metric_values: dict = {
+            (
+                bundled_metric_configuration.metric_configuration.metric_name,
+                bundled_metric_configuration.metric_configuration.metric_domain_kwargs_id,
+            ): results[bundled_metric_configuration.metric_configuration.id]
+            for bundled_metric_configuration in metric_fn_bundle
+        }
+        return metric_values, len(statements)
+
+    metric_values: dict
+    num_queries: int
+    metric_values, num_queries = resolve_metric_bundle()
+    assert num_queries == 1
+    assert sorted(metric_values.values()) == [2, 2, 2, 4, 5, 6, 6, 18, 18.0]
+
+    monkeypatch.setattr(
+        SqlAlchemyExecutionEngine,
+        "_resolve_batch_domain_queries",
+        lambda self, queries, resolved_metrics: queries,
+    )
+    expected_metric_values: dict
+    expected_metric_values, num_queries = resolve_metric_bundle()
+    assert num_queries == 4
+    assert metric_values == expected_metric_values
+
+
 def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
         engine=sqlite_view_engine
@@ -933,3 +1066,334 @@ def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
     )
 
     validate_tmp_tables()
+
+
+@pytest.mark.parametrize("create_temp_table", [True, False])
+def test_resolve_metrics_of_batches_split_from_same_table_with_one_query(
+    sa, monkeypatch, create_temp_table
+):
+    df = pd.DataFrame(
+        {
+            "date": [
+                "2020-01-05",
+                "2020-01-20",
+                "2020-02-11",
+                "2020-03-01",
+                "2020-03-02",
+                "2020-03-31",
+            ],
+            "value": [1, 5, 3, 7, 2, 4],
+        }
+    )
+
+    def resolve_max_and_row_count(group_batches: bool) -> Tuple[dict, int]:
+        engine = sa.create_engine("sqlite://")
+        execution_engine = SqlAlchemyExecutionEngine(
+            engine=engine, create_temp_table=create_temp_table
+        )
+        if not group_batches:
+            monkeypatch.setattr(
+                execution_engine,
+                "_resolve_multi_batch_queries",
+                lambda queries, resolved_metrics: queries,
+            )
+        df.to_sql("test_table", con=execution_engine.engine, index=False)
+
+        metrics_to_resolve: List[MetricConfiguration] = []
+
+        table_columns_metric: MetricConfiguration
+        metrics: dict
+
+        # The batch of April does not have any rows.
+        for month in [1, 2, 3, 4]:
+            batch_id: str = f"batch_{month}"
+            batch_data, _ = execution_engine.get_batch_data_and_markers(
+                batch_spec=SqlAlchemyDatasourceBatchSpec(
+                    table_name="test_table",
+                    splitter_method="split_on_year_and_month",
+                    splitter_kwargs={"column_name": "date"},
+                    batch_identifiers={"date": {"year": 2020, "month": month}},
+                )
+            )
+            execution_engine.load_batch_data(batch_id=batch_id, batch_data=batch_data)
+            table_columns_metric, metrics = get_table_columns_metric(
+                engine=execution_engine
+            )
+            metrics_to_resolve.extend(
+                [
+                    MetricConfiguration(
+                        metric_name="column.max",
+                        metric_domain_kwargs={"column": "value", "batch_id": batch_id},
+                        metric_value_kwargs=None,
+                        metric_dependencies={
+                            "metric_partial_fn": MetricConfiguration(
+                                metric_name="column.max.aggregate_fn",
+                                metric_domain_kwargs={
+                                    "column": "value",
+                                    "batch_id": batch_id,
+                                },
+                                metric_value_kwargs=None,
+                                metric_dependencies={
+                                    "table.columns": table_columns_metric,
+                                },
+                            ),
+                            "table.columns": table_columns_metric,
+                        },
+                    ),
+                    MetricConfiguration(
+                        metric_name="table.row_count",
+                        metric_domain_kwargs={"batch_id": batch_id},
+                        metric_value_kwargs=None,
+                        metric_dependencies={
+                            "metric_partial_fn": MetricConfiguration(
+                                metric_name="table.row_count.aggregate_fn",
+                                metric_domain_kwargs={"batch_id": batch_id},
+                                metric_value_kwargs=None,
+                            ),
+                        },
+                    ),
+                ]
+            )
+
+        metric_configuration: MetricConfiguration
+        metrics.update(
+            execution_engine.resolve_metrics(
+                metrics_to_resolve=[
+                    metric_configuration.metric_dependencies["metric_partial_fn"]
+                    for metric_configuration in metrics_to_resolve
+                ],
+                metrics=metrics,
+            )
+        )
+
+        statements: List[str] = []
+        sa.event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        metrics.update(
+            execution_engine.resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve, metrics=metrics
+            )
+        )
+        metric_values: dict = {
+            f"{metric_configuration.metric_domain_kwargs['batch_id']}.{metric_configuration.metric_name}": metrics[
+                metric_configuration.id
+            ]
+            for metric_configuration in metrics_to_resolve
+        }
+        return metric_values, len(statements)
+
+    expected_metric_values: dict
+    num_queries: int
+    expected_metric_values, num_queries = resolve_max_and_row_count(group_batches=False)
+    assert num_queries == 4
+    assert expected_metric_values == {
+        "batch_1.column.max": 5,
+        "batch_1.table.row_count": 2,
+        "batch_2.column.max": 3,
+        "batch_2.table.row_count": 1,
+        "batch_3.column.max": 7,
+        "batch_3.table.row_count": 3,
+        "batch_4.column.max": None,
+        "batch_4.table.row_count": 0,
+    }
+
+    metric_values: dict
+    metric_values, num_queries = resolve_max_and_row_count(group_batches=True)
+    # One query grouping the rows of all batches (of the source table, even for batches copied to temporary tables) by
+    # year and month, and one query for the batch without rows.
+    assert num_queries == 2
+    assert metric_values == expected_metric_values
+
+
+def test_get_split_keys():
+    split_keys = SqlAlchemyExecutionEngine._get_split_keys(
+        split_clause=sqlalchemy.and_(
+            sqlalchemy.column("a") == 1, sqlalchemy.column("b") == "x"
+        )
+    )
+    assert [(str(expression), value) for expression, value in split_keys] == [
+        ("a", 1),
+        ("b", "x"),
+    ]
+
+    assert SqlAlchemyExecutionEngine._get_split_keys(split_clause=None) is None
+    assert SqlAlchemyExecutionEngine._get_split_keys(split_clause=True) is None
+    assert (
+        SqlAlchemyExecutionEngine._get_split_keys(
+            split_clause=sqlalchemy.column("a") > 1
+        )
+        is None
+    )
+    assert (
+        SqlAlchemyExecutionEngine._get_split_keys(
+            split_clause=sqlalchemy.or_(
+                sqlalchemy.column("a") == 1, sqlalchemy.column("a") == 2
+            )
+        )
+        is None
+    )
+
+
+def test_temporary_tables_of_unloaded_batches_are_dropped(sa):
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sa.create_engine("sqlite://"), max_loaded_batches=1
+    )
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql(
+        "test_table", con=execution_engine.engine, index=False
+    )
+
+    def get_batch_data_loader(value: int):
+        def load_batch_data():
+            batch_data, _ = execution_engine.get_batch_data_and_markers(
+                batch_spec=SqlAlchemyDatasourceBatchSpec(
+                    table_name="test_table",
+                    splitter_method="split_on_column_value",
+                    splitter_kwargs={"column_name": "a"},
+                    batch_identifiers={"a": value},
+                )
+            )
+            return batch_data
+
+        return load_batch_data
+
+    for value in [1, 2, 3]:
+        execution_engine.load_batch_data_lazily(
+            batch_id=str(value), batch_data_loader=get_batch_data_loader(value)
+        )
+
+    temp_table_names: set = set()
+    for batch_id in ["1", "2", "3", "1"]:
+        temp_table_name: str = execution_engine.loaded_batch_data_dict[
+            batch_id
+        ].temp_table_name
+        assert temp_table_name is not None
+        temp_table_names.add(temp_table_name)
+        # Only the temporary table of the loaded batch remains.
+        assert get_sqlite_temp_table_names(execution_engine.engine) == {temp_table_name}
+
+    # Batch "1" got a new temporary table when it was loaded again.
+    assert len(temp_table_names) == 4
+
+    # Loading the same batch data again does not drop its temporary table.
+    batch_data = execution_engine.loaded_batch_data_dict["1"]
+    execution_engine.load_batch_data(batch_id="1", batch_data=batch_data)
+    assert get_sqlite_temp_table_names(execution_engine.engine) == {
+        batch_data.temp_table_name
+    }
+
+    execution_engine.unload_batch_data(batch_id="1")
+    assert get_sqlite_temp_table_names(execution_engine.engine) == set()
+
+
+def test_batches_referenced_after_being_unloaded_are_loaded_again(sa):
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sa.create_engine("sqlite://"), max_loaded_batches=1
+    )
+    pd.DataFrame({"a": [1, 2, 2]}).to_sql(
+        "test_table", con=execution_engine.engine, index=False
+    )
+
+    # Batches are loaded lazily in the same way as by Datasource.get_batch_list_from_batch_request().
+    batches: List[Batch] = []
+    for value in [1, 2]:
+        batch_spec = SqlAlchemyDatasourceBatchSpec(
+            table_name="test_table",
+            splitter_method="split_on_column_value",
+            splitter_kwargs={"column_name": "a"},
+            batch_identifiers={"a": value},
+        )
+        batch = Batch(
+            data=None,
+            batch_spec=batch_spec,
+            batch_data_loader=lambda batch_spec=batch_spec: execution_engine.get_batch_data_and_markers(
+                batch_spec=batch_spec
+            ),
+        )
+        execution_engine.load_batch_data_lazily(
+            batch_id=str(value),
+            batch_data_loader=lambda batch=batch: batch.data,
+            batch_spec=batch_spec,
+        )
+        batches.append(batch)
+
+    def get_row_count(batch_id: str) -> int:
+        selectable = execution_engine.loaded_batch_data_dict[batch_id].selectable
+        return execution_engine.engine.execute(
+            sa.select([sa.func.count()]).select_from(selectable)
+        ).scalar()
+
+    # The data of batch "1" is still referenced after it is unloaded (which drops its temporary table).
+    batch_data = execution_engine.loaded_batch_data_dict["1"]
+    assert get_row_count(batch_id="1") == 1
+    assert get_row_count(batch_id="2") == 2
+    assert batch_data.is_released
+
+    assert get_row_count(batch_id="1") == 1
+    assert execution_engine.loaded_batch_data_dict["1"] is not batch_data
+    assert batches[0].data is execution_engine.loaded_batch_data_dict["1"]
+
+
+def test_planning_metric_queries_does_not_load_lazy_batches(sa):
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sa.create_engine("sqlite://"), max_loaded_batches=1
+    )
+    pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).to_sql(
+        "test_table", con=execution_engine.engine, index=False
+    )
+
+    loaded_batch_ids: List[str] = []
+
+    def get_batch_data_loader(batch_id: str, batch_spec: SqlAlchemyDatasourceBatchSpec):
+        def load_batch_data():
+            loaded_batch_ids.append(batch_id)
+            batch_data, _ = execution_engine.get_batch_data_and_markers(
+                batch_spec=batch_spec
+            )
+            return batch_data
+
+        return load_batch_data
+
+    for value in [1, 2, 3]:
+        batch_spec = SqlAlchemyDatasourceBatchSpec(
+            table_name="test_table",
+            splitter_method="split_on_column_value",
+            splitter_kwargs={"column_name": "a"},
+            batch_identifiers={"a": value},
+        )
+        execution_engine.load_batch_data_lazily(
+            batch_id=str(value),
+            batch_data_loader=get_batch_data_loader(str(value), batch_spec),
+            batch_spec=batch_spec,
+        )
+
+    def plan(batch_id: str) -> Tuple:
+        query: dict = {
+            "domain_kwargs": {"batch_id": batch_id, "column": "b"},
+            "select": [sa.func.max(sa.column("b"))],
+        }
+        group_key, _ = execution_engine._get_multi_batch_group_key(query=query)
+        return (
+            group_key,
+            execution_engine._get_mergeable_domain_batch_id(
+                domain_kwargs=query["domain_kwargs"]
+            ),
+        )
+
+    # Batches are described by their batch specs, instead of being loaded (and unloaded).
+    group_keys: List[Tuple] = [plan(batch_id=batch_id) for batch_id in ["1", "2", "3"]]
+    assert loaded_batch_ids == []
+    assert group_keys[0][0] is not None
+    assert group_keys[0][0] == group_keys[1][0] == group_keys[2][0]
+    assert [mergeable_batch_id for _, mergeable_batch_id in group_keys] == [
+        "1",
+        "2",
+        "3",
+    ]
+
+    # Loaded batches are described by their data, in the same way.
+    assert execution_engine.loaded_batch_data_dict["1"].split_clause is not None
+    assert plan(batch_id="1") == group_keys[0]
+    assert loaded_batch_ids == ["1"]
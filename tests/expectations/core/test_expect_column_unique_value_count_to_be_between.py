@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.self_check.util import (
+    build_pandas_validator_with_data,
+    build_sa_validator_with_data,
+)
+from great_expectations.util import is_library_loadable
+
+
+@pytest.mark.integration
+def test_pandas_approximate_unique_value_count_and_proportion():
+    df = pd.DataFrame({"a": np.arange(20_000) % 5_000})
+    validator = build_pandas_validator_with_data(df)
+
+    result = validator.expect_column_unique_value_count_to_be_between(
+        column="a", min_value=4_800, max_value=5_200, approximate=True
+    )
+    assert result.success
+    assert result.result["details"]["approximate"] is True
+    assert 0 < result.result["details"]["relative_standard_error"] < 0.01
+
+    result = validator.expect_column_proportion_of_unique_values_to_be_between(
+        column="a", min_value=0.24, max_value=0.26, approximate=True
+    )
+    assert result.success
+    assert result.result["details"]["approximate"] is True
+
+    result = validator.expect_column_unique_value_count_to_be_between(
+        column="a", min_value=4_800, max_value=5_200
+    )
+    assert result.result["observed_value"] == 5_000
+    assert "details" not in result.result
+
+
+@pytest.mark.integration
+def test_pandas_approximate_unique_value_count_and_proportion_of_unique_values():
+    df = pd.DataFrame({"a": np.arange(1_000)})
+    validator = build_pandas_validator_with_data(df)
+
+    # Estimates exceeding the number of non-null values (1,009 for this column) are capped.
+    result = validator.expect_column_unique_value_count_to_be_between(
+        column="a", min_value=1_000, max_value=1_000, approximate=True
+    )
+    assert result.success
+    assert result.result["observed_value"] == 1_000
+
+    result = validator.expect_column_proportion_of_unique_values_to_be_between(
+        column="a", min_value=1, max_value=1, approximate=True
+    )
+    assert result.success
+    assert result.result["observed_value"] == 1.0
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="sqlalchemy"),
+    reason="sqlalchemy is not installed",
+)
+def test_sqlite_approximate_unique_value_count_is_exact():
+    df = pd.DataFrame({"a": [1, 2, 2, 3, None]})
+    validator = build_sa_validator_with_data(df=df, sa_engine_name="sqlite")
+
+    # Sqlite has no approximate distinct count function, so values are counted exactly.
+    result = validator.expect_column_unique_value_count_to_be_between(
+        column="a", min_value=3, max_value=3, approximate=True
+    )
+    assert result.success
+    assert result.result["observed_value"] == 3
+    assert result.result["details"] == {
+        "approximate": True,
+        "relative_standard_error": 0.0,
+    }
+
+    result = validator.expect_column_proportion_of_unique_values_to_be_between(
+        column="a", min_value=0.75, max_value=0.75, approximate=True
+    )
+    assert result.success
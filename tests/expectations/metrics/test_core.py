@@ -1,7 +1,7 @@
 import copy
 import datetime
 import logging
-from typing import Union
+from typing import List, Union
 
 import numpy as np
 import pandas as pd
@@ -9,6 +9,7 @@ import pytest
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -17,8 +18,14 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics import (
+    ColumnDistinctValuesCountApproximate,
+)
 from great_expectations.expectations.metrics.import_manager import pyspark_sql_Column
-from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.expectations.registry import (
+    get_expectation_impl,
+    get_metric_provider,
+)
 from great_expectations.self_check.util import (
     build_pandas_engine,
     build_sa_engine,
@@ -4471,6 +4478,152 @@ def test_distinct_metric_pd():
     assert metrics[column_distinct_values_count_threshold_metric.id] is True
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize("engine_type", ["pandas", "sqlite"])
+def test_distinct_values_set_membership_metric(engine_type, sa):
+    df = pd.DataFrame({"a": [1, 2, 1, 2, 3, 3, 4, 5, None]})
+    engine: Union[PandasExecutionEngine, SqlAlchemyExecutionEngine]
+    if engine_type == "pandas":
+        engine = build_pandas_engine(df)
+    else:
+        engine = build_sa_engine(df, sa)
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    set_membership_metric = MetricConfiguration(
+        metric_name="column.distinct_values.set_membership",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": [1, 2, 6], "partial_unexpected_count": 2},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(set_membership_metric,), metrics=metrics
+    )
+    set_membership: dict = results[set_membership_metric.id]
+
+    assert set_membership["unexpected_count"] == 3
+    assert len(set_membership["partial_unexpected_list"]) == 2
+    assert set(set_membership["partial_unexpected_list"]) <= {3, 4, 5}
+    assert sorted(set_membership["observed_expected_values"]) == [1, 2]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "expectation_type",
+    [
+        "expect_column_distinct_values_to_be_in_set",
+        "expect_column_distinct_values_to_contain_set",
+        "expect_column_distinct_values_to_equal_set",
+    ],
+)
+def test_distinct_values_set_membership_metric_of_boolean_only_results_issues_one_query(
+    expectation_type, sa
+):
+    df = pd.DataFrame({"a": [1, 2, 1, 2, 3, 3, 4, 5, None]})
+    engine: SqlAlchemyExecutionEngine = build_sa_engine(df, sa)
+
+    configuration = ExpectationConfiguration(
+        expectation_type=expectation_type,
+        kwargs={"column": "a", "value_set": [1, 2, 6]},
+    )
+    dependencies: dict = get_expectation_impl(expectation_type)(
+        configuration
+    ).get_validation_dependencies(
+        configuration,
+        execution_engine=engine,
+        runtime_configuration={"result_format": "BOOLEAN_ONLY"},
+    )
+    assert "column.value_counts" not in dependencies["metrics"]
+    set_membership_metric: MetricConfiguration = dependencies["metrics"][
+        "column.distinct_values.set_membership"
+    ]
+    assert set_membership_metric.metric_value_kwargs["partial_unexpected_count"] == 0
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+    set_membership_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+
+    statements: List[str] = []
+    sa.event.listen(
+        engine.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(set_membership_metric,), metrics=metrics
+    )
+    set_membership: dict = results[set_membership_metric.id]
+
+    assert set_membership["unexpected_count"] == 3
+    assert set_membership["partial_unexpected_list"] == []
+    assert len(statements) == 1
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("engine_type", ["pandas", "sqlite"])
+def test_distinct_values_count_approximate_metric(engine_type, sa):
+    df = pd.DataFrame({"a": [1, 2, 1, 2, 3, 3, 4, 5, None]})
+    engine: Union[PandasExecutionEngine, SqlAlchemyExecutionEngine]
+    if engine_type == "pandas":
+        engine = build_pandas_engine(df)
+    else:
+        engine = build_sa_engine(df, sa)
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    metric_dependencies: dict = {"table.columns": table_columns_metric}
+    if engine_type == "sqlite":
+        partial_metric = MetricConfiguration(
+            metric_name="column.distinct_values.count.approximate.aggregate_fn",
+            metric_domain_kwargs={"column": "a"},
+            metric_dependencies={"table.columns": table_columns_metric},
+        )
+        results = engine.resolve_metrics(
+            metrics_to_resolve=(partial_metric,), metrics=metrics
+        )
+        metrics.update(results)
+        metric_dependencies["metric_partial_fn"] = partial_metric
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.distinct_values.count.approximate",
+        metric_domain_kwargs={"column": "a"},
+        metric_dependencies=metric_dependencies,
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+
+    # Small numbers of distinct values are estimated exactly (sqlite has no approximate distinct count function).
+    assert results == {desired_metric.id: 5}
+    assert (
+        ColumnDistinctValuesCountApproximate.get_relative_standard_error(
+            execution_engine=engine
+        )
+        > 0
+    ) == (engine_type == "pandas")
+
+
 def test_batch_aggregate_metrics_pd():
     import datetime
 
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -19,12 +20,25 @@ from great_expectations.expectations.metrics import (
     CompoundColumnsUnique,
 )
 from great_expectations.expectations.metrics.map_metric_provider import (
+    UNEXPECTED_POSITIONS_CHUNK_SIZE,
     ColumnMapMetricProvider,
     MapMetricProvider,
+    _pandas_unexpected_positions,
 )
+from great_expectations.self_check.util import build_sa_engine
 from great_expectations.validator.validation_graph import MetricConfiguration
 from great_expectations.validator.validator import Validator
 
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 
 @pytest.fixture
 def dataframe_for_unexpected_rows():
@@ -325,3 +339,240 @@ def test_include_unexpected_rows_without_explicit_result_format_raises_error(
     )
     with pytest.raises(ValueError):
         expectation.validate(validator)
+
+
+def test_pandas_unexpected_positions():
+    num_rows: int = 3 * UNEXPECTED_POSITIONS_CHUNK_SIZE
+    domain_values = pd.Series(np.arange(num_rows), index=np.arange(num_rows) * 2)
+    boolean_mapped_unexpected_values = domain_values % 1000 == 999
+
+    unexpected_positions = _pandas_unexpected_positions(
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        domain_records=domain_values,
+        result_format={"result_format": "COMPLETE", "partial_unexpected_count": 20},
+    )
+    assert list(unexpected_positions) == list(range(999, num_rows, 1000))
+
+    # Only as many unexpected values as required are looked up, including across chunks.
+    for partial_unexpected_count in [0, 3, 70, 150]:
+        unexpected_positions = _pandas_unexpected_positions(
+            boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+            domain_records=domain_values,
+            result_format={
+                "result_format": "SUMMARY",
+                "partial_unexpected_count": partial_unexpected_count,
+            },
+        )
+        assert (
+            list(unexpected_positions)
+            == list(range(999, num_rows, 1000))[:partial_unexpected_count]
+        )
+
+    # A boolean mask that is not aligned with the domain records must be looked up by index label.
+    assert (
+        _pandas_unexpected_positions(
+            boolean_mapped_unexpected_values=boolean_mapped_unexpected_values.iloc[1:],
+            domain_records=domain_values,
+            result_format={"result_format": "COMPLETE"},
+        )
+        is None
+    )
+    assert (
+        _pandas_unexpected_positions(
+            boolean_mapped_unexpected_values=boolean_mapped_unexpected_values.reset_index(
+                drop=True
+            ),
+            domain_records=domain_values,
+            result_format={"result_format": "COMPLETE"},
+        )
+        is None
+    )
+
+
+def test_pandas_unexpected_rows_complete_result_format_with_sink(
+    dataframe_for_unexpected_rows, tmp_path
+):
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "a",
+            "value_set": [1, 5, 22],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "include_unexpected_rows": True,
+                "partial_unexpected_count": 1,
+                "unexpected_rows_sink": {
+                    "directory": str(tmp_path),
+                    "chunk_size": 1,
+                },
+            },
+        },
+    )
+
+    expectation = ExpectColumnValuesToBeInSet(expectation_configuration)
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=dataframe_for_unexpected_rows)],
+    )
+    result = expectation.validate(validator).result
+
+    # Unexpected rows, values, and index labels are written to files, to which results keep references.
+    unexpected_rows = result["unexpected_rows"]
+    assert unexpected_rows["file_format"] == "csv"
+    assert unexpected_rows["count"] == 2
+    assert pd.read_csv(unexpected_rows["path"], index_col=0).to_dict(
+        orient="records"
+    ) == [{"a": 3, "b": "giraffe"}, {"a": 10, "b": "zebra"}]
+
+    unexpected_index_list = result["unexpected_index_list"]
+    assert unexpected_index_list["count"] == 2
+    assert unexpected_index_list["partial_unexpected_index_list"] == [3]
+    assert list(pd.read_csv(unexpected_index_list["path"])["index"]) == [3, 5]
+
+    unexpected_list = result["unexpected_list"]
+    assert unexpected_list["count"] == 2
+    assert unexpected_list["partial_unexpected_list"] == [3]
+    assert list(pd.read_csv(unexpected_list["path"])["a"]) == [3, 10]
+
+    assert result["partial_unexpected_index_list"] == [3]
+    assert result["partial_unexpected_list"] == [3]
+    assert result["partial_unexpected_counts"] == [{"value": 3, "count": 1}]
+    assert result["unexpected_count"] == 2
+
+
+@pytest.mark.skipif(sa is None, reason="sqlalchemy is not installed")
+def test_sqlite_unexpected_rows_complete_result_format_with_sink(
+    dataframe_for_unexpected_rows, tmp_path
+):
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "a",
+            "value_set": [1, 5, 22],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "include_unexpected_rows": True,
+                "unexpected_rows_sink": {
+                    "directory": str(tmp_path),
+                    "chunk_size": 1,
+                },
+            },
+        },
+    )
+
+    expectation = ExpectColumnValuesToBeInSet(expectation_configuration)
+    validator = Validator(
+        execution_engine=build_sa_engine(dataframe_for_unexpected_rows, sa)
+    )
+    result = expectation.validate(validator).result
+
+    unexpected_rows = result["unexpected_rows"]
+    assert unexpected_rows["count"] == 2
+    assert pd.read_csv(unexpected_rows["path"]).to_dict(orient="records") == [
+        {"a": 3, "b": "giraffe"},
+        {"a": 10, "b": "zebra"},
+    ]
+
+    unexpected_list = result["unexpected_list"]
+    assert unexpected_list["count"] == 2
+    assert unexpected_list["partial_unexpected_list"] == [3, 10]
+    assert list(pd.read_csv(unexpected_list["path"])["a"]) == [3, 10]
+    assert result["partial_unexpected_list"] == [3, 10]
+
+
+@pytest.mark.skipif(pyarrow is None, reason="pyarrow is not installed")
+def test_pandas_unexpected_rows_complete_result_format_with_parquet_sink(tmp_path):
+    # Column "b" holds only nulls in the first chunk of unexpected rows.
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, 5],
+            "b": [None, None, None, "x", "y"],
+        }
+    )
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "a",
+            "value_set": [1],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "include_unexpected_rows": True,
+                "unexpected_rows_sink": {
+                    "directory": str(tmp_path),
+                    "file_format": "parquet",
+                    "chunk_size": 2,
+                },
+            },
+        },
+    )
+
+    expectation = ExpectColumnValuesToBeInSet(expectation_configuration)
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=df)],
+    )
+    result = expectation.validate(validator).result
+
+    unexpected_rows = result["unexpected_rows"]
+    assert unexpected_rows["file_format"] == "parquet"
+    assert unexpected_rows["count"] == 4
+    assert pd.read_parquet(unexpected_rows["path"]).to_dict(orient="index") == {
+        1: {"a": 2, "b": None},
+        2: {"a": 3, "b": None},
+        3: {"a": 4, "b": "x"},
+        4: {"a": 5, "b": "y"},
+    }
+
+    unexpected_list = result["unexpected_list"]
+    assert unexpected_list["count"] == 4
+    assert list(pd.read_parquet(unexpected_list["path"])["a"]) == [2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("backend", ["pandas", "sqlite"])
+def test_unexpected_rows_sink_counts_all_unexpected_values(backend, tmp_path):
+    if backend == "sqlite" and sa is None:
+        pytest.skip("sqlalchemy is not installed")
+
+    df = pd.DataFrame({"a": [1, 8, 8] + [7] * 20 + [8, 8, 8]})
+
+    def validate(result_format: dict) -> dict:
+        expectation_configuration = ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": "a",
+                "value_set": [1],
+                "result_format": {
+                    "result_format": "COMPLETE",
+                    "partial_unexpected_count": 3,
+                    **result_format,
+                },
+            },
+        )
+        if backend == "pandas":
+            validator = Validator(
+                execution_engine=PandasExecutionEngine(),
+                batches=[Batch(data=df)],
+            )
+        else:
+            validator = Validator(execution_engine=build_sa_engine(df, sa))
+
+        return (
+            ExpectColumnValuesToBeInSet(expectation_configuration)
+            .validate(validator)
+            .result
+        )
+
+    result = validate(result_format={})
+    result_with_sink = validate(
+        result_format={
+            "unexpected_rows_sink": {"directory": str(tmp_path), "chunk_size": 4}
+        }
+    )
+
+    # Counts are those of all unexpected values, not only of the partial unexpected list.
+    assert result_with_sink["partial_unexpected_list"] == [8, 8, 7]
+    assert (
+        result_with_sink["partial_unexpected_counts"]
+        == result["partial_unexpected_counts"]
+        == [{"value": 7, "count": 20}, {"value": 8, "count": 5}]
+    )
@@ -2,6 +2,7 @@ from great_expectations.expectations.row_conditions import (
     _parse_great_expectations_condition,
     parse_condition_to_spark,
     parse_condition_to_sqlalchemy,
+    parse_conditions_to_sqlalchemy,
 )
 
 
@@ -41,3 +42,23 @@ def test_parse_condition_to_sqlalchemy(sa):
 
     res = parse_condition_to_sqlalchemy('col("foo").notNull()')
     assert str(res) == "foo IS NOT NULL"
+
+
+def test_parse_conditions_to_sqlalchemy(sa):
+    res = parse_conditions_to_sqlalchemy(('col("foo") > 5', 'col("bar").notNull()'))
+    assert str(res) == "foo > :foo_1 AND bar IS NOT NULL"
+
+    # Compiled predicates are cached by condition
+    assert (
+        parse_conditions_to_sqlalchemy(('col("foo") > 5', 'col("bar").notNull()'))
+        is res
+    )
+    assert parse_conditions_to_sqlalchemy(
+        ('col("foo") > 5',)
+    ) is parse_condition_to_sqlalchemy('col("foo") > 5')
+
+
+def test_parsed_conditions_are_not_shared():
+    res = _parse_great_expectations_condition('col("foo") > 5')
+    res["column"] = "bar"
+    assert _parse_great_expectations_condition('col("foo") > 5')["column"] == "foo"
@@ -12,6 +12,10 @@ from great_expectations.expectations.expectation import (
     ExpectationConfiguration,
 )
 from great_expectations.expectations.registry import _registered_expectations
+from great_expectations.self_check.diagnostics_runner import (
+    run_expectation_diagnostics,
+)
+from great_expectations.self_check.util import ExpectationTestDataCache
 from tests.expectations.fixtures.expect_column_values_to_equal_three import (
     ExpectColumnValuesToEqualThree,
     ExpectColumnValuesToEqualThree__BrokenIteration,
@@ -556,3 +560,42 @@ def test_run_diagnostics_on_an_expectation_with_errors_in_its_tests():
         "validation_result",
     }
     assert tests[4]["test_passed"] is False
+
+
+def test_run_diagnostics_with_test_data_cache():
+    test_data_cache = ExpectationTestDataCache()
+    expectation = ExpectColumnValuesToEqualThree__SecondIteration()
+
+    diagnostics = expectation.run_diagnostics(test_data_cache=test_data_cache)
+    assert test_data_cache.hit_count == 0
+    assert test_data_cache.miss_count > 0
+
+    # The test data loaded for the first run is reused, with the same results.
+    cached_diagnostics = expectation.run_diagnostics(test_data_cache=test_data_cache)
+    assert test_data_cache.hit_count == test_data_cache.miss_count
+    assert [
+        (test.backend, test.test_title, test.test_passed)
+        for test in cached_diagnostics.tests
+    ] == [
+        (test.backend, test.test_title, test.test_passed) for test in diagnostics.tests
+    ]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_run_expectation_diagnostics(processes):
+    expectation_types = [
+        "expect_column_values_to_equal_three___second_iteration",
+        "expect_column_values_to_be_in_set",
+        "no_such_expectation",
+    ]
+    results = run_expectation_diagnostics(
+        expectation_types=expectation_types,
+        processes=processes,
+        only_consider_these_backends=["pandas"],
+    )
+
+    assert [result.expectation_type for result in results] == expectation_types
+    assert all(result.duration >= 0 for result in results)
+    assert [result.error is None for result in results] == [True, True, False]
+    assert results[1].diagnostics.backend_test_result_counts[0].backend == "pandas"
+    assert results[2].diagnostics is None
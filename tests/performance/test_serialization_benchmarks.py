@@ -0,0 +1,160 @@
+"""
+Test performance of serializing and deserializing large Expectation Suites and Validation Results.
+
+These benchmarks compare the marshmallow schemas with the serializers in "great_expectations.core.json_serializer"
+(which produce identical output).  Run them with, e.g.:
+
+    pytest tests/performance/test_serialization_benchmarks.py --benchmark-group-by=func
+"""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuite,
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+from great_expectations.core.expectation_suite import ExpectationSuiteSchema
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResultSchema,
+)
+from great_expectations.core.json_serializer import (
+    ExpectationSuiteJsonSerializer,
+    ExpectationSuiteValidationResultJsonSerializer,
+)
+
+NUMBER_OF_EXPECTATIONS = 2000
+UNEXPECTED_LIST_LENGTH = 200
+
+
+def _build_expectation_configurations() -> list:
+    return [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": f"column_{idx}",
+                "value_set": list(range(20)),
+                "mostly": 0.95,
+            },
+            meta={"notes": f"Expectation number {idx}"},
+        )
+        for idx in range(NUMBER_OF_EXPECTATIONS)
+    ]
+
+
+@pytest.fixture(scope="module")
+def large_expectation_suite() -> ExpectationSuite:
+    return ExpectationSuite(
+        expectation_suite_name="large_suite",
+        expectations=_build_expectation_configurations(),
+    )
+
+
+@pytest.fixture(scope="module")
+def large_validation_result() -> ExpectationSuiteValidationResult:
+    return ExpectationSuiteValidationResult(
+        success=False,
+        results=[
+            ExpectationValidationResult(
+                success=False,
+                expectation_config=expectation_configuration,
+                result={
+                    "element_count": 10000,
+                    "unexpected_count": UNEXPECTED_LIST_LENGTH,
+                    "unexpected_percent": 2.0,
+                    "partial_unexpected_list": list(range(20)),
+                    "unexpected_list": list(range(UNEXPECTED_LIST_LENGTH)),
+                },
+            )
+            for expectation_configuration in _build_expectation_configurations()
+        ],
+        statistics={"evaluated_expectations": NUMBER_OF_EXPECTATIONS},
+        meta={"expectation_suite_name": "large_suite"},
+    )
+
+
+@pytest.mark.parametrize("serializer_type", ["schema", "json_serializer"])
+def test_expectation_suite_dumps_benchmark(
+    benchmark: BenchmarkFixture,
+    large_expectation_suite: ExpectationSuite,
+    serializer_type: str,
+):
+    serializer = (
+        ExpectationSuiteSchema()
+        if serializer_type == "schema"
+        else ExpectationSuiteJsonSerializer()
+    )
+
+    result: str = benchmark(
+        serializer.dumps, large_expectation_suite, indent=2, sort_keys=True
+    )
+
+    assert result == ExpectationSuiteSchema().dumps(
+        large_expectation_suite, indent=2, sort_keys=True
+    )
+
+
+@pytest.mark.parametrize("serializer_type", ["schema", "json_serializer"])
+def test_expectation_suite_loads_benchmark(
+    benchmark: BenchmarkFixture,
+    large_expectation_suite: ExpectationSuite,
+    serializer_type: str,
+):
+    serializer = (
+        ExpectationSuiteSchema()
+        if serializer_type == "schema"
+        else ExpectationSuiteJsonSerializer()
+    )
+    serialized_value: str = ExpectationSuiteSchema().dumps(large_expectation_suite)
+
+    result: dict = benchmark(serializer.loads, serialized_value)
+
+    assert len(result["expectations"]) == NUMBER_OF_EXPECTATIONS
+
+
+@pytest.mark.parametrize("serializer_type", ["schema", "json_serializer"])
+def test_validation_result_dumps_benchmark(
+    benchmark: BenchmarkFixture,
+    large_validation_result: ExpectationSuiteValidationResult,
+    serializer_type: str,
+):
+    serializer = (
+        ExpectationSuiteValidationResultSchema()
+        if serializer_type == "schema"
+        else ExpectationSuiteValidationResultJsonSerializer()
+    )
+
+    result: str = benchmark.pedantic(
+        serializer.dumps,
+        args=(large_validation_result,),
+        kwargs={"indent": 2, "sort_keys": True},
+        rounds=3,
+    )
+
+    assert result == ExpectationSuiteValidationResultSchema().dumps(
+        large_validation_result, indent=2, sort_keys=True
+    )
+
+
+@pytest.mark.parametrize("serializer_type", ["schema", "json_serializer"])
+def test_validation_result_loads_benchmark(
+    benchmark: BenchmarkFixture,
+    large_validation_result: ExpectationSuiteValidationResult,
+    serializer_type: str,
+):
+    serializer = (
+        ExpectationSuiteValidationResultSchema()
+        if serializer_type == "schema"
+        else ExpectationSuiteValidationResultJsonSerializer()
+    )
+    serialized_value: str = ExpectationSuiteValidationResultSchema().dumps(
+        large_validation_result
+    )
+
+    result: ExpectationSuiteValidationResult = benchmark.pedantic(
+        serializer.loads, args=(serialized_value,), rounds=3
+    )
+
+    assert len(result.results) == NUMBER_OF_EXPECTATIONS
@@ -1,3 +1,4 @@
+import contextlib
 import logging
 import os
 import random
@@ -513,6 +514,101 @@ def test_build_suite_no_config(
     assert actual_events == expected_events
 
 
+def test_build_suite_prefetches_metrics(titanic_validator):
+    """
+    What does this test do and why?
+    Tests that the metrics needed to profile columns are computed all at once (before the profiler calls expectations),
+    and that the suite built is the same as the one built without prefetching them
+    """
+    with mock.patch.object(
+        Validator,
+        "compute_expectation_metrics",
+        autospec=True,
+        side_effect=Validator.compute_expectation_metrics,
+    ) as mock_compute_expectation_metrics:
+        profiler = UserConfigurableProfiler(titanic_validator)
+        suite = profiler.build_suite()
+
+    assert mock_compute_expectation_metrics.call_count == 2
+    expectation_types = {
+        expectation_configuration.expectation_type
+        for expectation_configuration in mock_compute_expectation_metrics.call_args_list[
+            1
+        ][
+            1
+        ][
+            "configurations"
+        ]
+    }
+    assert {
+        "expect_table_row_count_to_be_between",
+        "expect_column_min_to_be_between",
+        "expect_column_quantile_values_to_be_between",
+        "expect_column_distinct_values_to_be_in_set",
+        "expect_column_values_to_not_be_null",
+    }.issubset(expectation_types)
+
+    with mock.patch.object(
+        UserConfigurableProfiler,
+        "_prefetch_metrics",
+        return_value=contextlib.nullcontext(),
+    ):
+        profiler_without_prefetching = UserConfigurableProfiler(titanic_validator)
+        suite_without_prefetching = profiler_without_prefetching.build_suite()
+
+    assert suite.expectations == suite_without_prefetching.expectations
+
+
+def test_build_suite_prefetches_metrics_of_all_exploratory_expectations(
+    titanic_validator,
+):
+    """
+    What does this test do and why?
+    Tests that the expectations prefetched by build_suite are exactly the exploratory expectations that it then calls,
+    with or without a semantic_types dict
+    """
+    for semantic_types_dict in (
+        None,
+        {
+            "numeric": ["Age"],
+            "value_set": ["Sex", "SexCode", "PClass"],
+            "datetime": [],
+            "string": ["Name"],
+        },
+    ):
+        profiler = UserConfigurableProfiler(
+            titanic_validator,
+            semantic_types_dict=semantic_types_dict,
+            excluded_expectations=["expect_column_mean_to_be_between"],
+        )
+        with mock.patch.object(
+            Validator,
+            "compute_expectation_metrics",
+            autospec=True,
+            side_effect=Validator.compute_expectation_metrics,
+        ) as mock_compute_expectation_metrics, mock.patch.object(
+            UserConfigurableProfiler,
+            "_validate_expectation_configuration",
+            side_effect=UserConfigurableProfiler._validate_expectation_configuration,
+        ) as mock_validate_expectation_configuration:
+            profiler.build_suite()
+
+        prefetched_expectation_configurations = (
+            mock_compute_expectation_metrics.call_args[1]["configurations"]
+        )
+        called_expectation_configurations = [
+            call[1]["expectation_configuration"]
+            for call in mock_validate_expectation_configuration.call_args_list
+        ]
+        assert (
+            called_expectation_configurations == prefetched_expectation_configurations
+        )
+        assert "expect_column_mean_to_be_between" not in {
+            expectation_configuration.expectation_type
+            for expectation_configuration in called_expectation_configurations
+        }
+
+
 @pytest.mark.slow  # 1.32s
 def test_all_table_columns_populates(taxi_validator_pandas):
     taxi_profiler = UserConfigurableProfiler(taxi_validator_pandas)
@@ -500,6 +500,107 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     assert validations_set == validation_html_pages
 
 
+@pytest.mark.rendered_output
+@pytest.mark.slow  # 3.00s
+def test_configuration_driven_site_builder_incremental(
+    site_builder_data_context_with_html_store_titanic_random, mocker
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+
+    datasource_name = "titanic"
+    data_asset_name = "Titanic"
+    profiler_name = "BasicDatasetProfiler"
+    generator_name = "subdir_reader"
+    context.profile_datasource(datasource_name)
+
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+
+    def _get_index_filepaths(index_links_dict: dict) -> Dict[str, set]:
+        return {
+            section_name: {link["filepath"] for link in index_links_dict[section_name]}
+            for section_name in [
+                "expectations_links",
+                "profiling_links",
+                "validations_links",
+            ]
+            if section_name in index_links_dict
+        }
+
+    full_site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    _, full_build_index_links_dict = full_site_builder.build()
+
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        incremental=True,
+        max_render_workers=2,
+        **local_site_config
+    )
+    # Without a manifest, the first incremental build renders every resource (resource_identifiers are disregarded).
+    _, index_links_dict = site_builder.build(resource_identifiers=[])
+    assert _get_index_filepaths(index_links_dict) == _get_index_filepaths(
+        full_build_index_links_dict
+    )
+    assert site_builder.target_store.get_render_manifest() is not None
+
+    # Nothing changed, so nothing is rendered again, and the index is built from the manifest.
+    renderers = [
+        mocker.spy(site_section_builder.renderer_class, "render")
+        for site_section_builder in site_builder.site_section_builders.values()
+    ]
+    list_keys = mocker.spy(context.stores["validations_store"], "list_keys")
+    _, index_links_dict = site_builder.build()
+    assert all(renderer.call_count == 0 for renderer in renderers)
+    assert _get_index_filepaths(index_links_dict) == _get_index_filepaths(
+        full_build_index_links_dict
+    )
+
+    # Only the requested resource is rendered, without listing the source stores.
+    batch_kwargs = context.build_batch_kwargs(
+        datasource=datasource_name,
+        batch_kwargs_generator=generator_name,
+        data_asset_name=data_asset_name,
+    )
+    expectation_suite_name = "{}.{}.{}.{}".format(
+        datasource_name, generator_name, data_asset_name, profiler_name
+    )
+    batch = context.get_batch(
+        batch_kwargs=batch_kwargs,
+        expectation_suite_name=expectation_suite_name,
+    )
+    validation_result = batch.validate(
+        run_id=RunIdentifier(run_name="test_run_id_12345")
+    )
+    validation_result_identifier = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(
+            expectation_suite_name=expectation_suite_name
+        ),
+        run_id=RunIdentifier(run_name="test_run_id_12345"),
+        batch_identifier=batch.batch_id,
+    )
+    context.stores["validations_store"].set(
+        validation_result_identifier, validation_result
+    )
+    list_keys.reset_mock()
+
+    _, index_links_dict = site_builder.build(
+        resource_identifiers=[validation_result_identifier]
+    )
+    assert list_keys.call_count == 0
+    assert sum(renderer.call_count for renderer in renderers) == 1
+    assert [link["run_name"] for link in index_links_dict["validations_links"]] == [
+        "test_run_id_12345"
+    ]
+    assert (
+        site_builder.get_resource_url(resource_identifier=validation_result_identifier)
+        is not None
+    )
+
+
 @pytest.mark.rendered_output
 @pytest.mark.filterwarnings(
     "ignore:name is deprecated as a batch_parameter*:DeprecationWarning:great_expectations.data_context.data_context"
@@ -56,3 +56,41 @@ def test_get_chart_titles():
         DataAssistantResult._get_chart_titles(charts=[layer_a])
 
     assert e.value.message == "All DataAssistantResult charts must have a title."
+
+
+@pytest.mark.unit
+def test_get_list_column_names():
+    df = pd.DataFrame(
+        {
+            "table_columns": [["a", "b"], ["a"]],
+            "table_row_count": [10, 20],
+            "name": ["batch_1", "batch_2"],
+        }
+    )
+
+    assert DataAssistantResult._get_list_column_names(df=df) == ["table_columns"]
+    assert DataAssistantResult._get_list_column_names(df=df[["name"]]) == []
+
+
+@pytest.mark.unit
+def test_create_batch_identifier_df_for_charting():
+    data_assistant_result = DataAssistantResult(
+        _batch_id_to_batch_identifier_display_name_map={
+            "batch_id_1": {("year", "2019"), ("month", "01")},
+            "batch_id_2": {("month", "02"), ("year", "2019")},
+            "batch_id_3": [("year", "2020"), ("name", {"first": "a"})],
+        }
+    )
+
+    df: pd.DataFrame = data_assistant_result._create_batch_identifier_df_for_charting(
+        batch_ids=["batch_id_2", "batch_id_1"]
+    )
+    assert df.to_dict(orient="records") == [
+        {"month": "02", "year": "2019"},
+        {"month": "01", "year": "2019"},
+    ]
+
+    df = data_assistant_result._create_batch_identifier_df_for_charting(
+        batch_ids=["batch_id_3"]
+    )
+    assert df.to_dict(orient="records") == [{"name": "{First: a}", "year": "2020"}]
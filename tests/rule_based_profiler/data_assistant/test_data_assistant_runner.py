@@ -1,8 +1,11 @@
+from unittest import mock
+
 import pandas as pd
 import pytest
 
 from great_expectations.core.batch import RuntimeBatchRequest
 from great_expectations.data_context import DataContext
+from great_expectations.data_context.store import BatchMetricStore
 from great_expectations.rule_based_profiler.data_assistant_result import (
     DataAssistantResult,
 )
@@ -100,3 +103,45 @@ def test_onboarding_data_assistant_runner_top_level_kwargs_explicit_none(
     }
 
     assert "user_id" not in categorical_columns_used
+
+
+@pytest.mark.integration
+def test_volume_data_assistant_runner_metric_history_store(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    context: DataContext = bobby_columnar_table_multi_batch_deterministic_data_context
+    batch_metric_store = context.add_store(
+        "batch_metric_store", {"class_name": "BatchMetricStore"}
+    )
+    batch_request = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    data_assistant_result: DataAssistantResult = context.assistants.volume.run(
+        batch_request=batch_request,
+        metric_history_store_name="batch_metric_store",
+    )
+    num_stored_metrics: int = len(batch_metric_store.list_keys())
+    assert num_stored_metrics > 0
+
+    # The second run looks up the metrics of all the Batches in the metric history store, instead of computing them
+    # (only the row counts of the Batches, which are the fingerprints of their data, are computed), so that no metric
+    # values are recorded again.
+    with mock.patch.object(
+        BatchMetricStore,
+        "set_metric_values",
+        autospec=True,
+        side_effect=BatchMetricStore.set_metric_values,
+    ) as mock_set_metric_values:
+        assert (
+            context.assistants.volume.run(
+                batch_request=batch_request,
+                metric_history_store_name="batch_metric_store",
+            ).metrics_by_domain
+            == data_assistant_result.metrics_by_domain
+        )
+        assert not mock_set_metric_values.called
+
+    assert len(batch_metric_store.list_keys()) == num_stored_metrics
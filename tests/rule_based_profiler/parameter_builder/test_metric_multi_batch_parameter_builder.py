@@ -1,7 +1,11 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
+from unittest import mock
 
+import pandas as pd
 import pytest
 
+from great_expectations.core.batch import RuntimeBatchRequest
+from great_expectations.core.metric import BatchMetricIdentifier
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.data_context import DataContext
 from great_expectations.rule_based_profiler.domain import Domain
@@ -16,6 +20,7 @@ from great_expectations.rule_based_profiler.parameter_container import (
     build_parameter_container_for_variables,
     get_parameter_value_by_fully_qualified_parameter_name,
 )
+from great_expectations.validator.validator import Validator
 
 
 @pytest.mark.integration
@@ -270,3 +275,129 @@ def test_metric_multi_batch_parameter_builder_bobby_single_batch_yes(
     parameter_node["attributed_value"] = None
 
     assert parameter_node == expected_value_dict
+
+
+@pytest.mark.integration
+def test_metric_multi_batch_parameter_builder_bobby_metric_history_store(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+    batch_metric_store = data_context.add_store(
+        "batch_metric_store", {"class_name": "BatchMetricStore"}
+    )
+
+    # BatchRequest yielding three batches
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN,
+        domain_kwargs={"column": "passenger_count"},
+        rule_name="my_rule",
+    )
+    variables: ParameterContainer = build_parameter_container_for_variables(
+        variables_configs={"metric_history_store_name": "batch_metric_store"}
+    )
+
+    def build_max_passenger_counts(
+        batch_request: Union[dict, RuntimeBatchRequest] = batch_request
+    ) -> list:
+        metric_multi_batch_parameter_builder = MetricMultiBatchParameterBuilder(
+            name="max_passenger_count",
+            metric_name="column.max",
+            metric_domain_kwargs=DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
+            enforce_numeric_metric=True,
+            data_context=data_context,
+        )
+        parameters: Dict[str, ParameterContainer] = {
+            domain.id: ParameterContainer(parameter_nodes=None),
+        }
+        metric_multi_batch_parameter_builder.build_parameters(
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+            batch_request=batch_request,
+        )
+        return get_parameter_value_by_fully_qualified_parameter_name(
+            fully_qualified_parameter_name="$parameter.max_passenger_count.value",
+            domain=domain,
+            parameters=parameters,
+        )
+
+    def get_computed_metric_names() -> List[List[str]]:
+        return [
+            [
+                metric_configuration.metric_name
+                for metric_configuration in call[1]["metric_configurations"]
+            ]
+            for call in mock_compute_metrics.call_args_list
+        ]
+
+    with mock.patch.object(
+        Validator,
+        "compute_metrics",
+        autospec=True,
+        side_effect=Validator.compute_metrics,
+    ) as mock_compute_metrics:
+        max_passenger_counts: list = build_max_passenger_counts()
+        # The row counts of the Batches are the fingerprints of their data.
+        assert get_computed_metric_names() == [
+            ["table.row_count"] * 3,
+            ["column.max"] * 3,
+        ]
+        assert len(batch_metric_store.list_keys()) == 3
+
+        # All the metrics are found in the metric history store.
+        mock_compute_metrics.reset_mock()
+        assert build_max_passenger_counts() == max_passenger_counts
+        assert get_computed_metric_names() == [["table.row_count"] * 3]
+
+        # Only the metric of the Batch missing from the metric history store is computed.
+        mock_compute_metrics.reset_mock()
+        batch_metric_store.store_backend.remove_key(
+            batch_metric_store.list_keys()[0].to_tuple()
+        )
+        assert build_max_passenger_counts() == max_passenger_counts
+        assert get_computed_metric_names() == [["table.row_count"] * 3, ["column.max"]]
+        assert len(batch_metric_store.list_keys()) == 3
+
+        # Metrics recorded for different data of a Batch (e.g., before rows were appended to it) are computed again.
+        mock_compute_metrics.reset_mock()
+        key: BatchMetricIdentifier = batch_metric_store.list_keys()[0]
+        batch_metric_store.set(
+            key, {**batch_metric_store.get(key), "batch_fingerprint": -1}
+        )
+        assert build_max_passenger_counts() == max_passenger_counts
+        assert get_computed_metric_names() == [["table.row_count"] * 3, ["column.max"]]
+        assert batch_metric_store.get(key)["batch_fingerprint"] > 0
+
+        # Metrics of Batches of runtime data are neither looked up nor recorded.
+        mock_compute_metrics.reset_mock()
+        data_context.add_datasource(
+            name="runtime_pandas",
+            class_name="Datasource",
+            execution_engine={"class_name": "PandasExecutionEngine"},
+            data_connectors={
+                "runtime": {
+                    "class_name": "RuntimeDataConnector",
+                    "batch_identifiers": ["run_id"],
+                }
+            },
+        )
+        runtime_batch_request = RuntimeBatchRequest(
+            datasource_name="runtime_pandas",
+            data_connector_name="runtime",
+            data_asset_name="my_runtime_asset",
+            runtime_parameters={
+                "batch_data": pd.DataFrame({"passenger_count": [1, 2]})
+            },
+            batch_identifiers={"run_id": "my_run_id"},
+        )
+        assert build_max_passenger_counts(batch_request=runtime_batch_request) == [2]
+        assert get_computed_metric_names() == [["column.max"]]
+        assert len(batch_metric_store.list_keys()) == 3
@@ -346,6 +346,73 @@ def test_graph_validate(basic_datasource):
     ]
 
 
+@pytest.mark.integration
+def test_compute_expectation_metrics_and_precomputed_metrics(basic_datasource):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+
+    batch = basic_datasource.get_single_batch_from_batch_request(
+        RuntimeBatchRequest(
+            **{
+                "datasource_name": "my_datasource",
+                "data_connector_name": "test_runtime_data_connector",
+                "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                "runtime_parameters": {
+                    "batch_data": df,
+                },
+                "batch_identifiers": {
+                    "pipeline_stage_name": 0,
+                    "airflow_run_id": 0,
+                    "custom_key_0": 0,
+                },
+            }
+        )
+    )
+    validator = Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "a", "min_value": None, "max_value": None},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "b"},
+        ),
+    ]
+    metrics: Dict[Tuple[str, str, str], Any] = validator.compute_expectation_metrics(
+        configurations=expectation_configurations
+    )
+    assert {
+        "column.max",
+        "column_values.nonnull.unexpected_count",
+    }.issubset({metric_name for metric_name, _, _ in metrics})
+
+    with mock.patch.object(
+        PandasExecutionEngine,
+        "resolve_metrics",
+        autospec=True,
+        side_effect=PandasExecutionEngine.resolve_metrics,
+    ) as mock_resolve_metrics:
+        with validator.precomputed_metrics(metrics=metrics):
+            assert (
+                validator.expect_column_max_to_be_between(
+                    "a", min_value=None, max_value=None
+                ).result["observed_value"]
+                == 22
+            )
+            assert (
+                validator.expect_column_values_to_not_be_null("b", mostly=0.8).success
+                is True
+            )
+        # No metric is computed again.
+        assert all(
+            len(call[1]["metrics_to_resolve"]) == 0
+            for call in mock_resolve_metrics.call_args_list
+        )
+
+    assert validator._precomputed_metrics == {}
+
+
 @pytest.mark.integration
 def test_graph_validate_with_exception(basic_datasource):
     def mock_error(*args, **kwargs):
@@ -874,6 +941,58 @@ def test_validator_with_bad_batchrequest(
         )
 
 
+@pytest.mark.integration
+def test_validator_with_lazily_loaded_batches(
+    yellow_trip_pandas_data_context,
+):
+    context: DataContext = yellow_trip_pandas_data_context
+    execution_engine = PandasExecutionEngine(max_loaded_batches=1)
+    context.datasources["taxi_pandas"]._execution_engine = execution_engine
+
+    validator: Validator = context.get_validator(
+        batch_request=BatchRequest(
+            datasource_name="taxi_pandas",
+            data_connector_name="monthly",
+            data_asset_name="my_reports",
+            data_connector_query={"batch_filter_parameters": {"year": "2019"}},
+        ),
+        create_expectation_suite_with_name="validating_taxi_data",
+    )
+
+    batch_ids: List[str] = list(validator.batches)
+    assert len(batch_ids) == 3
+    assert validator.active_batch_id == batch_ids[-1]
+    # No batch has been loaded yet.
+    assert all(batch.is_lazy for batch in validator.batches.values())
+    assert not any(
+        execution_engine.loaded_batch_data_dict.is_loaded(batch_id)
+        for batch_id in batch_ids
+    )
+
+    for batch_id in batch_ids:
+        assert (
+            validator.get_metric(
+                MetricConfiguration(
+                    metric_name="table.row_count",
+                    metric_domain_kwargs={"batch_id": batch_id},
+                )
+            )
+            == 10000
+        )
+        # Only the batch in use stays loaded.
+        assert [
+            loaded_batch_id
+            for loaded_batch_id in batch_ids
+            if execution_engine.loaded_batch_data_dict.is_loaded(loaded_batch_id)
+        ] == [batch_id]
+
+    # Unloaded batches are loaded again when they are needed.
+    result = validator.expect_column_values_to_not_be_null(column="vendor_id")
+    assert result.success
+    assert validator.active_batch.batch_markers["ge_load_time"]
+    assert execution_engine.loaded_batch_data_dict.is_loaded(batch_ids[-1])
+
+
 @pytest.mark.integration
 def test_validator_batch_filter(
     multi_batch_taxi_validator,